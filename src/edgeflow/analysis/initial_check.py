@@ -45,9 +45,21 @@ class CompatibilityReport:
 class InitialChecker:
     """Performs initial compatibility checks for models and devices."""
 
-    def __init__(self, device_spec_file: Optional[str] = None):
-        """Initialize the checker with device specifications."""
+    def __init__(
+        self, device_spec_file: Optional[str] = None, measure_memory: bool = False
+    ):
+        """Initialize the checker with device specifications.
+
+        Args:
+            device_spec_file: Optional custom device specification file.
+            measure_memory: Load ``.tflite`` models with TFLite to measure
+                load + tensor-arena RAM instead of estimating it. Off by
+                default because it costs a full interpreter load; results
+                are cached per file (path, size and mtime).
+        """
         self.spec_manager = DeviceSpecManager(device_spec_file)
+        self.measure_memory = measure_memory
+        self._measured_ram: Dict[Tuple[str, int, int], Optional[float]] = {}
 
     @staticmethod
     def _is_quantized_by_name(model_path: str) -> bool:
@@ -56,12 +68,34 @@ class InitialChecker:
             ".tflite"
         )
 
+    def _measure_ram_mb(self, model_path: str) -> Optional[float]:
+        """Measure model load + tensor arena RSS, or None if unavailable."""
+        if not self.measure_memory or not model_path.lower().endswith(".tflite"):
+            return None
+        stat = Path(model_path).stat()
+        key = (str(Path(model_path).resolve()), stat.st_size, stat.st_mtime_ns)
+        if key not in self._measured_ram:
+            self._measured_ram[key] = self._load_and_measure(model_path)
+        return self._measured_ram[key]
+
+    @staticmethod
+    def _load_and_measure(model_path: str) -> Optional[float]:
+        try:
+            from edgeflow.benchmarking.benchmarker import measure_model_memory
+        except Exception:  # noqa: BLE001 - optional heavy dependency
+            return None
+        memory = measure_model_memory(model_path)
+        if not memory:
+            return None
+        return float(memory["model_load_mb"] + memory["arena_mb"])
+
     def profile_model(self, model_path: str) -> ModelProfile:
         """Profile a model to extract its characteristics.
 
         This implementation avoids heavy ML deps and provides robust heuristics:
         - size-based parameter/ops estimation
         - name-based quantization detection
+        - measured RAM (model load + tensor arena) with ``measure_memory``
         """
         p = Path(model_path)
         if not p.exists():
@@ -78,8 +112,13 @@ class InitialChecker:
         # Ops ~ 2x params as a rough upper bound
         num_ops = max(num_params * 2, 1)
 
-        # Estimated peak RAM as: model size + 50% activation buffer
-        estimated_ram_mb = round(size_mb * 1.5, 6)
+        # Prefer measured load + arena memory when enabled and TFLite loads it;
+        # otherwise estimate peak RAM as model size + 50% activation buffer
+        measured_ram_mb = self._measure_ram_mb(model_path)
+        if measured_ram_mb is not None:
+            estimated_ram_mb = round(max(measured_ram_mb, size_mb), 6)
+        else:
+            estimated_ram_mb = round(size_mb * 1.5, 6)
 
         fmt = p.suffix.lower().lstrip(".") or "unknown"
 
@@ -100,10 +139,14 @@ class InitialChecker:
         """Check if a model is compatible with target device."""
         profile = self.profile_model(model_path)
         device = self.spec_manager.get_device_spec(target_device or "generic")
-        print(
-            f"DEBUG: target={target_device}, device={device.name}, ram={device.ram_mb}, max_model={device.max_model_size_mb}"
+        logger.debug(
+            "target=%s, device=%s, ram=%s, max_model=%s, model_size=%s",
+            target_device,
+            device.name,
+            device.ram_mb,
+            device.max_model_size_mb,
+            profile.file_size_mb,
         )
-        print(f"DEBUG: profile.size={profile.file_size_mb}")
 
         # Use config memory_limit if specified, otherwise use device spec
         memory_limit_mb = float(config.get("memory_limit", device.ram_mb))
@@ -201,16 +244,23 @@ class InitialChecker:
 
 
 def perform_initial_check(
-    model_path: str, config: Dict[str, Any], device_spec_file: Optional[str] = None
+    model_path: str,
+    config: Dict[str, Any],
+    device_spec_file: Optional[str] = None,
+    checker: Optional[InitialChecker] = None,
 ) -> Tuple[bool, CompatibilityReport]:
     """
     Main entry point for initial compatibility check.
 
+    Pass ``checker`` to reuse already-loaded device specs across many checks;
+    ``device_spec_file`` is ignored in that case.
+
     Returns:
         Tuple of (should_proceed_with_optimization, compatibility_report)
     """
     target = str(config.get("target_device") or config.get("device") or "generic")
-    checker = InitialChecker(device_spec_file)
+    if checker is None:
+        checker = InitialChecker(device_spec_file)
     report = checker.check_compatibility(model_path, target, config)
     # Proceed with optimization if report suggests optimization is needed
     return report.requires_optimization, report
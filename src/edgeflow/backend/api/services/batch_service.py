@@ -0,0 +1,69 @@
+"""Batch execution helpers for the EdgeFlow API.
+
+Runs one function over many request items on a shared worker pool and
+yields results as soon as each finishes, so batch endpoints can stream them
+back instead of waiting for the slowest item.
+
+Features:
+- Bounded in-flight work: at most ``max_in_flight`` items are submitted at a
+  time, so a large batch never floods the pool or holds every result in memory
+- Completion-order results tagged with the item's index
+- Per-item failures are reported, never raised, so one bad item cannot abort
+  the rest of the batch
+- Pending work is cancelled when the consumer stops iterating (client gone)
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BatchResult = Tuple[int, Any, Optional[BaseException]]
+
+
+def iter_batch(
+    executor: Executor,
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_in_flight: int = 8,
+) -> Iterator[BatchResult]:
+    """Apply ``func`` to each item on ``executor``, yielding in completion order.
+
+    Yields:
+        ``(index, result, error)`` per item; ``error`` is the exception raised
+        by ``func`` (and ``result`` is ``None``) when the item failed.
+    """
+    pending: Dict[Future, int] = {}
+    source = enumerate(items)
+    limit = max(1, int(max_in_flight))
+
+    def fill() -> None:
+        while len(pending) < limit:
+            try:
+                index, item = next(source)
+            except StopIteration:
+                return
+            pending[executor.submit(func, item)] = index
+
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    logger.debug("Batch item %d failed: %s", index, error)
+                    yield index, None, error
+                else:
+                    yield index, future.result(), None
+            fill()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+__all__ = ["BatchResult", "iter_batch"]
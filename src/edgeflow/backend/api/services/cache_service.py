@@ -0,0 +1,180 @@
+"""Response cache for deterministic API endpoints.
+
+Compile, fast-compile, pipeline and check responses are pure functions of the
+submitted ``.ef`` content and request parameters, yet the web UI re-posts the
+same configuration on every keystroke pause. :class:`ResponseCache` memoizes
+those responses:
+
+- Keys are SHA-256 digests of a namespace, the normalized config text and the
+  JSON-encoded parameters, so whitespace-only edits still hit.
+- An in-process LRU tier bounded by entry count, with a TTL per entry. Values
+  are kept JSON-encoded, so every hit returns a fresh copy that callers may
+  mutate without corrupting the cache.
+- An optional shared on-disk tier (one JSON file per key, written atomically)
+  so several uvicorn workers reuse each other's results.
+- Hit/miss/eviction counters for monitoring.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_config_text(content: str) -> str:
+    """Normalize line endings and trailing whitespace of ``.ef`` content."""
+    lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def cache_key(namespace: str, content: str = "", **params: Any) -> str:
+    """Return a stable digest for ``namespace`` + normalized content + params."""
+    digest = hashlib.sha256()
+    digest.update(namespace.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalize_config_text(content).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + optional disk) cache of JSON-serializable values."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_s: float = 600.0,
+        disk_dir: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_s = ttl_s
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(found, value)`` for ``key``, consulting memory then disk."""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl_s:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return True, json.loads(entry[1])
+                del self._entries[key]
+                self._stats["expirations"] += 1
+        found, stored_at, text = self._disk_get(key, now)
+        with self._lock:
+            if found:
+                self._stats["hits"] += 1
+                self._stats["disk_hits"] += 1
+                self._store_locked(key, stored_at, text)
+            else:
+                self._stats["misses"] += 1
+        return found, json.loads(text) if found else None
+
+    def set(self, key: str, value: Any) -> None:
+        now = self.clock()
+        text = json.dumps(value, default=str)
+        with self._lock:
+            self._store_locked(key, now, text)
+        self._disk_set(key, now, text)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        should_store: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[Any, bool]:
+        """Return ``(value, hit)``, computing the value on a miss.
+
+        The computed value is stored unless ``should_store(value)`` is false.
+        """
+        found, value = self.get(key)
+        if found:
+            return value, True
+        value = compute()
+        if should_store is None or should_store(value):
+            self.set(key, value)
+        return value, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.disk_dir is not None:
+            for path in self.disk_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["max_entries"] = self.max_entries
+        stats["ttl_s"] = self.ttl_s
+        stats["disk_tier"] = str(self.disk_dir) if self.disk_dir else None
+        return stats
+
+    def _store_locked(self, key: str, stored_at: float, text: str) -> None:
+        self._entries[key] = (stored_at, text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _disk_get(self, key: str, now: float) -> Tuple[bool, float, str]:
+        if self.disk_dir is None:
+            return False, 0.0, ""
+        path = self.disk_dir / f"{key}.json"
+        try:
+            stored_at = path.stat().st_mtime
+            if now - stored_at > self.ttl_s:
+                path.unlink(missing_ok=True)
+                return False, 0.0, ""
+            text = path.read_text(encoding="utf-8")
+            json.loads(text)  # reject truncated or corrupt entries
+            return True, stored_at, text
+        except FileNotFoundError:
+            return False, 0.0, ""
+        except Exception as exc:  # noqa: BLE001 - a bad entry is just a miss
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, exc)
+            return False, 0.0, ""
+
+    def _disk_set(self, key: str, stored_at: float, text: str) -> None:
+        if self.disk_dir is None:
+            return
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.utime(tmp, (stored_at, stored_at))
+            os.replace(tmp, self.disk_dir / f"{key}.json")
+        except Exception as exc:  # noqa: BLE001 - disk tier is best effort
+            logger.warning("Failed to write cache entry %s: %s", key, exc)
+
+
+__all__ = ["ResponseCache", "cache_key", "normalize_config_text"]
@@ -0,0 +1,404 @@
+"""Background job execution for long-running API endpoints.
+
+Optimize, pipeline and benchmark requests can take seconds to minutes. Running
+them inline ties up a server worker thread for the whole job, so a handful of
+concurrent calls starves cheap traffic such as health checks and compiles.
+
+The :class:`JobManager` runs such work out of the request path:
+
+- Bounded process pool: at most ``max_workers`` jobs run at once on
+  long-lived spawned worker processes, so imports are paid once per worker
+  rather than once per job. A worker is terminated (and replaced on the next
+  job) when its job times out, is cancelled or crashes it.
+- Worker metrics: an optional ``collect_metrics`` callable runs in the worker
+  after every job and its result is handed to ``merge_metrics`` in the
+  parent, so observations made inside jobs are not lost.
+- Bounded queue: submitting beyond ``max_queue`` pending jobs raises
+  :class:`QueueFullError` carrying a Retry-After estimate.
+- Per-job timeouts and cancellation: the worker process is terminated and
+  the job is marked ``timed_out`` / ``cancelled``.
+- Bounded retention: only the most recent ``max_retained`` finished jobs are
+  kept for polling.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    TIMED_OUT = "timed_out"
+
+    @property
+    def is_terminal(self) -> bool:
+        return self not in (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at capacity."""
+
+    def __init__(self, retry_after_s: int) -> None:
+        super().__init__(f"Job queue is full; retry after {retry_after_s}s")
+        self.retry_after_s = retry_after_s
+
+
+@dataclass
+class Job:
+    """A unit of background work and its current state."""
+
+    job_id: str
+    kind: str
+    func: Callable[..., Any]
+    args: Tuple[Any, ...]
+    timeout_s: float
+    status: JobStatus = JobStatus.QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    done: threading.Event = field(default_factory=threading.Event)
+    on_done: Optional[Callable[["Job"], None]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the job for API responses (without the work function)."""
+        duration = None
+        if self.started_at is not None:
+            duration = round((self.finished_at or time.time()) - self.started_at, 3)
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_s": duration,
+            "timeout_s": self.timeout_s,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+def _worker_main(conn: Any, collect_metrics: Optional[Callable[[], Any]]) -> None:
+    """Serve ``(func, args)`` jobs sent over ``conn`` until ``None`` arrives.
+
+    Each outcome is sent back as ``(status, payload, metrics)``.
+    """
+    try:
+        while True:
+            try:
+                task = conn.recv()
+            except EOFError:
+                return
+            if task is None:
+                return
+            func, args = task
+            try:
+                outcome: Tuple[str, Any] = ("ok", func(*args))
+            except BaseException as exc:  # noqa: BLE001 - report every failure
+                detail = getattr(exc, "detail", None) or str(exc) or type(exc).__name__
+                outcome = ("error", str(detail))
+            metrics = None
+            if collect_metrics is not None:
+                try:
+                    metrics = collect_metrics()
+                except Exception:  # noqa: BLE001 - metrics are best effort
+                    logger.exception("Collecting worker metrics failed")
+            try:
+                conn.send(outcome + (metrics,))
+            except Exception as exc:  # noqa: BLE001 - e.g. unpicklable result
+                conn.send(("error", f"Job result could not be sent: {exc}", metrics))
+    finally:
+        conn.close()
+
+
+class _WorkerProcess:
+    """A long-lived spawned process running :func:`_worker_main`."""
+
+    def __init__(self, ctx: Any, collect_metrics: Optional[Callable[[], Any]]) -> None:
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(
+            target=_worker_main, args=(child, collect_metrics), daemon=True
+        )
+        self.proc.start()
+        child.close()
+
+    def is_alive(self) -> bool:
+        return bool(self.proc.is_alive())
+
+    def terminate(self) -> None:
+        self.conn.close()
+        if self.proc.is_alive():
+            self.proc.terminate()
+        self.proc.join(timeout=5)
+
+    def stop(self) -> None:
+        """Ask the worker to exit after its current job, then reap it."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.proc.join(timeout=5)
+        self.terminate()
+
+
+class JobManager:
+    """Bounded queue of jobs executed on a pool of terminable worker processes.
+
+    ``collect_metrics`` must be a picklable module-level function; it runs in
+    the worker after each job and its return value is passed to
+    ``merge_metrics`` in this process.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue: int = 16,
+        default_timeout_s: float = 300.0,
+        max_retained: int = 256,
+        poll_interval_s: float = 0.05,
+        collect_metrics: Optional[Callable[[], Any]] = None,
+        merge_metrics: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(1, int(max_queue))
+        self.default_timeout_s = default_timeout_s
+        self.max_retained = max_retained
+        self.poll_interval_s = poll_interval_s
+        self.collect_metrics = collect_metrics
+        self.merge_metrics = merge_metrics
+        self._ctx = multiprocessing.get_context("spawn")
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._avg_duration_s = 5.0
+        self._workers: list[threading.Thread] = []
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        kind: str,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout_s: Optional[float] = None,
+        on_done: Optional[Callable[[Job], None]] = None,
+    ) -> Job:
+        """Queue ``func(*args)`` for execution in a worker process.
+
+        ``func`` must be a picklable module-level function and its return value
+        must be picklable. ``on_done(job)`` runs in this process once the job
+        reaches a terminal state, including cancellation before it started; it
+        runs under the manager's lock, so it must be quick.
+
+        Raises:
+            QueueFullError: If ``max_queue`` jobs are already waiting.
+            RuntimeError: If the manager has been shut down.
+        """
+        timeout = float(timeout_s or self.default_timeout_s)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Job manager is shut down")
+            if self._pending >= self.max_queue:
+                raise QueueFullError(self._retry_after_locked())
+            job = Job(uuid.uuid4().hex, kind, func, tuple(args), timeout)
+            job.on_done = on_done
+            self._jobs[job.job_id] = job
+            self._pending += 1
+            self._evict_locked()
+            self._ensure_workers_locked()
+        self._queue.put(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Request cancellation; queued jobs never start, running ones are killed."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status.is_terminal:
+                return job
+            job.cancel_requested = True
+            if job.status is JobStatus.QUEUED:
+                self._finish_locked(job, JobStatus.CANCELLED, error="Cancelled")
+                self._pending -= 1
+        return job
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Block until the job reaches a terminal state or ``timeout`` expires."""
+        job = self.get(job_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queued": self._pending,
+                "running": self._running,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "retained": len(self._jobs),
+            }
+
+    def shutdown(self) -> None:
+        """Cancel outstanding jobs and stop the dispatcher threads."""
+        with self._lock:
+            self._closed = True
+            outstanding = [j.job_id for j in self._jobs.values() if not j.done.is_set()]
+        for job_id in outstanding:
+            self.cancel(job_id)
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+        self._workers.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _ensure_workers_locked(self) -> None:
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._dispatch_loop,
+                name=f"edgeflow-job-{len(self._workers)}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _retry_after_locked(self) -> int:
+        waves = (self._pending + self._running) / self.max_workers
+        return max(1, int(math.ceil(waves * self._avg_duration_s)))
+
+    def _evict_locked(self) -> None:
+        excess = len(self._jobs) - self.max_retained
+        if excess <= 0:
+            return
+        for job_id in [j.job_id for j in self._jobs.values() if j.done.is_set()]:
+            if excess <= 0:
+                break
+            del self._jobs[job_id]
+            excess -= 1
+
+    def _finish_locked(
+        self,
+        job: Job,
+        status: JobStatus,
+        result: Any = None,
+        error: Optional[str] = None,
+    ) -> None:
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = time.time()
+        job.done.set()
+        if job.on_done is not None:
+            try:
+                job.on_done(job)
+            except Exception:  # noqa: BLE001 - never kill the dispatcher
+                logger.exception("Completion callback of job %s failed", job.job_id)
+
+    def _dispatch_loop(self) -> None:
+        # Each dispatcher thread owns one worker process, (re)spawned lazily
+        worker: Optional[_WorkerProcess] = None
+        try:
+            while True:
+                job = self._queue.get()
+                if job is None:
+                    return
+                started = time.time()
+                with self._lock:
+                    if job.status is not JobStatus.QUEUED:
+                        continue
+                    job.status = JobStatus.RUNNING
+                    job.started_at = started
+                    self._pending -= 1
+                    self._running += 1
+                try:
+                    if worker is None or not worker.is_alive():
+                        worker = _WorkerProcess(self._ctx, self.collect_metrics)
+                    status, result, error = self._run_on_worker(worker, job)
+                except Exception as exc:  # noqa: BLE001 - never kill the dispatcher
+                    logger.exception("Job %s crashed the dispatcher", job.job_id)
+                    status, result, error = JobStatus.FAILED, None, str(exc)
+                with self._lock:
+                    self._running -= 1
+                    self._finish_locked(job, status, result, error)
+                    elapsed = time.time() - started
+                    self._avg_duration_s = 0.8 * self._avg_duration_s + 0.2 * elapsed
+        finally:
+            if worker is not None:
+                worker.stop()
+
+    def _run_on_worker(
+        self, worker: _WorkerProcess, job: Job
+    ) -> Tuple[JobStatus, Any, Optional[str]]:
+        """Run ``job`` on ``worker``; the worker is terminated if it must not be
+        reused (timeout, cancellation, lost connection)."""
+        worker.conn.send((job.func, job.args))
+        deadline = time.monotonic() + job.timeout_s
+        while True:
+            if job.cancel_requested:
+                worker.terminate()
+                return JobStatus.CANCELLED, None, "Cancelled"
+            if time.monotonic() >= deadline:
+                worker.terminate()
+                return (
+                    JobStatus.TIMED_OUT,
+                    None,
+                    f"Job exceeded timeout of {job.timeout_s:g}s",
+                )
+            if worker.conn.poll(self.poll_interval_s):
+                try:
+                    outcome, payload, metrics = worker.conn.recv()
+                except EOFError:
+                    worker.terminate()
+                    return JobStatus.FAILED, None, "Worker process exited"
+                if metrics is not None and self.merge_metrics is not None:
+                    try:
+                        self.merge_metrics(metrics)
+                    except Exception:  # noqa: BLE001 - metrics are best effort
+                        logger.exception("Merging worker metrics failed")
+                if outcome == "ok":
+                    return JobStatus.SUCCEEDED, payload, None
+                return JobStatus.FAILED, None, payload
+            if not worker.is_alive() and not worker.conn.poll(0):
+                exitcode = worker.proc.exitcode
+                worker.terminate()
+                return (
+                    JobStatus.FAILED,
+                    None,
+                    f"Worker process exited with code {exitcode}",
+                )
+
+
+__all__ = ["Job", "JobManager", "JobStatus", "QueueFullError"]
@@ -0,0 +1,390 @@
+"""Prometheus metrics for the EdgeFlow API.
+
+Provides a tiny metrics registry rendered in the Prometheus text exposition
+format, plus an ASGI middleware that records per-route request metrics.
+
+Design notes:
+- Hot-path updates take no locks: every thread writes to its own shard of a
+  metric (a plain dict of counters), and shards are only summed when
+  ``/api/metrics`` is scraped.
+- Histograms use fixed, pre-computed bucket bounds; an observation is a
+  ``bisect`` plus two additions.
+- Routes are labelled by their path template (``/api/jobs/{job_id}``), never by
+  the raw URL, so label cardinality stays bounded.
+- Values owned by other services (cache hit ratio, job queue depth) are read
+  at scrape time through registered collector callbacks.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+LabelValues = Tuple[str, ...]
+
+LATENCY_BUCKETS_S = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+SIZE_BUCKETS_BYTES = tuple(float(4**i * 256) for i in range(11))  # 256B .. 256MB
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class holding per-thread shards of ``{labels: state}``."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self._local = threading.local()
+        self._shards: List[Dict[LabelValues, Any]] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> Dict[LabelValues, Any]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            self._local.shard = shard
+            # Only taken once per thread, never on the update path
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _snapshot_shards(self) -> List[Dict[LabelValues, Any]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        # Copy each shard; a concurrent insert can make dict() raise, so retry
+        copies = []
+        for shard in shards:
+            while True:
+                try:
+                    copies.append(dict(shard))
+                    break
+                except RuntimeError:
+                    continue
+        return copies
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def values(self) -> Dict[LabelValues, float]:
+        totals: Dict[LabelValues, float] = {}
+        for shard in self._snapshot_shards():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0.0) + value
+        return totals
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(v)}"
+            for key, v in sorted(self.values().items())
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down (summed across thread shards)."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Histogram with fixed buckets; state per label set is ``[counts, sum]``."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS_S,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            state = [[0] * (len(self.buckets) + 1), 0.0]
+            shard[labels] = state
+        state[0][bisect.bisect_left(self.buckets, value)] += 1
+        state[1] += value
+
+    def merge(self, snapshot: Dict[LabelValues, Tuple[List[int], float]]) -> None:
+        """Add observations recorded elsewhere (e.g. in a job worker process)."""
+        shard = self._shard()
+        for key, (counts, total) in snapshot.items():
+            state = shard.get(tuple(key))
+            if state is None:
+                state = [[0] * (len(self.buckets) + 1), 0.0]
+                shard[tuple(key)] = state
+            for i, count in enumerate(counts):
+                state[0][i] += count
+            state[1] += total
+
+    def delta(
+        self, since: Dict[LabelValues, Tuple[List[int], float]]
+    ) -> Dict[LabelValues, Tuple[List[int], float]]:
+        """Observations made after the snapshot ``since`` was taken."""
+        changes = {}
+        for key, (counts, total) in self.snapshot().items():
+            before = since.get(key, ([0] * len(counts), 0.0))
+            if counts != before[0]:
+                changes[key] = (
+                    [a - b for a, b in zip(counts, before[0])],
+                    total - before[1],
+                )
+        return changes
+
+    def snapshot(self) -> Dict[LabelValues, Tuple[List[int], float]]:
+        merged: Dict[LabelValues, Tuple[List[int], float]] = {}
+        for shard in self._snapshot_shards():
+            for key, (counts, total) in shard.items():
+                acc = merged.setdefault(key, ([0] * len(counts), 0.0))
+                merged[key] = ([a + b for a, b in zip(acc[0], counts)], acc[1] + total)
+        return merged
+
+    def render(self) -> List[str]:
+        lines = []
+        names = self.label_names + ("le",)
+        for key, (counts, total) in sorted(self.snapshot().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            base = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{base} {_format_value(total)}")
+            lines.append(f"{self.name}_count{base} {cumulative}")
+        return lines
+
+
+Collector = Callable[[], Iterable[Tuple[str, str, str, Dict[str, str], float]]]
+
+
+class MetricsRegistry:
+    """Holds metrics and scrape-time collectors; renders Prometheus text."""
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Collector] = []
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, help_text, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS_S,
+    ) -> Histogram:
+        return self._add(Histogram(name, help_text, labels, buckets))
+
+    def register_collector(self, collector: Collector) -> None:
+        """Add a callback yielding ``(name, kind, help, labels, value)`` samples."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        seen = set()
+        for collector in self._collectors:
+            for name, kind, help_text, labels, value in collector():
+                if name not in seen:
+                    seen.add(name)
+                    lines.append(f"# HELP {name} {help_text}")
+                    lines.append(f"# TYPE {name} {kind}")
+                label_str = _format_labels(tuple(labels), tuple(labels.values()))
+                lines.append(f"{name}{label_str} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _add(self, metric: Any) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+
+class ApiMetrics:
+    """The API's metric families."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.requests = r.counter(
+            "edgeflow_http_requests_total",
+            "HTTP requests by route, method and status.",
+            ("route", "method", "status"),
+        )
+        self.latency = r.histogram(
+            "edgeflow_http_request_duration_seconds",
+            "HTTP request latency by route.",
+            ("route", "method"),
+        )
+        self.in_flight = r.gauge(
+            "edgeflow_http_requests_in_flight", "Requests currently being served."
+        )
+        self.request_size = r.histogram(
+            "edgeflow_http_request_size_bytes",
+            "Request body size by route.",
+            ("route",),
+            SIZE_BUCKETS_BYTES,
+        )
+        self.response_size = r.histogram(
+            "edgeflow_http_response_size_bytes",
+            "Response body size by route.",
+            ("route",),
+            SIZE_BUCKETS_BYTES,
+        )
+        self.rate_limited = r.counter(
+            "edgeflow_rate_limit_rejections_total",
+            "Requests rejected by the rate limiter.",
+            ("route",),
+        )
+        self.pipeline_stage = r.histogram(
+            "edgeflow_pipeline_stage_duration_seconds",
+            "Time spent in each stage of the pipeline and fast-compile endpoints.",
+            ("endpoint", "stage"),
+        )
+
+    def stage_clock(self, endpoint: str) -> "StageClock":
+        return StageClock(self.pipeline_stage, endpoint)
+
+
+class StageClock:
+    """Records consecutive pipeline stages as laps of one running clock."""
+
+    def __init__(self, histogram: Histogram, endpoint: str) -> None:
+        self.histogram = histogram
+        self.endpoint = endpoint
+        self.last = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.histogram.observe(now - self.last, self.endpoint, stage)
+        self.last = now
+
+
+def route_label(scope: Mapping[str, Any]) -> str:
+    """Path template of the matched route, or ``unmatched``."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request count, latency and sizes."""
+
+    def __init__(self, app: Any, metrics: ApiMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        metrics = self.metrics
+        start = time.perf_counter()
+        status = [500]
+        sent = [0]
+        received = [0]
+
+        async def counting_receive() -> Dict[str, Any]:
+            message = await receive()
+            if message["type"] == "http.request":
+                received[0] += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            elif message["type"] == "http.response.body":
+                sent[0] += len(message.get("body", b""))
+            await send(message)
+
+        metrics.in_flight.inc()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            metrics.in_flight.dec()
+            route = route_label(scope)
+            method = scope.get("method", "")
+            metrics.requests.inc(route, method, str(status[0]))
+            metrics.latency.observe(time.perf_counter() - start, route, method)
+            metrics.request_size.observe(received[0], route)
+            metrics.response_size.observe(sent[0], route)
+
+
+__all__ = [
+    "ApiMetrics",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "StageClock",
+    "route_label",
+]
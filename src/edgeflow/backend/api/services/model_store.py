@@ -0,0 +1,316 @@
+"""Content-addressed model store for the backend.
+
+Clients upload a model once and later requests reference it by its SHA-256
+digest. Layout under the store root::
+
+    incoming/                 temporary spool files (same filesystem as models)
+    models/<digest>/model<suffix>
+    models/<digest>/meta.json
+    models/<digest>/artifacts/<name>   derived results (reports, benchmarks)
+
+Features:
+- Deduplication: re-uploading identical bytes keeps the existing entry.
+- LRU eviction: when the total size exceeds ``max_bytes`` the least recently
+  used models (and their artifacts) are removed. Recency is the mtime of the
+  digest directory, so it survives restarts and is shared between workers.
+- Writes keep a running byte total; the store is only walked at startup and
+  when that total goes over budget (to pick up other workers' entries).
+- Models in use are never evicted: entries pinned with :meth:`ModelStore.pinned`
+  or opened within the last ``min_idle_s`` seconds are skipped.
+- Digests are validated before touching the filesystem.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+_ARTIFACT_RE = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+_SUFFIX_RE = re.compile(r"^\.[A-Za-z0-9]{1,16}$")
+
+
+class ModelNotFoundError(KeyError):
+    """Raised when a digest is not present in the store."""
+
+
+@dataclass
+class StoredModel:
+    """Metadata of a model held in the store."""
+
+    sha256: str
+    size_bytes: int
+    suffix: str
+    path: str
+    created_at: float
+    last_access: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def is_valid_digest(digest: str) -> bool:
+    return bool(_DIGEST_RE.match(digest or ""))
+
+
+class ModelStore:
+    """SHA-256 addressed model files plus derived artifacts, bounded by size."""
+
+    def __init__(
+        self, root: str, max_bytes: int = 5 * 1024**3, min_idle_s: float = 30.0
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.min_idle_s = min_idle_s
+        self.models_dir = self.root / "models"
+        self.incoming_dir = self.root / "incoming"
+        self.models_dir.mkdir(parents=True, exist_ok=True)
+        self.incoming_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pins: Dict[str, int] = {}
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        with self._lock:
+            self._scan_locked()
+
+    # ------------------------------------------------------------------
+    # Models
+    # ------------------------------------------------------------------
+
+    def add_file(
+        self, path: str, sha256: str, suffix: str = ""
+    ) -> Tuple[StoredModel, bool]:
+        """Move a spooled file into the store under ``sha256``.
+
+        The source file is consumed (moved or deleted).
+
+        Returns:
+            ``(record, created)`` where ``created`` is False for duplicates.
+        """
+        self._check_digest(sha256)
+        suffix = suffix if _SUFFIX_RE.match(suffix or "") else ""
+        entry = self.models_dir / sha256
+        with self._lock:
+            if (entry / "meta.json").exists():
+                Path(path).unlink(missing_ok=True)
+                self._touch(entry)
+                return self._load(sha256), False
+            entry.mkdir(parents=True, exist_ok=True)
+            target = entry / f"model{suffix}"
+            os.replace(path, target)
+            now = time.time()
+            record = StoredModel(
+                sha256=sha256,
+                size_bytes=target.stat().st_size,
+                suffix=suffix,
+                path=str(target),
+                created_at=now,
+                last_access=now,
+            )
+            meta = entry / "meta.json"
+            self._write_json(meta, record.to_dict())
+            self._account_locked(sha256, record.size_bytes + meta.stat().st_size)
+            self._evict_locked(keep=sha256)
+        return record, True
+
+    def pin(self, sha256: str) -> StoredModel:
+        """Protect ``sha256`` from eviction until a matching ``unpin``.
+
+        Raises:
+            ModelNotFoundError: If the digest is unknown or invalid.
+        """
+        record = self.get(sha256)
+        with self._lock:
+            self._pins[sha256] = self._pins.get(sha256, 0) + 1
+        return record
+
+    def unpin(self, sha256: str) -> None:
+        with self._lock:
+            self._pins[sha256] -= 1
+            if not self._pins[sha256]:
+                del self._pins[sha256]
+
+    @contextmanager
+    def pinned(self, sha256: str) -> Iterator[StoredModel]:
+        """Yield the record for ``sha256``, protected from eviction until exit.
+
+        Raises:
+            ModelNotFoundError: If the digest is unknown or invalid.
+        """
+        record = self.pin(sha256)
+        try:
+            yield record
+        finally:
+            self.unpin(sha256)
+
+    def get(self, sha256: str) -> StoredModel:
+        """Return the record for ``sha256`` and mark it recently used.
+
+        Raises:
+            ModelNotFoundError: If the digest is unknown or invalid.
+        """
+        if not is_valid_digest(sha256):
+            raise ModelNotFoundError(sha256)
+        entry = self.models_dir / sha256
+        try:
+            self._touch(entry)
+            return self._load(sha256)
+        except (FileNotFoundError, ValueError) as exc:
+            raise ModelNotFoundError(sha256) from exc
+
+    def delete(self, sha256: str) -> bool:
+        if not is_valid_digest(sha256):
+            return False
+        with self._lock:
+            entry = self.models_dir / sha256
+            if not entry.exists():
+                return False
+            shutil.rmtree(entry, ignore_errors=True)
+            self._total_bytes -= self._sizes.pop(sha256, 0)
+        return True
+
+    def list_models(self) -> List[StoredModel]:
+        records = []
+        for entry in self.models_dir.iterdir():
+            try:
+                records.append(self._load(entry.name))
+            except (FileNotFoundError, ValueError):
+                continue
+        return sorted(records, key=lambda r: r.last_access, reverse=True)
+
+    def stats(self) -> Dict[str, Any]:
+        records = self.list_models()
+        with self._lock:
+            total = self._total_bytes
+        return {
+            "models": len(records),
+            "total_bytes": total,
+            "max_bytes": self.max_bytes,
+        }
+
+    # ------------------------------------------------------------------
+    # Derived artifacts
+    # ------------------------------------------------------------------
+
+    def get_artifact(self, sha256: str, name: str) -> Optional[Any]:
+        """Return a stored JSON artifact for ``sha256`` or None."""
+        path = self._artifact_path(sha256, name)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except ValueError as exc:
+            logger.warning("Discarding corrupt artifact %s: %s", path, exc)
+            path.unlink(missing_ok=True)
+            return None
+
+    def list_artifacts(self, sha256: str) -> List[str]:
+        self._check_digest(sha256)
+        directory = self.models_dir / sha256 / "artifacts"
+        if not directory.is_dir():
+            return []
+        return sorted(p.name for p in directory.iterdir() if p.suffix != ".tmp")
+
+    def put_artifact(self, sha256: str, name: str, value: Any) -> None:
+        """Store a JSON artifact derived from model ``sha256``."""
+        self.get(sha256)
+        path = self._artifact_path(sha256, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            try:
+                previous = path.stat().st_size
+            except FileNotFoundError:
+                previous = 0
+            self._write_json(path, value)
+            self._account_locked(sha256, path.stat().st_size - previous)
+            self._evict_locked(keep=sha256)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _check_digest(self, sha256: str) -> None:
+        if not is_valid_digest(sha256):
+            raise ValueError(f"Invalid SHA-256 digest: {sha256!r}")
+
+    def _artifact_path(self, sha256: str, name: str) -> Path:
+        self._check_digest(sha256)
+        if not _ARTIFACT_RE.match(name):
+            raise ValueError(f"Invalid artifact name: {name!r}")
+        return self.models_dir / sha256 / "artifacts" / name
+
+    def _load(self, sha256: str) -> StoredModel:
+        entry = self.models_dir / sha256
+        meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+        meta["last_access"] = entry.stat().st_mtime
+        return StoredModel(**meta)
+
+    @staticmethod
+    def _touch(entry: Path) -> None:
+        now = time.time()
+        os.utime(entry, (now, now))
+
+    @staticmethod
+    def _write_json(path: Path, value: Any) -> None:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(value, fh, default=str)
+        os.replace(tmp, path)
+
+    def _entry_bytes(self, sha256: str) -> int:
+        total = 0
+        for dirpath, _dirs, files in os.walk(self.models_dir / sha256):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+        return total
+
+    def _account_locked(self, sha256: str, delta: int) -> None:
+        self._sizes[sha256] = self._sizes.get(sha256, 0) + delta
+        self._total_bytes += delta
+
+    def _scan_locked(self) -> None:
+        """Recompute entry sizes from disk (other workers share the root)."""
+        self._sizes = {
+            entry.name: self._entry_bytes(entry.name)
+            for entry in self.models_dir.iterdir()
+            if entry.is_dir()
+        }
+        self._total_bytes = sum(self._sizes.values())
+
+    def _evict_locked(self, keep: str) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+        self._scan_locked()
+        entries = []
+        for name, size in self._sizes.items():
+            try:
+                entries.append((os.stat(self.models_dir / name).st_mtime, name, size))
+            except OSError:
+                continue
+        busy_after = time.time() - self.min_idle_s
+        for mtime, name, size in sorted(entries):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if name == keep or name in self._pins or mtime > busy_after:
+                continue
+            shutil.rmtree(self.models_dir / name, ignore_errors=True)
+            self._total_bytes -= self._sizes.pop(name)
+            logger.info("Evicted model %s (%d bytes) from store", name, size)
+
+
+__all__ = ["ModelNotFoundError", "ModelStore", "StoredModel", "is_valid_digest"]
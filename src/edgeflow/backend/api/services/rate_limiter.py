@@ -0,0 +1,186 @@
+"""GCRA rate limiting for the EdgeFlow API.
+
+The limiter implements the Generic Cell Rate Algorithm: each client key stores
+a single "theoretical arrival time" (TAT). A request costing ``c`` units is
+allowed when ``max(TAT, now) + c * T - now <= period`` where ``T`` is the
+emission interval (``period / capacity``). This is equivalent to a sliding
+window of ``capacity`` units per ``period`` with smooth refill, and costs one
+read and one write per request.
+
+State backends:
+- :class:`MemoryRateStore`: an LRU-bounded ``OrderedDict`` per process.
+- :class:`SQLiteRateStore`: a SQLite table shared by every worker process on
+  the host, so all uvicorn workers enforce a single budget.
+
+Idle keys (TAT in the past) are indistinguishable from new ones, so both
+backends can drop them freely to bound memory.
+
+``capacity`` is a budget of cost units, not of requests: with the default
+cost of 1 per request the two coincide, but a route costing 4 uses four
+units of the per-period budget.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional, Protocol, Tuple
+
+UpdateFn = Callable[[Optional[float]], Tuple[Optional[float], "RateDecision"]]
+
+
+@dataclass
+class RateDecision:
+    """Outcome of a rate-limit check."""
+
+    allowed: bool
+    retry_after_s: float = 0.0
+    remaining: float = 0.0
+
+
+class RateLimitStore(Protocol):
+    """State backend holding one TAT per client key."""
+
+    def update(self, key: str, fn: UpdateFn) -> RateDecision:
+        """Atomically apply ``fn`` to the stored TAT of ``key``.
+
+        ``fn`` receives the current TAT (None if unknown) and returns the TAT
+        to store (None leaves it unchanged) plus the decision to return.
+        """
+        ...
+
+
+class MemoryRateStore:
+    """Per-process TAT table bounded to ``max_keys`` entries (LRU)."""
+
+    def __init__(self, max_keys: int = 10_000) -> None:
+        self.max_keys = max(1, int(max_keys))
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def update(self, key: str, fn: UpdateFn) -> RateDecision:
+        with self._lock:
+            new_tat, decision = fn(self._tats.get(key))
+            if new_tat is not None:
+                self._tats[key] = new_tat
+                self._tats.move_to_end(key)
+                if len(self._tats) > self.max_keys:
+                    self._tats.popitem(last=False)
+            return decision
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+class SQLiteRateStore:
+    """TAT table in a SQLite file shared between worker processes."""
+
+    def __init__(
+        self, path: str, prune_every: int = 1000, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.path = path
+        self.prune_every = max(1, int(prune_every))
+        self.clock = clock
+        self._local = threading.local()
+        self._ops = 0
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS gcra (key TEXT PRIMARY KEY, tat REAL NOT NULL)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def update(self, key: str, fn: UpdateFn) -> RateDecision:
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tat FROM gcra WHERE key = ?", (key,)).fetchone()
+            new_tat, decision = fn(row[0] if row else None)
+            if new_tat is not None:
+                conn.execute(
+                    "INSERT INTO gcra (key, tat) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                    (key, new_tat),
+                )
+            self._ops += 1
+            if self._ops % self.prune_every == 0:
+                # Keys whose TAT has passed carry no state; drop them
+                conn.execute("DELETE FROM gcra WHERE tat < ?", (self.clock(),))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return decision
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM gcra").fetchone()[0]
+
+
+class RateLimiter:
+    """GCRA limiter with per-route request costs.
+
+    Args:
+        capacity: Cost units allowed per ``period_s`` (and the maximum burst).
+        period_s: Length of the window in seconds.
+        store: State backend; defaults to an in-memory LRU table.
+        route_costs: Cost per route path template; others cost ``default_cost``.
+        default_cost: Cost of routes not listed in ``route_costs``.
+        clock: Wall-clock source (shared across processes for SQLite).
+    """
+
+    def __init__(
+        self,
+        capacity: int = 60,
+        period_s: float = 60.0,
+        store: Optional[RateLimitStore] = None,
+        route_costs: Optional[Mapping[str, float]] = None,
+        default_cost: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.capacity = capacity
+        self.period_s = period_s
+        self.store: RateLimitStore = store if store is not None else MemoryRateStore()
+        self.route_costs = dict(route_costs or {})
+        self.default_cost = default_cost
+        self.clock = clock
+
+    def cost_for(self, route: str) -> float:
+        return self.route_costs.get(route, self.default_cost)
+
+    def check(self, key: str, route: str = "", units: int = 1) -> RateDecision:
+        """Charge ``key`` for ``units`` requests to ``route`` (e.g. the items of
+        a batch) and return the decision."""
+        cost = self.cost_for(route) * units
+        if self.capacity <= 0:
+            return RateDecision(False, retry_after_s=self.period_s)
+        interval = self.period_s / self.capacity
+        now = self.clock()
+
+        def gcra(tat: Optional[float]) -> Tuple[Optional[float], RateDecision]:
+            start = now if tat is None or tat < now else tat
+            new_tat = start + cost * interval
+            if new_tat - now > self.period_s:
+                retry = new_tat - now - self.period_s
+                return None, RateDecision(False, retry_after_s=retry)
+            remaining = (self.period_s - (new_tat - now)) / interval
+            return new_tat, RateDecision(True, remaining=remaining)
+
+        return self.store.update(key, gcra)
+
+
+__all__ = [
+    "MemoryRateStore",
+    "RateDecision",
+    "RateLimitStore",
+    "RateLimiter",
+    "SQLiteRateStore",
+]
@@ -0,0 +1,160 @@
+"""Fast, negotiated serialization for large API payloads.
+
+Pipeline responses carry whole AST and IR dictionaries. Re-validating them
+through Pydantic and encoding them with the stdlib ``json`` module dominates
+request time for real models, so endpoints with large bodies build their
+response here instead:
+
+- Body format from ``Accept``: ``application/msgpack`` when ``msgpack`` is
+  installed and requested, JSON otherwise (via ``orjson`` when installed,
+  stdlib ``json`` as the fallback)
+- Compression from ``Accept-Encoding`` (q-values honoured): ``zstd`` when
+  ``zstandard`` is installed, then ``gzip``; bodies below
+  ``MIN_COMPRESS_BYTES`` are sent uncompressed
+- ``Vary: Accept, Accept-Encoding`` so shared caches keep variants apart
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from starlette.responses import Response
+
+try:  # Optional fast JSON encoder
+    import orjson  # type: ignore
+
+    _ORJSON_AVAILABLE = True
+except Exception:  # noqa: BLE001 - optional dependency
+    _ORJSON_AVAILABLE = False
+
+try:  # Optional binary encoding
+    import msgpack  # type: ignore
+
+    _MSGPACK_AVAILABLE = True
+except Exception:  # noqa: BLE001 - optional dependency
+    _MSGPACK_AVAILABLE = False
+
+try:  # Optional zstd compression
+    import zstandard  # type: ignore
+
+    _ZSTD_AVAILABLE = True
+except Exception:  # noqa: BLE001 - optional dependency
+    _ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 5
+ZSTD_LEVEL = 3
+
+
+def _parse_header(value: Optional[str]) -> List[Tuple[str, float]]:
+    """Split an ``Accept``-style header into ``(token, q)`` pairs."""
+    items = []
+    for part in (value or "").split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, raw = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(raw)
+                except ValueError:
+                    q = 0.0
+        items.append((token.strip().lower(), q))
+    return items
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """Content codings this process can produce, in server preference order."""
+    return ("zstd", "gzip") if _ZSTD_AVAILABLE else ("gzip",)
+
+
+def negotiate_encoding(
+    accept_encoding: Optional[str], available: Optional[Tuple[str, ...]] = None
+) -> str:
+    """Pick the best content coding, or ``identity``."""
+    offered = dict(_parse_header(accept_encoding))
+    best, best_q = "identity", 0.0
+    for coding in available if available is not None else available_encodings():
+        q = offered.get(coding, offered.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """``application/msgpack`` if asked for (and possible), else JSON."""
+    if not _MSGPACK_AVAILABLE:
+        return JSON_MEDIA_TYPE
+    offered = dict(_parse_header(accept))
+    msgpack_q = max(offered.get(m, 0.0) for m in MSGPACK_MEDIA_TYPES)
+    json_q = max(offered.get(JSON_MEDIA_TYPE, 0.0), offered.get("*/*", 0.0))
+    if msgpack_q > 0 and msgpack_q >= json_q:
+        return MSGPACK_MEDIA_TYPES[0]
+    return JSON_MEDIA_TYPE
+
+
+def dumps(content: Any, media_type: str = JSON_MEDIA_TYPE) -> bytes:
+    """Encode ``content`` as JSON or msgpack; unknown objects become strings."""
+    if media_type in MSGPACK_MEDIA_TYPES:
+        return msgpack.packb(content, default=str, use_bin_type=True)
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(content, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Apply a content coding chosen by :func:`negotiate_encoding`."""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return body
+
+
+def fast_response(
+    content: Any,
+    request_headers: Mapping[str, str],
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Encode ``content`` directly into a negotiated, possibly compressed body.
+
+    Nothing is validated: callers pass plain dicts/lists that already have
+    the response model's shape.
+    """
+    media_type = negotiate_media_type(request_headers.get("accept"))
+    body = dumps(content, media_type)
+    out_headers = dict(headers or {})
+    out_headers["Vary"] = "Accept, Accept-Encoding"
+    if len(body) >= MIN_COMPRESS_BYTES:
+        encoding = negotiate_encoding(request_headers.get("accept-encoding"))
+        if encoding != "identity":
+            body = compress(body, encoding)
+            out_headers["Content-Encoding"] = encoding
+    return Response(body, status_code, out_headers, media_type)
+
+
+__all__ = [
+    "JSON_MEDIA_TYPE",
+    "MIN_COMPRESS_BYTES",
+    "MSGPACK_MEDIA_TYPES",
+    "available_encodings",
+    "compress",
+    "dumps",
+    "fast_response",
+    "negotiate_encoding",
+    "negotiate_media_type",
+]
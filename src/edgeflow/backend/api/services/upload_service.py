@@ -0,0 +1,136 @@
+"""Streaming model uploads spooled to disk.
+
+Base64-in-JSON uploads inflate a model by a third and hold several copies of
+it in memory while parsing and decoding. The helpers here consume an upload
+chunk by chunk instead:
+
+- :func:`spool_chunks` writes an async byte stream to a temporary file while
+  hashing it incrementally and enforcing a size limit.
+- :func:`iter_upload_file` adapts a multipart ``UploadFile``; a raw request
+  body is consumed directly via ``request.stream()`` (chunked or not).
+- :class:`SpooledUpload` exposes the result by path, digest, size or a
+  read-only ``mmap`` so downstream code never loads the whole model.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(f"Upload exceeds limit of {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+@dataclass
+class SpooledUpload:
+    """A fully received upload stored in a temporary file."""
+
+    path: str
+    size_bytes: int
+    sha256: str
+
+    @property
+    def size_mb(self) -> float:
+        return round(self.size_bytes / (1024 * 1024), 6)
+
+    @contextmanager
+    def mmap(self) -> Iterator[Any]:
+        """Map the spooled file read-only; empty files yield ``b""``."""
+        if self.size_bytes == 0:
+            yield b""
+            return
+        with open(self.path, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    def cleanup(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        except Exception as exc:  # noqa: BLE001 - log unexpected cleanup errors
+            logger.warning("Upload cleanup failed: %s", exc)
+
+
+async def iter_upload_file(
+    upload: Any, chunk_size: int = UPLOAD_CHUNK_BYTES
+) -> AsyncIterator[bytes]:
+    """Yield a multipart ``UploadFile`` in ``chunk_size`` pieces."""
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write_chunk(fh: Any, digest: Any, chunk: bytes) -> None:
+    fh.write(chunk)
+    digest.update(chunk)
+
+
+async def spool_chunks(
+    chunks: AsyncIterator[bytes],
+    max_bytes: int,
+    suffix: str = "",
+    directory: Optional[str] = None,
+) -> SpooledUpload:
+    """Write ``chunks`` to a temporary file, hashing and size-checking as it goes.
+
+    Args:
+        chunks: Async iterator of byte chunks (request body or upload file).
+        max_bytes: Maximum accepted size; exceeding it aborts the upload.
+        suffix: Suffix of the temporary file (e.g. ``".tflite"``).
+        directory: Directory for the temporary file (system default if None).
+
+    Returns:
+        The spooled upload. The caller owns the file and must ``cleanup()``.
+
+    Raises:
+        UploadTooLargeError: If more than ``max_bytes`` bytes are received.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                # Keep disk writes and hashing off the event loop
+                await asyncio.to_thread(_write_chunk, fh, digest, chunk)
+    except BaseException:
+        Path(path).unlink(missing_ok=True)
+        raise
+    return SpooledUpload(path=path, size_bytes=size, sha256=digest.hexdigest())
+
+
+__all__ = [
+    "SpooledUpload",
+    "UPLOAD_CHUNK_BYTES",
+    "UploadTooLargeError",
+    "iter_upload_file",
+    "spool_chunks",
+]
@@ -2,22 +2,71 @@
 
 Implements strict CLI-API parity for compile, optimize, benchmark, version, and help
 endpoints. Uses existing core modules where possible and provides safe fallbacks.
+Optimize, pipeline and benchmark work runs on a bounded process pool: the
+``/api/jobs/*`` routes return a job to poll, while the classic routes wait for it.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import io
 import json
 import logging
+import math
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, nullcontext
 from datetime import datetime, timezone
+from functools import lru_cache
 from edgeflow.parser import parse_ef  # type: ignore
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 # Import core CLI logic
 import edgeflow.compiler.edgeflowc as edgeflowc  # type: ignore
+from edgeflow.backend.api.services.batch_service import iter_batch
+from edgeflow.backend.api.services.cache_service import ResponseCache, cache_key
+from edgeflow.backend.api.services.job_service import (
+    Job,
+    JobManager,
+    JobStatus,
+    QueueFullError,
+)
+from edgeflow.backend.api.services.metrics_service import (
+    ApiMetrics,
+    MetricsMiddleware,
+    route_label,
+)
+from edgeflow.backend.api.services.model_store import ModelNotFoundError, ModelStore
 from edgeflow.backend.api.services.parser_service import ParserService
+from edgeflow.backend.api.services.rate_limiter import (
+    MemoryRateStore,
+    RateLimiter,
+    RateLimitStore,
+    SQLiteRateStore,
+)
+from edgeflow.backend.api.services.serialization_service import dumps, fast_response
+from edgeflow.backend.api.services.upload_service import (
+    SpooledUpload,
+    UploadTooLargeError,
+    iter_upload_file,
+    spool_chunks,
+)
 from edgeflow.compiler.code_generator import CodeGenerator
 
 # Import EdgeFlow pipeline components
@@ -29,43 +78,103 @@ from edgeflow.ir.edgeflow_ir import (
     SchedulingPass,
 )
 from edgeflow.reporting.explainability_reporter import generate_explainability_report
+from edgeflow.reporting.traceability_system import (
+    ProvenanceTracker,
+    TraceabilityContext,
+    TransformationType,
+)
 from edgeflow.optimization.fast_compile import fast_compile_config
-from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi import (
+    Depends,
+    FastAPI,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from edgeflow.analysis.initial_check import InitialChecker, perform_initial_check
-from pydantic import BaseModel, Field, constr
+from pydantic import BaseModel, Field, constr, model_validator
 from edgeflow.reporting.reporter import generate_json_report  # type: ignore
 
 # ----------------------------------------------------------------------------
-# Rate limiting (simple in-memory token bucket per client IP)
+# Rate limiting (GCRA per client IP, weighted by route cost)
 # ----------------------------------------------------------------------------
 
+# The budget is in cost units, not requests: a client may spend 120 units per
+# minute, e.g. 120 compiles or 30 pipeline runs. Unlisted routes cost 1.
+# Batch routes are charged per item at a tenth of the single-item route: the
+# items share one request, parsed device specs and checker instances, so a
+# rollout batch of several hundred configs fits the budget (see
+# BATCH_MAX_ITEMS).
+RATE_LIMIT_CAPACITY = 120
+ROUTE_COSTS: Mapping[str, float] = {
+    "/api/pipeline": 4,
+    "/api/pipeline/stream": 4,
+    "/api/pipeline/events": 4,
+    "/api/optimize": 4,
+    "/api/optimize/upload": 4,
+    "/api/optimize/raw": 4,
+    "/api/benchmark": 4,
+    "/api/jobs/optimize": 4,
+    "/api/jobs/pipeline": 4,
+    "/api/jobs/benchmark": 4,
+    "/api/fast-compile": 2,
+    "/api/check": 2,
+    "/api/check/upload": 2,
+    "/api/check/raw": 2,
+    "/api/compile/batch": 0.1,
+    "/api/check/batch": 0.2,
+}
+
+
+def _rate_store() -> RateLimitStore:
+    # Point EDGEFLOW_RATE_LIMIT_DB at a file shared by all uvicorn workers so
+    # they enforce one budget instead of capacity x workers.
+    db_path = os.environ.get("EDGEFLOW_RATE_LIMIT_DB")
+    return SQLiteRateStore(db_path) if db_path else MemoryRateStore()
+
+
+rate_limiter = RateLimiter(
+    capacity=RATE_LIMIT_CAPACITY, store=_rate_store(), route_costs=ROUTE_COSTS
+)
 
-class SimpleRateLimiter:
-    def __init__(self, capacity: int = 60) -> None:
-        self.capacity = capacity
-        self.tokens: Dict[str, int] = {}
-        self.window_started: Dict[str, int] = {}
-
-    def __call__(self, request: Request) -> None:
-        # very simple 60 req/min per IP
-        now_minute = int(datetime.now(tz=timezone.utc).timestamp() // 60)
-        ip = request.client.host if request.client else "unknown"
-        if self.window_started.get(ip) != now_minute:
-            self.window_started[ip] = now_minute
-            self.tokens[ip] = self.capacity
-        if self.tokens[ip] <= 0:
-            raise HTTPException(status_code=429, detail="Rate limit exceeded")
-        self.tokens[ip] -= 1
-
-
-rate_limiter = SimpleRateLimiter(capacity=120)
+api_metrics = ApiMetrics()
 
 
 def rate_limit_dep(request: Request) -> None:
     """Dependency wrapper to apply rate limiting using the client IP."""
-    rate_limiter(request)
+    _charge_rate_limit(request)
+
+
+def _charge_rate_limit(request: Request, units: int = 1) -> None:
+    """Charge the client for ``units`` requests to the matched route."""
+    route = route_label(request.scope)
+    ip = request.client.host if request.client else "unknown"
+    cost = rate_limiter.cost_for(route) * units
+    if 0 < rate_limiter.capacity < cost:
+        # Could never be admitted, so a Retry-After would be misleading
+        raise HTTPException(
+            status_code=413,
+            detail=(
+                f"Request costs {cost:g} rate-limit units but at most "
+                f"{rate_limiter.capacity} are allowed per "
+                f"{rate_limiter.period_s:g}s; split it into smaller batches"
+            ),
+        )
+    decision = rate_limiter.check(ip, route, units)
+    if not decision.allowed:
+        api_metrics.rate_limited.inc(route)
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded",
+            headers={"Retry-After": str(max(1, math.ceil(decision.retry_after_s)))},
+        )
 
 
 # ----------------------------------------------------------------------------
@@ -73,9 +182,57 @@ def rate_limit_dep(request: Request) -> None:
 # ----------------------------------------------------------------------------
 
 
+def _require_one(model: BaseModel, inline: str, digest: str) -> None:
+    if (getattr(model, inline) is None) == (getattr(model, digest) is None):
+        raise ValueError(f"Provide exactly one of '{inline}' or '{digest}'")
+
+
+def _required(value: Optional[str], name: str) -> str:
+    """Narrow an optional request field that the handler needs to ``str``."""
+    if value is None:
+        raise HTTPException(status_code=400, detail=f"'{name}' is required")
+    return value
+
+
 class CompileRequest(BaseModel):
     config_file: str = Field(..., description="EdgeFlow config file content")
     filename: constr(strip_whitespace=True, min_length=1)  # type: ignore
+    model_digest: Optional[str] = Field(
+        None, description="SHA-256 of a stored model used as the config's model"
+    )
+
+
+PIPELINE_BACKENDS = ("python", "cpp", "onnx", "tensorrt")
+PIPELINE_SECTIONS = (
+    "ast",
+    "ir_graph",
+    "optimization_passes",
+    "generated_code",
+    "optimization_report",
+    "explainability_report",
+)
+
+
+class PipelineRequest(CompileRequest):
+    backends: Optional[List[Literal["python", "cpp", "onnx", "tensorrt"]]] = Field(
+        None, description="Backends to generate (default: all)"
+    )
+    sections: Optional[
+        List[
+            Literal[
+                "ast",
+                "ir_graph",
+                "optimization_passes",
+                "generated_code",
+                "optimization_report",
+                "explainability_report",
+            ]
+        ]
+    ] = Field(None, description="Response sections to produce (default: all)")
+    ir_format: Literal["dict", "columnar"] = Field(
+        "dict",
+        description="IR graph layout: node dicts, or a node table with edge indices",
+    )
 
 
 class CompileResponse(BaseModel):
@@ -106,19 +263,41 @@ class FastCompileResponse(BaseModel):
 
 
 class OptimizeRequest(BaseModel):
-    model_file: str = Field(..., description="Base64-encoded TFLite model")
+    model_file: Optional[str] = Field(None, description="Base64-encoded TFLite model")
+    model_digest: Optional[str] = Field(None, description="SHA-256 of a stored model")
     config: Dict[str, Any] = Field(default_factory=dict)
 
+    @model_validator(mode="after")
+    def _one_model(self) -> "OptimizeRequest":
+        _require_one(self, "model_file", "model_digest")
+        return self
+
 
 class OptimizeResponse(BaseModel):
     success: bool
-    optimized_model: str
+    optimized_model: Optional[str] = None
+    model_sha256: Optional[str] = None
+    optimization_report: Dict[str, Any]
+
+
+class OptimizeUploadResponse(BaseModel):
+    success: bool
+    model_sha256: str
+    model_size_bytes: int
     optimization_report: Dict[str, Any]
 
 
 class BenchmarkRequest(BaseModel):
-    original_model: str
-    optimized_model: str
+    original_model: Optional[str] = None
+    optimized_model: Optional[str] = None
+    original_digest: Optional[str] = None
+    optimized_digest: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _one_model_each(self) -> "BenchmarkRequest":
+        _require_one(self, "original_model", "original_digest")
+        _require_one(self, "optimized_model", "optimized_digest")
+        return self
 
 
 class Stats(BaseModel):
@@ -138,10 +317,52 @@ class BenchmarkResponse(BaseModel):
 
 
 class CheckRequest(BaseModel):
-    model_path: str
+    model_path: Optional[str] = None
+    model_digest: Optional[str] = None
+    config: Dict[str, Any] = Field(default_factory=dict)
+    device_spec_file: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _one_model(self) -> "CheckRequest":
+        _require_one(self, "model_path", "model_digest")
+        return self
+
+
+# A full check batch costs 500 x 0.2 = 100 of the 120 rate-limit units, so
+# every batch that passes validation can also be admitted by the limiter.
+BATCH_MAX_ITEMS = 500
+
+
+class CompileBatchItem(BaseModel):
+    config_file: str = Field(..., description="EdgeFlow config file content")
+    filename: constr(strip_whitespace=True, min_length=1)  # type: ignore
+
+
+class CompileBatchRequest(BaseModel):
+    items: List[CompileBatchItem] = Field(..., min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+class CheckBatchItem(BaseModel):
+    model_path: Optional[str] = None
+    model_digest: Optional[str] = None
     config: Dict[str, Any] = Field(default_factory=dict)
+    config_file: Optional[str] = Field(
+        None, description="EdgeFlow config content; replaces 'config' when given"
+    )
     device_spec_file: Optional[str] = None
 
+    @model_validator(mode="after")
+    def _one_model(self) -> "CheckBatchItem":
+        _require_one(self, "model_path", "model_digest")
+        return self
+
+
+class CheckBatchRequest(BaseModel):
+    items: List[CheckBatchItem] = Field(..., min_length=1, max_length=BATCH_MAX_ITEMS)
+    device_spec_file: Optional[str] = Field(
+        None, description="Device spec file for items that do not name their own"
+    )
+
 
 class CheckResponse(BaseModel):
     compatible: bool
@@ -151,12 +372,41 @@ class CheckResponse(BaseModel):
     fit_score: float
 
 
+class StoredModelResponse(BaseModel):
+    sha256: str
+    size_bytes: int
+    created_at: float
+    last_access: float
+    created: Optional[bool] = None
+    artifacts: List[str] = []
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    duration_s: Optional[float] = None
+    timeout_s: float
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
 # ----------------------------------------------------------------------------
 # FastAPI setup
 # ----------------------------------------------------------------------------
 
 
-app = FastAPI(title="EdgeFlow API", version="v1")
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    job_manager.shutdown()
+    batch_executor.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(title="EdgeFlow API", version="v1", lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -169,6 +419,68 @@ app.add_middleware(
 
 MAX_BYTES = 100 * 1024 * 1024  # 100MB
 
+# Long-running work (optimize/pipeline/benchmark) runs on a bounded process
+# pool so it cannot starve health checks and cheap compile traffic.
+JOB_WORKERS = 2
+JOB_QUEUE_DEPTH = 16
+JOB_TIMEOUT_S = 300.0
+JOB_MAX_TIMEOUT_S = 3600.0
+
+# Pipeline stage timings recorded inside a job worker process since its
+# previous job; shipped back to this process after every job.
+_worker_stage_snapshot: Dict[Any, Any] = {}
+
+
+def _collect_worker_stage_metrics() -> Dict[Any, Any]:
+    global _worker_stage_snapshot
+    delta = api_metrics.pipeline_stage.delta(_worker_stage_snapshot)
+    _worker_stage_snapshot = api_metrics.pipeline_stage.snapshot()
+    return delta
+
+
+job_manager = JobManager(
+    max_workers=JOB_WORKERS,
+    max_queue=JOB_QUEUE_DEPTH,
+    default_timeout_s=JOB_TIMEOUT_S,
+    collect_metrics=_collect_worker_stage_metrics,
+    merge_metrics=api_metrics.pipeline_stage.merge,
+)
+
+# Batch endpoints fan items out over a shared thread pool; each batch keeps at
+# most BATCH_IN_FLIGHT items submitted so one large batch cannot monopolize it.
+BATCH_WORKERS = min(8, os.cpu_count() or 1)
+BATCH_IN_FLIGHT = 2 * BATCH_WORKERS
+
+batch_executor = ThreadPoolExecutor(
+    max_workers=BATCH_WORKERS, thread_name_prefix="edgeflow-batch"
+)
+
+# Deterministic endpoints (compile, fast-compile, pipeline, check) are memoized
+# by normalized content hash. Point EDGEFLOW_API_CACHE_DIR at a shared
+# directory so several uvicorn workers reuse each other's entries.
+RESPONSE_CACHE_ENTRIES = 256
+RESPONSE_CACHE_TTL_S = 600.0
+
+response_cache = ResponseCache(
+    max_entries=RESPONSE_CACHE_ENTRIES,
+    ttl_s=RESPONSE_CACHE_TTL_S,
+    disk_dir=os.environ.get("EDGEFLOW_API_CACHE_DIR") or None,
+)
+
+# Uploaded models are kept once, addressed by SHA-256, with derived artifacts
+# (optimization reports, benchmarks, pipeline results) stored alongside.
+MODEL_STORE_MAX_BYTES = 5 * 1024**3  # 5GB
+
+# Jobs and streaming responses pin the stored models they read for as long as
+# they run; min_idle_s also spares models opened recently, e.g. uploaded just
+# before a client refers to them.
+model_store = ModelStore(
+    os.environ.get("EDGEFLOW_MODEL_STORE_DIR")
+    or os.path.join(tempfile.gettempdir(), "edgeflow-model-store"),
+    max_bytes=MODEL_STORE_MAX_BYTES,
+    min_idle_s=JOB_TIMEOUT_S,
+)
+
 
 @app.middleware("http")
 async def limit_body_size(request: Request, call_next):  # type: ignore
@@ -178,6 +490,55 @@ async def limit_body_size(request: Request, call_next):  # type: ignore
     return await call_next(request)
 
 
+# Outermost middleware so rejected and failed requests are measured too
+app.add_middleware(MetricsMiddleware, metrics=api_metrics)
+
+
+def _service_samples() -> Any:
+    cache = response_cache.stats()
+    for name in ("hits", "disk_hits", "misses", "evictions", "expirations"):
+        yield (
+            f"edgeflow_response_cache_{name}_total",
+            "counter",
+            f"Response cache {name.replace('_', ' ')}.",
+            {},
+            cache[name],
+        )
+    yield (
+        "edgeflow_response_cache_hit_ratio",
+        "gauge",
+        "Response cache hit ratio.",
+        {},
+        cache["hit_ratio"],
+    )
+    yield (
+        "edgeflow_response_cache_entries",
+        "gauge",
+        "Entries in the in-memory response cache.",
+        {},
+        cache["entries"],
+    )
+    jobs = job_manager.stats()
+    for state in ("queued", "running"):
+        yield (
+            "edgeflow_jobs",
+            "gauge",
+            "Background jobs by state.",
+            {"state": state},
+            jobs[state],
+        )
+    yield (
+        "edgeflow_job_queue_capacity",
+        "gauge",
+        "Maximum number of queued jobs.",
+        {},
+        jobs["max_queue"],
+    )
+
+
+api_metrics.registry.register_collector(_service_samples)
+
+
 def _parse_config_content(filename: str, content: str) -> Dict[str, Any]:
     if not filename.lower().endswith(".ef"):
         raise HTTPException(
@@ -208,6 +569,46 @@ def _parse_config_content(filename: str, content: str) -> Dict[str, Any]:
             logging.getLogger(__name__).warning("Temp cleanup failed: %s", exc)
 
 
+def _cache_lookup(
+    namespace: str, content: str, compute: Any, **params: Any
+) -> Tuple[Any, bool]:
+    """Return ``(value, hit)``; only successful results are stored."""
+    return response_cache.get_or_compute(
+        cache_key(namespace, content, **params),
+        compute,
+        should_store=lambda value: value.get("success", True),
+    )
+
+
+def _cached(
+    response: Response, namespace: str, content: str, compute: Any, **params: Any
+) -> Any:
+    """Serve ``compute()`` from the response cache, tagging ``X-Cache``."""
+    value, found = _cache_lookup(namespace, content, compute, **params)
+    response.headers["X-Cache"] = "HIT" if found else "MISS"
+    return value
+
+
+def _parse_result(content: str) -> Dict[str, Any]:
+    success, cfg, err = ParserService.parse_config_content(content)
+    return {"success": success, "config": cfg, "error": err}
+
+
+def _parsed(content: str) -> Dict[str, Any]:
+    return _cache_lookup("parse", content, lambda: _parse_result(content))[0]
+
+
+def _file_fingerprint(path: Optional[str]) -> Optional[List[int]]:
+    """Size and mtime of ``path`` so cached checks notice file changes."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
 def _b64_size_mb(data_b64: str) -> float:
     try:
         raw = base64.b64decode(data_b64)
@@ -216,6 +617,32 @@ def _b64_size_mb(data_b64: str) -> float:
     return round(len(raw) / (1024 * 1024), 6)
 
 
+def _stored_model(digest: str) -> Any:
+    try:
+        return model_store.get(digest)
+    except ModelNotFoundError as exc:
+        raise HTTPException(status_code=404, detail="Model not found") from exc
+
+
+def _pin_stored(digest: Optional[str]) -> ContextManager[Any]:
+    """Keep a stored model from being evicted while a response still reads it."""
+    return model_store.pinned(digest) if digest is not None else nullcontext()
+
+
+def _stored_size_mb(digest: str) -> float:
+    return round(_stored_model(digest).size_bytes / (1024 * 1024), 6)
+
+
+def _with_artifact(digest: str, name: str, compute: Any) -> Dict[str, Any]:
+    """Return a derived artifact of a stored model, computing it once."""
+    artifact = model_store.get_artifact(digest, name)
+    if artifact is None:
+        artifact = compute()
+        if artifact.get("success", True):
+            model_store.put_artifact(digest, name, artifact)
+    return artifact
+
+
 @app.get("/api/health")
 def health() -> Dict[str, Any]:
     return {"status": "healthy", "timestamp": datetime.now(tz=timezone.utc).isoformat()}
@@ -232,9 +659,31 @@ def help_() -> Dict[str, Any]:
         "POST /api/compile",
         "POST /api/compile/verbose",
         "POST /api/compile/dry-run",
+        "POST /api/compile/batch",
+        "POST /api/check/batch",
         "POST /api/check",
+        "POST /api/pipeline",
+        "POST /api/pipeline/stream",
+        "POST /api/pipeline/events",
         "POST /api/optimize",
+        "POST /api/optimize/upload",
+        "POST /api/optimize/raw",
+        "POST /api/check/upload",
+        "POST /api/check/raw",
         "POST /api/benchmark",
+        "POST /api/jobs/optimize",
+        "POST /api/jobs/pipeline",
+        "POST /api/jobs/benchmark",
+        "GET /api/jobs/{job_id}",
+        "GET /api/jobs/{job_id}/events",
+        "DELETE /api/jobs/{job_id}",
+        "GET /api/cache/stats",
+        "GET /api/metrics",
+        "POST /api/models",
+        "POST /api/models/raw",
+        "GET /api/models",
+        "GET /api/models/{digest}",
+        "DELETE /api/models/{digest}",
         "GET /api/version",
         "GET /api/help",
         "GET /api/health",
@@ -245,15 +694,18 @@ def help_() -> Dict[str, Any]:
 
 @app.post("/api/compile", response_model=CompileResponse)
 def compile_cfg(
-    req: CompileRequest, _: None = Depends(rate_limit_dep)
+    req: CompileRequest, response: Response, _: None = Depends(rate_limit_dep)
 ) -> CompileResponse:
     if not req.filename.lower().endswith(".ef"):
         raise HTTPException(
             status_code=400, detail="Invalid file extension; expected .ef"
         )
-    success, cfg, err = ParserService.parse_config_content(req.config_file)
-    if not success:
-        raise HTTPException(status_code=400, detail=err)
+    parsed = _cached(
+        response, "parse", req.config_file, lambda: _parse_result(req.config_file)
+    )
+    if not parsed["success"]:
+        raise HTTPException(status_code=400, detail=parsed["error"])
+    cfg = parsed["config"]
     return CompileResponse(
         success=True, parsed_config=cfg, message="Parsed successfully"
     )
@@ -287,12 +739,7 @@ def compile_verbose(
         root.setLevel(old_level)
 
 
-@app.post("/api/optimize", response_model=OptimizeResponse)
-def optimize(
-    req: OptimizeRequest, _: None = Depends(rate_limit_dep)
-) -> OptimizeResponse:
-    # Calculate sizes
-    size_mb = _b64_size_mb(req.model_file)
+def _optimization_report(size_mb: float, config: Dict[str, Any]) -> Dict[str, Any]:
     optimized_size_mb = max(size_mb * 0.5, 0.000001)  # Simulated 50% reduction
 
     # Create stats for reporter
@@ -308,39 +755,87 @@ def optimize(
     }
 
     # Generate JSON report using reporter module
-    json_report_str = generate_json_report(
-        unoptimized_stats, optimized_stats, req.config
-    )
+    json_report_str = generate_json_report(unoptimized_stats, optimized_stats, config)
     json_report_dict = json.loads(json_report_str)
 
     # Add quantization and target device info
     report = {
-        "quantize": req.config.get("quantize"),
-        "target_device": req.config.get("target_device"),
-        "optimize_for": req.config.get("optimize_for"),
+        "quantize": config.get("quantize"),
+        "target_device": config.get("target_device"),
+        "optimize_for": config.get("optimize_for"),
         "original_size_mb": size_mb,
         "estimated_size_mb": optimized_size_mb,
         **json_report_dict,  # Include full reporter metrics
     }
+    return report
+
+
+def optimize_payload(model_file: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """``/api/optimize`` body for an inline model, run by ``/api/jobs/optimize``."""
+    report = _optimization_report(_b64_size_mb(model_file), config)
+    optimized_model = model_file  # echo for now
+    return {
+        "success": True,
+        "optimized_model": optimized_model,
+        "optimization_report": report,
+    }
+
 
-    optimized_model = req.model_file  # echo for now
-    return OptimizeResponse(
-        success=True, optimized_model=optimized_model, optimization_report=report
+def optimize_stored_payload(
+    digest: str, size_mb: float, config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """``/api/optimize`` body for a stored model (no model bytes echoed)."""
+    return {
+        "success": True,
+        "model_sha256": digest,
+        "optimization_report": _optimization_report(size_mb, config),
+    }
+
+
+@app.post("/api/optimize", response_model=OptimizeResponse)
+def optimize(
+    req: OptimizeRequest, _: None = Depends(rate_limit_dep)
+) -> OptimizeResponse:
+    """Optimize a model; the report is computed on the job pool."""
+    if req.model_digest is None:
+        model_file = _required(req.model_file, "model_file")
+        size_mb = _b64_size_mb(model_file)
+        report = _run_job("optimize", _optimization_report, size_mb, req.config)
+        return OptimizeResponse(
+            success=True, optimized_model=model_file, optimization_report=report
+        )
+    digest, config = req.model_digest, req.config
+    size_mb = _stored_size_mb(digest)
+    result = _with_artifact(
+        digest,
+        f"optimize-{cache_key('optimize', config=config)}.json",
+        lambda: _run_job(
+            "optimize",
+            optimize_stored_payload,
+            digest,
+            size_mb,
+            config,
+            digests=[digest],
+        ),
     )
+    return OptimizeResponse(**result)
 
 
 @app.post("/api/compile/dry-run", response_model=CompileResponse)
 def compile_dry_run(
-    req: CompileRequest, _: None = Depends(rate_limit_dep)
+    req: CompileRequest, response: Response, _: None = Depends(rate_limit_dep)
 ) -> CompileResponse:
     """Parse-only endpoint to satisfy CLI-API parity for --dry-run."""
     if not req.filename.lower().endswith(".ef"):
         raise HTTPException(
             status_code=400, detail="Invalid file extension; expected .ef"
         )
-    success, cfg, err = ParserService.parse_config_content(req.config_file)
-    if not success:
-        raise HTTPException(status_code=400, detail=err)
+    parsed = _cached(
+        response, "parse", req.config_file, lambda: _parse_result(req.config_file)
+    )
+    if not parsed["success"]:
+        raise HTTPException(status_code=400, detail=parsed["error"])
+    cfg = parsed["config"]
     return CompileResponse(
         success=True,
         parsed_config=cfg,
@@ -350,11 +845,41 @@ def compile_dry_run(
 
 @app.post("/api/check", response_model=CheckResponse)
 def check_compatibility_api(
-    req: CheckRequest, _: None = Depends(rate_limit_dep)
+    req: CheckRequest, response: Response, _: None = Depends(rate_limit_dep)
 ) -> CheckResponse:
+    if req.model_digest is not None:
+        model_path = _stored_model(req.model_digest).path
+    else:
+        model_path = _required(req.model_path, "model_path")
     try:
+        result, found = _check_lookup(model_path, req.config, req.device_spec_file)
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    response.headers["X-Cache"] = "HIT" if found else "MISS"
+    return CheckResponse(**result)
+
+
+@lru_cache(maxsize=16)
+def _initial_checker(
+    device_spec_file: Optional[str], fingerprint: Optional[Tuple[int, ...]]
+) -> InitialChecker:
+    # Parsed device specs are read-only, so one checker per spec file version
+    # is shared by every request and batch worker.
+    return InitialChecker(device_spec_file)
+
+
+def _check_lookup(
+    model_path: str, config: Dict[str, Any], device_spec_file: Optional[str]
+) -> Tuple[Dict[str, Any], bool]:
+    """Run (or recall) a compatibility check; returns ``(body, cache_hit)``."""
+    spec_fingerprint = _file_fingerprint(device_spec_file)
+
+    def compute() -> Dict[str, Any]:
+        checker = _initial_checker(
+            device_spec_file, tuple(spec_fingerprint) if spec_fingerprint else None
+        )
         should_opt, report = perform_initial_check(
-            req.model_path, req.config, req.device_spec_file
+            model_path, config, device_spec_file, checker=checker
         )
         return CheckResponse(
             compatible=report.compatible,
@@ -362,9 +887,143 @@ def check_compatibility_api(
             issues=report.issues,
             recommendations=report.recommendations,
             fit_score=report.estimated_fit_score,
-        )
-    except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+        ).model_dump()
+
+    return _cache_lookup(
+        "check",
+        "",
+        compute,
+        model_path=model_path,
+        model=_file_fingerprint(model_path),
+        config=config,
+        device_spec_file=device_spec_file,
+        device_spec=spec_fingerprint,
+    )
+
+
+def _compile_batch_item(item: CompileBatchItem) -> Dict[str, Any]:
+    if not item.filename.lower().endswith(".ef"):
+        return {"success": False, "error": "Invalid file extension; expected .ef"}
+    parsed = _parsed(item.config_file)
+    if not parsed["success"]:
+        return {"success": False, "error": parsed["error"]}
+    return {"success": True, "parsed_config": parsed["config"]}
+
+
+def _check_batch_item(
+    item: CheckBatchItem, default_spec_file: Optional[str]
+) -> Dict[str, Any]:
+    if item.model_digest is not None:
+        model_path = model_store.get(item.model_digest).path
+    else:
+        model_path = _required(item.model_path, "model_path")
+    config = item.config
+    if item.config_file is not None:
+        parsed = _parsed(item.config_file)
+        if not parsed["success"]:
+            return {"success": False, "error": parsed["error"]}
+        config = parsed["config"]
+    body, _ = _check_lookup(
+        model_path, config, item.device_spec_file or default_spec_file
+    )
+    return {"success": True, **body}
+
+
+def _batch_lines(
+    func: Any, items: List[Any], extra: Optional[Any] = None
+) -> Iterator[str]:
+    """NDJSON lines: one ``result`` per item (completion order), then ``done``."""
+    failed = 0
+    for index, result, error in iter_batch(
+        batch_executor, func, items, BATCH_IN_FLIGHT
+    ):
+        if error is not None:
+            detail = "Model not found" if isinstance(error, KeyError) else str(error)
+            result = {"success": False, "error": detail}
+        failed += not result["success"]
+        line = {"event": "result", "index": index, **(extra(index) if extra else {})}
+        line.update(result)
+        yield json.dumps(line, default=str) + "\n"
+    done = {"event": "done", "total": len(items), "failed": failed}
+    yield json.dumps(done) + "\n"
+
+
+@app.post("/api/compile/batch")
+def compile_batch(req: CompileBatchRequest, request: Request) -> StreamingResponse:
+    """Parse and validate many configs, streaming one NDJSON line per config.
+
+    Lines arrive in completion order and carry the item's ``index``; a final
+    ``done`` line reports the totals. Items never fail the whole request.
+    The rate limit is charged per item before streaming starts.
+    """
+    items = req.items
+    _charge_rate_limit(request, len(items))
+    return StreamingResponse(
+        _batch_lines(
+            _compile_batch_item, items, lambda i: {"filename": items[i].filename}
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.post("/api/check/batch")
+def check_batch(req: CheckBatchRequest, request: Request) -> StreamingResponse:
+    """Run many compatibility checks, streaming one NDJSON line per item.
+
+    Device spec files are parsed once and shared by every item and worker.
+    The rate limit is charged per item before streaming starts.
+    """
+    _charge_rate_limit(request, len(req.items))
+    spec_file = req.device_spec_file
+    return StreamingResponse(
+        _batch_lines(lambda item: _check_batch_item(item, spec_file), req.items),
+        media_type="application/x-ndjson",
+    )
+
+
+def _json_form(value: str) -> Dict[str, Any]:
+    try:
+        parsed = json.loads(value)
+    except Exception:  # noqa: BLE001
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+async def _spool(
+    chunks: Any, filename: Optional[str], directory: Optional[str] = None
+) -> SpooledUpload:
+    """Spool an upload stream to disk, mapping oversize uploads to 413."""
+    suffix = Path(filename or "model").suffix
+    try:
+        return await spool_chunks(chunks, MAX_BYTES, suffix=suffix, directory=directory)
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=413, detail="Payload too large") from exc
+
+
+def _check_spooled(
+    upload: SpooledUpload, cfg: Dict[str, Any], device_spec_file: Optional[str]
+) -> CheckResponse:
+    checker = InitialChecker(device_spec_file)
+    target = str(cfg.get("target_device") or cfg.get("device") or "generic")
+    report = checker.check_compatibility(upload.path, target, cfg)
+    return CheckResponse(
+        compatible=report.compatible,
+        requires_optimization=report.requires_optimization,
+        issues=report.issues,
+        recommendations=report.recommendations,
+        fit_score=report.estimated_fit_score,
+    )
+
+
+def _optimize_spooled(
+    upload: SpooledUpload, cfg: Dict[str, Any]
+) -> OptimizeUploadResponse:
+    return OptimizeUploadResponse(
+        success=True,
+        model_sha256=upload.sha256,
+        model_size_bytes=upload.size_bytes,
+        optimization_report=_optimization_report(upload.size_mb, cfg),
+    )
 
 
 @app.post("/api/check/upload", response_model=CheckResponse)
@@ -374,210 +1033,565 @@ async def check_uploaded_model_api(
     device_spec_file: Optional[str] = Form(None),
     _: None = Depends(rate_limit_dep),
 ) -> CheckResponse:
-    import json as _json
-    import tempfile
+    # Spool the upload in chunks and profile it by path
+    upload = await _spool(iter_upload_file(model), model.filename)
+    try:
+        return await run_in_threadpool(
+            _check_spooled, upload, _json_form(config), device_spec_file
+        )
+    finally:
+        upload.cleanup()
+
 
+@app.post("/api/check/raw", response_model=CheckResponse)
+async def check_raw_model_api(
+    request: Request,
+    filename: str = Query("model.tflite"),
+    config: str = Query("{}"),
+    device_spec_file: Optional[str] = Query(None),
+    _: None = Depends(rate_limit_dep),
+) -> CheckResponse:
+    """Check a model sent as the raw (optionally chunked) request body."""
+    upload = await _spool(request.stream(), filename)
     try:
-        cfg = _json.loads(config)
-    except Exception:  # noqa: BLE001
-        cfg = {}
-    # Persist the uploaded file temporarily for profiling by path
-    suffix = Path(model.filename or "model").suffix
-    with tempfile.NamedTemporaryFile(
-        "wb", suffix=suffix, delete=True
-    ) as tmp:  # type: ignore[attr-defined]
-        content = await model.read()
-        tmp.write(content)
-        tmp.flush()
-        checker = InitialChecker(device_spec_file)
-        target = str(cfg.get("target_device") or cfg.get("device") or "generic")
-        report = checker.check_compatibility(tmp.name, target, cfg)
-        return CheckResponse(
-            compatible=report.compatible,
-            requires_optimization=report.requires_optimization,
-            issues=report.issues,
-            recommendations=report.recommendations,
-            fit_score=report.estimated_fit_score,
+        return await run_in_threadpool(
+            _check_spooled, upload, _json_form(config), device_spec_file
         )
+    finally:
+        upload.cleanup()
 
 
-@app.post("/api/pipeline", response_model=PipelineResponse)
-def run_full_pipeline(
-    req: CompileRequest, _: None = Depends(rate_limit_dep)
-) -> PipelineResponse:
-    """Run full EdgeFlow pipeline.
+@app.post("/api/optimize/upload", response_model=OptimizeUploadResponse)
+async def optimize_uploaded_model_api(
+    model: UploadFile = File(...),
+    config: str = Form("{}"),
+    _: None = Depends(rate_limit_dep),
+) -> OptimizeUploadResponse:
+    """Multipart variant of ``/api/optimize`` that never base64-encodes the model."""
+    upload = await _spool(iter_upload_file(model), model.filename)
+    try:
+        return await run_in_threadpool(_optimize_spooled, upload, _json_form(config))
+    finally:
+        upload.cleanup()
+
+
+@app.post("/api/optimize/raw", response_model=OptimizeUploadResponse)
+async def optimize_raw_model_api(
+    request: Request,
+    filename: str = Query("model.tflite"),
+    config: str = Query("{}"),
+    _: None = Depends(rate_limit_dep),
+) -> OptimizeUploadResponse:
+    """Raw-body (``application/octet-stream``) variant of ``/api/optimize``."""
+    upload = await _spool(request.stream(), filename)
+    try:
+        return await run_in_threadpool(_optimize_spooled, upload, _json_form(config))
+    finally:
+        upload.cleanup()
+
+
+class _Untraced:
+    """Stand-in for ``TraceabilityContext`` when a run has no tracker."""
+
+    def __enter__(self) -> "_Untraced":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def add_metric(self, name: str, value: float) -> None:
+        pass
+
 
-    Steps: parse -> AST -> IR -> optimization -> code generation.
+_UNTRACED = _Untraced()
+
+
+def _trace(
+    tracker: Optional[ProvenanceTracker],
+    transformation_type: TransformationType,
+    description: str,
+    **parameters: Any,
+) -> Any:
+    if tracker is None:
+        return _UNTRACED
+    return TraceabilityContext(
+        tracker, transformation_type, "api_pipeline", description, None, parameters
+    )
+
+
+def _graph_metrics(ctx: Any, prefix: str, ir_graph: Any) -> None:
+    ctx.add_metric(f"{prefix}nodes", len(ir_graph.nodes))
+    ctx.add_metric(f"{prefix}edges", len(ir_graph.edges))
+
+
+def iter_pipeline(
+    filename: str,
+    config_file: str,
+    model_path: Optional[str] = None,
+    backends: Optional[List[str]] = None,
+    sections: Optional[List[str]] = None,
+    ir_format: str = "dict",
+    tracker: Optional[ProvenanceTracker] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Run the EdgeFlow pipeline lazily, yielding results as they are ready.
+
+    Steps: parse -> AST -> IR -> optimization -> code generation -> reports.
+    Only the requested ``sections`` (default: all) and ``backends`` (default:
+    all) are produced; everything else is skipped. When ``model_path`` is given
+    it replaces the ``model`` named in the config. ``ir_format="columnar"``
+    returns the IR section as ``IRGraph.to_columnar()``. When a ``tracker`` is given,
+    every stage and optimization pass is recorded on it as a transformation
+    (with node/edge counts before and after) and each generated backend is
+    registered as an artifact, so its listeners see progress as it happens.
+
+    Yields:
+        Events: ``{"event": "section", "name", "data"}`` per report section,
+        ``{"event": "backend", "name", "code"}`` per generated backend, then
+        ``{"event": "done", "message"}`` or ``{"event": "error", "errors"}``.
     """
+    wanted = set(sections or PIPELINE_SECTIONS)
+    targets = list(backends or PIPELINE_BACKENDS) if "generated_code" in wanted else []
     try:
-        if not req.filename.lower().endswith(".ef"):
+        if not filename.lower().endswith(".ef"):
             raise HTTPException(
                 status_code=400, detail="Invalid file extension; expected .ef"
             )
 
+        clock = api_metrics.stage_clock("pipeline")
+
         # Step 1: Parse configuration
-        success, cfg, err = ParserService.parse_config_content(req.config_file)
+        with _trace(tracker, TransformationType.PARSING, "Parse configuration"):
+            success, cfg, err = ParserService.parse_config_content(config_file)
+        clock.lap("parse")
         if not success:
-            return PipelineResponse(success=False, errors=[err])
+            yield {"event": "error", "errors": [err]}
+            return
+        if model_path is not None:
+            cfg["model"] = model_path
 
         # Step 2: Build AST
-        ast = create_program_from_dict(cfg)
+        with _trace(tracker, TransformationType.PARSING, "Build AST"):
+            ast = create_program_from_dict(cfg)
+        clock.lap("ast")
+        if "ast" in wanted:
+            yield {"event": "section", "name": "ast", "data": ast.to_dict()}
 
         # Step 3: Build IR Graph
-        ir_builder = IRBuilder()
-        ir_graph = ir_builder.build_from_config(cfg)
+        with _trace(tracker, TransformationType.PARSING, "Build IR graph") as ctx:
+            ir_builder = IRBuilder()
+            ir_graph = ir_builder.build_from_config(cfg)
+            _graph_metrics(ctx, "", ir_graph)
+        clock.lap("ir")
 
         # Step 4: Apply optimization passes
         optimization_passes = []
-
-        # Quantization Pass
+        passes: List[Any] = []
         if "quantize" in cfg and cfg["quantize"] != "none":
-            quantize_pass = QuantizationPass()
-            ir_graph = quantize_pass.transform(ir_graph)
-            optimization_passes.append(
-                {
-                    "name": "QuantizationPass",
-                    "description": f"Applied {cfg['quantize']} quantization",
-                    "nodes_added": 1,
-                }
+            passes.append(
+                (
+                    QuantizationPass(),
+                    TransformationType.QUANTIZATION,
+                    f"Applied {cfg['quantize']} quantization",
+                )
             )
-
-        # Fusion Pass
         if cfg.get("enable_fusion", False):
-            fusion_pass = FusionPass()
-            ir_graph = fusion_pass.transform(ir_graph)
+            passes.append(
+                (
+                    FusionPass(),
+                    TransformationType.FUSION,
+                    "Fused operations for efficiency",
+                )
+            )
+        passes.append(
+            (
+                SchedulingPass(),
+                TransformationType.SCHEDULING,
+                "Optimized execution schedule",
+            )
+        )
+        for ir_pass, transformation_type, description in passes:
+            name = type(ir_pass).__name__
+            with _trace(tracker, transformation_type, name) as ctx:
+                _graph_metrics(ctx, "before_", ir_graph)
+                ir_graph = ir_pass.transform(ir_graph)
+                _graph_metrics(ctx, "after_", ir_graph)
             optimization_passes.append(
-                {
-                    "name": "FusionPass",
-                    "description": "Fused operations for efficiency",
-                    "nodes_added": 1,
-                }
+                {"name": name, "description": description, "nodes_added": 1}
             )
-
-        # Scheduling Pass
-        schedule_pass = SchedulingPass()
-        ir_graph = schedule_pass.transform(ir_graph)
-        optimization_passes.append(
-            {
-                "name": "SchedulingPass",
-                "description": "Optimized execution schedule",
-                "nodes_added": 1,
+        clock.lap("optimization_passes")
+
+        columnar = ir_format == "columnar"
+        ir_dict: Optional[Dict[str, Any]] = None
+        if ("ir_graph" in wanted and not columnar) or (
+            "explainability_report" in wanted
+        ):
+            ir_dict = ir_graph.to_dict()
+        if "ir_graph" in wanted:
+            ir_data = ir_graph.to_columnar() if columnar else ir_dict
+            yield {"event": "section", "name": "ir_graph", "data": ir_data}
+        if "optimization_passes" in wanted:
+            yield {
+                "event": "section",
+                "name": "optimization_passes",
+                "data": optimization_passes,
             }
-        )
 
-        # Step 5: Generate code
-        code_generator = CodeGenerator(ast, ir_graph)
-        generated_code = {
-            "python": code_generator.generate_ir_based_code("python"),
-            "cpp": code_generator.generate_ir_based_code("cpp"),
-            "onnx": code_generator.generate_ir_based_code("onnx"),
-            "tensorrt": code_generator.generate_ir_based_code("tensorrt"),
-        }
+        # Step 5: Generate code for the requested backends only
+        if targets:
+            code_generator = CodeGenerator(ast, ir_graph)
+            for backend in targets:
+                with _trace(
+                    tracker,
+                    TransformationType.CODE_GENERATION,
+                    f"Generate {backend} code",
+                    backend=backend,
+                ) as ctx:
+                    code = code_generator.generate_ir_based_code(backend)
+                    ctx.add_metric("code_bytes", len(code))
+                    if tracker is not None:
+                        ctx.add_output_artifact(
+                            tracker.register_artifact(
+                                f"generated_{backend}",
+                                "code",
+                                metadata={"backend": backend, "code_bytes": len(code)},
+                                created_by="api_pipeline",
+                            )
+                        )
+                clock.lap(f"code_generation.{backend}")
+                yield {"event": "backend", "name": backend, "code": code}
 
         # Step 6: Generate reports
-        optimization_report = {
-            "quantize": cfg.get("quantize"),
-            "target_device": cfg.get("target_device"),
-            "optimize_for": cfg.get("optimize_for"),
-            "optimization_passes_applied": len(optimization_passes),
-            "generated_backends": list(generated_code.keys()),
-        }
+        if "optimization_report" in wanted:
+            optimization_report = {
+                "quantize": cfg.get("quantize"),
+                "target_device": cfg.get("target_device"),
+                "optimize_for": cfg.get("optimize_for"),
+                "optimization_passes_applied": len(optimization_passes),
+                "generated_backends": targets,
+            }
+            yield {
+                "event": "section",
+                "name": "optimization_report",
+                "data": optimization_report,
+            }
 
-        # Prepare IR data for explainability report
-        ir_dict = ir_graph.to_dict()
-        ir_transformations = {
-            "passes_applied": len(optimization_passes),
-            "transformations": [pass_info["name"] for pass_info in optimization_passes],
-            "nodes": len(ir_dict["nodes"]),
-            "edges": len(ir_dict["edges"]),
-            "is_valid": True,
-            "execution_order": ir_dict["execution_order"],
-            "node_types": {},
-        }
+        if "explainability_report" in wanted:
+            if ir_dict is None:  # built above whenever this section is wanted
+                raise RuntimeError("IR graph was not serialized for the report")
+            # Prepare IR data for explainability report
+            ir_transformations = {
+                "passes_applied": len(optimization_passes),
+                "transformations": [
+                    pass_info["name"] for pass_info in optimization_passes
+                ],
+                "nodes": len(ir_dict["nodes"]),
+                "edges": len(ir_dict["edges"]),
+                "is_valid": True,
+                "execution_order": ir_dict["execution_order"],
+                "node_types": {},
+            }
+
+            # Count node types
+            for node in ir_dict["nodes"]:
+                node_type = node["node_type"]
+                ir_transformations["node_types"][node_type] = (
+                    ir_transformations["node_types"].get(node_type, 0) + 1
+                )
+
+            # Prepare optimization results for explainability report
+            optimization_results = {
+                "optimizations_applied": [
+                    str(pass_info["name"]).lower().replace("pass", "")
+                    for pass_info in optimization_passes
+                ],
+                "optimization_passes": optimization_passes,
+            }
 
-        # Count node types
-        for node in ir_dict["nodes"]:
-            node_type = node["node_type"]
-            ir_transformations["node_types"][node_type] = (
-                ir_transformations["node_types"].get(node_type, 0) + 1
+            explainability_report = generate_explainability_report(
+                cfg,
+                optimization_results,
+                ir_transformations,
+                {"estimated_impact": {"size_reduction": 0.3, "speedup": 1.5}},
             )
+            clock.lap("reports")
+            yield {
+                "event": "section",
+                "name": "explainability_report",
+                "data": explainability_report,
+            }
+
+        yield {"event": "done", "message": "Pipeline executed successfully"}
 
-        # Prepare optimization results for explainability report
-        optimization_results = {
-            "optimizations_applied": [
-                str(pass_info["name"]).lower().replace("pass", "")
-                for pass_info in optimization_passes
-            ],
-            "optimization_passes": optimization_passes,
+    except Exception as e:
+        yield {
+            "event": "error",
+            "errors": [f"Pipeline execution failed: {str(e)}"],
         }
 
-        explainability_report = generate_explainability_report(
-            cfg,
-            optimization_results,
-            ir_transformations,
-            {"estimated_impact": {"size_reduction": 0.3, "speedup": 1.5}},
-        )
 
-        return PipelineResponse(
-            success=True,
-            ast=ast.to_dict(),
-            ir_graph=ir_graph.to_dict(),
-            optimization_passes=optimization_passes,
-            generated_code=generated_code,
-            optimization_report=optimization_report,
-            explainability_report=explainability_report,
-            message="Pipeline executed successfully",
-        )
+def pipeline_payload(
+    filename: str,
+    config_file: str,
+    model_path: Optional[str] = None,
+    backends: Optional[List[str]] = None,
+    sections: Optional[List[str]] = None,
+    ir_format: str = "dict",
+) -> Dict[str, Any]:
+    """Run the pipeline and assemble the ``/api/pipeline`` response body."""
+    result: Dict[str, Any] = {"success": False}
+    for event in iter_pipeline(
+        filename, config_file, model_path, backends, sections, ir_format
+    ):
+        kind = event["event"]
+        if kind == "section":
+            result[event["name"]] = event["data"]
+        elif kind == "backend":
+            result.setdefault("generated_code", {})[event["name"]] = event["code"]
+        elif kind == "done":
+            result["success"] = True
+            result["message"] = event["message"]
+        else:
+            return {"success": False, "errors": event["errors"]}
+    return result
+
+
+def _pipeline_options(req: "PipelineRequest") -> Dict[str, Any]:
+    # Canonical order keeps cache keys stable and output order predictable
+    return {
+        "backends": (
+            [b for b in PIPELINE_BACKENDS if b in req.backends]
+            if req.backends
+            else None
+        ),
+        "sections": (
+            [x for x in PIPELINE_SECTIONS if x in req.sections]
+            if req.sections
+            else None
+        ),
+        "ir_format": req.ir_format,
+    }
 
-    except Exception as e:
-        return PipelineResponse(
-            success=False, errors=[f"Pipeline execution failed: {str(e)}"]
+
+@app.post("/api/pipeline", response_model=PipelineResponse)
+def run_full_pipeline(
+    req: PipelineRequest,
+    request: Request,
+    response: Response,
+    _: None = Depends(rate_limit_dep),
+) -> Response:
+    """Run full EdgeFlow pipeline.
+
+    Steps: parse -> AST -> IR -> optimization -> code generation. ``backends``
+    and ``sections`` restrict what is generated and returned.
+
+    Cache misses run on the job pool, as ``/api/jobs/pipeline`` does. The
+    body is encoded directly (orjson, or msgpack via ``Accept``) without
+    re-validating it through ``PipelineResponse``, and compressed according
+    to ``Accept-Encoding``.
+    """
+    digest = req.model_digest
+    model_path = _stored_model(digest).path if digest is not None else None
+    options = _pipeline_options(req)
+
+    def run() -> Dict[str, Any]:
+        return _run_job(
+            "pipeline",
+            pipeline_payload,
+            req.filename,
+            req.config_file,
+            model_path,
+            options["backends"],
+            options["sections"],
+            options["ir_format"],
+            digests=[digest],
         )
 
+    def compute() -> Dict[str, Any]:
+        if digest is None:
+            return run()
+        artifact_key = cache_key("pipeline", req.config_file, **options)
+        return _with_artifact(digest, f"pipeline-{artifact_key}.json", run)
+
+    result = _cached(
+        response,
+        "pipeline",
+        req.config_file,
+        compute,
+        filename_is_ef=req.filename.lower().endswith(".ef"),
+        model_digest=digest,
+        **options,
+    )
+    body = {name: result.get(name) for name in PipelineResponse.model_fields}
+    return fast_response(
+        body, request.headers, headers={"X-Cache": response.headers["X-Cache"]}
+    )
+
 
-@app.post("/api/fast-compile", response_model=FastCompileResponse)
-def fast_compile(
-    req: CompileRequest, _: None = Depends(rate_limit_dep)
-) -> FastCompileResponse:
-    """Fast compile with estimated impact analysis."""
+@app.post("/api/pipeline/stream")
+def stream_pipeline(
+    req: PipelineRequest, _: None = Depends(rate_limit_dep)
+) -> StreamingResponse:
+    """Stream pipeline results as NDJSON, one line per section or backend."""
+    model_path = None
+    if req.model_digest is not None:
+        model_path = _stored_model(req.model_digest).path
+    options = _pipeline_options(req)
+
+    def lines() -> Iterator[bytes]:
+        with _pin_stored(req.model_digest):
+            for event in iter_pipeline(
+                req.filename, req.config_file, model_path, **options
+            ):
+                yield dumps(event) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+# Tracker notification kinds as server-sent event names
+_PROGRESS_EVENTS = {"start": "stage_start", "end": "stage_end"}
+
+
+async def _pipeline_progress(
+    filename: str,
+    config_file: str,
+    model_path: Optional[str],
+    options: Dict[str, Any],
+) -> AsyncIterator[Any]:
+    """Run the pipeline on a worker thread, yielding ``(event, data)`` live.
+
+    Trace notifications from the run's own tracker (stage start/end with
+    per-pass statistics, registered artifacts) are interleaved with the
+    pipeline's section/backend results in the order they happen.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    tracker = ProvenanceTracker()
+
+    def emit(kind: Optional[str], data: Any) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, (kind, data))
+
+    tracker.add_listener(
+        lambda kind, data: emit(_PROGRESS_EVENTS.get(kind, kind), data)
+    )
+
+    def produce() -> None:
+        try:
+            for event in iter_pipeline(
+                filename, config_file, model_path, tracker=tracker, **options
+            ):
+                emit(event.pop("event"), event)
+                if stop.is_set():  # client went away
+                    break
+        finally:
+            emit(None, None)
+
+    threading.Thread(target=produce, name="pipeline-progress", daemon=True).start()
     try:
-        if not req.filename.lower().endswith(".ef"):
+        while True:
+            kind, data = await queue.get()
+            if kind is None:
+                return
+            yield kind, data
+    finally:
+        stop.set()
+
+
+@app.post("/api/pipeline/events")
+async def pipeline_events(
+    req: PipelineRequest, _: None = Depends(rate_limit_dep)
+) -> StreamingResponse:
+    """Stream live pipeline progress as server-sent events.
+
+    Events: ``stage_start``/``stage_end`` per stage and optimization pass,
+    ``artifact`` per registered artifact, ``section``/``backend`` results as
+    they are produced, then ``done`` or ``error``.
+    """
+    model_path = None
+    if req.model_digest is not None:
+        model_path = _stored_model(req.model_digest).path
+    options = _pipeline_options(req)
+
+    async def events() -> AsyncIterator[str]:
+        seq = 0
+        with _pin_stored(req.model_digest):
+            async for kind, data in _pipeline_progress(
+                req.filename, req.config_file, model_path, options
+            ):
+                seq += 1
+                payload = json.dumps(data, default=str)
+                yield f"id: {seq}\nevent: {kind}\ndata: {payload}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def fast_compile_payload(filename: str, config_file: str) -> Dict[str, Any]:
+    """Compute the ``/api/fast-compile`` response body."""
+    try:
+        if not filename.lower().endswith(".ef"):
             raise HTTPException(
                 status_code=400, detail="Invalid file extension; expected .ef"
             )
 
+        clock = api_metrics.stage_clock("fast-compile")
+
         # Parse configuration
-        success, cfg, err = ParserService.parse_config_content(req.config_file)
+        success, cfg, err = ParserService.parse_config_content(config_file)
+        clock.lap("parse")
         if not success:
-            return FastCompileResponse(success=False, message=err)
+            return {"success": False, "message": err}
 
         # Run fast compile
         result = fast_compile_config(cfg)
+        clock.lap("fast_compile")
 
-        return FastCompileResponse(
-            success=True,
-            estimated_impact=(
+        return {
+            "success": True,
+            "estimated_impact": (
                 result.performance_metrics.to_dict()
                 if result.performance_metrics
                 else None
             ),
-            validation_results={"errors": result.errors, "warnings": result.warnings},
-            message="Fast compile completed successfully",
-            warnings=result.warnings,
-        )
+            "validation_results": {
+                "errors": result.errors,
+                "warnings": result.warnings,
+            },
+            "message": "Fast compile completed successfully",
+            "warnings": result.warnings,
+        }
 
     except Exception as e:
-        return FastCompileResponse(
-            success=False, message=f"Fast compile failed: {str(e)}"
-        )
+        return {"success": False, "message": f"Fast compile failed: {str(e)}"}
 
 
-@app.post("/api/benchmark", response_model=BenchmarkResponse)
-def benchmark(
-    req: BenchmarkRequest, _: None = Depends(rate_limit_dep)
-) -> BenchmarkResponse:
-    orig_size = _b64_size_mb(req.original_model)
-    opt_size = _b64_size_mb(req.optimized_model)
+@app.post("/api/fast-compile", response_model=FastCompileResponse)
+def fast_compile(
+    req: CompileRequest, response: Response, _: None = Depends(rate_limit_dep)
+) -> FastCompileResponse:
+    """Fast compile with estimated impact analysis."""
+    result = _cached(
+        response,
+        "fast-compile",
+        req.config_file,
+        lambda: fast_compile_payload(req.filename, req.config_file),
+        filename_is_ef=req.filename.lower().endswith(".ef"),
+    )
+    return FastCompileResponse(**result)
+
+
+def benchmark_payload(original_model: str, optimized_model: str) -> Dict[str, Any]:
+    """``/api/benchmark`` body for inline models, run by ``/api/jobs/benchmark``."""
+    return benchmark_sizes_payload(
+        _b64_size_mb(original_model), _b64_size_mb(optimized_model)
+    )
+
+
+def benchmark_sizes_payload(orig_size: float, opt_size: float) -> Dict[str, Any]:
+    """``/api/benchmark`` body from model sizes in MB."""
     # Simple synthetic latencies: proportional to size
     orig_latency = round(max(1.0, orig_size * 10.0), 3)
     opt_latency = round(max(0.5, opt_size * 8.0), 3)
@@ -585,13 +1599,339 @@ def benchmark(
         round((orig_size - opt_size) / max(orig_size, 1e-9), 6) if orig_size else 0.0
     )
     speedup = round(orig_latency / max(opt_latency, 1e-9), 6)
-    return BenchmarkResponse(
-        original_stats=Stats(size_mb=orig_size, latency_ms=orig_latency),
-        optimized_stats=Stats(size_mb=opt_size, latency_ms=opt_latency),
-        improvement=Improvement(size_reduction=size_reduction, speedup=speedup),
+    return {
+        "original_stats": {"size_mb": orig_size, "latency_ms": orig_latency},
+        "optimized_stats": {"size_mb": opt_size, "latency_ms": opt_latency},
+        "improvement": {"size_reduction": size_reduction, "speedup": speedup},
+    }
+
+
+@app.post("/api/benchmark", response_model=BenchmarkResponse)
+def benchmark(
+    req: BenchmarkRequest, _: None = Depends(rate_limit_dep)
+) -> BenchmarkResponse:
+    """Benchmark two models; the comparison runs on the job pool."""
+    orig_size, opt_size = _benchmark_sizes(req)
+    digests = [req.original_digest, req.optimized_digest]
+
+    def run() -> Dict[str, Any]:
+        return _run_job(
+            "benchmark", benchmark_sizes_payload, orig_size, opt_size, digests=digests
+        )
+
+    if req.original_digest is None or req.optimized_digest is None:
+        return BenchmarkResponse(**run())
+    result = _with_artifact(
+        req.original_digest, f"benchmark-{req.optimized_digest}.json", run
+    )
+    return BenchmarkResponse(**result)
+
+
+def _benchmark_sizes(req: BenchmarkRequest) -> Tuple[float, float]:
+    """Sizes in MB of both benchmarked models, stored or inline."""
+    orig_size = (
+        _stored_size_mb(req.original_digest)
+        if req.original_digest is not None
+        else _b64_size_mb(_required(req.original_model, "original_model"))
+    )
+    opt_size = (
+        _stored_size_mb(req.optimized_digest)
+        if req.optimized_digest is not None
+        else _b64_size_mb(_required(req.optimized_model, "optimized_model"))
+    )
+    return orig_size, opt_size
+
+
+# ----------------------------------------------------------------------------
+# Background jobs
+# ----------------------------------------------------------------------------
+
+
+def _enqueue_job(
+    kind: str,
+    func: Any,
+    *args: Any,
+    timeout_s: Optional[float] = None,
+    digests: Iterable[Optional[str]] = (),
+) -> Job:
+    """Queue a job; stored models named by ``digests`` stay pinned until the
+    job finishes, however long it waits in the queue or runs."""
+    pins: List[str] = []
+
+    def release(_job: Any = None) -> None:
+        for digest in pins:
+            model_store.unpin(digest)
+
+    try:
+        for digest in digests:
+            if digest is not None:
+                model_store.pin(digest)
+                pins.append(digest)
+        job = job_manager.submit(
+            kind, func, *args, timeout_s=timeout_s, on_done=release
+        )
+    except ModelNotFoundError as exc:
+        release()
+        raise HTTPException(status_code=404, detail="Model not found") from exc
+    except QueueFullError as exc:
+        release()
+        raise HTTPException(
+            status_code=429,
+            detail=str(exc),
+            headers={"Retry-After": str(exc.retry_after_s)},
+        ) from exc
+    except RuntimeError as exc:
+        release()
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    return job
+
+
+def _submit_job(
+    kind: str,
+    func: Any,
+    *args: Any,
+    timeout_s: Optional[float],
+    digests: Iterable[Optional[str]] = (),
+) -> Any:
+    """Queue a job and answer ``202 Accepted`` pointing at its status URL."""
+    job = _enqueue_job(kind, func, *args, timeout_s=timeout_s, digests=digests)
+    return JSONResponse(
+        status_code=202,
+        content=job.to_dict(),
+        headers={"Location": f"/api/jobs/{job.job_id}"},
+    )
+
+
+# Terminal job states other than success, as HTTP errors for the waiting routes
+_JOB_ERROR_STATUS = {
+    JobStatus.FAILED: 500,
+    JobStatus.TIMED_OUT: 504,
+    JobStatus.CANCELLED: 503,
+}
+
+
+def _run_job(
+    kind: str, func: Any, *args: Any, digests: Iterable[Optional[str]] = ()
+) -> Any:
+    """Run ``func(*args)`` on the job pool and wait for its result.
+
+    The classic synchronous routes use this so their work shares the bounded
+    worker pool (and its queue limit) with ``/api/jobs/*``; the calling thread
+    only waits. Callers validate client input first, since a failed job can
+    only be reported as a server error.
+    """
+    job = _enqueue_job(kind, func, *args, digests=digests)
+    job.done.wait()
+    if job.status is not JobStatus.SUCCEEDED:
+        raise HTTPException(
+            status_code=_JOB_ERROR_STATUS.get(job.status, 500),
+            detail=job.error or job.status.value,
+        )
+    return job.result
+
+
+def _get_job_or_404(job_id: str) -> Any:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+_TIMEOUT_QUERY = Query(None, gt=0, le=JOB_MAX_TIMEOUT_S, description="Job timeout")
+
+
+@app.post("/api/jobs/optimize", status_code=202, response_model=JobResponse)
+def submit_optimize_job(
+    req: OptimizeRequest,
+    timeout_s: Optional[float] = _TIMEOUT_QUERY,
+    _: None = Depends(rate_limit_dep),
+) -> Any:
+    """Queue ``/api/optimize`` work; poll ``GET /api/jobs/{job_id}`` for the result."""
+    if req.model_digest is not None:
+        size_mb = _stored_size_mb(req.model_digest)
+        return _submit_job(
+            "optimize",
+            optimize_stored_payload,
+            req.model_digest,
+            size_mb,
+            req.config,
+            timeout_s=timeout_s,
+            digests=[req.model_digest],
+        )
+    return _submit_job(
+        "optimize",
+        optimize_payload,
+        _required(req.model_file, "model_file"),
+        req.config,
+        timeout_s=timeout_s,
+    )
+
+
+@app.post("/api/jobs/pipeline", status_code=202, response_model=JobResponse)
+def submit_pipeline_job(
+    req: PipelineRequest,
+    timeout_s: Optional[float] = _TIMEOUT_QUERY,
+    _: None = Depends(rate_limit_dep),
+) -> Any:
+    """Queue ``/api/pipeline`` work; poll ``GET /api/jobs/{job_id}`` for the result."""
+    model_path = None
+    if req.model_digest is not None:
+        model_path = _stored_model(req.model_digest).path
+    options = _pipeline_options(req)
+    return _submit_job(
+        "pipeline",
+        pipeline_payload,
+        req.filename,
+        req.config_file,
+        model_path,
+        options["backends"],
+        options["sections"],
+        options["ir_format"],
+        timeout_s=timeout_s,
+        digests=[req.model_digest],
+    )
+
+
+@app.post("/api/jobs/benchmark", status_code=202, response_model=JobResponse)
+def submit_benchmark_job(
+    req: BenchmarkRequest,
+    timeout_s: Optional[float] = _TIMEOUT_QUERY,
+    _: None = Depends(rate_limit_dep),
+) -> Any:
+    """Queue ``/api/benchmark`` work; poll ``GET /api/jobs/{job_id}`` for the result."""
+    if req.original_digest is not None or req.optimized_digest is not None:
+        return _submit_job(
+            "benchmark",
+            benchmark_sizes_payload,
+            *_benchmark_sizes(req),
+            timeout_s=timeout_s,
+            digests=[req.original_digest, req.optimized_digest],
+        )
+    return _submit_job(
+        "benchmark",
+        benchmark_payload,
+        _required(req.original_model, "original_model"),
+        _required(req.optimized_model, "optimized_model"),
+        timeout_s=timeout_s,
     )
 
 
+@app.get("/api/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: str) -> JobResponse:
+    return JobResponse(**_get_job_or_404(job_id).to_dict())
+
+
+@app.delete("/api/jobs/{job_id}", response_model=JobResponse)
+def cancel_job(job_id: str) -> JobResponse:
+    _get_job_or_404(job_id)
+    job = job_manager.cancel(job_id)
+    if job is not None and job.status is JobStatus.RUNNING:
+        job_manager.wait(job_id, timeout=5)
+    return JobResponse(**_get_job_or_404(job_id).to_dict())
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(job_id: str) -> StreamingResponse:
+    """Stream job status changes as server-sent events until the job finishes."""
+    job = _get_job_or_404(job_id)
+
+    async def events() -> Any:
+        last_status = None
+        while True:
+            status = job.status
+            if status != last_status:
+                last_status = status
+                payload = json.dumps(job.to_dict(), default=str)
+                yield f"event: {status.value}\ndata: {payload}\n\n"
+            if status.is_terminal:
+                return
+            await asyncio.sleep(0.25)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+# ----------------------------------------------------------------------------
+# Model store
+# ----------------------------------------------------------------------------
+
+
+def _stored_model_response(record: Any, created: Optional[bool] = None) -> Any:
+    return StoredModelResponse(
+        sha256=record.sha256,
+        size_bytes=record.size_bytes,
+        created_at=record.created_at,
+        last_access=record.last_access,
+        created=created,
+        artifacts=model_store.list_artifacts(record.sha256),
+    )
+
+
+async def _store_upload(chunks: Any, filename: Optional[str]) -> Any:
+    upload = await _spool(chunks, filename, str(model_store.incoming_dir))
+    suffix = Path(filename or "model").suffix
+    try:
+        record, created = await run_in_threadpool(
+            model_store.add_file, upload.path, upload.sha256, suffix
+        )
+    finally:
+        upload.cleanup()
+    return _stored_model_response(record, created)
+
+
+@app.post("/api/models", response_model=StoredModelResponse)
+async def upload_model(
+    model: UploadFile = File(...), _: None = Depends(rate_limit_dep)
+) -> StoredModelResponse:
+    """Store a model once; reference it later by the returned ``sha256``."""
+    return await _store_upload(iter_upload_file(model), model.filename)
+
+
+@app.post("/api/models/raw", response_model=StoredModelResponse)
+async def upload_model_raw(
+    request: Request,
+    filename: str = Query("model.tflite"),
+    _: None = Depends(rate_limit_dep),
+) -> StoredModelResponse:
+    """Raw-body variant of ``POST /api/models``."""
+    return await _store_upload(request.stream(), filename)
+
+
+@app.get("/api/models")
+def list_models() -> Dict[str, Any]:
+    return {
+        "models": [
+            _stored_model_response(r).model_dump() for r in model_store.list_models()
+        ],
+        **model_store.stats(),
+    }
+
+
+@app.get("/api/models/{digest}", response_model=StoredModelResponse)
+def get_model(digest: str) -> StoredModelResponse:
+    return _stored_model_response(_stored_model(digest))
+
+
+@app.delete("/api/models/{digest}")
+def delete_model(digest: str) -> Dict[str, Any]:
+    if not model_store.delete(digest):
+        raise HTTPException(status_code=404, detail="Model not found")
+    return {"deleted": digest}
+
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """Prometheus text exposition of request, cache, job and pipeline metrics."""
+    return PlainTextResponse(
+        api_metrics.registry.render(), media_type="text/plain; version=0.0.4"
+    )
+
+
+@app.get("/api/cache/stats")
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the deterministic-endpoint response cache."""
+    return response_cache.stats()
+
+
 # Root redirect/info
 @app.get("/")
 def root() -> Dict[str, Any]:
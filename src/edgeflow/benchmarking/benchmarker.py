@@ -8,6 +8,13 @@ available, with a graceful fallback to the earlier simulation-based metrics.
 Public low-level functions now exposed for the pipeline:
     - ``get_model_size(model_path)``  -> float (MB)
     - ``benchmark_latency(model_path, runs=100, warmup=1)`` -> float (ms)
+    - ``measure_model_memory(model_path)`` -> load/arena memory dict or None
+    - ``sweep_batch_sizes(model_path, batch_sizes, resolutions)`` -> latency,
+      throughput and memory per input shape plus a recommended batch size
+    - ``output_difference_metrics(reference, candidate)`` -> max abs error,
+      cosine similarity and top-1 agreement on a shared input set
+    - ``BaselineBenchmark`` -> benchmarks the original model in a worker
+      process while the optimizer runs
 
 If TensorFlow (``tensorflow`` package) is not installed, or a model cannot be
 loaded, the module silently falls back to deterministic simulation so tests
@@ -19,6 +26,9 @@ Real benchmarking logic:
     * Performs one (configurable) warm-up inference.
     * Measures average latency across N runs using ``time.perf_counter``.
     * Computes an approximate throughput (FPS = 1000 / avg_latency_ms).
+    * Records RSS around ``allocate_tensors``, peak RSS during ``invoke``,
+      tracemalloc peaks of Python-side pre/post-processing and page faults
+      (see ``memory_profiler``).
 
 The higher-level convenience functions ``benchmark_model`` and
 ``compare_models`` retain their original signatures and output schema so the
@@ -29,7 +39,7 @@ import logging
 import os
 import random
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 try:  # Optional heavy dependency
     import tensorflow as _tf  # type: ignore
@@ -40,7 +50,15 @@ except Exception:  # noqa: BLE001 - optional dependency
 import os
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+from edgeflow.benchmarking.memory_profiler import (
+    PeakRSSSampler,
+    PythonAllocTracker,
+    page_fault_delta,
+    profile_interpreter_memory,
+    read_page_faults,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -74,16 +92,25 @@ def _generate_random_input(shape, dtype):  # type: ignore[no-untyped-def]
 
 
 def benchmark_latency(
-    model_path: str, runs: int = 100, warmup: int = 1
+    model_path: str,
+    runs: int = 100,
+    warmup: int = 1,
+    on_sample: Optional[Callable[[int, float], None]] = None,
 ) -> Tuple[float, Optional[Dict[str, Any]]]:
     """Benchmark average inference latency (ms) for a TFLite model.
 
-    Performs one or more warm-up runs followed by timed runs.
+    Performs one or more warm-up runs followed by timed runs. Memory is
+    profiled alongside: RSS around ``allocate_tensors``, peak RSS while
+    invoking (sampled by a background thread), tracemalloc peaks of the
+    Python-side input generation / output read during the untimed warm-up
+    runs, and page faults for each phase.
 
     Args:
         model_path: Path to a *.tflite model
         runs: Number of timed inference iterations
         warmup: Number of warm-up iterations (not timed)
+        on_sample: Optional callback receiving ``(run_index, latency_ms)``
+            after each timed run, for live progress reporting
     Returns:
         (avg_latency_ms, debug_metadata_dict_or_None)
         If TensorFlow Lite is unavailable or model can't be loaded, returns (0.0, None)
@@ -92,11 +119,13 @@ def benchmark_latency(
         return 0.0, None
 
     try:  # Load interpreter
-        interpreter = _tf.lite.Interpreter(  # type: ignore[attr-defined]
-            model_path=model_path
+        interpreter, memory = profile_interpreter_memory(
+            lambda: _tf.lite.Interpreter(  # type: ignore[attr-defined]
+                model_path=model_path
+            )
         )
-        interpreter.allocate_tensors()
         input_details = interpreter.get_input_details()
+        output_details = interpreter.get_output_details()
         if not input_details:
             return 0.0, None
         first_input = input_details[0]
@@ -105,33 +134,379 @@ def benchmark_latency(
         index = first_input.get("index")
         if shape is None or dtype is None or index is None:
             return 0.0, None
+        output_index = output_details[0].get("index") if output_details else None
 
-        # Warm-up
+        # Warm-up (also used to profile Python-side allocations)
+        allocs = PythonAllocTracker()
         for _ in range(max(warmup, 0)):
-            data = _generate_random_input(shape, dtype)
+            with allocs.track("preprocess"):
+                data = _generate_random_input(shape, dtype)
             interpreter.set_tensor(index, data)
             interpreter.invoke()
+            if output_index is not None:
+                with allocs.track("postprocess"):
+                    interpreter.get_tensor(output_index)
 
         # Timed runs
         total = 0.0
-        for _ in range(max(runs, 1)):
-            data = _generate_random_input(shape, dtype)
-            start = time.perf_counter()
-            interpreter.set_tensor(index, data)
-            interpreter.invoke()
-            total += (time.perf_counter() - start) * 1000.0
+        faults = read_page_faults()
+        with PeakRSSSampler() as sampler:
+            for run in range(max(runs, 1)):
+                data = _generate_random_input(shape, dtype)
+                start = time.perf_counter()
+                interpreter.set_tensor(index, data)
+                interpreter.invoke()
+                elapsed_ms = (time.perf_counter() - start) * 1000.0
+                total += elapsed_ms
+                if on_sample is not None:
+                    on_sample(run, elapsed_ms)
+        memory["peak_rss_invoke_mb"] = round(sampler.peak_mb, 3)
+        memory["invoke_page_faults"] = page_fault_delta(faults)
+        memory["python_peak_kb"] = {k: round(v, 3) for k, v in allocs.peaks_kb.items()}
         avg_ms = total / max(runs, 1)
         metadata = {
             "input_shape": tuple(int(x) for x in shape),
             "dtype": str(dtype),
             "runs": runs,
             "warmup": warmup,
+            "memory": memory,
         }
         return avg_ms, metadata
     except Exception:  # noqa: BLE001
         return 0.0, None
 
 
+def measure_model_memory(model_path: str) -> Optional[Dict[str, Any]]:
+    """Measure load and arena memory of a TFLite model without running it.
+
+    Returns:
+        The memory dictionary from ``profile_interpreter_memory`` or ``None``
+        when TensorFlow Lite is unavailable or the model cannot be loaded.
+    """
+    if not _TF_AVAILABLE or not os.path.isfile(model_path):
+        return None
+    try:
+        interpreter, memory = profile_interpreter_memory(
+            lambda: _tf.lite.Interpreter(  # type: ignore[attr-defined]
+                model_path=model_path
+            )
+        )
+        del interpreter
+        return memory
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _sweep_input_shape(
+    base_shape: Sequence[int], batch_size: int, resolution: Optional[Tuple[int, int]]
+) -> List[int]:
+    """Return ``base_shape`` with its batch (and NHWC spatial) dims replaced."""
+    shape = [int(x) for x in base_shape]
+    shape[0] = int(batch_size)
+    if resolution is not None:
+        if len(shape) != 4:
+            raise ValueError(f"Resolution sweep needs a rank-4 input, got {shape}")
+        shape[1], shape[2] = int(resolution[0]), int(resolution[1])
+    return shape
+
+
+def recommend_batch_size(
+    points: List[Dict[str, Any]],
+    latency_budget_ms: Optional[float] = None,
+    knee_fraction: float = 0.9,
+) -> Optional[Dict[str, Any]]:
+    """Pick the knee of a throughput-vs-batch curve within a latency budget.
+
+    Throughput usually rises steeply for small batches and then flattens while
+    latency keeps growing. The knee is the smallest batch size reaching
+    ``knee_fraction`` of the best throughput among points whose per-batch
+    latency fits the budget.
+
+    Args:
+        points: Sweep points for a single resolution (see ``sweep_batch_sizes``)
+        latency_budget_ms: Maximum acceptable latency per invocation
+        knee_fraction: Fraction of the peak throughput considered "good enough"
+
+    Returns:
+        The recommended point plus a ``reason`` string, or ``None`` when no
+        point succeeded within the budget.
+    """
+    candidates = [
+        p
+        for p in points
+        if p.get("status") == "success"
+        and (latency_budget_ms is None or p["latency_ms"] <= latency_budget_ms)
+    ]
+    if not candidates:
+        return None
+    best = max(p["throughput_items_per_s"] for p in candidates)
+    knee = min(
+        (p for p in candidates if p["throughput_items_per_s"] >= knee_fraction * best),
+        key=lambda p: p["batch_size"],
+    )
+    reason = (
+        f"batch {knee['batch_size']} reaches "
+        f"{knee['throughput_items_per_s'] / best * 100:.0f}% of peak throughput "
+        f"({best:.1f} items/s)"
+    )
+    if latency_budget_ms is not None:
+        reason += f" within the {latency_budget_ms:g} ms budget"
+    return {**knee, "reason": reason}
+
+
+def sweep_batch_sizes(
+    model_path: str,
+    batch_sizes: Sequence[int] = (1, 2, 4, 8),
+    resolutions: Optional[Sequence[Tuple[int, int]]] = None,
+    runs: int = 20,
+    warmup: int = 2,
+    latency_budget_ms: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """Benchmark a TFLite model across batch sizes and input resolutions.
+
+    Each point builds a fresh interpreter, calls ``resize_tensor_input`` on the
+    first input and re-runs ``allocate_tensors`` so arena memory is measured
+    for that exact shape. Models with fixed input shapes report the failing
+    points with ``status == "error"`` instead of aborting the sweep.
+
+    Args:
+        model_path: Path to a *.tflite model
+        batch_sizes: Batch sizes to try
+        resolutions: ``(height, width)`` pairs for NHWC inputs; ``None`` keeps
+            the model's native resolution
+        runs: Timed invocations per point
+        warmup: Untimed invocations per point
+        latency_budget_ms: Per-invocation latency budget for the recommendation
+
+    Returns:
+        Dict with ``points`` and a ``recommendations`` entry per resolution, or
+        ``None`` when TensorFlow Lite is unavailable or the model can't be loaded.
+    """
+    if not _TF_AVAILABLE or not os.path.isfile(model_path):
+        return None
+    try:
+        probe = _tf.lite.Interpreter(model_path=model_path)  # type: ignore[attr-defined]
+        base = probe.get_input_details()[0]
+        base_shape = [int(x) for x in base["shape"]]
+        index, dtype = base["index"], base["dtype"]
+        del probe
+    except Exception:  # noqa: BLE001
+        return None
+
+    # ``None`` stands for the model's native input resolution
+    targets: List[Optional[Tuple[int, int]]] = [
+        r for r in resolutions or () if r is not None
+    ] or [None]
+
+    points: List[Dict[str, Any]] = []
+    for resolution in targets:
+        for batch_size in sorted(set(int(b) for b in batch_sizes)):
+            point: Dict[str, Any] = {
+                "batch_size": batch_size,
+                "resolution": list(resolution) if resolution else None,
+            }
+            try:
+                shape = _sweep_input_shape(base_shape, batch_size, resolution)
+                point["input_shape"] = shape
+
+                def factory(shape: List[int] = shape) -> Any:
+                    interp = _tf.lite.Interpreter(  # type: ignore[attr-defined]
+                        model_path=model_path
+                    )
+                    interp.resize_tensor_input(index, shape)
+                    return interp
+
+                interpreter, memory = profile_interpreter_memory(factory)
+                data = _generate_random_input(tuple(shape), dtype)
+                for _ in range(max(warmup, 0)):
+                    interpreter.set_tensor(index, data)
+                    interpreter.invoke()
+                total = 0.0
+                with PeakRSSSampler() as sampler:
+                    for _ in range(max(runs, 1)):
+                        start = time.perf_counter()
+                        interpreter.set_tensor(index, data)
+                        interpreter.invoke()
+                        total += (time.perf_counter() - start) * 1000.0
+                latency_ms = total / max(runs, 1)
+                point.update(
+                    {
+                        "status": "success",
+                        "latency_ms": round(latency_ms, 3),
+                        "latency_per_item_ms": round(latency_ms / batch_size, 3),
+                        "throughput_items_per_s": round(
+                            batch_size * 1000.0 / latency_ms if latency_ms > 0 else 0.0,
+                            2,
+                        ),
+                        "arena_mb": memory["arena_mb"],
+                        "peak_rss_mb": round(sampler.peak_mb, 3),
+                    }
+                )
+                del interpreter
+            except Exception as exc:  # noqa: BLE001
+                point.update({"status": "error", "error": str(exc)})
+            points.append(point)
+
+    recommendations = {}
+    for resolution in targets:
+        key = f"{resolution[0]}x{resolution[1]}" if resolution else "native"
+        same = [
+            p
+            for p in points
+            if p["resolution"] == (list(resolution) if resolution else None)
+        ]
+        recommendations[key] = recommend_batch_size(same, latency_budget_ms)
+
+    return {
+        "model_path": model_path,
+        "native_input_shape": base_shape,
+        "latency_budget_ms": latency_budget_ms,
+        "runs": runs,
+        "points": points,
+        "recommendations": recommendations,
+    }
+
+
+def generate_input_set(
+    model_path: str, num_inputs: int = 16, seed: int = 0
+) -> Optional[List[Any]]:
+    """Generate a reproducible set of inputs matching a model's first input.
+
+    The same ``seed`` always yields byte-identical arrays, so the original and
+    optimized models can be fed exactly the same data.
+
+    Returns:
+        List of NumPy arrays, or ``None`` when TensorFlow Lite is unavailable
+        or the model cannot be loaded.
+    """
+    import numpy as np
+
+    if not _TF_AVAILABLE or not os.path.isfile(model_path):
+        return None
+    try:
+        interpreter = _tf.lite.Interpreter(model_path=model_path)  # type: ignore[attr-defined]
+        detail = interpreter.get_input_details()[0]
+        shape = tuple(int(x) for x in detail["shape"])
+        dtype = np.dtype(detail["dtype"])
+    except Exception:  # noqa: BLE001
+        return None
+
+    rng = np.random.default_rng(seed)
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return [
+            rng.integers(info.min, info.max, size=shape, dtype=dtype, endpoint=True)
+            for _ in range(num_inputs)
+        ]
+    return [
+        rng.random(shape, dtype=np.float32).astype(dtype) for _ in range(num_inputs)
+    ]
+
+
+def _adapt_input(data: Any, detail: Dict[str, Any]) -> Any:
+    """Convert ``data`` to the dtype of an input tensor, quantizing if needed."""
+    import numpy as np
+
+    dtype = np.dtype(detail["dtype"])
+    if data.dtype == dtype:
+        return data
+    scale, zero_point = detail.get("quantization", (0.0, 0))
+    if np.issubdtype(dtype, np.integer) and np.issubdtype(data.dtype, np.floating):
+        if scale:
+            data = np.round(data / scale + zero_point)
+        info = np.iinfo(dtype)
+        return np.clip(data, info.min, info.max).astype(dtype)
+    return data.astype(dtype)
+
+
+def _dequantize_output(data: Any, detail: Dict[str, Any]) -> Any:
+    """Return a float32 view of an output tensor, undoing quantization."""
+    import numpy as np
+
+    scale, zero_point = detail.get("quantization", (0.0, 0))
+    if np.issubdtype(data.dtype, np.integer) and scale:
+        return (data.astype(np.float32) - zero_point) * scale
+    return data.astype(np.float32)
+
+
+def run_model_on_inputs(
+    model_path: str, inputs: List[Any]
+) -> Optional[Tuple[List[Any], float]]:
+    """Run a TFLite model over ``inputs`` and collect its first output.
+
+    Inputs are quantized to the model's input dtype when required and outputs
+    are dequantized to float32, so float and int8 variants are comparable.
+
+    Returns:
+        ``(outputs, avg_invoke_ms)`` or ``None`` when the model can't be run.
+    """
+    if not _TF_AVAILABLE or not os.path.isfile(model_path):
+        return None
+    try:
+        interpreter = _tf.lite.Interpreter(model_path=model_path)  # type: ignore[attr-defined]
+        interpreter.allocate_tensors()
+        in_detail = interpreter.get_input_details()[0]
+        out_detail = interpreter.get_output_details()[0]
+        outputs = []
+        total = 0.0
+        for data in inputs:
+            interpreter.set_tensor(in_detail["index"], _adapt_input(data, in_detail))
+            start = time.perf_counter()
+            interpreter.invoke()
+            total += (time.perf_counter() - start) * 1000.0
+            outputs.append(
+                _dequantize_output(
+                    interpreter.get_tensor(out_detail["index"]), out_detail
+                )
+            )
+        return outputs, total / max(len(inputs), 1)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Could not run %s on shared inputs: %s", model_path, exc)
+        return None
+
+
+def output_difference_metrics(
+    reference: List[Any], candidate: List[Any]
+) -> Dict[str, Any]:
+    """Compare two models' outputs on the same inputs.
+
+    Returns:
+        ``max_abs_error``, ``mean_abs_error``, mean per-sample
+        ``cosine_similarity`` and ``top1_agreement`` (fraction of samples whose
+        arg-max matches).
+    """
+    import numpy as np
+
+    if len(reference) != len(candidate) or not reference:
+        return {"error": "output count mismatch"}
+    ref = np.stack([np.asarray(r, dtype=np.float64).ravel() for r in reference])
+    try:
+        cand = np.stack([np.asarray(c, dtype=np.float64).ravel() for c in candidate])
+    except ValueError:
+        return {"error": "output shape mismatch"}
+    if ref.shape != cand.shape:
+        return {"error": "output shape mismatch"}
+
+    diff = np.abs(ref - cand)
+    norms = np.linalg.norm(ref, axis=1) * np.linalg.norm(cand, axis=1)
+    dots = np.sum(ref * cand, axis=1)
+    # Two all-zero outputs are identical; one zero output is orthogonal
+    cosine = np.where(
+        norms > 0,
+        dots / np.where(norms > 0, norms, 1.0),
+        np.all(ref == cand, axis=1).astype(np.float64),
+    )
+    return {
+        "samples": int(ref.shape[0]),
+        "max_abs_error": float(diff.max()),
+        "mean_abs_error": float(diff.mean()),
+        "cosine_similarity": float(cosine.mean()),
+        "top1_agreement": float(
+            np.mean(np.argmax(ref, axis=1) == np.argmax(cand, axis=1))
+        ),
+    }
+
+
 class EdgeFlowBenchmarker:
     """Comprehensive benchmarking for EdgeFlow models (real + simulated)."""
 
@@ -178,7 +553,20 @@ class EdgeFlowBenchmarker:
 
             if used_real:
                 throughput_fps = 1000.0 / latency_ms if latency_ms > 0 else 0.0
-                memory_usage_mb = round(min(model_size_mb * 2, self.memory_limit), 2)
+                memory = (meta or {}).get("memory")
+                if memory:
+                    # Measured growth over the pre-load baseline
+                    memory_usage_mb = round(
+                        max(
+                            memory["peak_rss_invoke_mb"] - memory["rss_before_load_mb"],
+                            0.0,
+                        ),
+                        2,
+                    )
+                else:
+                    memory_usage_mb = round(
+                        min(model_size_mb * 2, self.memory_limit), 2
+                    )
                 results = {
                     "model_path": model_path,
                     "model_size_mb": round(model_size_mb, 3),
@@ -192,6 +580,8 @@ class EdgeFlowBenchmarker:
                 }
                 if meta:
                     results["details"] = meta
+                if memory:
+                    results["memory"] = memory
             else:
                 # Simulation fallback
                 results = self._simulate_benchmark(model_path, model_size_mb)
@@ -210,12 +600,24 @@ class EdgeFlowBenchmarker:
 
         return results
 
-    def compare_models(self, original_path: str, optimized_path: str) -> Dict[str, Any]:
+    def compare_models(
+        self,
+        original_path: str,
+        optimized_path: str,
+        baseline: Optional["BaselineBenchmark"] = None,
+    ) -> Dict[str, Any]:
         """Compare original and optimized models.
 
+        Both models are fed the same pre-generated inputs and their outputs
+        are compared (see ``output_difference_metrics``) when TensorFlow Lite
+        is available.
+
         Args:
             original_path: Path to original model
             optimized_path: Path to optimized model
+            baseline: Optional ``BaselineBenchmark`` started before the
+                optimizer ran; its results and reference outputs are reused
+                instead of benchmarking the original model again.
 
         Returns:
             Dictionary with comparison results
@@ -223,7 +625,10 @@ class EdgeFlowBenchmarker:
         logger.info("Running model comparison benchmark")
 
         # Benchmark both models
-        original_results = self.benchmark_model(original_path)
+        if baseline is not None:
+            original_results = baseline.result()
+        else:
+            original_results = self.benchmark_model(original_path)
         optimized_results = self.benchmark_model(optimized_path)
 
         # Calculate improvements
@@ -236,8 +641,69 @@ class EdgeFlowBenchmarker:
             "summary": self._generate_summary(improvements),
         }
 
+        output_difference = self._compare_outputs(
+            original_path, optimized_path, baseline
+        )
+        if output_difference is not None:
+            comparison["output_difference"] = output_difference
+
         return comparison
 
+    def _compare_outputs(
+        self,
+        original_path: str,
+        optimized_path: str,
+        baseline: Optional["BaselineBenchmark"],
+    ) -> Optional[Dict[str, Any]]:
+        """Run both models on identical inputs and diff their outputs."""
+        if baseline is not None and baseline.reference_outputs is not None:
+            inputs = baseline.load_inputs()
+            reference = baseline.reference_outputs
+        else:
+            inputs = generate_input_set(original_path)
+            if inputs is None:
+                return None
+            ran = run_model_on_inputs(original_path, inputs)
+            if ran is None:
+                return None
+            reference = ran[0]
+        if not inputs:
+            return None
+        candidate = run_model_on_inputs(optimized_path, inputs)
+        if candidate is None:
+            return None
+        return output_difference_metrics(reference, candidate[0])
+
+    def sweep_model(
+        self,
+        model_path: str,
+        batch_sizes: Optional[Sequence[int]] = None,
+        resolutions: Optional[Sequence[Tuple[int, int]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Sweep batch sizes / resolutions using limits from the config.
+
+        Batch sizes default to powers of two up to the config's
+        ``buffer_size``; the latency budget comes from ``target_latency_ms``.
+
+        Returns:
+            The ``sweep_batch_sizes`` result, or ``None`` without TFLite.
+        """
+        if batch_sizes is None:
+            limit = max(int(self.config.get("buffer_size", 8)), 1)
+            batch_sizes = sorted(
+                {1 << i for i in range(limit.bit_length()) if 1 << i <= limit} | {limit}
+            )
+        budget = self.config.get("target_latency_ms")
+        result = sweep_batch_sizes(
+            model_path,
+            batch_sizes=batch_sizes,
+            resolutions=resolutions,
+            latency_budget_ms=float(budget) if budget is not None else None,
+        )
+        if result is not None:
+            result["device"] = self.target_device
+        return result
+
     def _simulate_benchmark(
         self, model_path: str, model_size_mb: float
     ) -> Dict[str, Any]:
@@ -454,6 +920,131 @@ class EdgeFlowBenchmarker:
         )
 
 
+def _baseline_worker(
+    model_path: str,
+    config: Dict[str, Any],
+    inputs_path: str,
+    num_inputs: int,
+    seed: int,
+) -> Tuple[Dict[str, Any], Optional[List[Any]]]:
+    """Benchmark the original model and record its outputs on shared inputs.
+
+    Runs in a worker process. The generated inputs are written to
+    ``inputs_path`` so the optimized model later sees byte-identical data.
+    """
+    import numpy as np
+
+    results = EdgeFlowBenchmarker(config).benchmark_model(model_path)
+    inputs = generate_input_set(model_path, num_inputs, seed)
+    if inputs is None:
+        return results, None
+    np.savez(inputs_path, *inputs)
+    ran = run_model_on_inputs(model_path, inputs)
+    return results, ran[0] if ran is not None else None
+
+
+class BaselineBenchmark:
+    """Benchmark the original model in a worker process.
+
+    Started before optimization so the baseline measurement overlaps with the
+    optimizer's conversion instead of adding a full benchmark to the build::
+
+        baseline = BaselineBenchmark(model_path, config).start()
+        optimized_path, _ = optimize(config)
+        comparison = compare_models(model_path, optimized_path, config, baseline)
+
+    Note that the worker competes with the optimizer for CPU, so baseline
+    latencies on single-core devices are pessimistic; pass ``parallel=False``
+    to run it inline instead.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        config: Dict[str, Any],
+        num_inputs: int = 16,
+        seed: int = 0,
+        parallel: bool = True,
+    ):
+        import tempfile
+
+        self.model_path = model_path
+        self.config = dict(config)
+        self.num_inputs = num_inputs
+        self.seed = seed
+        self.parallel = parallel
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="edgeflow_inputs_")
+        self.inputs_path = os.path.join(self._tmpdir.name, "inputs.npz")
+        self.reference_outputs: Optional[List[Any]] = None
+        self._future: Any = None
+        self._executor: Any = None
+        self._results: Optional[Dict[str, Any]] = None
+
+    def _args(self) -> Tuple[Any, ...]:
+        return (
+            self.model_path,
+            self.config,
+            self.inputs_path,
+            self.num_inputs,
+            self.seed,
+        )
+
+    def start(self) -> "BaselineBenchmark":
+        """Submit the baseline benchmark to a single-worker process pool."""
+        if not self.parallel:
+            return self
+        try:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # "spawn" avoids forking a process that may hold TensorFlow threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            )
+            self._future = self._executor.submit(_baseline_worker, *self._args())
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Parallel baseline unavailable (%s); running inline", exc)
+            self._shutdown()
+        return self
+
+    def result(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Wait for and return the baseline benchmark results."""
+        if self._results is not None:
+            return self._results
+        outcome = None
+        if self._future is not None:
+            try:
+                outcome = self._future.result(timeout=timeout)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Baseline worker failed (%s); running inline", exc)
+            finally:
+                self._shutdown()
+        if outcome is None:
+            outcome = _baseline_worker(*self._args())
+        self._results, self.reference_outputs = outcome
+        return self._results
+
+    def load_inputs(self) -> Optional[List[Any]]:
+        """Load the shared input set written by the baseline worker."""
+        import numpy as np
+
+        if not os.path.isfile(self.inputs_path):
+            return None
+        with np.load(self.inputs_path) as data:
+            return [data[f"arr_{i}"] for i in range(len(data.files))]
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._future = None
+
+    def cleanup(self) -> None:
+        """Remove the shared input set from disk."""
+        self._shutdown()
+        self._tmpdir.cleanup()
+
+
 def benchmark_model(model_path: str, config: Dict[str, Any]) -> Dict[str, Any]:
     """Benchmark wrapper retaining original public API."""
     """Benchmark a single model.
@@ -470,7 +1061,10 @@ def benchmark_model(model_path: str, config: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def compare_models(
-    original_path: str, optimized_path: str, config: Dict[str, Any]
+    original_path: str,
+    optimized_path: str,
+    config: Dict[str, Any],
+    baseline: Optional[BaselineBenchmark] = None,
 ) -> Dict[str, Any]:
     """Compare two models.
 
@@ -478,17 +1072,25 @@ def compare_models(
         original_path: Path to original model
         optimized_path: Path to optimized model
         config: EdgeFlow configuration
+        baseline: Optional baseline benchmark started before optimization
 
     Returns:
         Comparison results dictionary
     """
     benchmarker = EdgeFlowBenchmarker(config)
-    return benchmarker.compare_models(original_path, optimized_path)
+    return benchmarker.compare_models(original_path, optimized_path, baseline)
 
 
 __all__ = [
     "get_model_size",
     "benchmark_latency",
+    "measure_model_memory",
+    "sweep_batch_sizes",
+    "recommend_batch_size",
+    "generate_input_set",
+    "run_model_on_inputs",
+    "output_difference_metrics",
+    "BaselineBenchmark",
     "benchmark_model",
     "compare_models",
     "EdgeFlowBenchmarker",
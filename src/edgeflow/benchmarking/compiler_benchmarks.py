@@ -0,0 +1,694 @@
+"""EdgeFlow Compiler Self-Benchmarks
+
+Benchmarks the compiler itself rather than the models it produces. Synthetic
+``.ef`` sources and IR graphs are generated at increasing sizes so that
+super-linear behaviour (quadratic edge scans, deep recursion) shows up as a
+scaling regression instead of a surprise on a large user model.
+
+Covered stages:
+    * Parsing: ANTLR front-end (when generated artifacts exist) and the
+      ``_parse_kv_lines`` fallback
+    * ``IRBuilder.build_from_config``
+    * ``topological_sort`` on the EdgeFlow IR, UIR and semantic IR graphs
+    * Every UIR optimization / lowering pass
+    * ``UIRValidationSuite`` and ``SemanticAnalyzer.analyze``
+    * MLIR text emission and ``to_dict`` serialization
+
+Graph shapes:
+    * ``chain``    -> a single path of N nodes (worst case for recursion)
+    * ``wide``     -> one source fanning out to N-2 branches and back in
+    * ``residual`` -> stacked blocks with skip connections into ``add`` nodes
+
+Results are plain JSON so they can be stored as baselines under
+``benchmarks/`` and compared on later runs::
+
+    $ edgeflow bench compiler --sizes 10 100 1000 --save-baseline
+    $ edgeflow bench compiler --baseline benchmarks/compiler_baseline.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES: Tuple[int, ...] = (10, 100, 1000, 10000, 100000)
+GRAPH_SHAPES: Tuple[str, ...] = ("chain", "wide", "residual")
+DEFAULT_BASELINE_PATH = os.path.join("benchmarks", "compiler_baseline.json")
+
+# Statements accepted by both the ANTLR grammar and the fallback parser.
+_EF_STATEMENTS = (
+    'model = "models/mobilenet_v2.tflite"',
+    "quantize = int8",
+    "target_device = raspberry_pi",
+    'deploy_path = "/models/"',
+    "input_stream = camera",
+    "buffer_size = 32",
+    "optimize_for = latency",
+    "memory_limit = 64",
+    "enable_fusion = true",
+)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic inputs
+# ---------------------------------------------------------------------------
+
+
+def generate_ef_source(num_statements: int) -> str:
+    """Return a syntactically valid ``.ef`` source with ``num_statements`` lines."""
+    lines = ["# synthetic EdgeFlow config for compiler benchmarks"]
+    for i in range(num_statements):
+        lines.append(_EF_STATEMENTS[i % len(_EF_STATEMENTS)])
+    return "\n".join(lines) + "\n"
+
+
+def graph_edges(shape: str, size: int) -> List[Tuple[int, int]]:
+    """Return ``(src, dst)`` index pairs for a synthetic graph of ``size`` nodes.
+
+    Node ``0`` is always the single source and node ``size - 1`` the single
+    sink, so every shape produces a connected DAG.
+    """
+    if size < 2:
+        return []
+    if shape == "chain":
+        return [(i - 1, i) for i in range(1, size)]
+    if shape == "wide":
+        if size == 2:
+            return [(0, 1)]
+        sink = size - 1
+        edges = [(0, i) for i in range(1, sink)]
+        edges.extend((i, sink) for i in range(1, sink))
+        return edges
+    if shape == "residual":
+        # Blocks of three nodes: conv -> conv -> add, plus a skip from the
+        # block input straight into the add.
+        edges = [(i - 1, i) for i in range(1, size)]
+        for add in range(3, size, 3):
+            edges.append((add - 3, add))
+        return edges
+    raise ValueError(f"Unknown graph shape: {shape}")
+
+
+def _is_add_node(shape: str, index: int) -> bool:
+    return shape == "residual" and index > 0 and index % 3 == 0
+
+
+def build_edgeflow_ir_graph(shape: str, size: int) -> Any:
+    """Build an EdgeFlow ``IRGraph`` with the requested shape."""
+    from edgeflow.ir.edgeflow_ir import (
+        InputNode,
+        IRGraph,
+        IRNode,
+        ModelNode,
+        OutputNode,
+        PreprocessNode,
+    )
+
+    graph = IRGraph()
+    for i in range(size):
+        node_id = f"n{i}"
+        node: IRNode
+        if i == 0:
+            node = InputNode(node_id, node_id)
+        elif i == size - 1:
+            node = OutputNode(node_id, node_id)
+        elif _is_add_node(shape, i):
+            node = PreprocessNode(node_id, node_id, op_type="Add")
+        else:
+            node = ModelNode(node_id, node_id, op_type="Conv2D")
+        graph.add_node(node)
+    for src, dst in graph_edges(shape, size):
+        graph.add_edge(f"n{src}", f"n{dst}")
+    graph.graph_inputs = ["n0"]
+    graph.graph_outputs = [f"n{size - 1}"]
+    return graph
+
+
+def build_uir_graph(shape: str, size: int) -> Any:
+    """Build a ``UIRGraph`` with the requested shape.
+
+    Every node produces one tensor (``t<i>``) and consumes the tensors of its
+    predecessors, so tensor lookups and edge scans see realistic fan-in.
+    """
+    from edgeflow.ir.unified_ir import (
+        DataType,
+        FrameworkType,
+        OperationType,
+        TensorInfo,
+        TensorShape,
+        UIRGraph,
+        UIRNode,
+    )
+
+    edges = graph_edges(shape, size)
+    inputs: Dict[int, List[int]] = {}
+    for src, dst in edges:
+        inputs.setdefault(dst, []).append(src)
+
+    graph = UIRGraph(name=f"bench_{shape}_{size}", framework_type=FrameworkType.TFLITE)
+    for i in range(size):
+        if i == 0:
+            op = OperationType.RESHAPE
+        elif _is_add_node(shape, i):
+            op = OperationType.ADD
+        elif i % 2:
+            op = OperationType.CONV2D
+        else:
+            op = OperationType.RELU
+        graph.add_tensor(
+            TensorInfo(f"t{i}", TensorShape([1, 32, 32, 16]), DataType.FLOAT32)
+        )
+        node = UIRNode(
+            node_id=f"n{i}",
+            name=f"n{i}",
+            operation_type=op,
+            framework_type=FrameworkType.TFLITE,
+            inputs=[f"t{j}" for j in inputs.get(i, [])],
+            outputs=[f"t{i}"],
+        )
+        if op == OperationType.CONV2D:
+            node.add_attribute("filters", 16)
+            node.add_attribute("kernel_size", [3, 3])
+        graph.add_node(node)
+    for src, dst in edges:
+        graph.add_edge(f"n{src}", f"n{dst}", f"t{src}")
+    return graph
+
+
+def build_semantic_graph(shape: str, size: int) -> Any:
+    """Build a semantic-analyzer ``IRGraph`` with the requested shape."""
+    from edgeflow.semantic_analyzer.ir_nodes import (
+        ActivationType,
+        IRGraph,
+        IRNode,
+        LayerType,
+        TensorShape,
+        create_dense_node,
+        create_input_node,
+    )
+
+    graph = IRGraph()
+    nodes = []
+    for i in range(size):
+        node_id = f"n{i}"
+        if i == 0:
+            node = create_input_node(node_id, TensorShape((64,)))
+        elif _is_add_node(shape, i):
+            node = IRNode(node_id=node_id, layer_type=LayerType.ADD)
+        else:
+            node = create_dense_node(node_id, units=64, activation=ActivationType.RELU)
+            if i == size - 1:
+                node.layer_type = LayerType.OUTPUT
+        graph.add_node(node)
+        nodes.append(node)
+    for src, dst in graph_edges(shape, size):
+        nodes[src].connect_to(nodes[dst])
+    return graph
+
+
+# ---------------------------------------------------------------------------
+# Benchmark cases
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CaseResult:
+    """Timing for one (case, size) point."""
+
+    case: str
+    size: int
+    seconds: Optional[float] = None
+    repeats: int = 0
+    error: Optional[str] = None
+    skipped: bool = False
+
+
+def _uir_passes() -> List[Tuple[str, Callable[[], Any]]]:
+    """Return ``(name, factory)`` for every UIR transformation pass."""
+    from edgeflow.compiler.mlir_dialect import (
+        CrossFrameworkOptimizationPass,
+        EdgeOptimizationPass,
+        HardwareSpecificPass,
+    )
+    from edgeflow.ir.uir_normalizer import UIRNormalizer
+    from edgeflow.ir.uir_optimization_passes import (
+        FusionPass,
+        HardwareSpecificOptimizationPass,
+        MemoryOptimizationPass,
+        PruningPass,
+        QuantizationPass,
+    )
+
+    return [
+        ("normalize", UIRNormalizer),
+        ("quantization", QuantizationPass),
+        ("pruning", PruningPass),
+        ("fusion", FusionPass),
+        ("memory_optimization", MemoryOptimizationPass),
+        (
+            "hardware_specific",
+            lambda: HardwareSpecificOptimizationPass("raspberry_pi"),
+        ),
+        ("mlir_cross_framework", CrossFrameworkOptimizationPass),
+        ("mlir_edge_optimization", EdgeOptimizationPass),
+        ("mlir_hardware_specific", lambda: HardwareSpecificPass("raspberry_pi")),
+    ]
+
+
+def _parse_cases() -> List[Tuple[str, Callable[[int], Any], Callable[[Any], Any]]]:
+    """Return ``(name, setup(size), run(state))`` for front-end cases."""
+    from edgeflow.ir.edgeflow_ir import IRBuilder
+    from edgeflow.parser import (
+        ANTLR_AVAILABLE,
+        _parse_kv_lines,
+        parse_edgeflow_string,
+    )
+
+    cases: List[Tuple[str, Callable[[int], Any], Callable[[Any], Any]]] = [
+        ("parse.fallback", generate_ef_source, _parse_kv_lines),
+        (
+            "ir_builder.build_from_config",
+            lambda n: _parse_kv_lines(generate_ef_source(n)),
+            lambda cfg: IRBuilder().build_from_config(cfg),
+        ),
+    ]
+    if ANTLR_AVAILABLE:
+        cases.insert(0, ("parse.antlr", generate_ef_source, parse_edgeflow_string))
+    return cases
+
+
+def _graph_cases(
+    shape: str,
+) -> List[Tuple[str, Callable[[int], Any], Callable[[Any], Any]]]:
+    """Return ``(name, setup(size), run(state))`` for graph cases of ``shape``."""
+    from edgeflow.compiler.mlir_dialect import UIRToMLIRConverter
+    from edgeflow.ir.uir_validators import UIRValidationSuite
+    from edgeflow.semantic_analyzer.analyzer import SemanticAnalyzer
+
+    def uir(n: int) -> Any:
+        return build_uir_graph(shape, n)
+
+    def run_pass(factory: Callable[[], Any]) -> Callable[[Any], Any]:
+        return lambda g: factory().transform(g)
+
+    cases: List[Tuple[str, Callable[[int], Any], Callable[[Any], Any]]] = [
+        (
+            f"edgeflow_ir.topological_sort[{shape}]",
+            lambda n: build_edgeflow_ir_graph(shape, n),
+            lambda g: g.topological_sort(),
+        ),
+        (
+            f"edgeflow_ir.to_dict[{shape}]",
+            lambda n: build_edgeflow_ir_graph(shape, n),
+            lambda g: g.to_dict(),
+        ),
+        (f"uir.topological_sort[{shape}]", uir, lambda g: g.topological_sort()),
+        (f"uir.to_dict[{shape}]", uir, lambda g: g.to_dict()),
+        (
+            f"uir.validation_suite[{shape}]",
+            uir,
+            lambda g: UIRValidationSuite().validate_graph(g),
+        ),
+        (
+            f"uir.mlir_text[{shape}]",
+            uir,
+            lambda g: UIRToMLIRConverter().convert_to_mlir(g).to_mlir_text(),
+        ),
+        (
+            f"semantic.topological_sort[{shape}]",
+            lambda n: build_semantic_graph(shape, n),
+            lambda g: g.topological_sort(),
+        ),
+        (
+            f"semantic.analyze[{shape}]",
+            lambda n: build_semantic_graph(shape, n),
+            lambda g: SemanticAnalyzer().analyze(g),
+        ),
+    ]
+    for pass_name, factory in _uir_passes():
+        cases.append((f"uir_pass.{pass_name}[{shape}]", uir, run_pass(factory)))
+    return cases
+
+
+class CompilerBenchmarkSuite:
+    """Run the compiler self-benchmarks over a range of input sizes.
+
+    Each case is timed at every size in ascending order. Once a case fails or
+    a single run exceeds ``time_budget_s`` the larger sizes for that case are
+    marked as skipped, so one quadratic stage cannot stall the whole suite.
+    """
+
+    def __init__(
+        self,
+        sizes: Sequence[int] = DEFAULT_SIZES,
+        shapes: Sequence[str] = GRAPH_SHAPES,
+        repeats: int = 3,
+        time_budget_s: float = 5.0,
+        case_filter: Optional[str] = None,
+    ):
+        for shape in shapes:
+            if shape not in GRAPH_SHAPES:
+                raise ValueError(f"Unknown graph shape: {shape}")
+        self.sizes = sorted(set(int(s) for s in sizes))
+        self.shapes = list(shapes)
+        self.repeats = max(1, repeats)
+        self.time_budget_s = time_budget_s
+        self.case_filter = case_filter
+
+    def _cases(self) -> List[Tuple[str, Callable[[int], Any], Callable[[Any], Any]]]:
+        cases = _parse_cases()
+        for shape in self.shapes:
+            cases.extend(_graph_cases(shape))
+        if self.case_filter:
+            cases = [c for c in cases if self.case_filter in c[0]]
+        return cases
+
+    def _time_case(
+        self, setup: Callable[[int], Any], run: Callable[[Any], Any], size: int
+    ) -> Tuple[float, int]:
+        """Return the best wall time of ``run`` over fresh ``setup`` states."""
+        best = math.inf
+        repeats = 0
+        for _ in range(self.repeats):
+            # Passes may mutate their input, so every repeat gets a new graph
+            state = setup(size)
+            start = time.perf_counter()
+            run(state)
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed)
+            repeats += 1
+            if elapsed > self.time_budget_s:
+                break
+        return best, repeats
+
+    def run(self) -> Dict[str, Any]:
+        """Run every case and return a JSON-serializable results dict."""
+        # Synthetic graphs are noisy at DEBUG level; keep the timings clean
+        previous_level = logging.root.manager.disable
+        logging.disable(logging.INFO)
+        results: List[CaseResult] = []
+        try:
+            for name, setup, run in self._cases():
+                exhausted = False
+                for size in self.sizes:
+                    if exhausted:
+                        results.append(CaseResult(name, size, skipped=True))
+                        continue
+                    try:
+                        seconds, repeats = self._time_case(setup, run, size)
+                        results.append(
+                            CaseResult(name, size, round(seconds, 6), repeats)
+                        )
+                        exhausted = seconds > self.time_budget_s
+                    except Exception as exc:  # noqa: BLE001
+                        results.append(
+                            CaseResult(
+                                name, size, error=f"{type(exc).__name__}: {exc}"[:200]
+                            )
+                        )
+                        exhausted = True
+        finally:
+            logging.disable(previous_level)
+
+        return {
+            "suite": "compiler",
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+            },
+            "sizes": self.sizes,
+            "shapes": self.shapes,
+            "results": [asdict(r) for r in results],
+            "scaling": scaling_exponents([asdict(r) for r in results]),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Analysis and baselines
+# ---------------------------------------------------------------------------
+
+
+def _by_case(results: Sequence[Dict[str, Any]]) -> Dict[str, Dict[int, Dict]]:
+    grouped: Dict[str, Dict[int, Dict]] = {}
+    for r in results:
+        grouped.setdefault(r["case"], {})[int(r["size"])] = r
+    return grouped
+
+
+def scaling_exponents(results: Sequence[Dict[str, Any]]) -> Dict[str, float]:
+    """Estimate the empirical complexity exponent of each case.
+
+    Fits ``log(time) = k * log(size) + c`` over the timed points; ``k`` close
+    to 1 means linear scaling and ``k`` close to 2 means quadratic. Points
+    faster than 50 microseconds are dominated by overhead and ignored.
+    """
+    exponents: Dict[str, float] = {}
+    for case, points in _by_case(results).items():
+        xs, ys = [], []
+        for size, r in sorted(points.items()):
+            seconds = r.get("seconds")
+            if seconds and seconds >= 5e-5 and size > 1:
+                xs.append(math.log(size))
+                ys.append(math.log(seconds))
+        if len(xs) < 2:
+            continue
+        mean_x = sum(xs) / len(xs)
+        mean_y = sum(ys) / len(ys)
+        var = sum((x - mean_x) ** 2 for x in xs)
+        if var == 0:
+            continue
+        cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+        exponents[case] = round(cov / var, 3)
+    return exponents
+
+
+def save_baseline(results: Dict[str, Any], path: str = DEFAULT_BASELINE_PATH) -> str:
+    """Write benchmark results to ``path`` as a baseline and return the path."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def load_baseline(path: str = DEFAULT_BASELINE_PATH) -> Dict[str, Any]:
+    """Load a baseline previously written by :func:`save_baseline`."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_to_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 1.5,
+    exponent_tolerance: float = 0.3,
+    min_seconds: float = 1e-3,
+) -> List[Dict[str, Any]]:
+    """Return regressions of ``results`` relative to ``baseline``.
+
+    A regression is reported when:
+        * a point is slower than ``tolerance`` x its baseline time (points
+          under ``min_seconds`` in both runs are too noisy to compare),
+        * a point that used to succeed now errors or is skipped, or
+        * a case's scaling exponent grew by more than ``exponent_tolerance``.
+    """
+    regressions: List[Dict[str, Any]] = []
+    current = _by_case(results.get("results", []))
+    previous = _by_case(baseline.get("results", []))
+
+    for case, points in current.items():
+        for size, r in points.items():
+            base = previous.get(case, {}).get(size)
+            if base is None or base.get("seconds") is None:
+                continue
+            if r.get("seconds") is None:
+                regressions.append(
+                    {
+                        "case": case,
+                        "size": size,
+                        "kind": "error" if r.get("error") else "skipped",
+                        "detail": r.get("error") or "exceeded time budget",
+                    }
+                )
+                continue
+            if max(r["seconds"], base["seconds"]) < min_seconds:
+                continue
+            ratio = r["seconds"] / max(base["seconds"], 1e-9)
+            if ratio > tolerance:
+                regressions.append(
+                    {
+                        "case": case,
+                        "size": size,
+                        "kind": "slowdown",
+                        "ratio": round(ratio, 2),
+                        "baseline_seconds": base["seconds"],
+                        "seconds": r["seconds"],
+                    }
+                )
+
+    base_exp = baseline.get("scaling", {})
+    for case, exponent in results.get("scaling", {}).items():
+        if case in base_exp and exponent - base_exp[case] > exponent_tolerance:
+            regressions.append(
+                {
+                    "case": case,
+                    "kind": "scaling",
+                    "baseline_exponent": base_exp[case],
+                    "exponent": exponent,
+                }
+            )
+    return regressions
+
+
+def format_results_table(results: Dict[str, Any]) -> str:
+    """Render results as a fixed-width text table (one row per case)."""
+    sizes = results["sizes"]
+    grouped = _by_case(results["results"])
+    name_width = max([len(c) for c in grouped] + [4])
+    header = "case".ljust(name_width) + "".join(f"{s:>12}" for s in sizes) + "       k"
+    lines = [header, "-" * len(header)]
+    for case, points in grouped.items():
+        cells = []
+        for size in sizes:
+            r = points.get(size, {})
+            if r.get("seconds") is not None:
+                cells.append(f"{r['seconds'] * 1000:>10.2f}ms")
+            elif r.get("error"):
+                cells.append(f"{'error':>12}")
+            else:
+                cells.append(f"{'-':>12}")
+        exponent = results.get("scaling", {}).get(case)
+        k = f"{exponent:8.2f}" if exponent is not None else f"{'':>8}"
+        lines.append(case.ljust(name_width) + "".join(cells) + k)
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# CLI: ``edgeflow bench compiler``
+# ---------------------------------------------------------------------------
+
+
+def add_bench_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the ``edgeflow bench compiler`` options on ``parser``."""
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Graph/config sizes to benchmark (default: 10 .. 100000)",
+    )
+    parser.add_argument(
+        "--shapes",
+        nargs="+",
+        choices=list(GRAPH_SHAPES),
+        default=list(GRAPH_SHAPES),
+        help="Synthetic graph shapes to benchmark",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per point")
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=5.0,
+        help="Skip larger sizes of a case once one run exceeds this (seconds)",
+    )
+    parser.add_argument("--filter", dest="case_filter", help="Only run matching cases")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument(
+        "--baseline",
+        help="Compare against a baseline JSON and exit 1 on regressions",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const=DEFAULT_BASELINE_PATH,
+        help=f"Store results as a baseline (default: {DEFAULT_BASELINE_PATH})",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="Allowed slowdown ratio against the baseline",
+    )
+
+
+def run_bench(args: argparse.Namespace) -> int:
+    """Run the compiler suite with options parsed by ``add_bench_arguments``.
+
+    Returns:
+        int: 0 on success, 1 when regressions against the baseline are found.
+    """
+    suite = CompilerBenchmarkSuite(
+        sizes=args.sizes,
+        shapes=args.shapes,
+        repeats=args.repeats,
+        time_budget_s=args.time_budget,
+        case_filter=args.case_filter,
+    )
+    results = suite.run()
+    print(format_results_table(results))
+
+    if args.output:
+        save_baseline(results, args.output)
+        print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        regressions = compare_to_baseline(
+            results, load_baseline(args.baseline), tolerance=args.tolerance
+        )
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for reg in regressions:
+                print("  " + json.dumps(reg, sort_keys=True))
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for ``python -m edgeflow.benchmarking.compiler_benchmarks``."""
+    parser = argparse.ArgumentParser(
+        prog="edgeflow bench compiler",
+        description="Benchmark the EdgeFlow compiler on synthetic inputs",
+    )
+    add_bench_arguments(parser)
+    return run_bench(parser.parse_args(argv))
+
+
+__all__ = [
+    "DEFAULT_SIZES",
+    "GRAPH_SHAPES",
+    "CaseResult",
+    "CompilerBenchmarkSuite",
+    "generate_ef_source",
+    "graph_edges",
+    "build_edgeflow_ir_graph",
+    "build_uir_graph",
+    "build_semantic_graph",
+    "scaling_exponents",
+    "save_baseline",
+    "load_baseline",
+    "compare_to_baseline",
+    "format_results_table",
+    "add_bench_arguments",
+    "run_bench",
+    "main",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
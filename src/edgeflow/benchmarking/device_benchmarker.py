@@ -17,6 +17,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from edgeflow.benchmarking.memory_profiler import PeakRSSSampler, read_rss_mb
+
 logger = logging.getLogger(__name__)
 
 
@@ -352,13 +354,16 @@ class DeviceSpecificBenchmarker:
         # Select appropriate measurement method
         measurement_method = self._select_measurement_method(interface_type)
 
-        # Run benchmark
-        if measurement_method in self.benchmark_methods:
-            benchmark_func = self.benchmark_methods[measurement_method]
-            result = benchmark_func(model_path, interface_type, num_runs)
-        else:
-            # Fallback to basic benchmarking
-            result = self._benchmark_basic(model_path, interface_type, num_runs)
+        # Run benchmark, tracking peak RSS rather than a point sample
+        with PeakRSSSampler() as sampler:
+            if measurement_method in self.benchmark_methods:
+                benchmark_func = self.benchmark_methods[measurement_method]
+                result = benchmark_func(model_path, interface_type, num_runs)
+            else:
+                # Fallback to basic benchmarking
+                result = self._benchmark_basic(model_path, interface_type, num_runs)
+        if sampler.peak_mb > 0:
+            result.memory_usage_mb = sampler.peak_mb
 
         # Add device-specific metadata
         result.metadata = {
@@ -404,7 +409,6 @@ class DeviceSpecificBenchmarker:
 
         # Simulate model loading and inference
         times = []
-        memory_usage = []
         cpu_usage = []
 
         for i in range(num_runs):
@@ -425,8 +429,7 @@ class DeviceSpecificBenchmarker:
             end_time = time.perf_counter()
             times.append((end_time - start_time) * 1000)  # Convert to ms
 
-            # Simulate memory and CPU usage
-            memory_usage.append(self._get_memory_usage())
+            # Simulate CPU usage
             cpu_usage.append(self._get_cpu_usage())
 
         return BenchmarkResult(
@@ -435,7 +438,7 @@ class DeviceSpecificBenchmarker:
             measurement_method="perf_counter",
             latency_ms=sum(times) / len(times),
             throughput_fps=1000.0 / (sum(times) / len(times)),
-            memory_usage_mb=sum(memory_usage) / len(memory_usage),
+            memory_usage_mb=self._get_memory_usage(),
             cpu_usage_percent=sum(cpu_usage) / len(cpu_usage),
             metadata={"runs": num_runs, "times": times},
         )
@@ -543,16 +546,9 @@ class DeviceSpecificBenchmarker:
         )
 
     def _get_memory_usage(self) -> float:
-        """Get current memory usage in MB."""
-        try:
-            if os.path.exists("/proc/self/status"):
-                with open("/proc/self/status", "r") as f:
-                    for line in f:
-                        if line.startswith("VmRSS:"):
-                            return float(line.split()[1]) / 1024  # Convert KB to MB
-        except Exception:
-            pass
-        return 50.0  # Default fallback
+        """Get current memory usage (RSS) in MB."""
+        rss = read_rss_mb()
+        return rss if rss > 0 else 50.0  # Default fallback
 
     def _get_cpu_usage(self) -> float:
         """Get current CPU usage percentage."""
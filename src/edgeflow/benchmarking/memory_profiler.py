@@ -0,0 +1,197 @@
+"""EdgeFlow Memory Profiler
+
+Low-overhead process memory instrumentation used by the benchmarkers.
+
+The helpers here measure what a model actually costs on a device instead of
+guessing from its file size:
+
+    * ``read_rss_mb()``       -> current resident set size (MB)
+    * ``read_page_faults()``  -> (minor, major) page-fault counters
+    * ``PeakRSSSampler``      -> background thread tracking peak RSS of a block
+    * ``PythonAllocTracker``  -> tracemalloc peak for Python-side work
+
+Everything degrades gracefully: on platforms without ``/proc`` or the
+``resource`` module the functions return zeros instead of raising, so the
+benchmarks keep working in lightweight environments.
+"""
+
+import threading
+import tracemalloc
+from typing import Any, Dict, Optional, Tuple
+
+try:  # Unix only
+    import resource as _resource
+
+    _RESOURCE_AVAILABLE = True
+except ImportError:  # pragma: no cover - Windows
+    _RESOURCE_AVAILABLE = False
+
+_PROC_STATUS = "/proc/self/status"
+
+
+def _maxrss_mb() -> float:
+    """Return the lifetime peak RSS reported by ``getrusage`` in MB."""
+    if not _RESOURCE_AVAILABLE:
+        return 0.0
+    # Linux reports ru_maxrss in KB
+    return _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def read_rss_mb() -> float:
+    """Return the current resident set size of this process in MB.
+
+    Reads ``VmRSS`` from ``/proc/self/status`` when available and falls back
+    to the ``getrusage`` high-water mark otherwise.
+    """
+    try:
+        with open(_PROC_STATUS, "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return float(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return _maxrss_mb()
+
+
+def read_page_faults() -> Tuple[int, int]:
+    """Return ``(minor, major)`` page-fault counts for this process."""
+    if not _RESOURCE_AVAILABLE:
+        return 0, 0
+    usage = _resource.getrusage(_resource.RUSAGE_SELF)
+    return int(usage.ru_minflt), int(usage.ru_majflt)
+
+
+def page_fault_delta(start: Tuple[int, int]) -> Dict[str, int]:
+    """Return page faults incurred since ``start`` as a dict."""
+    minor, major = read_page_faults()
+    return {"minor": minor - start[0], "major": major - start[1]}
+
+
+class PeakRSSSampler:
+    """Track the peak RSS of a code block with a background sampling thread.
+
+    The sampler reads ``/proc/self/status`` every ``interval_s`` seconds,
+    which keeps the overhead to a single small file read per tick. Use it as
+    a context manager around the code to observe::
+
+        with PeakRSSSampler() as sampler:
+            interpreter.invoke()
+        print(sampler.peak_mb)
+    """
+
+    def __init__(self, interval_s: float = 0.005):
+        self.interval_s = interval_s
+        self.start_mb = 0.0
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            rss = read_rss_mb()
+            if rss > self.peak_mb:
+                self.peak_mb = rss
+
+    def start(self) -> "PeakRSSSampler":
+        self.start_mb = read_rss_mb()
+        self.peak_mb = self.start_mb
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> float:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        # Catch growth that happened after the last tick
+        self.peak_mb = max(self.peak_mb, read_rss_mb())
+        return self.peak_mb
+
+    def __enter__(self) -> "PeakRSSSampler":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+class PythonAllocTracker:
+    """Record the tracemalloc peak of Python-side code sections.
+
+    Sections are named (e.g. ``"preprocess"``, ``"postprocess"``) and the
+    largest peak seen for each name is kept. Tracing is only active inside
+    ``track()`` blocks so timed native code is not slowed down.
+    """
+
+    def __init__(self) -> None:
+        self.peaks_kb: Dict[str, float] = {}
+
+    def track(self, section: str) -> "_TrackedSection":
+        return _TrackedSection(self, section)
+
+    def _record(self, section: str, peak_bytes: int) -> None:
+        peak_kb = peak_bytes / 1024.0
+        if peak_kb > self.peaks_kb.get(section, 0.0):
+            self.peaks_kb[section] = peak_kb
+
+
+class _TrackedSection:
+    def __init__(self, tracker: PythonAllocTracker, section: str):
+        self.tracker = tracker
+        self.section = section
+        self._started = False
+
+    def __enter__(self) -> None:
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def __exit__(self, *exc: Any) -> None:
+        _, peak = tracemalloc.get_traced_memory()
+        if self._started:
+            tracemalloc.stop()
+        self.tracker._record(self.section, max(peak - self._baseline, 0))
+
+
+def profile_interpreter_memory(
+    interpreter_factory: Any,
+) -> Tuple[Any, Dict[str, Any]]:
+    """Construct an interpreter and measure the cost of loading it.
+
+    Args:
+        interpreter_factory: Zero-argument callable returning an interpreter
+            whose ``allocate_tensors()`` has *not* been called yet.
+
+    Returns:
+        (interpreter, memory_dict) where ``memory_dict`` holds RSS before
+        loading, after loading, after ``allocate_tensors`` and the page faults
+        incurred by tensor allocation.
+    """
+    rss_before_load = read_rss_mb()
+    interpreter = interpreter_factory()
+    rss_before_allocate = read_rss_mb()
+    faults = read_page_faults()
+    interpreter.allocate_tensors()
+    rss_after_allocate = read_rss_mb()
+    return interpreter, {
+        "rss_before_load_mb": round(rss_before_load, 3),
+        "rss_before_allocate_mb": round(rss_before_allocate, 3),
+        "rss_after_allocate_mb": round(rss_after_allocate, 3),
+        "model_load_mb": round(max(rss_before_allocate - rss_before_load, 0.0), 3),
+        "arena_mb": round(max(rss_after_allocate - rss_before_allocate, 0.0), 3),
+        "allocate_page_faults": page_fault_delta(faults),
+    }
+
+
+__all__ = [
+    "read_rss_mb",
+    "read_page_faults",
+    "page_fault_delta",
+    "PeakRSSSampler",
+    "PythonAllocTracker",
+    "profile_interpreter_memory",
+]
@@ -12,6 +12,10 @@ from __future__ import annotations
 import os
 from typing import Any, Dict, List, Optional, Set
 
+from edgeflow.deployment.deployment_packager import (
+    _LATENCY_HISTOGRAM_CODE,
+    _MODEL_PAGE_CACHE_CODE,
+)
 from edgeflow.ir.edgeflow_ast import (
     ASTVisitor,
     BinaryExpression,
@@ -46,6 +50,318 @@ try:
 except ImportError:
     IR_AVAILABLE = False
 
+# Input streams served by the generated frame-source runtime
+IMAGE_INPUT_STREAMS = ("camera", "file", "stream")
+
+# Frame-source runtime emitted into generated Python code for image input
+# streams (see ``CodeGenerator._generate_python_frame_source``).
+_PYTHON_FRAME_SOURCE_CODE = '''
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".npy")
+
+
+class _ImageDirReader:
+    """Reads the images of a directory in name order (a camera stand-in)."""
+
+    live = False
+
+    def __init__(self, path: str, fps: float = 0.0):
+        self.files = sorted(
+            os.path.join(path, name)
+            for name in os.listdir(path)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self.files:
+            raise ValueError(f"No images found in {path}")
+        self.fps = fps
+        self._next = 0
+
+    def read(self) -> Optional[np.ndarray]:
+        if self._next >= len(self.files):
+            return None
+        path = self.files[self._next]
+        self._next += 1
+        frame = np.load(path) if path.endswith(".npy") else cv2.imread(path)
+        if frame is None:
+            raise ValueError(f"Could not load image: {path}")
+        return frame
+
+    def close(self) -> None:
+        pass
+
+
+class _CaptureReader:
+    """OpenCV capture of a V4L2 device, video file or network stream."""
+
+    def __init__(self, source: Union[int, str], fps: Optional[float] = None):
+        if isinstance(source, str) and source.isdigit():
+            source = int(source)
+        device = isinstance(source, int) or str(source).startswith("/dev/video")
+        if device and hasattr(cv2, "CAP_V4L2"):
+            self.cap = cv2.VideoCapture(source, cv2.CAP_V4L2)
+        else:
+            self.cap = cv2.VideoCapture(source)
+        if not self.cap.isOpened():
+            raise ValueError(f"Could not open frame source: {source}")
+        self.live = device or "://" in str(source)
+        if device:
+            # Frames queued in the driver only add latency
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if fps is not None:
+            self.fps = fps
+        else:
+            self.fps = 0.0 if self.live else float(self.cap.get(cv2.CAP_PROP_FPS))
+        self._frame = None
+
+    def read(self) -> Optional[np.ndarray]:
+        # Decode into the previous frame's buffer: it is preprocessed before
+        # the next read, so it can be reused
+        ok, frame = self.cap.read(self._frame)
+        if not ok:
+            return None
+        self._frame = frame
+        return frame
+
+    def close(self) -> None:
+        self.cap.release()
+
+
+def open_frame_reader(source: Union[int, str], fps: Optional[float] = None):
+    """Open a V4L2 device (index or ``/dev/videoN``), video file, URL or image
+    directory. ``fps`` paces file sources like a camera (0 disables pacing)."""
+    if isinstance(source, str) and os.path.isdir(source):
+        return _ImageDirReader(source, fps or 0.0)
+    return _CaptureReader(source, fps)
+
+
+class FramePreprocessor:
+    """Vectorized resize and normalization into the model's input layout.
+
+    Nearest-neighbour gather indices are computed once per source resolution,
+    so a frame costs one ``np.take`` into a reused buffer plus one fused
+    scale/cast into the destination; nothing is allocated per frame. BGR
+    frames (OpenCV order) are swapped to RGB, and NCHW inputs are written
+    through a transposed view.
+    """
+
+    def __init__(
+        self,
+        input_shape,
+        dtype,
+        scale: float = 1.0 / 255.0,
+        mean: float = 0.0,
+        swap_rb: bool = True,
+    ):
+        self.shape = tuple(int(d) for d in input_shape)
+        layout = self.shape[1:] if len(self.shape) == 4 else self.shape
+        if len(layout) != 3:
+            raise ValueError(f"Not an image input shape: {self.shape}")
+        self.channels_first = layout[0] in (1, 3) and layout[-1] not in (1, 3)
+        if self.channels_first:
+            self.channels, self.height, self.width = layout
+        else:
+            self.height, self.width, self.channels = layout
+        self.dtype = np.dtype(dtype)
+        self.scale = scale
+        self.mean = mean
+        self.swap_rb = swap_rb
+        self._key = None
+
+    def _build(self, frame: np.ndarray) -> None:
+        src_h, src_w, channels = frame.shape
+        rows = (np.arange(self.height) * src_h // self.height).astype(np.intp)
+        cols = (np.arange(self.width) * src_w // self.width).astype(np.intp)
+        self._index = (rows[:, None] * src_w + cols[None, :]).ravel()
+        self._flat = np.empty((self.height * self.width, channels), frame.dtype)
+        pixels = self._flat.reshape(self.height, self.width, channels)
+        if self.swap_rb and channels == 3:
+            pixels = pixels[..., ::-1]
+        if self.channels_first:
+            pixels = pixels.transpose(2, 0, 1)
+        self._pixels = pixels
+        self._key = (frame.shape, frame.dtype)
+
+    def __call__(self, frame: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Write ``frame`` (HxW or HxWxC) into ``out`` and return ``out``."""
+        src = np.ascontiguousarray(frame)
+        if src.ndim == 2:
+            src = src[:, :, None]
+        if (src.shape, src.dtype) != self._key:
+            self._build(src)
+        np.take(src.reshape(-1, src.shape[2]), self._index, axis=0, out=self._flat)
+        dst = out[0] if out.ndim == 4 else out
+        if np.issubdtype(dst.dtype, np.floating):
+            np.multiply(
+                self._pixels, self.scale, out=dst, dtype=dst.dtype, casting="unsafe"
+            )
+            if self.mean:
+                np.subtract(dst, self.mean, out=dst)
+        elif dst.dtype == np.int8:
+            np.subtract(self._pixels, 128, out=dst, dtype=np.int16, casting="unsafe")
+        else:
+            np.copyto(dst, self._pixels, casting="unsafe")
+        return out
+
+
+class FrameRing:
+    """Fixed ring of pre-allocated frames shared by a producer and a consumer.
+
+    With ``drop_policy="latest"`` the producer never waits: when every slot
+    is full it overwrites the oldest unread frame, and the consumer always
+    receives the newest frame, skipping older unread ones. ``"block"`` makes
+    the producer wait for a free slot instead (offline processing of files).
+    A frame returned by ``get`` stays valid until the next ``get`` call.
+    """
+
+    def __init__(self, capacity: int, shape, dtype, drop_policy: str = "latest"):
+        if drop_policy not in ("latest", "block"):
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        self.capacity = max(3, int(capacity))
+        self.slots = np.zeros((self.capacity,) + tuple(shape), dtype)
+        self.timestamps = np.zeros(self.capacity)
+        self.drop_latest = drop_policy == "latest"
+        self.dropped = 0
+        self.last_timestamp = 0.0
+        self._free = collections.deque(range(self.capacity))
+        self._pending: "collections.deque[int]" = collections.deque()
+        self._held: Optional[int] = None
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def acquire(self) -> Optional[int]:
+        """Slot for the producer to fill; ``None`` once the ring is closed."""
+        with self._cond:
+            while not self._closed:
+                if self._free:
+                    return self._free.popleft()
+                if self.drop_latest and self._pending:
+                    self.dropped += 1
+                    return self._pending.popleft()
+                self._cond.wait()
+            return None
+
+    def commit(self, slot: int) -> None:
+        """Publish a filled slot to the consumer."""
+        with self._cond:
+            self.timestamps[slot] = time.monotonic()
+            self._pending.append(slot)
+            self._cond.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Next frame for the consumer; ``None`` when closed and drained."""
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._pending or self._closed, timeout=timeout
+            ):
+                return None
+            if not self._pending:
+                return None
+            while self.drop_latest and len(self._pending) > 1:
+                self._free.append(self._pending.popleft())
+                self.dropped += 1
+            slot = self._pending.popleft()
+            if self._held is not None:
+                self._free.append(self._held)
+            self._held = slot
+            self.last_timestamp = float(self.timestamps[slot])
+            self._cond.notify_all()
+            return self.slots[slot]
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class FrameSource:
+    """Captures and preprocesses frames on a background thread.
+
+    Frames land in a :class:`FrameRing` already in the model's input layout,
+    so the consumer never waits on capture or decoding. File sources with a
+    known frame rate are paced like a camera unless ``fps=0`` is given.
+    Iterate over the source (or call :meth:`frames`) to consume it.
+    """
+
+    def __init__(
+        self,
+        reader,
+        preprocessor: FramePreprocessor,
+        buffer_size: int,
+        drop_policy: str = "latest",
+    ):
+        self.reader = reader
+        self.preprocessor = preprocessor
+        self.ring = FrameRing(
+            buffer_size, preprocessor.shape, preprocessor.dtype, drop_policy
+        )
+        self.captured = 0
+        self.error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "FrameSource":
+        self._thread = threading.Thread(
+            target=self._capture, name="edgeflow-capture", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.ring.close()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+    def __enter__(self) -> "FrameSource":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _capture(self) -> None:
+        period = 1.0 / self.reader.fps if self.reader.fps > 0 else 0.0
+        deadline = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                frame = self.reader.read()
+                if frame is None:
+                    break
+                slot = self.ring.acquire()
+                if slot is None:
+                    break
+                self.preprocessor(frame, self.ring.slots[slot])
+                self.ring.commit(slot)
+                self.captured += 1
+                if period:
+                    deadline += period
+                    time.sleep(max(0.0, deadline - time.perf_counter()))
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.ring.close()
+            self.reader.close()
+
+    def frames(self) -> Iterator[np.ndarray]:
+        """Yield model-ready frames (valid until the next one is requested)."""
+        while True:
+            frame = self.ring.get()
+            if frame is None:
+                if self.error is not None:
+                    raise self.error
+                return
+            yield frame
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return self.frames()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "captured": self.captured,
+            "dropped": self.ring.dropped,
+            "buffer_size": self.ring.capacity,
+        }
+
+'''
+
 
 class CodeGenerator(ASTVisitor):
     """Generates target-specific inference code from EdgeFlow AST and IR."""
@@ -269,10 +585,20 @@ class CodeGenerator(ASTVisitor):
                 "import tensorflow as tf",
                 "import numpy as np",
                 "import cv2",
+                "import mmap",
                 "import time",
-                "from typing import Optional, Union, List, Tuple, Dict, Any",
+                "from typing import Optional, Union, List, Tuple, Dict, Any, Iterable",
             ]
         )
+        if self._has_frame_source():
+            self.imports.update(
+                [
+                    "import collections",
+                    "import os",
+                    "import threading",
+                    "from typing import Iterator",
+                ]
+            )
 
         # Add device-specific imports
         if self.config.get("target_device") == "raspberry_pi":
@@ -280,11 +606,38 @@ class CodeGenerator(ASTVisitor):
 
         # Generate the Python class
         code = self._generate_python_header()
+        code += "try:\n"
+        code += "    import resource\n"
+        code += "except ImportError:\n"
+        code += "    resource = None  # type: ignore[assignment]\n\n"
+        code += _MODEL_PAGE_CACHE_CODE
+        code += _LATENCY_HISTOGRAM_CODE + "\n"
+        code += self._generate_python_frame_source()
         code += self._generate_python_class()
         code += self._generate_python_main()
 
         return code
 
+    def _has_frame_source(self) -> bool:
+        return self.config.get("input_stream", "camera") in IMAGE_INPUT_STREAMS
+
+    def _generate_python_frame_source(self) -> str:
+        """Generate the frame-source runtime for image input streams.
+
+        ``input_stream`` selects the default source and ``buffer_size`` sizes
+        the frame ring (through ``EdgeFlowInference.buffer_size``).
+        """
+        if not self._has_frame_source():
+            return ""
+        input_stream = self.config.get("input_stream", "camera")
+        default_source = "/dev/video0" if input_stream == "camera" else None
+
+        code = "# Frame source configuration (input_stream / buffer_size)\n"
+        code += f'INPUT_STREAM = "{input_stream}"\n'
+        code += f"DEFAULT_FRAME_SOURCE = {default_source!r}\n"
+        code += _PYTHON_FRAME_SOURCE_CODE
+        return code
+
     def _generate_python_header(self) -> str:
         """Generate Python file header with imports and docstring."""
         header = '"""EdgeFlow Generated Python Inference Code.\n\n'
@@ -315,9 +668,19 @@ class CodeGenerator(ASTVisitor):
         code += '    """EdgeFlow inference engine for edge devices."""\n\n'
 
         # Constructor
-        code += "    def __init__(self, model_path: str = None):\n"
-        code += '        """Initialize the inference engine."""\n'
+        code += (
+            "    def __init__(self, model_path: str = None, "
+            "madvise: Optional[Tuple[str, ...]] = None):\n"
+        )
+        code += '        """Initialize the inference engine.\n\n'
+        code += "        The model is loaded by path, which TFLite maps read-only and\n"
+        code += "        shared: processes serving the same model share its pages.\n"
+        code += (
+            "        ``madvise`` hints (e.g. ``('willneed',)``) are applied first.\n"
+        )
+        code += '        """\n'
         code += f'        self.model_path = model_path or "{model_path}"\n'
+        code += "        self.madvise = tuple(madvise or ())\n"
         code += f"        self.buffer_size = {buffer_size}\n"
         code += (
             f"        self.memory_limit = {memory_limit} * 1024 * 1024\n"  # MB to bytes
@@ -326,6 +689,11 @@ class CodeGenerator(ASTVisitor):
         code += "        self.interpreter = None\n"
         code += "        self.input_details = None\n"
         code += "        self.output_details = None\n"
+        code += "        # Always-on per-stage latency histograms\n"
+        code += (
+            "        self.latency = "
+            "{stage: LatencyHistogram() for stage in LATENCY_STAGES}\n"
+        )
         code += "        self._setup_memory_management()\n"
         code += "        self._load_model()\n\n"
 
@@ -340,6 +708,7 @@ class CodeGenerator(ASTVisitor):
 
         # Inference methods
         code += self._generate_python_inference_methods()
+        code += self._generate_python_streaming_methods()
 
         # Utility methods
         code += self._generate_python_utility_methods()
@@ -372,7 +741,11 @@ class CodeGenerator(ASTVisitor):
         code = "    def _load_model(self):\n"
         code += '        """Load and configure the TensorFlow Lite model."""\n'
         code += "        try:\n"
-        code += "            # Load TFLite model\n"
+        code += "            if self.madvise:\n"
+        code += "                advise_model(self.model_path, self.madvise)\n"
+        code += (
+            "            # Load TFLite model (mmap'd by path, not read into memory)\n"
+        )
         code += "            self.interpreter = tf.lite.Interpreter(\n"
         code += "                model_path=self.model_path,\n"
         code += "                experimental_preserve_all_tensors=True\n"
@@ -386,6 +759,13 @@ class CodeGenerator(ASTVisitor):
         code += (
             "            self.output_details = self.interpreter.get_output_details()\n"
         )
+        code += "            # Callables returning views of the interpreter's buffers\n"
+        code += "            self._input_view = self.interpreter.tensor(\n"
+        code += "                self.input_details[0]['index']\n"
+        code += "            )\n"
+        code += "            self._output_view = self.interpreter.tensor(\n"
+        code += "                self.output_details[0]['index']\n"
+        code += "            )\n"
         code += "            \n"
         code += '            print(f"Model loaded: {self.model_path}")\n'
         code += "            if self.input_details:\n"
@@ -452,35 +832,90 @@ class CodeGenerator(ASTVisitor):
         return code
 
     def _generate_python_inference_methods(self) -> str:
-        """Generate inference methods."""
-        code = (
-            "    def predict(self, input_data: Union[np.ndarray, str]) -> np.ndarray:\n"
+        """Generate inference methods.
+
+        Inputs are written into, and outputs read from, views of the
+        interpreter's tensor buffers (``interpreter.tensor(index)()``) rather
+        than through the copying ``set_tensor``/``get_tensor`` calls.
+        """
+        code = "    def input_buffer(self) -> np.ndarray:\n"
+        code += '        """Writable view of the input tensor; see predict_into."""\n'
+        code += "        return self._input_view()\n\n"
+
+        code += "    def allocate_output(self) -> np.ndarray:\n"
+        code += '        """Allocate an array usable as the out of predict_into."""\n'
+        code += "        return np.empty_like(self._output_view())\n\n"
+
+        code += (
+            "    def _run(self, input_data: "
+            "Optional[Union[np.ndarray, str]]) -> None:\n"
         )
-        code += '        """Run inference on input data."""\n'
-        code += "        start_time = time.time()\n"
-        code += "        \n"
-        code += "        # Preprocess input\n"
-        code += "        processed_input = self._preprocess_input(input_data)\n"
-        code += "        \n"
-        code += "        # Set input tensor\n"
-        code += "        self.interpreter.set_tensor(\n"
-        code += "            self.input_details[0]['index'],\n"
-        code += "            processed_input\n"
-        code += "        )\n"
-        code += "        \n"
-        code += "        # Run inference\n"
+        code += "        start = time.perf_counter_ns()\n"
+        code += "        if input_data is not None:\n"
+        code += (
+            "            # Write straight into the tensor arena (no set_tensor copy)\n"
+        )
+        code += (
+            "            self._input_view()[...] = self._preprocess_input(input_data)\n"
+        )
+        code += "        invoked = time.perf_counter_ns()\n"
         code += "        self.interpreter.invoke()\n"
-        code += "        \n"
-        code += "        # Get output\n"
-        code += "        output = self.interpreter.get_tensor(\n"
-        code += "            self.output_details[0]['index']\n"
-        code += "        )\n"
-        code += "        \n"
-        code += "        inference_time = time.time() - start_time\n"
-        code += '        print(f"Inference time: {inference_time:.4f}s")\n'
-        code += "        \n"
+        code += "        done = time.perf_counter_ns()\n"
+        code += '        self.latency["preprocess"].record_ns(invoked - start)\n'
+        code += '        self.latency["invoke"].record_ns(done - invoked)\n'
+        code += '        print(f"Inference time: {(done - start) / 1e9:.4f}s")\n\n'
+
+        code += (
+            "    def predict(self, input_data: Union[np.ndarray, str], "
+            "copy: bool = True) -> np.ndarray:\n"
+        )
+        code += '        """Run inference on input data.\n'
+        code += "\n"
+        code += "        With copy=False the returned array is a view of the\n"
+        code += "        interpreter's output tensor (see predict_into for the\n"
+        code += "        aliasing rules) instead of a private copy.\n"
+        code += '        """\n'
+        code += "        self._run(input_data)\n"
+        code += "        start = time.perf_counter_ns()\n"
+        code += "        output = self._output_view()\n"
+        code += "        if copy:\n"
+        code += "            output = output.copy()\n"
+        code += (
+            '        self.latency["postprocess"].record_ns('
+            "time.perf_counter_ns() - start)\n"
+        )
         code += "        return output\n\n"
 
+        code += (
+            "    def predict_into(self, out: np.ndarray, input_data: "
+            "Optional[Union[np.ndarray, str]] = None) -> np.ndarray:\n"
+        )
+        code += (
+            '        """Run inference, writing the output into out (no allocation).\n'
+        )
+        code += "\n"
+        code += "        With input_data=None the input tensor is used as already\n"
+        code += "        filled through input_buffer().\n"
+        code += "\n"
+        code += "        Aliasing rules for input_buffer() and predict(copy=False):\n"
+        code += "        - the views alias the interpreter's tensor arena and are\n"
+        code += "          overwritten in place by the next inference;\n"
+        code += "        - drop them (del view) before the next predict call, the\n"
+        code += "          interpreter refuses to invoke while they are referenced;\n"
+        code += (
+            "        - they are invalid after allocate_tensors/resize_tensor_input.\n"
+        )
+        code += "        out is owned by the caller and can be reused across frames.\n"
+        code += '        """\n'
+        code += "        self._run(input_data)\n"
+        code += "        start = time.perf_counter_ns()\n"
+        code += "        np.copyto(out, self._output_view())\n"
+        code += (
+            '        self.latency["postprocess"].record_ns('
+            "time.perf_counter_ns() - start)\n"
+        )
+        code += "        return out\n\n"
+
         # Batch inference
         code += (
             "    def predict_batch(self, input_data: "
@@ -493,6 +928,74 @@ class CodeGenerator(ASTVisitor):
         code += "            results.append(result)\n"
         code += "        return results\n\n"
 
+        code += (
+            "    def latency_snapshot(self, reset: bool = False) "
+            "-> Dict[str, Dict[str, Any]]:\n"
+        )
+        code += '        """Per-stage latency histograms (preprocess, invoke,\n'
+        code += "        postprocess) since start-up or the last reset.\n"
+        code += '        """\n'
+        code += (
+            "        snapshot = "
+            "{stage: h.snapshot() for stage, h in self.latency.items()}\n"
+        )
+        code += "        if reset:\n"
+        code += "            self.reset_latency()\n"
+        code += "        return snapshot\n\n"
+
+        code += "    def reset_latency(self) -> None:\n"
+        code += '        """Clear every latency histogram."""\n'
+        code += "        for histogram in self.latency.values():\n"
+        code += "            histogram.reset()\n\n"
+
+        return code
+
+    def _generate_python_streaming_methods(self) -> str:
+        """Generate methods feeding the engine from a frame source."""
+        if not self._has_frame_source():
+            return ""
+        code = (
+            "    def open_frame_source(self, source: Optional[Union[int, str]] = None, "
+            'drop_policy: str = "latest", fps: Optional[float] = None) '
+            "-> FrameSource:\n"
+        )
+        code += '        """Open a frame source producing model-ready input frames.\n'
+        code += "\n"
+        code += "        source defaults to the configured input stream; the ring\n"
+        code += "        holds buffer_size frames.\n"
+        code += '        """\n'
+        code += "        source = DEFAULT_FRAME_SOURCE if source is None else source\n"
+        code += "        if source is None:\n"
+        code += (
+            '            raise ValueError(f"input_stream {INPUT_STREAM!r} '
+            'needs an explicit source")\n'
+        )
+        code += "        detail = self.input_details[0]\n"
+        code += "        return FrameSource(\n"
+        code += "            open_frame_reader(source, fps),\n"
+        code += "            FramePreprocessor(detail['shape'], detail['dtype']),\n"
+        code += "            self.buffer_size,\n"
+        code += "            drop_policy,\n"
+        code += "        )\n\n"
+
+        code += (
+            "    def run_stream(self, source: Optional[Union[int, str]] = None, "
+            'drop_policy: str = "latest", fps: Optional[float] = None) '
+            "-> Iterator[np.ndarray]:\n"
+        )
+        code += '        """Yield the model output for each frame of a source.\n'
+        code += "\n"
+        code += "        The same output array is reused for every frame (see\n"
+        code += "        predict_into); copy it to keep a result.\n"
+        code += '        """\n'
+        code += "        out = self.allocate_output()\n"
+        code += (
+            "        with self.open_frame_source(source, drop_policy, fps) as frames:\n"
+        )
+        code += "            for frame in frames:\n"
+        code += "                self._input_view()[...] = frame\n"
+        code += "                yield self.predict_into(out)\n\n"
+
         return code
 
     def _generate_python_utility_methods(self) -> str:
@@ -536,6 +1039,7 @@ class CodeGenerator(ASTVisitor):
 
     def _generate_python_main(self) -> str:
         """Generate main execution code."""
+        model_path = self.config.get("model_path", "model.tflite")
         code = "def main():\n"
         code += '    """Main execution function."""\n'
         code += "    import argparse\n"
@@ -543,20 +1047,49 @@ class CodeGenerator(ASTVisitor):
         code += (
             '    parser = argparse.ArgumentParser(description="EdgeFlow Inference")\n'
         )
+        code += '    parser.add_argument("--input", help="Input data path")\n'
+        code += '    parser.add_argument("--model", help="Model path override")\n'
+        code += (
+            '    parser.add_argument("--madvise", nargs="+", '
+            "choices=MODEL_MADVISE_HINTS, "
+            'help="madvise hints for the model file")\n'
+        )
         code += (
-            '    parser.add_argument("--input", required=True, '
-            'help="Input data path")\n'
+            '    parser.add_argument("--prewarm", action="store_true", '
+            'help="Load the model into the page cache and exit")\n'
         )
-        code += '    parser.add_argument("--model", help="Model path override")\n'
         code += (
             '    parser.add_argument("--benchmark", action="store_true", '
             'help="Run benchmark")\n'
         )
+        if self._has_frame_source():
+            code += (
+                '    parser.add_argument("--stream", action="store_true", '
+                'help="Run continuously on a camera, video file or image '
+                'directory")\n'
+            )
         code += "    args = parser.parse_args()\n"
         code += "    \n"
+        code += "    if args.prewarm:\n"
+        code += f'        model_path = args.model or "{model_path}"\n'
+        code += "        print(prewarm_model(model_path))\n"
+        code += "        return\n"
+        code += "    if not args.input:\n"
+        code += '        parser.error("--input is required")\n'
+        code += "    \n"
         code += "    # Initialize inference engine\n"
-        code += "    engine = EdgeFlowInference(args.model)\n"
+        code += "    engine = EdgeFlowInference(args.model, args.madvise)\n"
         code += "    \n"
+        if self._has_frame_source():
+            code += "    if args.stream:\n"
+            code += "        frames = 0\n"
+            code += "        start = time.time()\n"
+            code += "        for output in engine.run_stream(args.input):\n"
+            code += "            frames += 1\n"
+            code += "        elapsed = max(time.time() - start, 1e-9)\n"
+            code += '        print(f"Processed {frames} frames ({frames / elapsed:.1f} FPS)")\n'
+            code += "        return\n"
+            code += "    \n"
         code += "    if args.benchmark:\n"
         code += "        # Run benchmark\n"
         code += "        results = engine.benchmark(args.input)\n"
@@ -35,6 +35,7 @@ parse_ef = _parse_edgeflow_file
 from typing import Any
 from typing import Dict as DictType
 from typing import Optional
+from typing import Tuple
 
 from edgeflow.reporting.cli_formatter import (
     CLIFormatter,
@@ -116,18 +117,87 @@ def _configure_logging(verbose: bool) -> None:
     )
 
 
+def _parse_resolution(value: str) -> Tuple[int, int]:
+    """Parse an ``HxW`` resolution such as ``224x224``."""
+
+    try:
+        height, width = (int(v) for v in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid resolution {value!r}, expected HxW (e.g. 224x224)"
+        )
+    return height, width
+
+
+def _build_bench_parser() -> argparse.ArgumentParser:
+    """Parser for ``edgeflowc bench {compiler,sweep}``."""
+
+    from edgeflow.benchmarking.compiler_benchmarks import (
+        add_bench_arguments,
+        run_bench,
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="edgeflowc bench",
+        description="Benchmark the EdgeFlow compiler or a TFLite model",
+    )
+    suites = parser.add_subparsers(dest="suite", metavar="suite", required=True)
+
+    compiler = suites.add_parser(
+        "compiler",
+        help="Time the compiler itself on synthetic inputs",
+        description="Benchmark the EdgeFlow compiler on synthetic inputs",
+    )
+    add_bench_arguments(compiler)
+    compiler.set_defaults(handler=run_bench)
+
+    sweep = suites.add_parser(
+        "sweep",
+        help="Sweep batch sizes and input resolutions of a TFLite model",
+        description="Sweep batch sizes and input resolutions of a TFLite model",
+    )
+    sweep.add_argument("model", help="Path to a .tflite model")
+    sweep.add_argument(
+        "--config", help="EdgeFlow config (.ef) for buffer_size and target device"
+    )
+    sweep.add_argument("--batch-sizes", type=int, nargs="+", help="Batch sizes")
+    sweep.add_argument(
+        "--resolutions",
+        type=_parse_resolution,
+        nargs="+",
+        help="Input resolutions as HxW (e.g. 224x224)",
+    )
+    sweep.add_argument(
+        "--latency-budget", type=float, help="Latency budget per invocation (ms)"
+    )
+    sweep.add_argument("--output", help="Write the sweep results as JSON")
+    sweep.set_defaults(handler=run_batch_sweep)
+    return parser
+
+
 def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments.
 
+    ``edgeflowc bench ...`` is parsed by its own sub-command parser (see
+    ``_build_bench_parser``); the returned namespace then has
+    ``command == "bench"`` and a ``handler`` to run.
+
     Returns:
         argparse.Namespace: Parsed arguments.
     """
 
+    argv = sys.argv[1:]
+    if argv[:1] == ["bench"]:
+        args = _build_bench_parser().parse_args(argv[1:])
+        args.command = "bench"
+        return args
+
     parser = argparse.ArgumentParser(
         prog="edgeflowc",
         description=(
             "EdgeFlow compiler for optimizing TFLite models using DSL configs"
         ),
+        epilog="Run 'edgeflowc bench {compiler,sweep} --help' for benchmarks.",
     )
     parser.add_argument(
         "config_path",
@@ -245,7 +315,8 @@ def parse_arguments() -> argparse.Namespace:
         help="Build Docker image without cache",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    args.command = "compile"
     return args
 
 
@@ -427,12 +498,19 @@ def optimize_model(
     """Run the full Day 3/4 pipeline: benchmark -> optimize -> benchmark.
 
     This reorders the earlier logic so we always capture baseline metrics
-    prior to optimization (as required by Phase II tasks). It then performs
-    optimization and captures post-optimization metrics plus a comparison.
+    prior to optimization (as required by Phase II tasks). When the model
+    exists, the baseline benchmark runs in a worker process while the
+    optimizer converts, and both models are fed the same pre-generated inputs
+    so the comparison also reports output differences.
     """
     formatter = formatter or CLIFormatter()
+    baseline = None
     try:
-        from edgeflow.benchmarking.benchmarker import benchmark_model, compare_models
+        from edgeflow.benchmarking.benchmarker import (
+            BaselineBenchmark,
+            benchmark_model,
+            compare_models,
+        )
         from edgeflow.optimization.optimizer import optimize
 
         model_path = config.get("model", "model.tflite")
@@ -441,12 +519,16 @@ def optimize_model(
                 "Model file not found: %s (a test model may be generated by optimizer)",
                 model_path,
             )
-
-        print(formatter.header("Baseline Benchmark (Pre-Optimization)", level=2))
-        spinner = Spinner("Benchmarking original model", formatter)
-        spinner.start()
-        original_benchmark = benchmark_model(model_path, config)
-        spinner.stop(True, "Benchmark complete")
+            print(formatter.header("Baseline Benchmark (Pre-Optimization)", level=2))
+            spinner = Spinner("Benchmarking original model", formatter)
+            spinner.start()
+            original_benchmark = benchmark_model(model_path, config)
+            spinner.stop(True, "Benchmark complete")
+        else:
+            print(
+                formatter.info("Baseline benchmark running in parallel with optimizer")
+            )
+            baseline = BaselineBenchmark(model_path, config).start()
 
         print(formatter.header("Optimization Phase", level=2))
         progress = ProgressBar(100, "Optimizing model", formatter=formatter)
@@ -458,7 +540,11 @@ def optimize_model(
         spinner = Spinner("Benchmarking optimized model", formatter)
         spinner.start()
         # Use comparison results for consistent benchmarking
-        comparison = compare_models(model_path, optimized_path, config)
+        if baseline is not None:
+            comparison = compare_models(model_path, optimized_path, config, baseline)
+            original_benchmark = comparison.get("original", {})
+        else:
+            comparison = compare_models(model_path, optimized_path, config)
         optimized_benchmark = comparison.get("optimized", {})
         spinner.stop(True, "Benchmark complete")
 
@@ -480,9 +566,15 @@ def optimize_model(
             f"Latency improvement: {improvements.get('latency_improvement_percent', 0.0):.1f}%",
             f"Throughput improvement: {improvements.get('throughput_improvement_percent', 0.0):.1f}%",
             f"Memory improvement: {improvements.get('memory_improvement_percent', 0.0):.1f}%",
-            "",
-            f"Optimized model: {optimized_path}",
         ]
+        output_difference = comparison.get("output_difference") or {}
+        if "top1_agreement" in output_difference:
+            summary_lines += [
+                f"Top-1 agreement: {output_difference['top1_agreement'] * 100:.1f}%",
+                f"Output cosine similarity: {output_difference['cosine_similarity']:.4f}",
+                f"Max abs output error: {output_difference['max_abs_error']:.4g}",
+            ]
+        summary_lines += ["", f"Optimized model: {optimized_path}"]
 
         print(
             create_summary_box(
@@ -499,6 +591,9 @@ def optimize_model(
     except Exception as e:  # noqa: BLE001
         logging.error("Optimization pipeline failed: %s", e)
         return {"error": str(e)}
+    finally:
+        if baseline is not None:
+            baseline.cleanup()
 
 
 def apply_ir_transformations(
@@ -562,6 +657,56 @@ def apply_ir_transformations(
         return {"passes_applied": 0, "transformations": [], "error": str(e)}
 
 
+def run_batch_sweep(args: argparse.Namespace) -> int:
+    """Run ``edgeflowc bench sweep``: batch-size / resolution sweep of a model.
+
+    Args:
+        args: Arguments parsed by the ``sweep`` sub-command parser.
+
+    Returns:
+        int: 0 on success, 1 when the sweep could not run.
+    """
+
+    from edgeflow.benchmarking.benchmarker import EdgeFlowBenchmarker
+
+    cfg: DictType[str, Any] = {}
+    if args.config:
+        cfg = load_config(args.config)
+    if args.latency_budget is not None:
+        cfg["target_latency_ms"] = args.latency_budget
+    result = EdgeFlowBenchmarker(cfg).sweep_model(
+        args.model, batch_sizes=args.batch_sizes, resolutions=args.resolutions
+    )
+    if result is None:
+        print("Sweep unavailable: TensorFlow Lite missing or model not loadable")
+        return 1
+
+    print(
+        f"{'batch':>5} {'resolution':>10} {'latency':>10} {'per item':>10} "
+        f"{'items/s':>9} {'arena':>8}"
+    )
+    for point in result["points"]:
+        res = "x".join(map(str, point["resolution"] or [])) or "native"
+        if point["status"] != "success":
+            print(f"{point['batch_size']:>5} {res:>10}  error: {point['error']}")
+            continue
+        print(
+            f"{point['batch_size']:>5} {res:>10} {point['latency_ms']:>8.2f}ms "
+            f"{point['latency_per_item_ms']:>8.2f}ms "
+            f"{point['throughput_items_per_s']:>9.1f} {point['arena_mb']:>6.1f}MB"
+        )
+    for res, rec in result["recommendations"].items():
+        if rec is None:
+            print(f"[{res}] no batch size fits the latency budget")
+        else:
+            print(f"[{res}] recommended: {rec['reason']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
 def main() -> int:
     """Main entry point for EdgeFlow compiler.
 
@@ -571,6 +716,8 @@ def main() -> int:
 
     try:
         args = parse_arguments()
+        if getattr(args, "command", None) == "bench":
+            return int(args.handler(args))
         _configure_logging(args.verbose)
         formatter = CLIFormatter()
 
@@ -4,13 +4,30 @@ EdgeFlow Inference Engine for raspberry_pi
 Generated by EdgeFlow Deployment Packager
 """
 
+import collections
+import contextlib
+import http.client
+import http.server
+import io
+import json
 import logging
+import mmap
 import os
+import queue
+import socket
+import socketserver
+import threading
 import time
-from typing import Any, Dict, Optional
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore[assignment]
+
 # Device-specific imports
 try:
     import tflite_runtime.interpreter as tflite
@@ -24,32 +41,461 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Memory budget for models hosted together (ModelRuntimeManager)
+MAX_MEMORY_MB = 256
+
+
+def _rss_mb() -> float:
+    """Current resident set size in MB (0.0 if unavailable)."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return float(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return 0.0
+
+
+class _PeakRSSSampler:
+    """Background thread recording peak RSS while active."""
+
+    def __init__(self, interval_s: float = 0.005):
+        self.interval_s = interval_s
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            self.peak_mb = max(self.peak_mb, _rss_mb())
+
+    def __enter__(self):
+        self.peak_mb = _rss_mb()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self.peak_mb = max(self.peak_mb, _rss_mb())
+
+
+def _page_faults() -> Tuple[int, int]:
+    """(minor, major) page faults of this process."""
+    if resource is None:
+        return 0, 0
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_minflt, usage.ru_majflt
+
+
+# Hints accepted by prewarm_model for its own read pass over the model file
+MADVISE_HINTS = {
+    "willneed": "MADV_WILLNEED",
+    "sequential": "MADV_SEQUENTIAL",
+    "random": "MADV_RANDOM",
+}
+
+# Hints accepted by advise_model, EdgeFlowInference(madvise=...) and --madvise.
+# Only willneed's page-cache readahead outlives the mapping it is applied to;
+# sequential/random would only tune a mapping that TFLite never sees.
+MODEL_MADVISE_HINTS = ("willneed",)
+
+
+def _map_model(model_path: str) -> "mmap.mmap":
+    """Read-only shared mapping of a model file (no private copy)."""
+    with open(model_path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _madvise(mapping: "mmap.mmap", hints: Iterable[str]) -> List[str]:
+    applied = []
+    for hint in hints:
+        if hint not in MADVISE_HINTS:
+            raise ValueError(f"Unknown madvise hint: {hint}")
+        flag = getattr(mmap, MADVISE_HINTS[hint], None)
+        if flag is None or not hasattr(mapping, "madvise"):
+            continue  # not supported on this platform
+        try:
+            mapping.madvise(flag)
+        except OSError:
+            continue
+        applied.append(hint)
+    return applied
+
+
+def advise_model(model_path: str, hints: Iterable[str] = ("willneed",)) -> List[str]:
+    """Apply ``madvise`` hints to the pages of a model file.
+
+    ``willneed`` starts asynchronous readahead into the page cache, so the
+    interpreter's first passes over the weights do not stall on SD-card
+    reads. It is the only hint accepted here (see ``MODEL_MADVISE_HINTS``).
+    Returns the hints the platform accepted.
+    """
+    hints = tuple(hints)
+    for hint in hints:
+        if hint in MADVISE_HINTS and hint not in MODEL_MADVISE_HINTS:
+            raise ValueError(
+                f"madvise hint {hint!r} does not outlive the mapping it is "
+                f"applied to; use one of {MODEL_MADVISE_HINTS}"
+            )
+    mapping = _map_model(model_path)
+    try:
+        return _madvise(mapping, hints)
+    finally:
+        mapping.close()
+
+
+def prewarm_model(
+    model_path: str, hints: Iterable[str] = ("willneed",)
+) -> Dict[str, Any]:
+    """Read a model file into the page cache, e.g. from a boot-time service.
+
+    Touches one byte per page through a read-only mapping, so later loads by
+    any process are served from memory. ``hints`` apply to that mapping only
+    and end with this pass (``sequential``/``random`` tune its readahead);
+    what persists is the page cache it fills. The returned ``major_faults``
+    count is 0 when the file was already cached.
+    """
+    start = time.perf_counter()
+    faults = _page_faults()
+    mapping = _map_model(model_path)
+    try:
+        applied = _madvise(mapping, hints)
+        size = len(mapping)
+        for offset in range(0, size, mmap.PAGESIZE):
+            mapping[offset]  # faults the page in
+    finally:
+        mapping.close()
+    return {
+        "bytes": size,
+        "pages": -(-size // mmap.PAGESIZE),
+        "major_faults": _page_faults()[1] - faults[1],
+        "ms": (time.perf_counter() - start) * 1000,
+        "hints": applied,
+    }
+
+
+LATENCY_STAGES = ("preprocess", "invoke", "postprocess")
+
+
+class LatencyHistogram:
+    """Constant-memory latency histogram with HDR-style log-linear buckets.
+
+    Durations are recorded in whole microseconds. Values below
+    ``2**precision_bits`` get a bucket each; above that every power of two is
+    split into ``2**(precision_bits - 1)`` linear sub-buckets, so a recorded
+    value is known to within ``2**(1 - precision_bits)`` (1.6% with the
+    default 7 bits) from 1 us up to ``max_ms``. Recording is a few integer
+    operations, cheap enough to leave on in production, and memory stays
+    fixed (about 1,400 counters for 60 s) however long the process runs.
+    Recording takes no lock: a snapshot taken while another thread records
+    may miss that one in-flight sample.
+    """
+
+    # Set by reset()
+    _counts: List[int]
+    _total_us: int
+    _max_us: int
+    _min_us: int
+
+    def __init__(self, max_ms: float = 60000.0, precision_bits: int = 7):
+        self.precision_bits = int(precision_bits)
+        self._sub = 1 << self.precision_bits
+        self._half = self._sub >> 1
+        self.highest_us = max(int(max_ms * 1000), self._sub)
+        self._buckets = self._index(self.highest_us) + 1
+        self.reset()
+
+    def _index(self, us: int) -> int:
+        if us < self._sub:
+            return us
+        shift = us.bit_length() - self.precision_bits
+        return self._sub + (shift - 1) * self._half + (us >> shift) - self._half
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        """``[low, high)`` in microseconds of bucket ``index``."""
+        if index < self._sub:
+            return index, index + 1
+        shift, offset = divmod(index - self._sub, self._half)
+        low = (self._half + offset) << (shift + 1)
+        return low, low + (1 << (shift + 1))
+
+    def record_us(self, us: int) -> None:
+        us = min(max(int(us), 0), self.highest_us)
+        self._counts[self._index(us)] += 1
+        self._total_us += us
+        if us > self._max_us:
+            self._max_us = us
+        if us < self._min_us:
+            self._min_us = us
+
+    def record_ns(self, ns: int) -> None:
+        """Record a ``time.perf_counter_ns()`` delta."""
+        self.record_us(ns // 1000)
+
+    def record_ms(self, ms: float) -> None:
+        self.record_us(int(ms * 1000))
+
+    def reset(self) -> None:
+        self._counts = [0] * self._buckets
+        self._total_us = 0
+        self._max_us = 0
+        self._min_us = self.highest_us
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Count, mean, min/max, p50/p90/p99/p99.9 and the non-empty buckets.
+
+        Percentiles are bucket midpoints (capped at the largest value seen);
+        ``buckets`` lists ``[low_ms, high_ms, count]`` for merging snapshots
+        from several devices or processes.
+        """
+        counts = np.array(self._counts, dtype=np.int64)
+        count = int(counts.sum())
+        snapshot: Dict[str, Any] = {"count": count}
+        cumulative = np.cumsum(counts)
+        for name, q in (("p50", 50.0), ("p90", 90.0), ("p99", 99.0), ("p999", 99.9)):
+            value = 0.0
+            if count:
+                index = int(np.searchsorted(cumulative, max(q / 100.0 * count, 1.0)))
+                low, high = self._bounds(index)
+                value = min((low + high - 1) / 2.0, self._max_us)
+            snapshot[f"{name}_ms"] = value / 1000.0
+        snapshot["mean_ms"] = self._total_us / count / 1000.0 if count else 0.0
+        snapshot["min_ms"] = self._min_us / 1000.0 if count else 0.0
+        snapshot["max_ms"] = self._max_us / 1000.0
+        buckets = []
+        for index in map(int, np.flatnonzero(counts)):
+            low, high = self._bounds(index)
+            buckets.append([low / 1000.0, high / 1000.0, int(counts[index])])
+        snapshot["buckets"] = buckets
+        return snapshot
+
+
+_STREAM_END = object()
+
+
+class _StreamFailure:
+    """Carries an exception from a pipeline stage to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _StreamPipeline:
+    """Overlaps preprocessing, invoke and postprocessing across threads.
+
+    Frames travel through a ring of ``depth`` pre-allocated input/output
+    buffer pairs. The preprocess thread fills a free input slot, the invoke
+    thread runs the interpreter and copies the output into the same slot, and
+    the consuming thread postprocesses it and returns the slot to the free
+    list. The ring bounds the number of frames in flight, so a slow stage
+    applies back-pressure instead of queueing frames without limit, and no
+    per-frame arrays are allocated by the pipeline itself.
+    """
+
+    _POLL_S = 0.1
+
+    def __init__(
+        self,
+        engine: "EdgeFlowInference",
+        preprocess: Optional[Callable[[Any, np.ndarray], None]],
+        postprocess: Optional[Callable[[np.ndarray], Any]],
+        depth: int,
+    ):
+        self.engine = engine
+        self.preprocess = preprocess or _default_preprocess
+        self.postprocess = postprocess or np.copy
+        self.depth = max(2, int(depth))
+        interpreter = engine._ensure_loaded()
+        in_detail = interpreter.get_input_details()[0]
+        out_detail = interpreter.get_output_details()[0]
+        self.input_ring = [
+            np.zeros(in_detail["shape"], dtype=in_detail["dtype"])
+            for _ in range(self.depth)
+        ]
+        self.output_ring = [
+            np.zeros(out_detail["shape"], dtype=out_detail["dtype"])
+            for _ in range(self.depth)
+        ]
+        self._free: "queue.Queue[int]" = queue.Queue(maxsize=self.depth)
+        for slot in range(self.depth):
+            self._free.put(slot)
+        self._to_infer: "queue.Queue[Any]" = queue.Queue(maxsize=self.depth)
+        self._to_post: "queue.Queue[Any]" = queue.Queue(maxsize=self.depth)
+        self._stop = threading.Event()
+        self.stats: Dict[str, float] = {
+            "frames": 0,
+            "preprocess_ms": 0.0,
+            "invoke_ms": 0.0,
+            "postprocess_ms": 0.0,
+        }
+
+    def _put(self, q: "queue.Queue[Any]", item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=self._POLL_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: "queue.Queue[Any]") -> Any:
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=self._POLL_S)
+            except queue.Empty:
+                continue
+        return _STREAM_END
+
+    def _preprocess_stage(self, inputs: Iterable[Any]) -> None:
+        try:
+            for item in inputs:
+                slot = self._get(self._free)
+                if slot is _STREAM_END:
+                    return
+                start = time.perf_counter_ns()
+                self.preprocess(item, self.input_ring[slot])
+                elapsed = time.perf_counter_ns() - start
+                self.engine.latency["preprocess"].record_ns(elapsed)
+                self.stats["preprocess_ms"] += elapsed / 1e6
+                if not self._put(self._to_infer, slot):
+                    return
+            self._put(self._to_infer, _STREAM_END)
+        except BaseException as e:
+            self._put(self._to_infer, _StreamFailure(e))
+
+    def _invoke_stage(self) -> None:
+        interpreter = self.engine._ensure_loaded()
+        in_index = interpreter.get_input_details()[0]["index"]
+        out_index = interpreter.get_output_details()[0]["index"]
+        try:
+            while True:
+                slot = self._get(self._to_infer)
+                if slot is _STREAM_END or isinstance(slot, _StreamFailure):
+                    self._put(self._to_post, slot)
+                    return
+                start = time.perf_counter_ns()
+                interpreter.set_tensor(in_index, self.input_ring[slot])
+                interpreter.invoke()  # releases the GIL
+                np.copyto(self.output_ring[slot], interpreter.tensor(out_index)())
+                elapsed = time.perf_counter_ns() - start
+                self.engine.latency["invoke"].record_ns(elapsed)
+                self.stats["invoke_ms"] += elapsed / 1e6
+                if not self._put(self._to_post, slot):
+                    return
+        except BaseException as e:
+            self._put(self._to_post, _StreamFailure(e))
+
+    def run(self, inputs: Iterable[Any]) -> Iterator[Any]:
+        threads = [
+            threading.Thread(
+                target=self._preprocess_stage,
+                args=(inputs,),
+                name="edgeflow-preprocess",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._invoke_stage, name="edgeflow-invoke", daemon=True
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                slot = self._get(self._to_post)
+                if slot is _STREAM_END:
+                    return
+                if isinstance(slot, _StreamFailure):
+                    raise slot.error
+                start = time.perf_counter_ns()
+                result = self.postprocess(self.output_ring[slot])
+                elapsed = time.perf_counter_ns() - start
+                self.engine.latency["postprocess"].record_ns(elapsed)
+                self.stats["postprocess_ms"] += elapsed / 1e6
+                self.stats["frames"] += 1
+                self._free.put(slot)
+                yield result
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join(timeout=1.0)
+
+
+def _default_preprocess(item: Any, out: np.ndarray) -> None:
+    """Copy (and cast) an already prepared frame into its ring slot."""
+    out[...] = np.reshape(item, out.shape)
+
 
 class EdgeFlowInference:
-    """Device-optimized inference engine for raspberry_pi."""
+    """Device-optimized inference engine for raspberry_pi.
+
+    The model is loaded by path: TFLite maps the file read-only and shared
+    (``MAP_SHARED``), so its weights stay in the page cache and every process
+    serving the same model shares one physical copy. (``model_content``
+    would instead hold a private in-memory copy per process.) ``madvise``
+    hints such as ``("willneed",)`` are applied to the file before loading;
+    see ``prewarm_model`` to fill the page cache at boot.
+    """
 
-    def __init__(self, model_path: str = "mobilenet_v2_keras.h5"):
+    def __init__(
+        self,
+        model_path: str = "mobilenet_v2_keras.h5",
+        madvise: Optional[Iterable[str]] = None,
+    ):
         """Initialize inference engine."""
         self.model_path = model_path
-        self.interpreter = None
-        self.input_details = None
-        self.output_details = None
+        self.madvise = tuple(madvise or ())
+        # Set by _load_model; use _ensure_loaded() for the interpreter
+        self.interpreter: Optional[Any] = None
+        self.input_details: Optional[List[Dict[str, Any]]] = None
+        self.output_details: Optional[List[Dict[str, Any]]] = None
         self.device_type = "raspberry_pi"
 
         # Device-specific configuration
         self.buffer_size = 32
         self.quantize_type = "int8"
+        self.memory_stats: Dict[str, Any] = {}
+        # Always-on per-stage latency histograms (see latency_snapshot)
+        self.latency = {stage: LatencyHistogram() for stage in LATENCY_STAGES}
 
         self._load_model()
 
     def _load_model(self):
         """Load TensorFlow Lite model."""
         try:
+            rss_before_load = _rss_mb()
+            load_start = time.perf_counter()
+            advised = (
+                advise_model(self.model_path, self.madvise) if self.madvise else []
+            )
+            # Loaded by path so TFLite mmaps the file (shared, read-only pages)
             self.interpreter = tflite.Interpreter(model_path=self.model_path)
+            load_ms = (time.perf_counter() - load_start) * 1000
+            rss_before_allocate = _rss_mb()
+            faults = _page_faults()
             self.interpreter.allocate_tensors()
+            rss_after_allocate = _rss_mb()
+            minor, major = _page_faults()
+            self.memory_stats = {
+                "model_load_ms": load_ms,
+                "madvise": advised,
+                "rss_before_load_mb": rss_before_load,
+                "rss_before_allocate_mb": rss_before_allocate,
+                "rss_after_allocate_mb": rss_after_allocate,
+                "arena_mb": max(rss_after_allocate - rss_before_allocate, 0.0),
+                "allocate_page_faults": {
+                    "minor": minor - faults[0],
+                    "major": major - faults[1],
+                },
+            }
 
             self.input_details = self.interpreter.get_input_details()
             self.output_details = self.interpreter.get_output_details()
+            # Callables returning views of the interpreter's own tensor buffers
+            self._input_view = self.interpreter.tensor(self.input_details[0]["index"])
+            self._output_view = self.interpreter.tensor(self.output_details[0]["index"])
 
             logger.info(f"Model loaded successfully for {self.device_type}")
             logger.info(f"Input shape: {self.input_details[0]['shape']}")
@@ -59,60 +505,1080 @@ class EdgeFlowInference:
             logger.error(f"Failed to load model: {e}")
             raise
 
-    def predict(self, input_data: np.ndarray) -> np.ndarray:
-        """Run inference on input data."""
+    def input_buffer(self) -> np.ndarray:
+        """Return a writable view of the interpreter's input tensor.
+
+        Fill it in place (e.g. ``cv2.resize(frame, size, dst=buf[0])``) and
+        then call ``predict_into(out)`` to skip every intermediate input
+        array. See ``predict_into`` for the aliasing rules.
+        """
+        self._ensure_loaded()
+        return self._input_view()
+
+    def allocate_output(self) -> np.ndarray:
+        """Allocate an array suitable as the ``out`` of ``predict_into``."""
+        self._ensure_loaded()
+        return np.empty_like(self._output_view())
+
+    def _ensure_loaded(self) -> Any:
+        """Return the loaded interpreter, or raise if loading failed."""
         if self.interpreter is None:
             raise RuntimeError("Model not loaded")
+        return self.interpreter
 
-        # Set input tensor
-        self.interpreter.set_tensor(self.input_details[0]["index"], input_data)
+    def _invoke(self, input_data: Optional[np.ndarray]) -> None:
+        interpreter = self._ensure_loaded()
+        start = time.perf_counter_ns()
+        if input_data is not None:
+            # Written straight into the tensor arena: no set_tensor copy
+            self._input_view()[...] = input_data
+        invoked = time.perf_counter_ns()
+        interpreter.invoke()
+        done = time.perf_counter_ns()
+        self.latency["preprocess"].record_ns(invoked - start)
+        self.latency["invoke"].record_ns(done - invoked)
 
-        # Run inference
-        start_time = time.perf_counter()
-        self.interpreter.invoke()
-        inference_time = time.perf_counter() - start_time
+    def predict(self, input_data: np.ndarray, copy: bool = True) -> np.ndarray:
+        """Run inference on input data.
 
-        # Get output
-        output_data = self.interpreter.get_tensor(self.output_details[0]["index"])
+        The input is written directly into the interpreter's input tensor and
+        the output is read through a view of its output tensor. With
+        ``copy=False`` that view is returned instead of a private copy; it
+        follows the aliasing rules of ``predict_into``.
+        """
+        self._invoke(input_data)
+        start = time.perf_counter_ns()
+        output_data = self._output_view()
+        if copy:
+            output_data = output_data.copy()
+        self.latency["postprocess"].record_ns(time.perf_counter_ns() - start)
+        return output_data
 
-        logger.debug(f"Inference time: {inference_time * 1000:.2f}ms")
+    def predict_into(
+        self, out: np.ndarray, input_data: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Run inference and write the output into ``out`` (no allocation).
 
-        return output_data
+        If ``input_data`` is ``None`` the input tensor is used as already
+        filled through ``input_buffer()``.
 
-    def benchmark(self, num_runs: int = 100) -> Dict[str, float]:
-        """Benchmark inference performance."""
-        if self.input_details is None:
-            raise RuntimeError("Model not loaded")
+        Aliasing rules for views of interpreter memory (``input_buffer()``
+        and ``predict(..., copy=False)``):
+
+        - They alias the interpreter's tensor arena, not a private array: the
+          next inference overwrites them in place.
+        - Drop every such view (``del buf``) before the next ``predict*``
+          call. The TFLite interpreter refuses to invoke while Python holds
+          references into its buffers.
+        - They become invalid after ``allocate_tensors``/``resize_tensor_input``
+          (e.g. when a ``DynamicBatcher`` takes over the engine).
+        - ``out`` is owned by the caller and never aliased, so it can be kept
+          and reused across frames.
+        """
+        self._invoke(input_data)
+        start = time.perf_counter_ns()
+        np.copyto(out, self._output_view())
+        self.latency["postprocess"].record_ns(time.perf_counter_ns() - start)
+        return out
+
+    def latency_snapshot(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Latency histograms per stage since start-up or the last reset.
+
+        ``preprocess`` is writing the input into the interpreter (or the
+        ``predict_stream`` preprocess function), ``invoke`` the interpreter
+        itself and ``postprocess`` reading the output (or the stream
+        postprocess function). With ``reset=True`` the histograms restart
+        after the snapshot, e.g. for one reporting interval at a time.
+        """
+        snapshot = {stage: h.snapshot() for stage, h in self.latency.items()}
+        if reset:
+            self.reset_latency()
+        return snapshot
+
+    def reset_latency(self) -> None:
+        """Clear every latency histogram."""
+        for histogram in self.latency.values():
+            histogram.reset()
+
+    def predict_stream(
+        self,
+        inputs: Iterable[Any],
+        preprocess: Optional[Callable[[Any, np.ndarray], None]] = None,
+        postprocess: Optional[Callable[[np.ndarray], Any]] = None,
+        depth: int = 4,
+    ) -> Iterator[Any]:
+        """Run inference over a stream of frames with pipelined stages.
 
-        # Generate test input
-        input_shape = self.input_details[0]["shape"]
-        dtype = self.input_details[0]["dtype"]
+        Decoding/preprocessing, ``invoke`` and postprocessing run concurrently
+        on separate threads (TFLite releases the GIL while invoking), linked by
+        bounded queues over a ring of ``depth`` pre-allocated buffers. Results
+        are yielded in input order.
 
+        Args:
+            inputs: Iterable of raw frames (e.g. camera captures).
+            preprocess: ``preprocess(frame, out)`` writes the model input into
+                the pre-allocated array ``out``; defaults to a reshape/cast copy.
+            postprocess: Maps the output buffer to a result. The buffer is
+                reused once the function returns, so keep only what it returns;
+                defaults to ``np.copy``.
+            depth: Ring size, i.e. the maximum number of frames in flight.
+
+        The engine must not be used for other predictions while a stream is
+        running. Per-stage timings of the last stream are kept in
+        ``self.stream_stats``.
+        """
+        pipeline = _StreamPipeline(self, preprocess, postprocess, depth)
+        self.stream_stats = pipeline.stats
+        return pipeline.run(inputs)
+
+    def benchmark(self, num_runs: int = 100) -> Dict[str, Any]:
+        """Benchmark inference performance and memory usage."""
+        detail = self._ensure_loaded().get_input_details()[0]
+
+        # Generate test input (tracemalloc records Python-side preprocessing)
+        input_shape = detail["shape"]
+        dtype = detail["dtype"]
+
+        tracemalloc.start()
         if dtype == np.float32:
             test_input = np.random.random(input_shape).astype(np.float32)
         elif dtype == np.int8:
             test_input = np.random.randint(-128, 127, size=input_shape, dtype=np.int8)
         else:
             test_input = np.random.random(input_shape).astype(np.float32)
+        preprocess_peak_kb = tracemalloc.get_traced_memory()[1] / 1024.0
+        tracemalloc.stop()
 
         # Warmup
+        output = self.allocate_output()
         for _ in range(10):
-            self.predict(test_input)
+            self.predict_into(output, test_input)
 
         # Benchmark
         times = []
-        for _ in range(num_runs):
-            start_time = time.perf_counter()
-            self.predict(test_input)
-            times.append(time.perf_counter() - start_time)
+        histogram = LatencyHistogram()
+        faults = _page_faults()
+        with _PeakRSSSampler() as sampler:
+            for _ in range(num_runs):
+                start_time = time.perf_counter()
+                self.predict_into(output, test_input)
+                times.append(time.perf_counter() - start_time)
+                histogram.record_ms(times[-1] * 1000)
+        minor, major = _page_faults()
+        latency = histogram.snapshot()
 
         return {
             "mean_time_ms": np.mean(times) * 1000,
             "std_time_ms": np.std(times) * 1000,
             "min_time_ms": np.min(times) * 1000,
             "max_time_ms": np.max(times) * 1000,
+            "p50_time_ms": latency["p50_ms"],
+            "p99_time_ms": latency["p99_ms"],
             "throughput_fps": 1.0 / np.mean(times),
+            "memory": {
+                **self.memory_stats,
+                "peak_rss_invoke_mb": sampler.peak_mb,
+                "invoke_page_faults": {
+                    "minor": minor - faults[0],
+                    "major": major - faults[1],
+                },
+                "preprocess_peak_kb": preprocess_peak_kb,
+            },
+        }
+
+
+class _ManagedModel:
+    """Registry entry of a model hosted by ``ModelRuntimeManager``."""
+
+    def __init__(self, name: str, model_path: str, arena_mb: float, pinned: bool):
+        self.name = name
+        self.model_path = model_path
+        self.model_mb = os.path.getsize(model_path) / (1024.0 * 1024.0)
+        self.arena_mb = arena_mb
+        self.pinned = pinned
+        self.engine: Optional[EdgeFlowInference] = None
+        self.in_use = 0
+        self.load_lock = threading.Lock()
+        # One TFLite interpreter must not run on two threads at once
+        self.engine_lock = threading.RLock()
+        self.stats: Dict[str, float] = {
+            "requests": 0,
+            "hits": 0,
+            "loads": 0,
+            "evictions": 0,
+            "load_ms": 0.0,
+            "inference_ms": 0.0,
+            "last_used": 0.0,
+        }
+
+    @property
+    def footprint_mb(self) -> float:
+        return self.model_mb + self.arena_mb
+
+
+class ModelRuntimeManager:
+    """Hosts several models in one process within a memory budget.
+
+    Interpreters are created lazily on first use. The TFLite runtime maps
+    model files read-only (``mmap``), so model weights are clean page-cache
+    pages. A model's footprint is its file size plus its tensor arena, which
+    is measured at load time or taken from the ``arena_mb`` registration
+    hint. When loading a model would exceed ``max_memory_mb``, the least
+    recently used models that are neither pinned nor in use are evicted
+    first. Memory for loads still in progress is reserved up front, so
+    concurrent loads of different models cannot overshoot the budget
+    together.
+
+    Engines are not thread-safe: ``use`` lends each model to one thread at a
+    time, and other threads borrowing the same model wait their turn.
+
+    The manager also counts which model tends to follow which.
+    ``likely_next`` exposes those transitions as pre-warming hints, and
+    ``prewarm`` loads models ahead of need, optionally in the background.
+    """
+
+    def __init__(
+        self,
+        max_memory_mb: float = MAX_MEMORY_MB,
+        loader: Optional[Callable[[str], EdgeFlowInference]] = None,
+        auto_prewarm: bool = False,
+    ):
+        self.max_memory_mb = float(max_memory_mb)
+        self.loader = loader or EdgeFlowInference
+        self.auto_prewarm = auto_prewarm
+        self._models: Dict[str, _ManagedModel] = {}
+        self._resident: "collections.OrderedDict[str, None]" = collections.OrderedDict()
+        self._transitions: Dict[str, "collections.Counter[str]"] = {}
+        self._previous: Optional[str] = None
+        self._lock = threading.RLock()
+        self._loading_mb = 0.0  # reserved by loads in progress
+        self.over_budget_loads = 0
+
+    def register(
+        self, name: str, model_path: str, arena_mb: float = 0.0, pinned: bool = False
+    ) -> None:
+        """Make a model available under ``name`` without loading it."""
+        with self._lock:
+            if name in self._models:
+                raise ValueError(f"Model already registered: {name}")
+            self._models[name] = _ManagedModel(name, model_path, arena_mb, pinned)
+
+    def _entry(self, name: str) -> _ManagedModel:
+        try:
+            return self._models[name]
+        except KeyError:
+            raise KeyError(f"Unknown model: {name}") from None
+
+    def resident_mb(self) -> float:
+        with self._lock:
+            return sum(self._models[n].footprint_mb for n in self._resident)
+
+    def _evict_for(self, needed_mb: float) -> None:
+        """Evict LRU models until ``needed_mb`` more fits (lock held)."""
+        resident = self._loading_mb
+        resident += sum(self._models[n].footprint_mb for n in self._resident)
+        for name in list(self._resident):
+            if resident + needed_mb <= self.max_memory_mb:
+                return
+            entry = self._models[name]
+            if entry.pinned or entry.in_use:
+                continue
+            self._unload(entry)
+            entry.stats["evictions"] += 1
+            resident -= entry.footprint_mb
+            logger.info(f"Evicted model {name} ({entry.footprint_mb:.1f}MB)")
+        if resident + needed_mb > self.max_memory_mb:
+            self.over_budget_loads += 1
+            logger.warning(
+                f"Memory budget {self.max_memory_mb:.0f}MB exceeded: "
+                f"{resident + needed_mb:.1f}MB resident"
+            )
+
+    def _unload(self, entry: _ManagedModel) -> None:
+        entry.engine = None  # frees the interpreter and its arena
+        self._resident.pop(entry.name, None)
+
+    def _ensure_loaded(self, entry: _ManagedModel) -> EdgeFlowInference:
+        with entry.load_lock:
+            engine = entry.engine
+            if engine is not None:
+                entry.stats["hits"] += 1
+                return engine
+            reserved = entry.footprint_mb
+            with self._lock:
+                self._evict_for(reserved)
+                self._loading_mb += reserved
+            try:
+                start = time.perf_counter()
+                engine = self.loader(entry.model_path)
+                entry.stats["load_ms"] = (time.perf_counter() - start) * 1000
+                entry.stats["loads"] += 1
+                measured = getattr(engine, "memory_stats", {}).get("arena_mb", 0.0)
+                if measured > 0:
+                    entry.arena_mb = measured
+            finally:
+                with self._lock:
+                    self._loading_mb -= reserved
+            with self._lock:
+                entry.engine = engine
+                self._resident[entry.name] = None
+            return engine
+
+    def _touch(self, entry: _ManagedModel) -> None:
+        with self._lock:
+            if entry.name in self._resident:
+                self._resident.move_to_end(entry.name)
+            entry.stats["last_used"] = time.time()
+            if self._previous is not None and self._previous != entry.name:
+                counts = self._transitions.setdefault(
+                    self._previous, collections.Counter()
+                )
+                counts[entry.name] += 1
+            self._previous = entry.name
+
+    @contextlib.contextmanager
+    def use(self, name: str) -> Iterator[EdgeFlowInference]:
+        """Borrow a loaded engine exclusively; it cannot be evicted while
+        borrowed, and other threads borrowing ``name`` wait until it is
+        returned."""
+        with self._lock:
+            entry = self._entry(name)
+            entry.in_use += 1
+        try:
+            engine = self._ensure_loaded(entry)
+            self._touch(entry)
+            with entry.engine_lock:
+                yield engine
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+        if self.auto_prewarm:
+            for hint in self.likely_next(name, limit=1):
+                self.prewarm([hint], background=True)
+
+    def predict(self, name: str, input_data: np.ndarray) -> np.ndarray:
+        """Run ``name`` on ``input_data``, loading (and evicting) as needed."""
+        with self.use(name) as engine:
+            entry = self._models[name]
+            start = time.perf_counter()
+            output = engine.predict(input_data)
+            entry.stats["inference_ms"] += (time.perf_counter() - start) * 1000
+            entry.stats["requests"] += 1
+            return output
+
+    def likely_next(self, name: str, limit: int = 2) -> List[str]:
+        """Models most often requested right after ``name`` (pre-warm hints)."""
+        with self._lock:
+            counts = self._transitions.get(name)
+            if not counts:
+                return []
+            return [n for n, _ in counts.most_common() if n != name][:limit]
+
+    def prewarm(
+        self, names: Optional[Iterable[str]] = None, background: bool = False
+    ) -> Optional[threading.Thread]:
+        """Load models ahead of need (all registered ones by default).
+
+        Models that are already resident are left alone. With
+        ``background=True`` the loads run on a daemon thread, which is
+        returned.
+        """
+        with self._lock:
+            targets = [self._entry(n) for n in (names or list(self._models))]
+
+        def load_all() -> None:
+            for entry in targets:
+                if entry.engine is None:
+                    try:
+                        self._ensure_loaded(entry)
+                    except Exception as e:
+                        logger.warning(f"Pre-warming {entry.name} failed: {e}")
+
+        if not background:
+            load_all()
+            return None
+        thread = threading.Thread(target=load_all, name="edgeflow-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def unload(self, name: str) -> None:
+        with self._lock:
+            entry = self._entry(name)
+            if entry.in_use:
+                raise RuntimeError(f"Model in use: {name}")
+            self._unload(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory use and per-model usage counters."""
+        with self._lock:
+            models = {}
+            for name, entry in self._models.items():
+                requests = entry.stats["requests"]
+                models[name] = {
+                    **entry.stats,
+                    "resident": entry.engine is not None,
+                    "pinned": entry.pinned,
+                    "model_mb": entry.model_mb,
+                    "arena_mb": entry.arena_mb,
+                    "mean_inference_ms": (
+                        entry.stats["inference_ms"] / requests if requests else 0.0
+                    ),
+                    "likely_next": self.likely_next(name),
+                }
+            return {
+                "max_memory_mb": self.max_memory_mb,
+                "resident_mb": sum(
+                    self._models[n].footprint_mb for n in self._resident
+                ),
+                "resident": list(self._resident),
+                "loading_mb": self._loading_mb,
+                "over_budget_loads": self.over_budget_loads,
+                "models": models,
+            }
+
+
+_THROTTLED_PATH = "/sys/devices/platform/soc/soc:firmware/get_throttled"
+_THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
+
+class DeviceSignals:
+    """Cheap device signals read straight from ``/sys`` and ``/proc``.
+
+    CPU load is the busy share of ``/proc/stat`` jiffies since the previous
+    call, so sampling never blocks. Throttling comes from the firmware's
+    ``get_throttled`` sysfs file, which replaces a ``vcgencmd`` subprocess.
+    Any signal that cannot be read is reported as ``None``.
+    """
+
+    def __init__(self, sys_root: str = "/"):
+        self.sys_root = sys_root
+        self._last_cpu: Optional[Tuple[int, int]] = None
+
+    def _read(self, path: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.sys_root, path.lstrip("/"))) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def _cpu_percent(self) -> Optional[float]:
+        line = (self._read("/proc/stat") or "").split("\n", 1)[0]
+        fields = [int(v) for v in line.split()[1:]]
+        if len(fields) < 4:
+            return None
+        idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+        total = sum(fields)
+        last, self._last_cpu = self._last_cpu, (idle, total)
+        if last is None or total <= last[1]:
+            return None
+        return 100.0 * (1.0 - (idle - last[0]) / (total - last[1]))
+
+    def __call__(self) -> Dict[str, Any]:
+        temp = self._read(_THERMAL_PATH)
+        throttled = self._read(_THROTTLED_PATH)
+        return {
+            "temperature_c": float(temp) / 1000.0 if temp else None,
+            "throttling": bool(int(throttled, 16) & 0xF) if throttled else None,
+            "cpu_percent": self._cpu_percent(),
+        }
+
+
+def signals_from_monitor(monitor: Any) -> Callable[[], Dict[str, Any]]:
+    """Adapt a ``RaspberryPiMonitor`` (or anything with its interface) into a
+    signal source for :class:`VariantPolicy`."""
+
+    def read() -> Dict[str, Any]:
+        # Reuse the monitor's latest ring sample; sample once if it is idle
+        sample = monitor.latest_sample() or monitor.sample()
+        throttled = sample.get("throttled")
+        return {
+            "temperature_c": sample.get("temperature_c"),
+            "throttling": bool(throttled) if throttled is not None else None,
+            "cpu_percent": sample.get("cpu_percent"),
+        }
+
+    return read
+
+
+class VariantPolicy:
+    """Chooses among model variants with hysteresis.
+
+    ``variants`` are ordered from the most accurate (and most expensive) to
+    the cheapest. The policy steps one variant cheaper when the device is
+    under pressure: throttling, temperature at or above ``temp_high_c``, CPU
+    load at or above ``cpu_high``, or p95 latency over ``latency_slo_ms``.
+    It steps one variant back only when every signal is comfortably clear:
+    temperature at or below ``temp_low_c``, load at or below ``cpu_low``, and
+    p95 at or below ``recover_ratio`` times the SLO. Downgrades wait
+    ``hold_down_s`` after the previous switch and upgrades wait the longer
+    ``hold_up_s``, so the policy does not flap around a threshold.
+
+    ``signals`` is any callable returning ``temperature_c``, ``throttling``
+    and ``cpu_percent`` (``None`` when unknown), and ``clock`` returns
+    seconds. Both are injectable for off-device testing.
+    """
+
+    def __init__(
+        self,
+        variants: List[str],
+        latency_slo_ms: Optional[float] = None,
+        signals: Optional[Callable[[], Dict[str, Any]]] = None,
+        temp_high_c: float = 75.0,
+        temp_low_c: float = 65.0,
+        cpu_high: float = 90.0,
+        cpu_low: float = 60.0,
+        recover_ratio: float = 0.7,
+        hold_down_s: float = 2.0,
+        hold_up_s: float = 30.0,
+        latency_window: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not variants:
+            raise ValueError("At least one variant is required")
+        self.variants = list(variants)
+        self.latency_slo_ms = latency_slo_ms
+        self.signals = signals or DeviceSignals()
+        self.temp_high_c = temp_high_c
+        self.temp_low_c = temp_low_c
+        self.cpu_high = cpu_high
+        self.cpu_low = cpu_low
+        self.recover_ratio = recover_ratio
+        self.hold_down_s = hold_down_s
+        self.hold_up_s = hold_up_s
+        self.clock = clock
+        self.level = 0
+        self.last_signals: Dict[str, Any] = {}
+        self.switches: List[Dict[str, Any]] = []
+        self._latencies: "collections.deque[float]" = collections.deque(
+            maxlen=latency_window
+        )
+        self._last_switch = clock()
+
+    @property
+    def current(self) -> str:
+        return self.variants[self.level]
+
+    def observe_latency(self, latency_ms: float) -> None:
+        """Record the latency of a request served by the current variant."""
+        self._latencies.append(latency_ms)
+
+    def _p95(self) -> Optional[float]:
+        if not self._latencies:
+            return None
+        return float(np.percentile(np.fromiter(self._latencies, float), 95))
+
+    def _pressure(self, s: Dict[str, Any], p95: Optional[float]) -> Optional[str]:
+        temp, cpu = s.get("temperature_c"), s.get("cpu_percent")
+        if s.get("throttling"):
+            return "throttling"
+        if temp is not None and temp >= self.temp_high_c:
+            return f"temperature {temp:.1f}C"
+        if cpu is not None and cpu >= self.cpu_high:
+            return f"cpu {cpu:.0f}%"
+        if self.latency_slo_ms and p95 is not None and p95 > self.latency_slo_ms:
+            return f"p95 {p95:.1f}ms over SLO"
+        return None
+
+    def _relaxed(self, s: Dict[str, Any], p95: Optional[float]) -> bool:
+        temp, cpu = s.get("temperature_c"), s.get("cpu_percent")
+        if s.get("throttling"):
+            return False
+        if temp is not None and temp > self.temp_low_c:
+            return False
+        if cpu is not None and cpu > self.cpu_low:
+            return False
+        if self.latency_slo_ms and p95 is not None:
+            return p95 <= self.latency_slo_ms * self.recover_ratio
+        return True
+
+    def update(self) -> str:
+        """Sample the signals, switch variant if warranted, return the current."""
+        self.last_signals = s = self.signals()
+        p95 = self._p95()
+        held = self.clock() - self._last_switch
+        reason = self._pressure(s, p95)
+        if reason and self.level < len(self.variants) - 1:
+            if held >= self.hold_down_s:
+                self._switch(self.level + 1, reason)
+        elif not reason and self.level > 0 and self._relaxed(s, p95):
+            if held >= self.hold_up_s:
+                self._switch(self.level - 1, "recovered")
+        return self.current
+
+    def _switch(self, level: int, reason: str) -> None:
+        previous = self.current
+        self.level = level
+        self._last_switch = self.clock()
+        self._latencies.clear()  # latencies of the old variant no longer apply
+        self.switches.append(
+            {
+                "time": time.time(),
+                "from": previous,
+                "to": self.current,
+                "reason": reason,
+            }
+        )
+        logger.info(f"Switched variant {previous} -> {self.current} ({reason})")
+
+
+class AdaptiveInference:
+    """Serves requests from the variant chosen by a :class:`VariantPolicy`.
+
+    Variants are hosted by a :class:`ModelRuntimeManager`, so only the ones
+    in use stay loaded within the memory budget. Signals are sampled at most
+    every ``check_interval_s`` seconds to keep per-request overhead low.
+    """
+
+    def __init__(
+        self,
+        variants: Dict[str, str],
+        policy: Optional[VariantPolicy] = None,
+        manager: Optional[ModelRuntimeManager] = None,
+        check_interval_s: float = 1.0,
+        **policy_options: Any,
+    ):
+        self.manager = manager or ModelRuntimeManager()
+        for name, path in variants.items():
+            self.manager.register(name, path)
+        self.policy = policy or VariantPolicy(list(variants), **policy_options)
+        self.check_interval_s = check_interval_s
+        self._next_check = 0.0
+
+    @classmethod
+    def from_manifest(cls, manifest_path: str, **kwargs: Any) -> "AdaptiveInference":
+        """Build from the ``variants.json`` written by the deployment packager."""
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        base = os.path.dirname(os.path.abspath(manifest_path))
+        variants = {
+            v["name"]: os.path.join(base, v["path"]) for v in manifest["variants"]
+        }
+        options = {**manifest.get("policy", {}), **kwargs}
+        return cls(variants, **options)
+
+    def predict(self, input_data: np.ndarray) -> np.ndarray:
+        now = self.policy.clock()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval_s
+            self.policy.update()
+        with self.manager.use(self.policy.current) as engine:
+            # Timed after loading so a variant switch does not skew the SLO
+            start = time.perf_counter()
+            output = engine.predict(input_data)
+            self.policy.observe_latency((time.perf_counter() - start) * 1000)
+        return output
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "variant": self.policy.current,
+            "signals": self.policy.last_signals,
+            "switches": list(self.policy.switches),
+            "runtime": self.manager.stats(),
+        }
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the inference server queue is at capacity."""
+
+
+class _PendingRequest:
+    """One queued single-sample request and its result slot."""
+
+    __slots__ = ("data", "enqueued", "done", "output", "error", "timing")
+
+    def __init__(self, data: np.ndarray):
+        self.data = data
+        self.enqueued = time.perf_counter()
+        self.done = threading.Event()
+        self.output: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+        self.timing: Dict[str, float] = {}
+
+
+class DynamicBatcher:
+    """Queues single-sample requests and runs them as dynamic batches.
+
+    A batch is dispatched as soon as it holds ``max_batch`` requests or the
+    oldest queued request has waited ``max_wait_ms``. The interpreter input
+    is resized to ``max_batch`` once at start-up, so every batch reuses the
+    same pre-allocated tensors and batch buffer; rows beyond a partial batch
+    hold stale data and their outputs are discarded. Models that cannot be
+    resized are served one request at a time.
+    """
+
+    def __init__(
+        self,
+        engine: "EdgeFlowInference",
+        max_batch: int = 8,
+        max_wait_ms: float = 5.0,
+        max_queue: int = 256,
+    ):
+        self.engine = engine
+        self.max_wait_s = max(max_wait_ms, 0.0) / 1000.0
+        self.max_queue = max_queue
+        self._queue: "collections.deque[_PendingRequest]" = collections.deque()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"requests": 0, "batches": 0, "rejected": 0, "errors": 0}
+        self._latency_ms = {"queue": 0.0, "inference": 0.0, "total": 0.0}
+        # Per-request histograms; the engine keeps the per-stage ones
+        self.latency = {"queue": LatencyHistogram(), "total": LatencyHistogram()}
+        self.max_batch = self._prepare_interpreter(max(1, int(max_batch)))
+
+    def _prepare_interpreter(self, max_batch: int) -> int:
+        interpreter = self._interpreter = self.engine._ensure_loaded()
+        detail = interpreter.get_input_details()[0]
+        self.sample_shape = tuple(int(d) for d in detail["shape"][1:])
+        if int(detail["shape"][0]) != max_batch:
+            try:
+                interpreter.resize_tensor_input(
+                    detail["index"], [max_batch, *self.sample_shape]
+                )
+                interpreter.allocate_tensors()
+            except Exception as e:
+                logger.warning(f"Batching disabled, model is not resizable: {e}")
+                max_batch = int(detail["shape"][0]) or 1
+            self.engine.input_details = interpreter.get_input_details()
+            self.engine.output_details = interpreter.get_output_details()
+        detail = interpreter.get_input_details()[0]
+        self._input_index = detail["index"]
+        self._output_index = interpreter.get_output_details()[0]["index"]
+        self._batch = np.zeros([max_batch, *self.sample_shape], dtype=detail["dtype"])
+        return max_batch
+
+    def start(self) -> "DynamicBatcher":
+        with self._cond:
+            if self._running:
+                return self
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="edgeflow-batcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop accepting work; queued requests are still served."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def infer(
+        self, data: np.ndarray, timeout_s: Optional[float] = None
+    ) -> Tuple[np.ndarray, Dict[str, float]]:
+        """Run one sample through the next batch.
+
+        Returns:
+            ``(output, timing)`` where ``output`` has a leading batch dim of 1
+            and ``timing`` holds ``queue_ms``, ``inference_ms``, ``total_ms``
+            and ``batch_size`` for this request.
+        """
+        sample = np.asarray(data)
+        if sample.shape != self.sample_shape:
+            if sample.shape[1:] != self.sample_shape or sample.shape[0] != 1:
+                raise ValueError(
+                    f"Expected input shape {self.sample_shape}, got {sample.shape}"
+                )
+            sample = sample[0]
+        request = _PendingRequest(sample)
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("Inference server is not running")
+            if len(self._queue) >= self.max_queue:
+                self._stats["rejected"] += 1
+                raise QueueFullError("Inference queue is full")
+            self._queue.append(request)
+            self._cond.notify_all()
+        if not request.done.wait(timeout_s):
+            raise TimeoutError("Inference request timed out")
+        if request.error is not None:
+            raise request.error
+        assert request.output is not None  # set by _execute unless it failed
+        return request.output, request.timing
+
+    def stats(self) -> Dict[str, Any]:
+        """Request/batch counters and mean per-request latencies."""
+        with self._cond:
+            stats: Dict[str, Any] = dict(self._stats)
+            latency = dict(self._latency_ms)
+            stats["queued"] = len(self._queue)
+        served = max(stats["requests"], 1)
+        stats["max_batch"] = self.max_batch
+        stats["mean_batch_size"] = stats["requests"] / max(stats["batches"], 1)
+        for name, total in latency.items():
+            stats[f"mean_{name}_ms"] = total / served
+        return stats
+
+    def latency_snapshot(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Engine stage histograms plus per-request ``queue`` and ``total``."""
+        snapshot = self.engine.latency_snapshot(reset)
+        for name, histogram in self.latency.items():
+            snapshot[name] = histogram.snapshot()
+            if reset:
+                histogram.reset()
+        return snapshot
+
+    def _next_batch(self) -> List[_PendingRequest]:
+        with self._cond:
+            while self._running and not self._queue:
+                self._cond.wait()
+            if not self._queue:
+                return []
+            deadline = self._queue[0].enqueued + self.max_wait_s
+            while self._running and len(self._queue) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            size = min(self.max_batch, len(self._queue))
+            return [self._queue.popleft() for _ in range(size)]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            self._execute(batch)
+
+    def _execute(self, batch: List[_PendingRequest]) -> None:
+        stages = self.engine.latency
+        start = time.perf_counter()
+        try:
+            for row, request in enumerate(batch):
+                self._batch[row] = request.data
+            self._interpreter.set_tensor(self._input_index, self._batch)
+            invoked = time.perf_counter()
+            self._interpreter.invoke()
+            done = time.perf_counter()
+            outputs = self._interpreter.get_tensor(self._output_index)
+            for row, request in enumerate(batch):
+                request.output = outputs[row : row + 1]
+            stages["preprocess"].record_ms((invoked - start) * 1000)
+            stages["invoke"].record_ms((done - invoked) * 1000)
+            stages["postprocess"].record_ms((time.perf_counter() - done) * 1000)
+        except Exception as e:
+            for request in batch:
+                request.error = e
+        end = time.perf_counter()
+
+        with self._cond:
+            self._stats["batches"] += 1
+            self._stats["requests"] += len(batch)
+            for request in batch:
+                request.timing = {
+                    "queue_ms": (start - request.enqueued) * 1000,
+                    "inference_ms": (end - start) * 1000,
+                    "total_ms": (end - request.enqueued) * 1000,
+                    "batch_size": len(batch),
+                }
+                self._latency_ms["queue"] += request.timing["queue_ms"]
+                self._latency_ms["inference"] += request.timing["inference_ms"]
+                self._latency_ms["total"] += request.timing["total_ms"]
+                self.latency["queue"].record_ms(request.timing["queue_ms"])
+                self.latency["total"].record_ms(request.timing["total_ms"])
+                if request.error is not None:
+                    self._stats["errors"] += 1
+        for request in batch:
+            request.done.set()
+
+
+def _npy_bytes(array: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    np.save(buf, array, allow_pickle=False)
+    return buf.getvalue()
+
+
+class _InferenceServer(socketserver.BaseServer):
+    """State shared by the TCP and Unix socket inference servers."""
+
+    batcher: DynamicBatcher
+    daemon_threads = True
+
+
+class _InferenceRequestHandler(http.server.BaseHTTPRequestHandler):
+    """HTTP front end: ``POST /predict`` (.npy in and out), ``GET /stats``.
+
+    ``GET /latency`` returns the latency histograms; ``POST /latency/reset``
+    returns them and starts new ones.
+    """
+
+    server: _InferenceServer
+    protocol_version = "HTTP/1.1"  # keep-alive for repeated client calls
+    server_version = "EdgeFlowInference/1.0"
+
+    def address_string(self) -> str:
+        # Unix socket peers have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _reply(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str = "application/json",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, message: str) -> None:
+        self._reply(status, json.dumps({"error": message}).encode())
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._reply(200, json.dumps(self.server.batcher.stats()).encode())
+        elif self.path == "/latency":
+            snapshot = self.server.batcher.latency_snapshot()
+            self._reply(200, json.dumps(snapshot).encode())
+        elif self.path == "/health":
+            self._reply(200, b'{"status": "ok"}')
+        else:
+            self._error(404, "Not found")
+
+    def do_POST(self) -> None:
+        if self.path == "/latency/reset":
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            snapshot = self.server.batcher.latency_snapshot(reset=True)
+            self._reply(200, json.dumps(snapshot).encode())
+            return
+        if self.path != "/predict":
+            self._error(404, "Not found")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            data = np.load(io.BytesIO(self.rfile.read(length)), allow_pickle=False)
+            output, timing = self.server.batcher.infer(data)
+        except QueueFullError as e:
+            self._error(503, str(e))
+            return
+        except (ValueError, OSError) as e:
+            self._error(400, str(e))
+            return
+        except Exception as e:
+            self._error(500, str(e))
+            return
+        headers = {
+            "X-Queue-Ms": f"{timing['queue_ms']:.3f}",
+            "X-Inference-Ms": f"{timing['inference_ms']:.3f}",
+            "X-Total-Ms": f"{timing['total_ms']:.3f}",
+            "X-Batch-Size": str(timing["batch_size"]),
+        }
+        self._reply(200, _npy_bytes(output), "application/x-npy", headers)
+
+
+class _TCPInferenceServer(_InferenceServer, http.server.ThreadingHTTPServer):
+    pass
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixInferenceServer(
+        _InferenceServer, socketserver.ThreadingUnixStreamServer
+    ):
+        pass
+
+
+def create_inference_server(
+    engine: "EdgeFlowInference",
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: Optional[str] = None,
+    max_batch: int = 8,
+    max_wait_ms: float = 5.0,
+) -> Any:
+    """Create (but do not start serving) an inference server for ``engine``.
+
+    Every client process shares this one model copy. Listens on the Unix
+    socket ``unix_socket`` when given, otherwise on ``host:port``. Call
+    ``serve_forever()`` on the result, and ``batcher.stop()`` after
+    ``shutdown()``.
+    """
+    batcher = DynamicBatcher(engine, max_batch, max_wait_ms).start()
+    server: _InferenceServer
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        server = _UnixInferenceServer(unix_socket, _InferenceRequestHandler)
+    else:
+        server = _TCPInferenceServer((host, port), _InferenceRequestHandler)
+    server.batcher = batcher
+    return server
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class InferenceClient:
+    """Client for a running inference server (one keep-alive connection)."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        unix_socket: Optional[str] = None,
+        timeout: float = 30.0,
+    ):
+        self._conn: http.client.HTTPConnection
+        if unix_socket:
+            self._conn = _UnixHTTPConnection(unix_socket, timeout)
+        else:
+            self._conn = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def predict(self, input_data: np.ndarray) -> Tuple[np.ndarray, Dict[str, float]]:
+        """Send one sample; returns ``(output, timing)`` as the server measured."""
+        body = _npy_bytes(np.asarray(input_data))
+        headers = {"Content-Type": "application/x-npy"}
+        try:
+            self._conn.request("POST", "/predict", body, headers)
+            response = self._conn.getresponse()
+        except (ConnectionError, http.client.HTTPException):
+            self._conn.close()  # stale keep-alive connection; retry once
+            self._conn.request("POST", "/predict", body, headers)
+            response = self._conn.getresponse()
+        payload = response.read()
+        if response.status != 200:
+            raise RuntimeError(f"Inference failed ({response.status}): {payload!r}")
+        timing = {
+            "queue_ms": float(response.getheader("X-Queue-Ms", 0)),
+            "inference_ms": float(response.getheader("X-Inference-Ms", 0)),
+            "total_ms": float(response.getheader("X-Total-Ms", 0)),
+            "batch_size": int(response.getheader("X-Batch-Size", 1)),
         }
+        return np.load(io.BytesIO(payload), allow_pickle=False), timing
+
+    def stats(self) -> Dict[str, Any]:
+        self._conn.request("GET", "/stats")
+        return json.loads(self._conn.getresponse().read())
+
+    def latency(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """The server's latency histograms (restarted after this if ``reset``)."""
+        if reset:
+            self._conn.request("POST", "/latency/reset", b"")
+        else:
+            self._conn.request("GET", "/latency")
+        return json.loads(self._conn.getresponse().read())
+
+    def close(self) -> None:
+        self._conn.close()
 
 
 def main():
@@ -126,17 +1592,70 @@ def main():
     parser.add_argument(
         "--runs", type=int, default=100, help="Number of benchmark runs"
     )
+    parser.add_argument(
+        "--serve", action="store_true", help="Run as a shared inference server"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Server bind address")
+    parser.add_argument("--port", type=int, default=8765, help="Server port")
+    parser.add_argument("--socket", help="Serve on this Unix socket instead of TCP")
+    parser.add_argument(
+        "--max-batch", type=int, default=32, help="Largest dynamic batch"
+    )
+    parser.add_argument(
+        "--max-wait-ms", type=float, default=5.0, help="Longest wait to fill a batch"
+    )
+    parser.add_argument(
+        "--madvise",
+        nargs="+",
+        choices=MODEL_MADVISE_HINTS,
+        help="madvise hints for the model file",
+    )
+    parser.add_argument(
+        "--prewarm",
+        action="store_true",
+        help="Load the model into the page cache and exit",
+    )
 
     args = parser.parse_args()
 
+    if args.prewarm:
+        result = prewarm_model(args.model)
+        print(
+            f"Prewarmed {args.model}: {result['bytes'] / 1e6:.1f}MB "
+            f"in {result['ms']:.0f}ms ({result['major_faults']} major faults)"
+        )
+        return
+
     # Initialize inference engine
-    inference = EdgeFlowInference(args.model)
+    inference = EdgeFlowInference(args.model, args.madvise)
 
-    if args.benchmark:
+    if args.serve:
+        server = create_inference_server(
+            inference,
+            args.host,
+            args.port,
+            args.socket,
+            args.max_batch,
+            args.max_wait_ms,
+        )
+        where = args.socket or f"{args.host}:{args.port}"
+        print(f"Serving {args.model} on {where} (max batch {server.batcher.max_batch})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            server.batcher.stop()
+    elif args.benchmark:
         print("Running benchmark...")
         results = inference.benchmark(args.runs)
         print(f"Mean inference time: {results['mean_time_ms']:.2f}ms")
+        print(f"p50/p99: {results['p50_time_ms']:.2f}/{results['p99_time_ms']:.2f}ms")
         print(f"Throughput: {results['throughput_fps']:.2f} FPS")
+        memory = results["memory"]
+        print(f"Tensor arena: {memory['arena_mb']:.2f}MB")
+        print(f"Peak RSS during invoke: {memory['peak_rss_invoke_mb']:.2f}MB")
     else:
         print("EdgeFlow inference engine ready")
         print(f"Device: raspberry_pi")
@@ -71,11 +71,28 @@ ExecStart=$DEPLOY_PATH/bin/inference
 Restart=always
 RestartSec=5
 
+[Install]
+WantedBy=multi-user.target
+EOF
+
+    # Fill the page cache with the model at boot, before the service loads it
+    cat > /etc/systemd/system/edgeflow-prewarm.service << EOF
+[Unit]
+Description=EdgeFlow model page-cache prewarm
+DefaultDependencies=no
+After=local-fs.target
+Before=edgeflow.service
+
+[Service]
+Type=oneshot
+ExecStart=$DEPLOY_PATH/bin/inference --model $DEPLOY_PATH/models/$(basename "$MODEL_PATH") --prewarm
+
 [Install]
 WantedBy=multi-user.target
 EOF
 
     systemctl daemon-reload
+    systemctl enable edgeflow-prewarm.service
     systemctl enable edgeflow.service
 }
 
@@ -97,7 +114,7 @@ main() {
     echo "Deployment complete!"
     echo "Model: $MODEL_PATH"
     echo "Deploy path: $DEPLOY_PATH"
-    echo "Service: edgeflow.service"
+    echo "Service: edgeflow.service (model prewarmed at boot by edgeflow-prewarm.service)"
     echo ""
     echo "To start the service: systemctl start edgeflow"
     echo "To check status: systemctl status edgeflow"
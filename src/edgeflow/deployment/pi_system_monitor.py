@@ -1,32 +1,822 @@
 #!/usr/bin/env python3
 """
 Raspberry Pi System Monitor for EdgeFlow Model Performance
-Monitors CPU, memory, temperature, and inference performance in real-time
+Monitors CPU, memory, temperature, and inference performance in real-time,
+and soak-tests models under sustained load to expose thermal throttling
+
+Sampling is cheap enough to run next to the model it observes: CPU load is
+accounted from ``/proc/stat`` deltas (no blocking interval), ``/proc`` and
+``/sys`` files are read through cached handles, and history lives in
+fixed-size NumPy rings with incrementally maintained histograms for rolling
+percentiles. Long runs can record to a compact binary telemetry log with
+1 s / 1 min / 1 h rollups (``TelemetryLog``), readable as columns and
+exportable to CSV, NumPy ``.npz`` or Parquet.
 """
 
+import csv
 import json
 import os
+import shutil
+import struct
 import subprocess
 import sys
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import psutil
 
+# Firmware sysfs file with the same bits as ``vcgencmd get_throttled``
+THROTTLED_SYSFS = "devices/platform/soc/soc:firmware/get_throttled"
+
+# Bit positions reported by ``vcgencmd get_throttled``; the same flag shifted
+# by 16 bits means "has occurred since boot".
+THROTTLE_FLAGS = {
+    0: "under_voltage",
+    1: "arm_freq_capped",
+    2: "throttled",
+    3: "soft_temp_limit",
+}
+
+
+class SystemSources:
+    """Access to ``/sys`` files and ``vcgencmd``, injectable for off-device tests.
+
+    Files are opened once and re-read from offset 0 on every call, which
+    avoids an ``open``/``close`` pair per sample; procfs and sysfs regenerate
+    their content on each read.
+
+    Args:
+        sys_root: Root of the sysfs tree (``/sys`` on a real device).
+        vcgencmd_runner: Callable taking vcgencmd arguments and returning its
+            stdout (or ``None`` on failure). Defaults to running the real
+            binary when it is on ``PATH``.
+        proc_root: Root of the procfs tree (``/proc`` on a real device).
+    """
+
+    def __init__(
+        self,
+        sys_root: str = "/sys",
+        vcgencmd_runner: Optional[Callable[..., Optional[str]]] = None,
+        proc_root: str = "/proc",
+    ):
+        self.sys_root = sys_root
+        self.proc_root = proc_root
+        self._handles: Dict[str, IO[str]] = {}
+        self._handles_lock = threading.Lock()
+        self._vcgencmd_runner = vcgencmd_runner
+        if vcgencmd_runner is None and shutil.which("vcgencmd"):
+            self._vcgencmd_runner = self._run_vcgencmd
+
+    @staticmethod
+    def _run_vcgencmd(*args: str) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                ["vcgencmd", *args], capture_output=True, text=True, timeout=2
+            )
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip()
+
+    def vcgencmd(self, *args: str) -> Optional[str]:
+        """Run ``vcgencmd`` with ``args``; ``None`` when unavailable."""
+        if self._vcgencmd_runner is None:
+            return None
+        return self._vcgencmd_runner(*args)
+
+    def _read(self, path: str) -> Optional[str]:
+        with self._handles_lock:
+            handle = self._handles.get(path)
+            try:
+                if handle is None:
+                    handle = self._handles[path] = open(path, "r")
+                handle.seek(0)
+                return handle.read().strip()
+            except (OSError, ValueError):
+                # Missing file or a handle gone stale (e.g. device removed)
+                stale = self._handles.pop(path, None)
+                if stale is not None:
+                    stale.close()
+                return None
+
+    def read_sys(self, relative_path: str) -> Optional[str]:
+        """Read a sysfs file relative to ``sys_root``; ``None`` if missing."""
+        return self._read(os.path.join(self.sys_root, relative_path))
+
+    def read_proc(self, relative_path: str) -> Optional[str]:
+        """Read a procfs file relative to ``proc_root``; ``None`` if missing."""
+        return self._read(os.path.join(self.proc_root, relative_path))
+
+    def close(self) -> None:
+        """Close all cached file handles."""
+        with self._handles_lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+
+
+class MetricRing:
+    """Fixed-size ring of float samples with rolling percentiles.
+
+    Samples live in a pre-allocated NumPy array, so appending never
+    allocates or copies history. A histogram over ``[low, high)`` (log-spaced
+    with ``log_scale``) is kept in step with the window: each append
+    increments one bin and decrements the bin of the sample it overwrites.
+    Both updates are O(1), and a percentile is a scan of the fixed number of
+    bins, independent of the window length. Percentiles are accurate to one
+    bin width; out-of-range samples count in the edge bins.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        low: float = 0.0,
+        high: float = 100.0,
+        bins: int = 200,
+        log_scale: bool = False,
+    ):
+        self.capacity = int(capacity)
+        self.values = np.zeros(self.capacity)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self._slot_bins = np.zeros(self.capacity, dtype=np.int64)
+        self.log_scale = log_scale
+        if log_scale:
+            self.edges = np.geomspace(low, high, bins + 1)
+            self._low, self._span = np.log(low), np.log(high) - np.log(low)
+        else:
+            self.edges = np.linspace(low, high, bins + 1)
+            self._low, self._span = low, high - low
+        self._bins = bins
+        self.index = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _bin(self, value: float) -> int:
+        if self.log_scale:
+            value = np.log(max(value, 1e-12))
+        position = int((value - self._low) / self._span * self._bins)
+        return min(max(position, 0), self._bins - 1)
+
+    def append(self, value: Optional[float]) -> None:
+        """Add a sample; ``None``/NaN (signal unavailable) is skipped."""
+        if value is None or value != value:
+            return
+        i = self.index
+        if self.size == self.capacity:
+            self.counts[self._slot_bins[i]] -= 1
+        else:
+            self.size += 1
+        b = self._bin(value)
+        self.values[i] = value
+        self._slot_bins[i] = b
+        self.counts[b] += 1
+        self.index = (i + 1) % self.capacity
+
+    @property
+    def latest(self) -> Optional[float]:
+        if not self.size:
+            return None
+        return float(self.values[(self.index - 1) % self.capacity])
+
+    def ordered(self) -> np.ndarray:
+        """Samples in chronological order (a copy)."""
+        if self.size < self.capacity:
+            return self.values[: self.size].copy()
+        return np.roll(self.values, -self.index)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Approximate ``q``-th percentile of the window (bin midpoint)."""
+        if not self.size:
+            return None
+        cumulative = np.cumsum(self.counts)
+        b = int(np.searchsorted(cumulative, q / 100.0 * self.size))
+        b = min(b, self._bins - 1)
+        return float((self.edges[b] + self.edges[b + 1]) / 2.0)
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.size:
+            return {"count": 0}
+        window = self.values[: self.size]
+        return {
+            "count": self.size,
+            "latest": self.latest,
+            "mean": float(window.mean()),
+            "min": float(window.min()),
+            "max": float(window.max()),
+            "std": float(window.std()),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class MetricSampler:
+    """Non-blocking system sampler recording into per-metric rings.
+
+    CPU load is the busy share of ``/proc/stat`` jiffies since the previous
+    sample. Memory comes from ``/proc/meminfo``. Temperature, frequency and
+    throttle state come from sysfs; ``vcgencmd`` is used only where the sysfs
+    file is missing, and then at most every ``slow_interval_s`` seconds.
+    """
+
+    # (low, high) histogram range of each ring
+    METRICS: Dict[str, Tuple[float, float]] = {
+        "cpu_percent": (0.0, 100.0),
+        "memory_percent": (0.0, 100.0),
+        "swap_percent": (0.0, 100.0),
+        "load_avg_1m": (0.0, 16.0),
+        "temperature_c": (0.0, 110.0),
+        "cpu_freq_mhz": (0.0, 4000.0),
+        "throttled": (0.0, 2.0),
+    }
+
+    def __init__(
+        self,
+        sources: SystemSources,
+        capacity: int = 1000,
+        slow_interval_s: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.sources = sources
+        self.clock = clock
+        self.slow_interval_s = slow_interval_s
+        self.rings = {
+            name: MetricRing(capacity, low, high)
+            for name, (low, high) in self.METRICS.items()
+        }
+        self.timestamps = MetricRing(capacity, 0.0, 1.0, bins=1)
+        self.count = 0
+        self.per_core: List[float] = []
+        self.memory_used_gb: Optional[float] = None
+        self.memory_total_gb: Optional[float] = None
+        self._last: Dict[str, Any] = {}
+        self._cpu_times: Optional[np.ndarray] = None
+        self._slow_cache: Dict[str, Tuple[float, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._cpu_load()  # prime the jiffy counters
+
+    def _cpu_load(self) -> Optional[float]:
+        text = self.sources.read_proc("stat")
+        if not text:
+            return None
+        rows = [line.split()[1:] for line in text.split("\n") if line.startswith("cpu")]
+        try:
+            times = np.array([[int(v) for v in row[:8]] for row in rows], dtype=float)
+        except ValueError:
+            return None
+        previous, self._cpu_times = self._cpu_times, times
+        if previous is None or previous.shape != times.shape:
+            return None
+        delta = times - previous
+        total = delta.sum(axis=1)
+        idle = delta[:, 3] + delta[:, 4]
+        busy = np.where(total > 0, 100.0 * (1.0 - idle / np.maximum(total, 1)), 0.0)
+        self.per_core = [float(v) for v in busy[1:]]
+        return float(busy[0]) if total[0] > 0 else None
+
+    def _memory(self) -> Tuple[Optional[float], Optional[float]]:
+        text = self.sources.read_proc("meminfo")
+        if not text:
+            return None, None
+        info = {}
+        for line in text.split("\n"):
+            key, _, rest = line.partition(":")
+            if key in ("MemTotal", "MemAvailable", "SwapTotal", "SwapFree"):
+                info[key] = float(rest.split()[0])  # kB
+        total = info.get("MemTotal")
+        if not total or "MemAvailable" not in info:
+            return None, None
+        used = total - info["MemAvailable"]
+        self.memory_total_gb = total / (1024**2)
+        self.memory_used_gb = used / (1024**2)
+        swap_total = info.get("SwapTotal", 0.0)
+        swap = (
+            100.0 * (swap_total - info.get("SwapFree", 0.0)) / swap_total
+            if swap_total
+            else 0.0
+        )
+        return 100.0 * used / total, swap
+
+    def _slow(self, key: str, read: Callable[[], Optional[float]]) -> Optional[float]:
+        """Rate-limit readings that need a ``vcgencmd`` subprocess."""
+        now = self.clock()
+        cached = self._slow_cache.get(key)
+        if cached is not None and now - cached[0] < self.slow_interval_s:
+            return cached[1]
+        value = read()
+        self._slow_cache[key] = (now, value)
+        return value
+
+    def _temperature(self) -> Optional[float]:
+        raw = self.sources.read_sys("class/thermal/thermal_zone0/temp")
+        if raw:
+            try:
+                return float(raw) / 1000.0
+            except ValueError:
+                pass
+
+        def vcgencmd_temp() -> Optional[float]:
+            output = self.sources.vcgencmd("measure_temp")
+            try:
+                return float(output.split("=")[1].split("'")[0]) if output else None
+            except (IndexError, ValueError):
+                return None
+
+        return self._slow("temperature_c", vcgencmd_temp)
+
+    def _frequency(self) -> Optional[float]:
+        raw = self.sources.read_sys("devices/system/cpu/cpu0/cpufreq/scaling_cur_freq")
+        try:
+            return int(raw) / 1000.0 if raw else None
+        except ValueError:
+            return None
+
+    def _throttled(self) -> Optional[float]:
+        def decode(raw: Optional[str]) -> Optional[float]:
+            try:
+                return float(bool(int(raw, 16) & 0xF)) if raw else None
+            except ValueError:
+                return None
+
+        raw = self.sources.read_sys(THROTTLED_SYSFS)
+        if raw:
+            return decode(raw)
+
+        def vcgencmd_throttled() -> Optional[float]:
+            output = self.sources.vcgencmd("get_throttled")
+            return decode(output.split("=")[-1]) if output else None
+
+        return self._slow("throttled", vcgencmd_throttled)
+
+    def sample(self) -> Dict[str, Any]:
+        """Take one sample (never blocks) and record it in the rings."""
+        with self._lock:
+            memory_percent, swap_percent = self._memory()
+            values = {
+                "cpu_percent": self._cpu_load(),
+                "memory_percent": memory_percent,
+                "swap_percent": swap_percent,
+                "load_avg_1m": (
+                    os.getloadavg()[0] if hasattr(os, "getloadavg") else None
+                ),
+                "temperature_c": self._temperature(),
+                "cpu_freq_mhz": self._frequency(),
+                "throttled": self._throttled(),
+            }
+            for name, value in values.items():
+                self.rings[name].append(value)
+            values["timestamp"] = self.clock()
+            self.timestamps.append(values["timestamp"])
+            self.count += 1
+            self._last = values
+            return values
+
+    def latest(self) -> Dict[str, Any]:
+        """The most recent sample (empty before the first one)."""
+        return dict(self._last)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Rolling statistics (mean/min/max/std/p50/p95/p99) per metric."""
+        with self._lock:
+            return {name: ring.summary() for name, ring in self.rings.items()}
+
+    def to_columns(self) -> Dict[str, List[float]]:
+        """Chronological history per metric, for export."""
+        with self._lock:
+            columns = {"timestamp": self.timestamps.ordered().tolist()}
+            for name, ring in self.rings.items():
+                columns[name] = ring.ordered().tolist()
+            return columns
+
+
+# --- Binary telemetry log -------------------------------------------------
+#
+# Layout: a 16-byte header (magic, version, record size) followed by
+# fixed-width little-endian records, appended in batches. A torn record at
+# the end of the file (power loss) is ignored by the reader.
+
+TELEMETRY_VERSION = 1
+_HEADER = struct.Struct("<4sHH8x")
+RAW_MAGIC = b"EFTS"
+ROLLUP_MAGIC = b"EFRU"
+
+RECORD_SYSTEM = 0
+RECORD_INFERENCE = 1
+_UNKNOWN = 255  # "throttled" / model id not available
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("kind", "u1"),
+        ("throttled", "u1"),
+        ("model_id", "<u2"),
+        ("latency_ms", "<f4"),
+        ("cpu_percent", "<f4"),
+        ("memory_percent", "<f4"),
+        ("temperature_c", "<f4"),
+        ("cpu_freq_mhz", "<f4"),
+        ("load_avg_1m", "<f4"),
+    ]
+)
+
+ROLLUP_DTYPE = np.dtype(
+    [
+        ("start", "<f8"),
+        ("samples", "<u4"),
+        ("inferences", "<u4"),
+        ("cpu_mean", "<f4"),
+        ("cpu_max", "<f4"),
+        ("memory_mean", "<f4"),
+        ("temperature_mean", "<f4"),
+        ("temperature_max", "<f4"),
+        ("throttled_fraction", "<f4"),
+        ("latency_mean_ms", "<f4"),
+        ("latency_p50_ms", "<f4"),
+        ("latency_p95_ms", "<f4"),
+        ("latency_p99_ms", "<f4"),
+        ("latency_max_ms", "<f4"),
+    ]
+)
+
+# Column names in record order (``dtype.names`` is optional to type checkers)
+_RECORD_FIELDS: Tuple[str, ...] = RECORD_DTYPE.names or ()
+_ROLLUP_FIELDS: Tuple[str, ...] = ROLLUP_DTYPE.names or ()
+
+ROLLUP_RESOLUTIONS = {"1s": 1.0, "1m": 60.0, "1h": 3600.0}
+
+# Log-spaced latency buckets (0.01 ms .. 60 s, ~4% wide) for rollup percentiles
+_LATENCY_EDGES = np.geomspace(0.01, 60000.0, 401)
+
+
+def _nan(value: Optional[float]) -> float:
+    return float("nan") if value is None else float(value)
+
+
+class _BinaryAppender:
+    """Buffered append-only writer of fixed-width records.
+
+    Records are staged in a pre-allocated array and written in batches;
+    ``fsync`` runs at most every ``fsync_interval_s`` seconds so flash
+    storage sees few, large writes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        magic: bytes,
+        dtype: np.dtype,
+        buffer_records: int = 256,
+        fsync_interval_s: float = 10.0,
+    ):
+        self.path = path
+        self.dtype = dtype
+        self.fsync_interval_s = fsync_interval_s
+        exists = os.path.exists(path) and os.path.getsize(path) >= _HEADER.size
+        if exists:
+            _read_header(path, magic, dtype)
+        self._file = open(path, "ab")
+        if not exists:
+            self._file.write(_HEADER.pack(magic, TELEMETRY_VERSION, dtype.itemsize))
+        self._buffer = np.zeros(max(1, buffer_records), dtype=dtype)
+        self._count = 0
+        self._last_fsync = time.monotonic()
+
+    def next_record(self) -> np.void:
+        """Slot for the next record (written on the following flush)."""
+        if self._count == len(self._buffer):
+            self.flush()
+        record = self._buffer[self._count]
+        self._count += 1
+        return record
+
+    def flush(self, fsync: bool = False) -> None:
+        if self._count:
+            self._file.write(self._buffer[: self._count].tobytes())
+            self._count = 0
+        self._file.flush()
+        now = time.monotonic()
+        if fsync or now - self._last_fsync >= self.fsync_interval_s:
+            os.fsync(self._file.fileno())
+            self._last_fsync = now
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush(fsync=True)
+            self._file.close()
+
+
+def _read_header(path: str, magic: bytes, dtype: np.dtype) -> None:
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+    found, version, itemsize = _HEADER.unpack(header)
+    if found != magic or version != TELEMETRY_VERSION or itemsize != dtype.itemsize:
+        raise ValueError(f"Not a compatible EdgeFlow telemetry file: {path}")
+
+
+class _RollupBucket:
+    """Aggregates of one rollup resolution for the current time bucket."""
+
+    def __init__(self, seconds: float, appender: _BinaryAppender):
+        self.seconds = seconds
+        self.appender = appender
+        self.latency_counts = np.zeros(len(_LATENCY_EDGES) - 1, dtype=np.int64)
+        self.start: Optional[float] = None
+        self._reset(0.0)
+
+    def _reset(self, start: float) -> None:
+        self.start = start
+        self.samples = 0
+        self.cpu_sum = self.cpu_max = 0.0
+        self.memory_sum = 0.0
+        self.temperature_sum = 0.0
+        self.temperature_max = float("-inf")
+        self.temperature_samples = 0
+        self.throttled = 0
+        self.inferences = 0
+        self.latency_sum = self.latency_max = 0.0
+        self.latency_counts[:] = 0
+
+    def _advance(self, timestamp: float) -> None:
+        bucket = timestamp - timestamp % self.seconds
+        if self.samples or self.inferences:
+            if bucket != self.start:
+                self._emit()
+                self._reset(bucket)
+        else:
+            self.start = bucket
+
+    def add_system(self, timestamp: float, sample: Dict[str, Any]) -> None:
+        self._advance(timestamp)
+        self.samples += 1
+        cpu = sample.get("cpu_percent") or 0.0
+        self.cpu_sum += cpu
+        self.cpu_max = max(self.cpu_max, cpu)
+        self.memory_sum += sample.get("memory_percent") or 0.0
+        temperature = sample.get("temperature_c")
+        if temperature is not None:
+            self.temperature_sum += temperature
+            self.temperature_max = max(self.temperature_max, temperature)
+            self.temperature_samples += 1
+        self.throttled += 1 if sample.get("throttled") else 0
+
+    def add_latency(self, timestamp: float, latency_ms: float) -> None:
+        self._advance(timestamp)
+        self.inferences += 1
+        self.latency_sum += latency_ms
+        self.latency_max = max(self.latency_max, latency_ms)
+        b = int(np.searchsorted(_LATENCY_EDGES, latency_ms, side="right")) - 1
+        self.latency_counts[min(max(b, 0), len(self.latency_counts) - 1)] += 1
+
+    def _percentile(self, q: float) -> float:
+        cumulative = np.cumsum(self.latency_counts)
+        b = int(np.searchsorted(cumulative, q / 100.0 * self.inferences))
+        b = min(b, len(self.latency_counts) - 1)
+        return float(np.sqrt(_LATENCY_EDGES[b] * _LATENCY_EDGES[b + 1]))
+
+    def _emit(self) -> None:
+        record = self.appender.next_record()
+        record["start"] = _nan(self.start)
+        record["samples"] = self.samples
+        record["inferences"] = self.inferences
+        samples = max(self.samples, 1)
+        record["cpu_mean"] = self.cpu_sum / samples
+        record["cpu_max"] = self.cpu_max
+        record["memory_mean"] = self.memory_sum / samples
+        if self.temperature_samples:
+            record["temperature_mean"] = self.temperature_sum / self.temperature_samples
+            record["temperature_max"] = self.temperature_max
+        else:
+            record["temperature_mean"] = record["temperature_max"] = np.nan
+        record["throttled_fraction"] = self.throttled / samples
+        if self.inferences:
+            record["latency_mean_ms"] = self.latency_sum / self.inferences
+            record["latency_p50_ms"] = self._percentile(50)
+            record["latency_p95_ms"] = self._percentile(95)
+            record["latency_p99_ms"] = self._percentile(99)
+            record["latency_max_ms"] = self.latency_max
+        else:
+            for field in ("mean", "p50", "p95", "p99", "max"):
+                record[f"latency_{field}_ms"] = np.nan
+
+    def close(self) -> None:
+        if self.samples or self.inferences:
+            self._emit()
+            self._reset(0.0)
+        self.appender.close()
+
+
+class TelemetryLog:
+    """Append-only binary time-series log with on-device rollups.
+
+    ``path`` receives one 36-byte record per system sample or inference
+    (unless ``raw=False``), ``path + ".names"`` the model names referenced by
+    id, and ``path + ".1s"``/``".1m"``/``".1h"`` one aggregate per bucket with
+    latency percentiles. Multi-day soaks can keep only the rollups to save
+    flash space and wear.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        raw: bool = True,
+        rollups: Iterable[str] = ("1s", "1m", "1h"),
+        fsync_interval_s: float = 10.0,
+        buffer_records: int = 256,
+    ):
+        self.path = path
+        self._lock = threading.Lock()
+        self._raw = (
+            _BinaryAppender(
+                path, RAW_MAGIC, RECORD_DTYPE, buffer_records, fsync_interval_s
+            )
+            if raw
+            else None
+        )
+        self._rollups = [
+            _RollupBucket(
+                ROLLUP_RESOLUTIONS[name],
+                _BinaryAppender(
+                    f"{path}.{name}", ROLLUP_MAGIC, ROLLUP_DTYPE, 16, fsync_interval_s
+                ),
+            )
+            for name in rollups
+        ]
+        self._names = _read_names(path)
+        self._model_ids = {name: i for i, name in enumerate(self._names)}
+
+    def _model_id(self, name: str) -> int:
+        model_id = self._model_ids.get(name)
+        if model_id is None:
+            model_id = self._model_ids[name] = len(self._names)
+            self._names.append(name)
+            with open(f"{self.path}.names", "a") as f:
+                f.write(name.replace("\n", " ") + "\n")
+        return model_id
+
+    def record_system(self, sample: Dict[str, Any]) -> None:
+        """Append a :meth:`MetricSampler.sample` result."""
+        timestamp = sample.get("timestamp")
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            if self._raw is not None:
+                record = self._raw.next_record()
+                record["timestamp"] = timestamp
+                record["kind"] = RECORD_SYSTEM
+                throttled = sample.get("throttled")
+                record["throttled"] = _UNKNOWN if throttled is None else int(throttled)
+                record["model_id"] = _UNKNOWN
+                record["latency_ms"] = np.nan
+                for name in (
+                    "cpu_percent",
+                    "memory_percent",
+                    "temperature_c",
+                    "cpu_freq_mhz",
+                    "load_avg_1m",
+                ):
+                    record[name] = _nan(sample.get(name))
+            for rollup in self._rollups:
+                rollup.add_system(timestamp, sample)
+
+    def record_inference(
+        self,
+        latency_ms: float,
+        model_name: str = "unknown",
+        timestamp: Optional[float] = None,
+    ) -> None:
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            if self._raw is not None:
+                record = self._raw.next_record()
+                record["timestamp"] = timestamp
+                record["kind"] = RECORD_INFERENCE
+                record["throttled"] = _UNKNOWN
+                record["model_id"] = self._model_id(model_name)
+                record["latency_ms"] = latency_ms
+                for name in (
+                    "cpu_percent",
+                    "memory_percent",
+                    "temperature_c",
+                    "cpu_freq_mhz",
+                    "load_avg_1m",
+                ):
+                    record[name] = np.nan
+            for rollup in self._rollups:
+                rollup.add_latency(timestamp, latency_ms)
+
+    def flush(self, fsync: bool = False) -> None:
+        with self._lock:
+            if self._raw is not None:
+                self._raw.flush(fsync)
+            for rollup in self._rollups:
+                rollup.appender.flush(fsync)
+
+    def close(self) -> None:
+        """Emit the open rollup buckets and close every file."""
+        with self._lock:
+            if self._raw is not None:
+                self._raw.close()
+            for rollup in self._rollups:
+                rollup.close()
+
+
+def _read_names(path: str) -> List[str]:
+    try:
+        with open(f"{path}.names") as f:
+            return f.read().splitlines()
+    except OSError:
+        return []
+
+
+def _read_records(path: str, magic: bytes, dtype: np.dtype) -> np.ndarray:
+    _read_header(path, magic, dtype)
+    count = (os.path.getsize(path) - _HEADER.size) // dtype.itemsize
+    return np.fromfile(path, dtype=dtype, count=count, offset=_HEADER.size)
+
+
+def read_telemetry(path: str) -> Dict[str, np.ndarray]:
+    """Load a raw telemetry log as columns (one NumPy array per field).
+
+    Adds a ``model`` column with the model name of inference records.
+    """
+    records = _read_records(path, RAW_MAGIC, RECORD_DTYPE)
+    columns = {name: records[name] for name in _RECORD_FIELDS}
+    names = np.array(_read_names(path) + [""], dtype=object)
+    ids = records["model_id"].astype(np.int64)
+    ids[(ids == _UNKNOWN) | (ids >= len(names) - 1)] = len(names) - 1
+    columns["model"] = names[ids]
+    return columns
+
+
+def read_rollups(path: str, resolution: str = "1s") -> Dict[str, np.ndarray]:
+    """Load the ``1s``/``1m``/``1h`` rollups of a telemetry log as columns."""
+    if resolution not in ROLLUP_RESOLUTIONS:
+        raise ValueError(f"Unknown rollup resolution: {resolution}")
+    records = _read_records(f"{path}.{resolution}", ROLLUP_MAGIC, ROLLUP_DTYPE)
+    return {name: records[name] for name in _ROLLUP_FIELDS}
+
+
+def export_columns(columns: Dict[str, np.ndarray], output_path: str) -> str:
+    """Write columns as ``.csv``, ``.npz`` (NumPy columnar) or ``.parquet``.
+
+    Parquet output needs the optional ``pyarrow`` package.
+    """
+    suffix = Path(output_path).suffix.lower()
+    if suffix == ".npz":
+        arrays: Dict[str, np.ndarray] = {
+            name: values.astype(str) if values.dtype == object else values
+            for name, values in columns.items()
+        }
+        np.savez(output_path, allow_pickle=False, **arrays)
+    elif suffix == ".parquet":
+        try:
+            import pyarrow as pa  # type: ignore
+            import pyarrow.parquet as pq  # type: ignore
+        except ImportError as e:
+            raise ImportError("Parquet export requires pyarrow") from e
+        table = pa.table(
+            {
+                name: values.tolist() if values.dtype == object else values
+                for name, values in columns.items()
+            }
+        )
+        pq.write_table(table, output_path)
+    else:
+        names = list(columns)
+        with open(output_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            writer.writerows(zip(*(columns[name].tolist() for name in names)))
+    return output_path
+
 
 class RaspberryPiMonitor:
     """Real-time system monitoring for Raspberry Pi during model inference."""
 
-    def __init__(self, log_file: str = "pi_performance.log"):
+    def __init__(
+        self,
+        log_file: str = "pi_performance.log",
+        sources: Optional["SystemSources"] = None,
+        history: int = 1000,
+        telemetry: Optional[TelemetryLog] = None,
+    ):
         self.log_file = log_file
+        self.sources = sources or SystemSources()
         self.monitoring = False
-        self.stats: List[Dict[str, Any]] = []
-        self.inference_stats: List[Dict[str, Any]] = []
+        self.sampler = MetricSampler(self.sources, capacity=history)
+        self.inference_latency = MetricRing(history, 0.01, 10000.0, log_scale=True)
+        self.inference_times = MetricRing(history, 0.0, 1.0, bins=1)
+        self.inference_count = 0
+        self.last_model_name = "unknown"
+        self.telemetry = telemetry
         self.start_time: Optional[float] = None
+        self._stop_event = threading.Event()
 
         # System info
         self.cpu_count = psutil.cpu_count()
@@ -38,84 +828,96 @@ class RaspberryPiMonitor:
 
     def get_cpu_temperature(self) -> Optional[float]:
         """Get CPU temperature in Celsius."""
-        try:
-            {
-                "original_stats": {
-                    "size_mb": 0.001953,
-                    "latency_ms": 0.019530000000000002,
-                    "model_path": "uploaded_model.tflite",
-                },
-                "optimized_stats": {
-                    "size_mb": 0.0009765,
-                    "latency_ms": 0.007812,
-                    "model_path": "optimized_model.tflite",
-                },
-                "improvements": {
-                    "size_reduction": 50.0,
-                    "speedup": 2.5,
-                    "latency_reduction": 60.0,
-                    "throughput_increase": 150.0,
-                    "memory_saved": 0.0,
-                },
-                "config": {"quantize": "int8", "target_device": "raspberry_pi"},
-                "timestamp": "2025-09-24T12:51:00.830617",
-            }  # Try vcgencmd first (Raspberry Pi specific)
-            result = subprocess.run(
-                ["vcgencmd", "measure_temp"], capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                temp_str = result.stdout.strip()
+        # Try vcgencmd first (Raspberry Pi specific)
+        output = self.sources.vcgencmd("measure_temp")
+        if output:
+            try:
                 # Extract temperature from "temp=XX.X'C"
-                temp = float(temp_str.split("=")[1].split("'")[0])
-                return temp
-        except Exception:
-            pass
+                return float(output.split("=")[1].split("'")[0])
+            except (IndexError, ValueError):
+                pass
 
+        # Fallback to thermal zone
+        raw = self.sources.read_sys("class/thermal/thermal_zone0/temp")
+        if raw is None:
+            return None
         try:
-            # Fallback to thermal zone
-            with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-                temp = float(f.read().strip()) / 1000.0
-            return temp
-        except (FileNotFoundError, PermissionError, ValueError) as e:
+            return float(raw) / 1000.0
+        except ValueError as e:
             print(f"⚠️  Could not read CPU temperature: {e}")
             return None
-        except Exception:
-            return None
 
-    def get_gpu_memory(self) -> Dict[str, Optional[int]]:
-        """Get GPU memory usage (Raspberry Pi specific)."""
+    def get_cpu_frequency_mhz(self) -> Optional[float]:
+        """Get the current frequency of CPU0 in MHz."""
+        output = self.sources.vcgencmd("measure_clock", "arm")
+        if output:
+            try:
+                # "frequency(48)=1500398464"
+                return int(output.split("=")[1]) / 1e6
+            except (IndexError, ValueError):
+                pass
+
+        raw = self.sources.read_sys("devices/system/cpu/cpu0/cpufreq/scaling_cur_freq")
+        if raw is None:
+            return None
         try:
-            # Get GPU memory split
-            result = subprocess.run(
-                ["vcgencmd", "get_mem", "gpu"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            gpu_mem = None
-            if result.returncode == 0:
-                gpu_mem = int(result.stdout.strip().split("=")[1].replace("M", ""))
+            return int(raw) / 1000.0  # kHz -> MHz
+        except ValueError:
+            return None
 
-            # Get GPU memory usage
-            result = subprocess.run(
-                ["vcgencmd", "get_mem", "reloc"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            gpu_used = None
-            if result.returncode == 0:
-                gpu_used = int(result.stdout.strip().split("=")[1].replace("M", ""))
+    def get_throttle_state(self) -> Optional[Dict[str, Any]]:
+        """Decode ``vcgencmd get_throttled`` flags.
 
-            return {"total": gpu_mem, "used": gpu_used}
-        except Exception:
-            return {"total": None, "used": None}
+        Returns ``None`` when vcgencmd is not available (non-Pi hardware).
+        """
+        output = self.sources.vcgencmd("get_throttled")
+        if not output:
+            return None
+        try:
+            raw = int(output.split("=")[1], 16)
+        except (IndexError, ValueError):
+            return None
+        state: Dict[str, Any] = {"raw": hex(raw)}
+        for bit, name in THROTTLE_FLAGS.items():
+            state[name] = bool(raw & (1 << bit))
+            state[f"{name}_occurred"] = bool(raw & (1 << (bit + 16)))
+        state["throttling"] = any(state[name] for name in THROTTLE_FLAGS.values())
+        return state
+
+    def get_gpu_memory(self) -> Dict[str, Optional[int]]:
+        """Get GPU memory usage (Raspberry Pi specific)."""
+        values: Dict[str, Optional[int]] = {"total": None, "used": None}
+        # Get GPU memory split and usage
+        for key, region in (("total", "gpu"), ("used", "reloc")):
+            output = self.sources.vcgencmd("get_mem", region)
+            if output:
+                try:
+                    values[key] = int(output.split("=")[1].replace("M", ""))
+                except (IndexError, ValueError):
+                    pass
+        return values
+
+    def sample(self) -> Dict[str, Any]:
+        """Take one non-blocking sample into the rings (and telemetry log)."""
+        sample = self.sampler.sample()
+        if self.telemetry is not None:
+            self.telemetry.record_system(sample)
+        return sample
+
+    def latest_sample(self) -> Dict[str, Any]:
+        """Most recent sample taken by the monitor (empty if none yet)."""
+        return self.sampler.latest()
 
     def get_system_stats(self) -> Dict[str, Any]:
-        """Get comprehensive system statistics."""
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        cpu_per_core = psutil.cpu_percent(interval=0.1, percpu=True)
+        """Get comprehensive system statistics.
+
+        CPU figures are deltas since the previous sample, so this never
+        blocks. It still runs ``vcgencmd`` for GPU memory, so the background
+        monitor records lightweight samples via :meth:`sample` instead.
+        """
+        sample = self.sampler.sample()
+        cpu_percent = sample["cpu_percent"] or 0.0
+        cpu_per_core = list(self.sampler.per_core)
 
         # Memory usage
         memory = psutil.virtual_memory()
@@ -128,7 +930,7 @@ class RaspberryPiMonitor:
         net_io = psutil.net_io_counters()
 
         # Temperature
-        temperature = self.get_cpu_temperature()
+        temperature = sample["temperature_c"]
 
         # GPU memory
         gpu_memory = self.get_gpu_memory()
@@ -169,6 +971,7 @@ class RaspberryPiMonitor:
     def start_monitoring(self, interval: float = 0.5):
         """Start system monitoring in background thread."""
         self.monitoring = True
+        self._stop_event.clear()
         self.start_time = time.time()
         self.monitor_thread = threading.Thread(
             target=self._monitor_loop, args=(interval,)
@@ -180,172 +983,181 @@ class RaspberryPiMonitor:
     def stop_monitoring(self):
         """Stop system monitoring."""
         self.monitoring = False
+        self._stop_event.set()
         if hasattr(self, "monitor_thread"):
             self.monitor_thread.join(timeout=2)
+        if self.telemetry is not None:
+            self.telemetry.flush(fsync=True)
         print("⏹️  System monitoring stopped")
 
     def _monitor_loop(self, interval: float):
         """Background monitoring loop."""
         while self.monitoring:
             try:
-                stats = self.get_system_stats()
-                self.stats.append(stats)
-
-                # Keep only last 1000 samples to prevent memory issues
-                if len(self.stats) > 1000:
-                    self.stats = self.stats[-1000:]
-
-                time.sleep(interval)
+                # Rings overwrite the oldest sample in place: no trimming
+                self.sample()
             except Exception as e:
                 print(f"⚠️  Monitoring error: {e}")
-                time.sleep(interval)
+            self._stop_event.wait(interval)
 
     def log_inference_stats(
         self, inference_time_ms: float, model_name: str = "unknown"
     ):
-        """Log inference performance statistics."""
-        inference_stat = {
-            "timestamp": time.time(),
-            "datetime": datetime.now().isoformat(),
-            "model_name": model_name,
-            "inference_time_ms": inference_time_ms,
-            "fps": 1000.0 / inference_time_ms if inference_time_ms > 0 else 0,
-        }
-
-        # Add current system stats
-        if self.stats:
-            current_stats = self.stats[-1]
-            inference_stat.update(
-                {
-                    "cpu_percent": current_stats["cpu"]["percent"],
-                    "memory_percent": current_stats["memory"]["percent"],
-                    "temperature": current_stats["temperature"]["cpu_celsius"],
-                }
-            )
-
-        self.inference_stats.append(inference_stat)
-
-        # Keep only last 1000 inference stats
-        if len(self.inference_stats) > 1000:
-            self.inference_stats = self.inference_stats[-1000:]
+        """Log inference performance statistics.
+
+        The latency goes into the in-memory ring and, when configured, the
+        binary telemetry log; system context is correlated by timestamp.
+        """
+        now = time.time()
+        self.inference_latency.append(inference_time_ms)
+        self.inference_times.append(now)
+        self.inference_count += 1
+        self.last_model_name = model_name
+        if self.telemetry is not None:
+            self.telemetry.record_inference(inference_time_ms, model_name, now)
 
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get performance summary statistics."""
-        if not self.stats:
+        if not self.sampler.count:
             return {"error": "No monitoring data available"}
 
-        # System stats
-        cpu_usage = [s["cpu"]["percent"] for s in self.stats]
-        memory_usage = [s["memory"]["percent"] for s in self.stats]
-        temperatures = [
-            s["temperature"]["cpu_celsius"]
-            for s in self.stats
-            if s["temperature"]["cpu_celsius"] is not None
-        ]
-        load_avg = [s["cpu"]["load_avg_1m"] for s in self.stats]
+        metrics = self.sampler.summary()
+        cpu = metrics["cpu_percent"]
+        memory = metrics["memory_percent"]
+        load_avg = metrics["load_avg_1m"]
+        temperature = metrics["temperature_c"]
+        latency = self.inference_latency.summary()
 
-        # Inference stats
-        inference_times = [s["inference_time_ms"] for s in self.inference_stats]
-        fps_values = [s["fps"] for s in self.inference_stats]
+        def stat(summary: Dict[str, Any], key: str) -> float:
+            return summary.get(key, 0.0)
 
         summary: Dict[str, Any] = {
             "monitoring_duration_s": (
                 time.time() - self.start_time if self.start_time is not None else 0
             ),
-            "total_samples": len(self.stats),
-            "total_inferences": len(self.inference_stats),
+            "total_samples": self.sampler.count,
+            "total_inferences": self.inference_count,
             "system_performance": {
                 "cpu": {
-                    "avg_percent": np.mean(cpu_usage),
-                    "max_percent": np.max(cpu_usage),
-                    "min_percent": np.min(cpu_usage),
-                    "std_percent": np.std(cpu_usage),
+                    "avg_percent": stat(cpu, "mean"),
+                    "max_percent": stat(cpu, "max"),
+                    "min_percent": stat(cpu, "min"),
+                    "std_percent": stat(cpu, "std"),
+                    "p95_percent": stat(cpu, "p95"),
                 },
                 "memory": {
-                    "avg_percent": np.mean(memory_usage),
-                    "max_percent": np.max(memory_usage),
-                    "min_percent": np.min(memory_usage),
+                    "avg_percent": stat(memory, "mean"),
+                    "max_percent": stat(memory, "max"),
+                    "min_percent": stat(memory, "min"),
                 },
                 "load_average": {
-                    "avg": np.mean(load_avg),
-                    "max": np.max(load_avg),
-                    "min": np.min(load_avg),
+                    "avg": stat(load_avg, "mean"),
+                    "max": stat(load_avg, "max"),
+                    "min": stat(load_avg, "min"),
                 },
             },
         }
 
-        if temperatures:
+        if temperature["count"]:
             summary["system_performance"]["temperature"] = {
-                "avg_celsius": np.mean(temperatures),
-                "max_celsius": np.max(temperatures),
-                "min_celsius": np.min(temperatures),
+                "avg_celsius": temperature["mean"],
+                "max_celsius": temperature["max"],
+                "min_celsius": temperature["min"],
             }
 
-        if inference_times:
+        if latency["count"]:
+            times = self.inference_latency.values[: latency["count"]]
+            fps_values = 1000.0 / np.maximum(times, 1e-9)
             summary["inference_performance"] = {
-                "avg_time_ms": np.mean(inference_times),
-                "min_time_ms": np.min(inference_times),
-                "max_time_ms": np.max(inference_times),
-                "std_time_ms": np.std(inference_times),
-                "avg_fps": np.mean(fps_values),
-                "max_fps": np.max(fps_values),
-                "min_fps": np.min(fps_values),
+                "avg_time_ms": latency["mean"],
+                "min_time_ms": latency["min"],
+                "max_time_ms": latency["max"],
+                "std_time_ms": latency["std"],
+                "p50_time_ms": latency["p50"],
+                "p95_time_ms": latency["p95"],
+                "p99_time_ms": latency["p99"],
+                "avg_fps": float(np.mean(fps_values)),
+                "max_fps": float(np.max(fps_values)),
+                "min_fps": float(np.min(fps_values)),
             }
 
         return summary
 
     def print_real_time_stats(self):
         """Print real-time statistics to console."""
-        if not self.stats:
+        latest = self.sampler.latest()
+        if not latest:
             print("No monitoring data available")
             return
 
-        latest = self.stats[-1]
-
-        print(f"\n🔍 Real-time System Stats ({latest['datetime']})")
+        when = datetime.fromtimestamp(latest["timestamp"]).isoformat()
+        print(f"\n🔍 Real-time System Stats ({when})")
         print("=" * 60)
         print(
-            f"CPU Usage:     {latest['cpu']['percent']:6.1f}% "
-            f"(Load: {latest['cpu']['load_avg_1m']:.2f})"
-        )
-        print(
-            f"Memory Usage:  {latest['memory']['percent']:6.1f}% "
-            f"({latest['memory']['used_gb']:.2f}GB/{latest['memory']['total_gb']:.2f}GB)"
+            f"CPU Usage:     {latest['cpu_percent'] or 0.0:6.1f}% "
+            f"(Load: {latest['load_avg_1m'] or 0.0:.2f})"
         )
+        if latest["memory_percent"] is not None:
+            print(
+                f"Memory Usage:  {latest['memory_percent']:6.1f}% "
+                f"({self.sampler.memory_used_gb:.2f}GB/"
+                f"{self.sampler.memory_total_gb:.2f}GB)"
+            )
 
-        if latest["temperature"]["cpu_celsius"]:
-            temp = latest["temperature"]["cpu_celsius"]
+        if latest["temperature_c"]:
+            temp = latest["temperature_c"]
             temp_status = "🔥" if temp > 70 else "⚠️" if temp > 60 else "✅"
             print(f"CPU Temp:      {temp:6.1f}°C {temp_status}")
 
-        if latest["gpu"]["total"]:
-            print(f"GPU Memory:    {latest['gpu']['total']}MB allocated")
+        gpu = self.get_gpu_memory()
+        if gpu["total"]:
+            print(f"GPU Memory:    {gpu['total']}MB allocated")
 
         # Per-core CPU usage
         core_usage = " | ".join(
-            [
-                f"Core{i}: {usage:4.1f}%"
-                for i, usage in enumerate(latest["cpu"]["per_core"])
-            ]
+            [f"Core{i}: {usage:4.1f}%" for i, usage in enumerate(self.sampler.per_core)]
         )
         print(f"CPU Cores:     {core_usage}")
 
         # Recent inference stats
-        if self.inference_stats:
-            recent_inferences = self.inference_stats[-5:]  # Last 5 inferences
-            avg_time = np.mean([s["inference_time_ms"] for s in recent_inferences])
-            avg_fps = np.mean([s["fps"] for s in recent_inferences])
+        if len(self.inference_latency):
+            ring = self.inference_latency
+            recent = ring.ordered()[-5:]  # Last 5 inferences
+            avg_time = float(np.mean(recent))
+            avg_fps = float(np.mean(1000.0 / np.maximum(recent, 1e-9)))
             print(f"Recent Inf:    {avg_time:6.1f}ms ({avg_fps:5.1f} FPS)")
 
     def save_detailed_log(self, filename: Optional[str] = None):
-        """Save detailed monitoring data to file."""
-        if filename is None:
-            filename = f"pi_monitor_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        """Save detailed monitoring data to file.
+
+        Samples go to a binary telemetry log (see :func:`read_telemetry`);
+        only the summary is written as JSON, next to it. When the monitor
+        already records to a telemetry log, that log is flushed instead of
+        writing the in-memory history again.
+        """
+        if self.telemetry is not None:
+            self.telemetry.flush(fsync=True)
+            filename = self.telemetry.path
+        else:
+            if filename is None:
+                filename = f"pi_monitor_{datetime.now().strftime('%Y%m%d_%H%M%S')}.eft"
+            log = TelemetryLog(filename, rollups=())
+            columns = self.sampler.to_columns()
+            # Rings skip unavailable readings; only gap-free metrics line up
+            # with the timestamps, the others are recorded as missing.
+            length = len(columns["timestamp"])
+            names = [name for name in columns if len(columns[name]) == length]
+            for row in zip(*(columns[name] for name in names)):
+                log.record_system(dict(zip(names, row)))
+            times = self.inference_times.ordered()
+            latencies = self.inference_latency.ordered()
+            for timestamp, latency in zip(times, latencies):
+                log.record_inference(float(latency), self.last_model_name, timestamp)
+            log.close()
 
         data = {
             "summary": self.get_performance_summary(),
-            "system_stats": self.stats,
-            "inference_stats": self.inference_stats,
+            "telemetry_log": filename,
             "metadata": {
                 "cpu_count": self.cpu_count,
                 "memory_total_gb": self.memory_total,
@@ -353,17 +1165,20 @@ class RaspberryPiMonitor:
                 "monitoring_end": time.time(),
             },
         }
-
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(f"{filename}.summary.json", "w") as f:
+            json.dump(data, f, default=str)
 
         print(f"📄 Detailed log saved: {filename}")
         return filename
 
 
-def run_htop_like_monitor():
+def _open_telemetry(telemetry_path: Optional[str]) -> Optional[TelemetryLog]:
+    return TelemetryLog(telemetry_path) if telemetry_path else None
+
+
+def run_htop_like_monitor(telemetry_path: Optional[str] = None):
     """Run htop-like real-time monitoring display."""
-    monitor = RaspberryPiMonitor()
+    monitor = RaspberryPiMonitor(telemetry=_open_telemetry(telemetry_path))
     monitor.start_monitoring(interval=1.0)
 
     try:
@@ -377,7 +1192,7 @@ def run_htop_like_monitor():
             monitor.print_real_time_stats()
 
             # Show summary if we have enough data
-            if len(monitor.stats) > 10:
+            if monitor.sampler.count > 10:
                 summary = monitor.get_performance_summary()
                 print("\n📊 Session Summary:")
                 print(f"   Monitoring time: {summary['monitoring_duration_s']:.1f}s")
@@ -403,6 +1218,8 @@ def run_htop_like_monitor():
 
         # Save log
         monitor.save_detailed_log()
+        if monitor.telemetry is not None:
+            monitor.telemetry.close()
 
         # Print final summary
         summary = monitor.get_performance_summary()
@@ -441,7 +1258,16 @@ def run_htop_like_monitor():
             )
 
 
-def monitor_inference_with_model(model_path: str, num_inferences: int = 100):
+def _make_test_input(input_shape: Any, input_dtype: Any) -> np.ndarray:
+    """Generate a random input tensor matching the model's input spec."""
+    if input_dtype == np.int8:
+        return np.random.randint(-128, 127, size=input_shape, dtype=np.int8)
+    return np.random.random(input_shape).astype(np.float32)
+
+
+def monitor_inference_with_model(
+    model_path: str, num_inferences: int = 100, telemetry_path: Optional[str] = None
+):
     """Monitor system while running model inference."""
     print(f"🤖 Monitoring model inference: {model_path}")
 
@@ -455,7 +1281,7 @@ def monitor_inference_with_model(model_path: str, num_inferences: int = 100):
         return
 
     # Initialize monitoring
-    monitor = RaspberryPiMonitor()
+    monitor = RaspberryPiMonitor(telemetry=_open_telemetry(telemetry_path))
     monitor.start_monitoring(interval=0.1)  # High frequency monitoring
 
     try:
@@ -476,14 +1302,7 @@ def monitor_inference_with_model(model_path: str, num_inferences: int = 100):
 
         for i in range(num_inferences):
             # Generate test input
-            if input_dtype == np.float32:
-                test_input = np.random.random(input_shape).astype(np.float32)
-            elif input_dtype == np.int8:
-                test_input = np.random.randint(
-                    -128, 127, size=input_shape, dtype=np.int8
-                )
-            else:
-                test_input = np.random.random(input_shape).astype(np.float32)
+            test_input = _make_test_input(input_shape, input_dtype)
 
             # Run inference with timing
             start_time = time.perf_counter()
@@ -511,6 +1330,8 @@ def monitor_inference_with_model(model_path: str, num_inferences: int = 100):
 
         # Save detailed log
         log_file = monitor.save_detailed_log()
+        if monitor.telemetry is not None:
+            monitor.telemetry.close()
 
         # Print comprehensive summary
         summary = monitor.get_performance_summary()
@@ -543,6 +1364,202 @@ def monitor_inference_with_model(model_path: str, num_inferences: int = 100):
         print(f"\n📄 Detailed log saved: {log_file}")
 
 
+def _close_soak_window(
+    monitor: RaspberryPiMonitor,
+    start_s: float,
+    end_s: float,
+    latencies_ms: List[float],
+) -> Dict[str, Any]:
+    """Summarize one soak window and sample the thermal state at its end."""
+    elapsed = max(end_s - start_s, 1e-9)
+    window: Dict[str, Any] = {
+        "start_s": round(start_s, 3),
+        "end_s": round(end_s, 3),
+        "inferences": len(latencies_ms),
+        "throughput_fps": len(latencies_ms) / elapsed,
+        "temperature_celsius": monitor.get_cpu_temperature(),
+        "cpu_freq_mhz": monitor.get_cpu_frequency_mhz(),
+        "throttle": monitor.get_throttle_state(),
+    }
+    if latencies_ms:
+        p50, p90, p99 = np.percentile(latencies_ms, [50, 90, 99])
+        window.update(
+            {
+                "latency_p50_ms": float(p50),
+                "latency_p90_ms": float(p90),
+                "latency_p99_ms": float(p99),
+                "latency_max_ms": float(max(latencies_ms)),
+            }
+        )
+    return window
+
+
+def run_soak_test(
+    inference: Any,
+    duration_s: float,
+    window_s: float = 10.0,
+    monitor: Optional[RaspberryPiMonitor] = None,
+    inputs: Optional[Iterable[np.ndarray]] = None,
+    freq_drop_ratio: float = 0.9,
+    clock: Callable[[], float] = time.perf_counter,
+) -> Dict[str, Any]:
+    """Run inference continuously and correlate latency with thermal state.
+
+    Short benchmarks finish before the SoC heats up; this keeps the model busy
+    for ``duration_s`` seconds and records, per ``window_s`` window, latency
+    percentiles, throughput, CPU temperature, CPU frequency and
+    ``vcgencmd get_throttled`` flags.
+
+    Args:
+        inference: Object with ``predict(input)`` (e.g. ``EdgeFlowInference``).
+        duration_s: Total soak duration in seconds.
+        window_s: Length of each reporting window in seconds.
+        monitor: Monitor used for temperature/frequency/throttle readings;
+            pass one built with custom ``SystemSources`` to run off-device.
+        inputs: Pre-generated inputs cycled through during the soak. Defaults
+            to eight random tensors matching ``inference.input_details``.
+        freq_drop_ratio: A window counts as throttled when its CPU frequency
+            falls below this fraction of the first reading, even if no
+            throttle flag is reported.
+        clock: Monotonic clock in seconds (injectable for tests).
+
+    Returns:
+        Dict with ``windows``, ``time_to_throttle_s`` (``None`` if throttling
+        never occurred), ``steady_state_fps`` and ``throughput_loss_percent``.
+    """
+    if monitor is None:
+        monitor = RaspberryPiMonitor()
+    if inputs is None:
+        details = inference.input_details[0]
+        inputs = [
+            _make_test_input(details["shape"], details["dtype"]) for _ in range(8)
+        ]
+    input_pool = list(inputs)
+    if not input_pool:
+        raise ValueError("Soak test needs at least one input")
+
+    initial_freq = monitor.get_cpu_frequency_mhz()
+    initial_temp = monitor.get_cpu_temperature()
+
+    windows: List[Dict[str, Any]] = []
+    latencies: List[float] = []
+    start = clock()
+    window_start = start
+    i = 0
+    while True:
+        now = clock()
+        if now - window_start >= window_s or now - start >= duration_s:
+            windows.append(
+                _close_soak_window(
+                    monitor, window_start - start, now - start, latencies
+                )
+            )
+            latencies = []
+            window_start = now
+            if now - start >= duration_s:
+                break
+        t0 = clock()
+        inference.predict(input_pool[i % len(input_pool)])
+        latencies.append((clock() - t0) * 1000.0)
+        i += 1
+
+    time_to_throttle = None
+    for window in windows:
+        flags = window["throttle"] or {}
+        freq = window["cpu_freq_mhz"]
+        freq_dropped = (
+            initial_freq is not None
+            and freq is not None
+            and freq < initial_freq * freq_drop_ratio
+        )
+        if flags.get("throttling") or freq_dropped:
+            time_to_throttle = window["end_s"]
+            break
+
+    # Steady state = the last third of the soak, once temperatures settle
+    tail = windows[-max(1, len(windows) // 3) :]
+    steady_fps = float(np.mean([w["throughput_fps"] for w in tail]))
+    first_fps = windows[0]["throughput_fps"]
+
+    result: Dict[str, Any] = {
+        "duration_s": round(clock() - start, 3),
+        "window_s": window_s,
+        "total_inferences": i,
+        "initial_temperature_celsius": initial_temp,
+        "initial_cpu_freq_mhz": initial_freq,
+        "windows": windows,
+        "time_to_throttle_s": time_to_throttle,
+        "initial_fps": first_fps,
+        "steady_state_fps": steady_fps,
+        "throughput_loss_percent": (
+            (1.0 - steady_fps / first_fps) * 100.0 if first_fps > 0 else 0.0
+        ),
+    }
+
+    # Correlation between temperature and median latency across windows
+    points = [
+        (w["temperature_celsius"], w["latency_p50_ms"])
+        for w in windows
+        if w["temperature_celsius"] is not None and "latency_p50_ms" in w
+    ]
+    if len(points) >= 3:
+        temps, p50s = zip(*points)
+        if np.std(temps) > 0 and np.std(p50s) > 0:
+            result["temperature_latency_correlation"] = float(
+                np.corrcoef(temps, p50s)[0, 1]
+            )
+    return result
+
+
+def soak_test_with_model(model_path: str, duration_s: float, window_s: float = 10.0):
+    """Soak-test a deployed model and save the per-window report."""
+    print(f"🔥 Soak testing model: {model_path} ({duration_s:.0f}s)")
+
+    try:
+        sys.path.append("/home/pi/edgeflow")
+        from inference import EdgeFlowInference  # type: ignore
+    except ImportError:
+        print("❌ EdgeFlow inference engine not found")
+        print("   Make sure you've deployed the model first")
+        return None
+
+    inference = EdgeFlowInference(model_path)
+    if inference.input_details is None:
+        print("❌ Model input details not available")
+        return None
+
+    result = run_soak_test(inference, duration_s, window_s)
+
+    print("\n📊 Soak Test Report:")
+    print("=" * 50)
+    print(f"{'t(s)':>7} {'p50':>8} {'p99':>8} {'FPS':>7} {'Temp':>6} {'MHz':>6}  Flags")
+    for w in result["windows"]:
+        flags = (w["throttle"] or {}).get("raw", "-")
+        temp = w["temperature_celsius"]
+        freq = w["cpu_freq_mhz"]
+        print(
+            f"{w['end_s']:7.0f} {w.get('latency_p50_ms', 0):7.2f}ms "
+            f"{w.get('latency_p99_ms', 0):7.2f}ms {w['throughput_fps']:7.1f} "
+            f"{temp if temp is not None else float('nan'):6.1f} "
+            f"{freq if freq is not None else float('nan'):6.0f}  {flags}"
+        )
+
+    if result["time_to_throttle_s"] is None:
+        print("\n✅ No throttling observed")
+    else:
+        print(f"\n🔥 Time to throttle: {result['time_to_throttle_s']:.0f}s")
+    print(
+        f"Steady-state throughput: {result['steady_state_fps']:.1f} FPS "
+        f"({result['throughput_loss_percent']:.1f}% below initial)"
+    )
+
+    filename = f"pi_soak_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(filename, "w") as f:
+        json.dump(result, f, indent=2, default=str)
+    print(f"📄 Soak report saved: {filename}")
+    return result
+
+
 def main():
     """Main function with command line interface."""
     import argparse
@@ -557,16 +1574,53 @@ def main():
     parser.add_argument(
         "--inferences", type=int, default=100, help="Number of inferences to run"
     )
+    parser.add_argument(
+        "--soak",
+        type=float,
+        metavar="SECONDS",
+        help="Run a sustained-load soak test of --model for this many seconds",
+    )
+    parser.add_argument(
+        "--window", type=float, default=10.0, help="Soak report window in seconds"
+    )
+    parser.add_argument(
+        "--telemetry",
+        metavar="PATH",
+        help="Record samples to a binary telemetry log with 1s/1m/1h rollups",
+    )
+    parser.add_argument(
+        "--export",
+        metavar="LOG",
+        help="Export a telemetry log to --output (.csv, .npz or .parquet)",
+    )
+    parser.add_argument("--output", help="Output file for --export")
+    parser.add_argument(
+        "--rollup",
+        choices=sorted(ROLLUP_RESOLUTIONS),
+        help="Export this rollup of the log instead of the raw records",
+    )
 
     args = parser.parse_args()
 
-    if args.htop:
-        run_htop_like_monitor()
+    if args.export:
+        if not args.output:
+            parser.error("--export requires --output")
+        if args.rollup:
+            columns = read_rollups(args.export, args.rollup)
+        else:
+            columns = read_telemetry(args.export)
+        export_columns(columns, args.output)
+        print(f"📄 Exported {args.export} -> {args.output}")
+    elif args.htop:
+        run_htop_like_monitor(args.telemetry)
     elif args.model:
         if not Path(args.model).exists():
             print(f"❌ Model not found: {args.model}")
             sys.exit(1)
-        monitor_inference_with_model(args.model, args.inferences)
+        if args.soak:
+            soak_test_with_model(args.model, args.soak, args.window)
+        else:
+            monitor_inference_with_model(args.model, args.inferences, args.telemetry)
     else:
         print("🔍 Raspberry Pi System Monitor for EdgeFlow")
         print("=" * 45)
@@ -574,9 +1628,15 @@ def main():
         print("  --htop                 : Run real-time system monitor")
         print("  --model <path>         : Monitor model inference performance")
         print("  --inferences <num>     : Number of inferences to run (default: 100)")
+        print("  --soak <seconds>       : Sustained-load thermal soak test of --model")
+        print("  --telemetry <path>     : Record a binary telemetry log with rollups")
+        print("  --export <log> --output <file.csv|.npz|.parquet> [--rollup 1m]")
         print("\nExamples:")
         print("  python3 pi_system_monitor.py --htop")
         print("  python3 pi_system_monitor.py --model /home/pi/models/model.tflite")
+        print(
+            "  python3 pi_system_monitor.py --model model.tflite --soak 3600 --window 30"
+        )
 
 
 if __name__ == "__main__":
@@ -317,6 +317,50 @@ class IRGraph:
             "topology_info": dict(self.topology_info),
         }
 
+    def to_columnar(self) -> Dict[str, Any]:
+        """Convert the IR graph to a compact column-oriented representation.
+
+        Nodes become a table of parallel columns (one list per field, row
+        ``i`` describing ``node_ids[i]``) and every node reference (edges,
+        execution order, graph inputs/outputs) becomes an integer row index.
+        ``dependencies``/``dependents`` are omitted since they follow from the
+        edge arrays.
+        """
+        node_ids = list(self.nodes)
+        row = {node_id: i for i, node_id in enumerate(node_ids)}
+        nodes = list(self.nodes.values())
+        return {
+            "format": "columnar",
+            "node_ids": node_ids,
+            "nodes": {
+                "name": [n.name for n in nodes],
+                "node_type": [
+                    n.node_type.value if n.node_type else "unknown" for n in nodes
+                ],
+                "op_type": [n.op_type for n in nodes],
+                "dtype": [n.dtype for n in nodes],
+                "framework_origin": [n.framework_origin for n in nodes],
+                "input_shapes": [n.input_shapes for n in nodes],
+                "output_shapes": [n.output_shapes for n in nodes],
+                "inputs": [list(n.inputs) for n in nodes],
+                "outputs": [list(n.outputs) for n in nodes],
+                "params": [dict(n.params) for n in nodes],
+                "device_constraints": [dict(n.device_constraints) for n in nodes],
+                "provenance": [list(n.provenance) for n in nodes],
+                "properties": [dict(getattr(n, "properties", {})) for n in nodes],
+            },
+            "edges": {
+                "src": [row[src] for src, _ in self.edges],
+                "dst": [row[dst] for _, dst in self.edges],
+            },
+            "execution_order": [row[n] for n in self.execution_order if n in row],
+            "optimization_passes": list(self.optimization_passes),
+            "graph_inputs": [row[n] for n in self.graph_inputs if n in row],
+            "graph_outputs": [row[n] for n in self.graph_outputs if n in row],
+            "metadata": dict(self.metadata),
+            "topology_info": dict(self.topology_info),
+        }
+
 
 class IRTransformation(ABC):
     """Abstract base class for IR transformations."""
@@ -304,8 +304,19 @@ class FusionPass(UIRTransformation):
         for node in fused_nodes:
             fused_graph.add_node(node)
 
-        # Copy remaining edges
-        for edge in graph.edges:
+        # Re-point edges at the fused nodes, dropping the ones now internal
+        # to a fused node
+        node_map = {}
+        for node in fused_nodes:
+            node_map[node.node_id] = node.node_id
+            for node_id in node.framework_metadata.get("fused_node_ids", []):
+                node_map.setdefault(node_id, node.node_id)
+        seen_edges = set()
+        for from_id, to_id, tensor_name in graph.edges:
+            edge = (node_map[from_id], node_map[to_id], tensor_name)
+            if edge[0] == edge[1] or edge in seen_edges:
+                continue
+            seen_edges.add(edge)
             fused_graph.add_edge(*edge)
 
         return fused_graph
@@ -377,16 +388,18 @@ class FusionPass(UIRTransformation):
     ) -> Optional[UIRNode]:
         """Find the next node in the execution order that matches the target
         operation type."""
+        # Only direct successors can continue a pattern; take the earliest
+        # matching one in execution order
         current_index = execution_order.index(current_node.node_id)
-
-        for i in range(current_index + 1, len(execution_order)):
-            next_node_id = execution_order[i]
-            next_node = graph.nodes[next_node_id]
-
-            # Check if this node is connected to the current node
-            if self._are_nodes_connected(current_node, next_node, graph):
-                if next_node.operation_type == target_op_type:
-                    return next_node
+        candidates = [
+            (execution_order.index(to_id), to_id)
+            for from_id, to_id, _ in graph.edges
+            if from_id == current_node.node_id
+            and graph.nodes[to_id].operation_type == target_op_type
+        ]
+        for index, node_id in sorted(candidates):
+            if index > current_index:
+                return graph.nodes[node_id]
 
         return None
 
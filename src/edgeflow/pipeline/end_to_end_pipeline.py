@@ -36,6 +36,7 @@ from edgeflow.reporting.traceability_system import (
     export_session_report,
     register_artifact,
     trace_transformation,
+    use_tracker,
 )
 
 logger = logging.getLogger(__name__)
@@ -52,10 +53,26 @@ class EdgeFlowPipeline:
         self.error_reporter = get_error_reporter()
         self.profile_manager = get_profile_manager()
 
+        self._stage_start = 0.0
+
         logger.info(
             f"🚀 EdgeFlow Pipeline initialized (session: {self.tracker.session_id})"
         )
 
+    def _begin_stage(self, stage: str) -> None:
+        """Announce a stage to tracker listeners."""
+        self._stage_start = time.perf_counter()
+        self.tracker.publish("stage", {"stage": stage, "status": "started"})
+
+    def _complete_stage(self, results: Dict[str, Any], stage: str) -> None:
+        """Record a completed stage and announce it to tracker listeners."""
+        results["stages_completed"].append(stage)
+        duration_ms = (time.perf_counter() - self._stage_start) * 1000
+        self.tracker.publish(
+            "stage",
+            {"stage": stage, "status": "completed", "duration_ms": duration_ms},
+        )
+
     def run_complete_pipeline(
         self,
         dsl_file: str,
@@ -63,8 +80,24 @@ class EdgeFlowPipeline:
         output_dir: str = "pipeline_output",
         deploy_targets: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """Run the complete EdgeFlow pipeline from DSL to deployment."""
+        """Run the complete EdgeFlow pipeline from DSL to deployment.
+
+        Progress is reported live to listeners on ``self.tracker``: every
+        component's trace events, ``"stage"`` notifications and
+        ``"benchmark_sample"`` latencies.
+        """
+        with use_tracker(self.tracker):
+            return self._run_complete_pipeline(
+                dsl_file, model_path, output_dir, deploy_targets
+            )
 
+    def _run_complete_pipeline(
+        self,
+        dsl_file: str,
+        model_path: str,
+        output_dir: str,
+        deploy_targets: Optional[List[str]],
+    ) -> Dict[str, Any]:
         start_time = time.perf_counter()
         results: Dict[str, Any] = {
             "success": False,
@@ -92,16 +125,18 @@ class EdgeFlowPipeline:
             ) as ctx:
                 # Stage 1: DSL Validation
                 logger.info("📋 Stage 1: DSL Validation and Parsing")
+                self._begin_stage("validation")
                 validation_result = self._validate_dsl(dsl_file)
                 if not validation_result["success"]:
                     results["errors"].extend(validation_result["errors"])
                     return results
 
-                results["stages_completed"].append("validation")
+                self._complete_stage(results, "validation")
                 config = validation_result["config"]
 
                 # Stage 2: Device Profile Selection
                 logger.info("🎯 Stage 2: Device Profile Analysis")
+                self._begin_stage("device_analysis")
                 device_profile = self._analyze_target_device(config)
                 if not device_profile:
                     results["errors"].append(
@@ -109,10 +144,11 @@ class EdgeFlowPipeline:
                     )
                     return results
 
-                results["stages_completed"].append("device_analysis")
+                self._complete_stage(results, "device_analysis")
 
                 # Stage 3: Model Optimization
                 logger.info("⚡ Stage 3: Model Optimization")
+                self._begin_stage("optimization")
                 optimization_result = self._optimize_model(
                     model_path, config, device_profile, output_dir
                 )
@@ -120,40 +156,44 @@ class EdgeFlowPipeline:
                     results["errors"].extend(optimization_result["errors"])
                     return results
 
-                results["stages_completed"].append("optimization")
+                self._complete_stage(results, "optimization")
                 results["artifacts_generated"].extend(optimization_result["artifacts"])
                 optimized_model = optimization_result["optimized_model_path"]
 
                 # Stage 4: Performance Validation
                 logger.info("📊 Stage 4: Performance Validation")
+                self._begin_stage("performance_validation")
                 perf_result = self._validate_performance(
                     optimized_model, config, device_profile
                 )
                 results["warnings"].extend(perf_result.get("warnings", []))
-                results["stages_completed"].append("performance_validation")
+                self._complete_stage(results, "performance_validation")
 
                 # Stage 5: Code Generation
                 logger.info("🛠️  Stage 5: Target Code Generation")
+                self._begin_stage("code_generation")
                 codegen_result = self._generate_target_code(
                     optimized_model, config, output_dir
                 )
                 results["artifacts_generated"].extend(codegen_result["artifacts"])
-                results["stages_completed"].append("code_generation")
+                self._complete_stage(results, "code_generation")
 
                 # Stage 6: Deployment (if requested)
                 if deploy_targets:
                     logger.info("🚀 Stage 6: Multi-Platform Deployment")
+                    self._begin_stage("deployment")
                     deployment_results = self._deploy_to_targets(
                         optimized_model, config, deploy_targets, output_dir
                     )
                     results["deployment_results"] = deployment_results
-                    results["stages_completed"].append("deployment")
+                    self._complete_stage(results, "deployment")
 
                 # Stage 7: Report Generation
                 logger.info("📄 Stage 7: Report Generation")
+                self._begin_stage("reporting")
                 report_result = self._generate_reports(output_dir)
                 results["artifacts_generated"].extend(report_result["artifacts"])
-                results["stages_completed"].append("reporting")
+                self._complete_stage(results, "reporting")
 
                 results["success"] = True
 
@@ -306,10 +346,18 @@ class EdgeFlowPipeline:
             target_latency = config.get("target_latency_ms")
             target_size = config.get("target_size_mb")
 
-            # Benchmark model
-            from benchmarker import benchmark_latency, get_model_size
+            # Benchmark model, streaming each timed run to tracker listeners
+            from edgeflow.benchmarking.benchmarker import (
+                benchmark_latency,
+                get_model_size,
+            )
+
+            def on_sample(run: int, latency_ms: float) -> None:
+                self.tracker.publish(
+                    "benchmark_sample", {"run": run, "latency_ms": latency_ms}
+                )
 
-            actual_latency, _ = benchmark_latency(model_path)
+            actual_latency, _ = benchmark_latency(model_path, on_sample=on_sample)
             actual_size = get_model_size(model_path)
 
             # Check against targets
@@ -3,17 +3,24 @@
 This module provides comprehensive tracking of all transformations, optimizations,
 and decisions made during the EdgeFlow compilation pipeline. It enables full
 audit trails, debugging, and reproducibility of model optimizations.
+
+Trackers can also be observed live: listeners registered with
+``ProvenanceTracker.add_listener`` receive every transformation start/end,
+logged event and registered artifact as it happens, and ``use_tracker`` routes
+the module-level helpers to a per-run tracker for the current thread/task.
 """
 
+import contextvars
 import json
 import logging
 import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -140,12 +147,17 @@ class ArtifactInfo:
         }
 
 
+TrackerListener = Callable[[str, Dict[str, Any]], None]
+
+
 class ProvenanceTracker:
     """Tracks provenance and lineage of all artifacts and transformations."""
 
     def __init__(self, session_id: Optional[str] = None):
         self.session_id = session_id or str(uuid.uuid4())
         self.events: List[TransformationEvent] = []
+        self._events_by_id: Dict[str, TransformationEvent] = {}
+        self._listeners: List[TrackerListener] = []
         self.artifacts: Dict[str, ArtifactInfo] = {}
         self.start_time = datetime.now()
         self.metadata: Dict[str, Any] = {
@@ -156,6 +168,32 @@ class ProvenanceTracker:
 
         logger.info(f"Started provenance tracking session: {self.session_id}")
 
+    def add_listener(self, listener: TrackerListener) -> None:
+        """Call ``listener(kind, payload)`` for every event recorded from now on.
+
+        ``kind`` is ``"start"``, ``"end"``, ``"event"`` or ``"artifact"`` (or
+        any kind passed to :meth:`publish`); ``payload`` is the event or
+        artifact as a dictionary. Listeners run synchronously on the thread
+        that records the event, so they should only hand the payload off.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: TrackerListener) -> None:
+        """Stop notifying ``listener``."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def publish(self, kind: str, payload: Dict[str, Any]) -> None:
+        """Send a progress notification (e.g. a benchmark sample) to listeners.
+
+        Published payloads are not stored in the provenance record.
+        """
+        for listener in list(self._listeners):
+            try:
+                listener(kind, payload)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Provenance listener failed: {e}")
+
     def register_artifact(
         self,
         name: str,
@@ -188,6 +226,8 @@ class ProvenanceTracker:
 
         self.artifacts[artifact_id] = artifact
         logger.debug(f"Registered artifact: {name} ({artifact_id})")
+        if self._listeners:
+            self.publish("artifact", artifact.to_dict())
         return artifact_id
 
     def start_transformation(
@@ -210,7 +250,10 @@ class ProvenanceTracker:
         )
 
         self.events.append(event)
+        self._events_by_id[event.event_id] = event
         logger.debug(f"Started transformation: {description} ({event.event_id})")
+        if self._listeners:
+            self.publish("start", event.to_dict())
         return event.event_id
 
     def complete_transformation(
@@ -223,7 +266,7 @@ class ProvenanceTracker:
         error_message: Optional[str] = None,
     ) -> None:
         """Complete a transformation event."""
-        event = next((e for e in self.events if e.event_id == event_id), None)
+        event = self._events_by_id.get(event_id)
         if not event:
             logger.warning(f"Transformation event not found: {event_id}")
             return
@@ -235,6 +278,8 @@ class ProvenanceTracker:
         event.error_message = error_message
 
         logger.debug(f"Completed transformation: {event.description}")
+        if self._listeners:
+            self.publish("end", event.to_dict())
 
     def log_event(
         self,
@@ -264,7 +309,10 @@ class ProvenanceTracker:
         )
 
         self.events.append(event)
+        self._events_by_id[event.event_id] = event
         logger.debug(f"Logged event: {description}")
+        if self._listeners:
+            self.publish("event", event.to_dict())
         return event.event_id
 
     def get_artifact_lineage(self, artifact_id: str) -> List[TransformationEvent]:
@@ -351,6 +399,7 @@ class ProvenanceTracker:
         self.events = [
             TransformationEvent.from_dict(event_data) for event_data in report["events"]
         ]
+        self._events_by_id = {event.event_id: event for event in self.events}
 
         logger.info(f"Imported provenance report from: {input_path}")
 
@@ -420,9 +469,17 @@ class TraceabilityContext:
 # Global tracker instance
 _global_tracker: Optional[ProvenanceTracker] = None
 
+# Per-run override; contextvars keep concurrent runs (threads or tasks) apart
+_current_tracker: contextvars.ContextVar[Optional[ProvenanceTracker]] = (
+    contextvars.ContextVar("edgeflow_current_tracker", default=None)
+)
+
 
 def get_global_tracker() -> ProvenanceTracker:
-    """Get or create the global provenance tracker."""
+    """Get the tracker bound by ``use_tracker``, else the global one."""
+    current = _current_tracker.get()
+    if current is not None:
+        return current
     global _global_tracker
     if _global_tracker is None:
         _global_tracker = ProvenanceTracker()
@@ -435,6 +492,16 @@ def set_global_tracker(tracker: ProvenanceTracker) -> None:
     _global_tracker = tracker
 
 
+@contextmanager
+def use_tracker(tracker: ProvenanceTracker) -> Iterator[ProvenanceTracker]:
+    """Route the module-level helpers to ``tracker`` within this context."""
+    token = _current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_tracker.reset(token)
+
+
 def trace_transformation(
     transformation_type: TransformationType,
     component: str,
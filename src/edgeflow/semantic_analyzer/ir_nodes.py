@@ -307,20 +307,19 @@ class IRGraph:
             return True
 
         visited = set()
-        start_node = next(iter(self.nodes.keys()))
-
-        def dfs(node_id: str):
+        # Iterative DFS: deep chains would overflow the recursion limit
+        stack = [next(iter(self.nodes.keys()))]
+        while stack:
+            node_id = stack.pop()
             if node_id in visited:
-                return
+                continue
             visited.add(node_id)
 
-            node = self.nodes.get(node_id)
-            if node:
-                for neighbor_id in node.input_nodes + node.output_nodes:
-                    if neighbor_id in self.nodes:
-                        dfs(neighbor_id)
+            node = self.nodes[node_id]
+            for neighbor_id in node.input_nodes + node.output_nodes:
+                if neighbor_id in self.nodes and neighbor_id not in visited:
+                    stack.append(neighbor_id)
 
-        dfs(start_node)
         return len(visited) == len(self.nodes)
 
     def get_execution_order(self) -> List[str]:
@@ -0,0 +1,148 @@
+"""Tests for the batch compile/check endpoints and the batch worker helper."""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from edgeflow.backend import app as app_module
+from edgeflow.backend.api.services.batch_service import iter_batch
+from edgeflow.backend.api.services.cache_service import ResponseCache
+from edgeflow.backend.api.services.rate_limiter import MemoryRateStore, RateLimiter
+
+CONFIG = 'model = "m.tflite"\nquantize = int8\ntarget_device = "raspberry_pi"\n'
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, "response_cache", ResponseCache())
+    monkeypatch.setattr(app_module, "rate_limiter", RateLimiter(capacity=1000))
+    return TestClient(app_module.app)
+
+
+def _lines(resp):
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+def test_iter_batch_yields_in_completion_order_with_bounded_work():
+    active = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def work(delay):
+        with lock:
+            active.append(delay)
+            peak[0] = max(peak[0], len(active))
+        time.sleep(delay)
+        with lock:
+            active.remove(delay)
+        if delay == 0.02:
+            raise ValueError("bad item")
+        return delay
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(iter_batch(pool, work, [0.2, 0.01, 0.02, 0.01], 3))
+
+    assert [index for index, _, _ in results][-1] == 0  # slowest item last
+    assert peak[0] <= 3
+    failed = [(i, err) for i, _, err in results if err is not None]
+    assert failed[0][0] == 2 and isinstance(failed[0][1], ValueError)
+
+
+def test_compile_batch_streams_one_line_per_config(client: TestClient):
+    items = [
+        {"config_file": CONFIG, "filename": "a.ef"},
+        {"config_file": "quantize = int8\n", "filename": "b.ef"},
+        {"config_file": CONFIG, "filename": "c.txt"},
+    ]
+    lines = _lines(client.post("/api/compile/batch", json={"items": items}))
+
+    results = {line["index"]: line for line in lines if line["event"] == "result"}
+    assert results[0]["success"] and results[0]["parsed_config"]["model"] == "m.tflite"
+    assert results[0]["filename"] == "a.ef"
+    assert not results[1]["success"] and results[1]["error"]
+    assert "extension" in results[2]["error"]
+    assert lines[-1] == {"event": "done", "total": 3, "failed": 2}
+
+
+def test_compile_batch_rejects_empty_batches(client: TestClient):
+    assert client.post("/api/compile/batch", json={"items": []}).status_code == 422
+
+
+def test_batches_are_charged_per_item(client: TestClient, monkeypatch):
+    limiter = RateLimiter(capacity=10, route_costs={"/api/check/batch": 2})
+    monkeypatch.setattr(app_module, "rate_limiter", limiter)
+    items = [{"config_file": CONFIG, "filename": "a.ef"}] * 6
+
+    assert client.post("/api/compile/batch", json={"items": items}).status_code == 200
+    resp = client.post("/api/compile/batch", json={"items": items})
+    assert resp.status_code == 429  # 6 + 6 units exceed the budget of 10
+
+    checks = [{"model_path": "m.tflite"}] * 6  # 12 units can never fit
+    resp = client.post("/api/check/batch", json={"items": checks})
+    assert resp.status_code == 413
+    assert "split" in resp.json()["detail"]
+
+
+def test_default_limiter_admits_rollout_sized_batches(tmp_path: Path, monkeypatch):
+    # The app's own limiter and costs, with fresh state for this test
+    monkeypatch.setattr(app_module, "response_cache", ResponseCache())
+    monkeypatch.setattr(app_module.rate_limiter, "store", MemoryRateStore())
+    client = TestClient(app_module.app)
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"\0" * 1024)
+
+    checks = [{"model_path": str(model), "config_file": CONFIG}] * 300
+    lines = _lines(client.post("/api/check/batch", json={"items": checks}))
+    assert lines[-1] == {"event": "done", "total": 300, "failed": 0}
+
+    configs = [{"config_file": CONFIG, "filename": "a.ef"}] * 300
+    assert client.post("/api/compile/batch", json={"items": configs}).status_code == 200
+
+    limiter = app_module.rate_limiter
+    for route in ("/api/compile/batch", "/api/check/batch"):
+        cost = limiter.cost_for(route) * app_module.BATCH_MAX_ITEMS
+        assert cost <= limiter.capacity
+
+
+def test_check_batch_shares_device_specs(
+    client: TestClient, tmp_path: Path, monkeypatch
+):
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"\0" * 1024)
+    loads = []
+    original = app_module.InitialChecker.__init__
+
+    def counting_init(self, device_spec_file=None):
+        loads.append(device_spec_file)
+        original(self, device_spec_file)
+
+    monkeypatch.setattr(app_module.InitialChecker, "__init__", counting_init)
+    app_module._initial_checker.cache_clear()
+
+    items = [
+        {"model_path": str(model), "config": {"target_device": "raspberry_pi"}},
+        {"model_path": str(model), "config_file": CONFIG},
+    ]
+    items += [
+        {"model_path": str(model), "config": {"memory_limit": 64 + i}}
+        for i in range(20)
+    ]
+    items.append({"model_path": str(tmp_path / "missing.tflite")})
+    items.append({"model_digest": "0" * 64})
+
+    lines = _lines(client.post("/api/check/batch", json={"items": items}))
+    results = {line["index"]: line for line in lines if line["event"] == "result"}
+
+    assert len(results) == len(items)
+    assert all(results[i]["success"] for i in range(22))
+    assert "fit_score" in results[1]
+    assert not results[22]["success"]
+    assert results[23]["error"] == "Model not found"
+    assert lines[-1]["failed"] == 2
+    assert loads == [None]  # specs parsed once for the whole batch
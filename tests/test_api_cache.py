@@ -0,0 +1,112 @@
+"""Tests for the deterministic-endpoint response cache."""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from edgeflow.backend import app as app_module
+from edgeflow.backend.api.services.cache_service import ResponseCache, cache_key
+
+CONFIG = 'model = "m.tflite"\nquantize = int8\ntarget_device = "raspberry_pi"\n'
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, "response_cache", ResponseCache())
+    return TestClient(app_module.app)
+
+
+def test_key_ignores_whitespace_but_not_params():
+    assert cache_key("p", "a = 1\r\nb = 2  \n\n") == cache_key("p", "a = 1\nb = 2")
+    assert cache_key("p", "a = 1") != cache_key("q", "a = 1")
+    assert cache_key("p", "a = 1", x=1) != cache_key("p", "a = 1", x=2)
+
+
+def test_lru_eviction_and_ttl():
+    clock = _Clock()
+    cache = ResponseCache(max_entries=2, ttl_s=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") == (False, None)
+
+    clock.now += 11
+    assert cache.get("a") == (False, None)
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["expirations"] == 1
+    assert stats["hits"] == 1 and stats["misses"] == 2
+
+
+def test_disk_tier_is_shared_between_instances(tmp_path: Path):
+    writer = ResponseCache(disk_dir=str(tmp_path))
+    reader = ResponseCache(disk_dir=str(tmp_path))
+    writer.set("k", {"value": [1, 2]})
+
+    assert reader.get("k") == (True, {"value": [1, 2]})
+    assert reader.stats()["disk_hits"] == 1
+    assert reader.get("k") == (True, {"value": [1, 2]})
+    assert reader.stats()["disk_hits"] == 1  # promoted to the memory tier
+
+
+def test_hits_return_copies_and_failures_are_not_stored():
+    cache = ResponseCache()
+    value, hit = cache.get_or_compute("k", lambda: {"items": [1]})
+    assert not hit
+    value["items"].append(2)
+    cached, hit = cache.get_or_compute("k", lambda: {"items": []})
+    assert hit and cached == {"items": [1]}
+    cached["items"].clear()
+    assert cache.get("k") == (True, {"items": [1]})
+
+    failing = {"success": False}
+    value, _ = cache.get_or_compute(
+        "f", lambda: failing, should_store=lambda v: v["success"]
+    )
+    assert value is failing and cache.get("f") == (False, None)
+
+
+def test_pipeline_responses_are_cached(client: TestClient):
+    first = client.post(
+        "/api/pipeline", json={"config_file": CONFIG, "filename": "a.ef"}
+    )
+    assert first.headers["x-cache"] == "MISS"
+    assert first.json()["success"]
+
+    edited = CONFIG.replace("\n", "   \r\n")
+    second = client.post(
+        "/api/pipeline", json={"config_file": edited, "filename": "a.ef"}
+    )
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+
+    stats = client.get("/api/cache/stats").json()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_cached_parse_still_checks_extension(client: TestClient):
+    ok = client.post("/api/compile", json={"config_file": CONFIG, "filename": "a.ef"})
+    assert ok.status_code == 200
+    bad = client.post("/api/compile", json={"config_file": CONFIG, "filename": "a.txt"})
+    assert bad.status_code == 400
+
+
+def test_check_cache_notices_model_changes(client: TestClient, tmp_path: Path):
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"\0" * 1024)
+    body = {"model_path": str(model), "config": {"target_device": "raspberry_pi"}}
+
+    assert client.post("/api/check", json=body).headers["x-cache"] == "MISS"
+    assert client.post("/api/check", json=body).headers["x-cache"] == "HIT"
+    model.write_bytes(b"\0" * 4096)
+    assert client.post("/api/check", json=body).headers["x-cache"] == "MISS"
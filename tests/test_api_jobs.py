@@ -0,0 +1,183 @@
+"""Tests for the background job subsystem behind /api/jobs."""
+
+import base64
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from edgeflow.backend import app as app_module
+from edgeflow.backend.api.services.job_service import JobManager, JobStatus
+from edgeflow.backend.api.services.model_store import ModelNotFoundError, ModelStore
+
+
+@pytest.fixture
+def client(monkeypatch):
+    manager = JobManager(max_workers=1, max_queue=2, default_timeout_s=60)
+    monkeypatch.setattr(app_module, "job_manager", manager)
+    yield TestClient(app_module.app)
+    manager.shutdown()
+
+
+def _wait_terminal(client: TestClient, job_id: str, timeout: float = 60.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        body = client.get(f"/api/jobs/{job_id}").json()
+        if body["status"] not in ("queued", "running"):
+            return body
+        time.sleep(0.1)
+    raise AssertionError("job did not finish")
+
+
+def test_benchmark_job_matches_sync_endpoint(client: TestClient):
+    payload = {
+        "original_model": base64.b64encode(b"\0" * 2048).decode(),
+        "optimized_model": base64.b64encode(b"\0" * 1024).decode(),
+    }
+    resp = client.post("/api/jobs/benchmark", json=payload)
+    assert resp.status_code == 202
+    assert resp.headers["location"] == f"/api/jobs/{resp.json()['job_id']}"
+
+    body = _wait_terminal(client, resp.json()["job_id"])
+    assert body["status"] == "succeeded"
+    assert body["result"] == client.post("/api/benchmark", json=payload).json()
+
+
+def test_failed_job_reports_error(client: TestClient):
+    resp = client.post(
+        "/api/jobs/optimize", json={"model_file": "not base64!", "config": {}}
+    )
+    body = _wait_terminal(client, resp.json()["job_id"])
+    assert body["status"] == "failed"
+    assert "Invalid base64" in body["error"]
+
+
+def test_unknown_job_is_404(client: TestClient):
+    assert client.get("/api/jobs/missing").status_code == 404
+    assert client.delete("/api/jobs/missing").status_code == 404
+
+
+def test_queue_full_returns_429_with_retry_after(client: TestClient):
+    manager = app_module.job_manager
+    slow = manager.submit("sleep", time.sleep, 30)
+    while manager.get(slow.job_id).status is JobStatus.QUEUED:
+        time.sleep(0.05)
+    manager.submit("sleep", time.sleep, 30)
+    manager.submit("sleep", time.sleep, 30)
+
+    payload = {"original_model": "", "optimized_model": ""}
+    resp = client.post("/api/jobs/benchmark", json=payload)
+    assert resp.status_code == 429
+    assert int(resp.headers["retry-after"]) >= 1
+
+    cancelled = client.delete(f"/api/jobs/{slow.job_id}").json()
+    assert cancelled["status"] == "cancelled"
+
+
+def test_sync_routes_run_on_the_job_pool(client: TestClient):
+    manager = app_module.job_manager
+    payload = {
+        "original_model": base64.b64encode(b"\0" * 2048).decode(),
+        "optimized_model": base64.b64encode(b"\0" * 1024).decode(),
+    }
+    assert client.post("/api/benchmark", json=payload).status_code == 200
+    model = {"model_file": payload["original_model"], "config": {}}
+    assert client.post("/api/optimize", json=model).status_code == 200
+    assert manager.stats()["retained"] == 2
+
+    # Client errors are still caught before any work is queued
+    bad = client.post("/api/optimize", json={"model_file": "not base64!"})
+    assert bad.status_code == 400
+    assert manager.stats()["retained"] == 2
+
+    slow = manager.submit("sleep", time.sleep, 30)
+    while manager.get(slow.job_id).status is JobStatus.QUEUED:
+        time.sleep(0.05)
+    manager.submit("sleep", time.sleep, 30)
+    manager.submit("sleep", time.sleep, 30)
+    resp = client.post("/api/benchmark", json=payload)
+    assert resp.status_code == 429
+    assert int(resp.headers["retry-after"]) >= 1
+    client.delete(f"/api/jobs/{slow.job_id}")
+
+
+def _store_model(store: ModelStore, tmp_path: Path, data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    src = tmp_path / digest
+    src.write_bytes(data)
+    store.add_file(str(src), digest, ".tflite")
+    return digest
+
+
+def test_jobs_pin_their_stored_model_until_finished(
+    client: TestClient, tmp_path: Path, monkeypatch
+):
+    store = ModelStore(str(tmp_path / "store"), max_bytes=2500, min_idle_s=0)
+    monkeypatch.setattr(app_module, "model_store", store)
+    digest = _store_model(store, tmp_path, b"a" * 1000)
+
+    manager = app_module.job_manager
+    slow = manager.submit("sleep", time.sleep, 30)
+    while manager.get(slow.job_id).status is JobStatus.QUEUED:
+        time.sleep(0.05)
+    resp = client.post("/api/jobs/optimize", json={"model_digest": digest})
+    job_id = resp.json()["job_id"]
+
+    # Still queued behind the slow job: newer models evict around it
+    _store_model(store, tmp_path, b"b" * 1000)
+    _store_model(store, tmp_path, b"c" * 1000)
+    assert store.get(digest)
+
+    client.delete(f"/api/jobs/{job_id}")
+    client.delete(f"/api/jobs/{slow.job_id}")
+    past = time.time() - 60
+    os.utime(store.models_dir / digest, (past, past))  # now the LRU entry
+    _store_model(store, tmp_path, b"d" * 1000)
+    with pytest.raises(ModelNotFoundError):
+        store.get(digest)
+
+    missing = client.post("/api/jobs/optimize", json={"model_digest": "0" * 64})
+    assert missing.status_code == 404
+
+
+def test_workers_are_reused_and_report_stage_metrics():
+    stage = app_module.api_metrics.pipeline_stage
+    before = stage.snapshot()
+    manager = JobManager(
+        max_workers=1,
+        collect_metrics=app_module._collect_worker_stage_metrics,
+        merge_metrics=stage.merge,
+    )
+    try:
+        cfg = 'model = "m.tflite"\nquantize = int8\n'
+        jobs = [manager.submit("pipeline", app_module.pipeline_payload, "a.ef", cfg)]
+        manager.wait(jobs[0].job_id, timeout=60)
+        jobs.append(manager.submit("pid", os.getpid))
+        jobs.append(manager.submit("pid", os.getpid))
+        for job in jobs[1:]:
+            manager.wait(job.job_id, timeout=60)
+        assert [j.status for j in jobs] == [JobStatus.SUCCEEDED] * 3
+        assert jobs[1].result == jobs[2].result != os.getpid()
+    finally:
+        manager.shutdown()
+
+    recorded = stage.delta(before)
+    assert ("pipeline", "code_generation.python") in recorded
+
+
+def test_job_timeout_terminates_worker():
+    manager = JobManager(max_workers=1, max_queue=4)
+    try:
+        job = manager.submit("sleep", time.sleep, 30, timeout_s=0.5)
+        queued = manager.submit("sleep", time.sleep, 30)
+        manager.cancel(queued.job_id)
+        manager.wait(job.job_id, timeout=30)
+        assert job.status is JobStatus.TIMED_OUT
+        assert queued.status is JobStatus.CANCELLED
+        assert queued.started_at is None
+        assert manager.stats()["queued"] == 0
+    finally:
+        manager.shutdown()
@@ -0,0 +1,71 @@
+"""Tests for the Prometheus metrics registry and /api/metrics."""
+
+import threading
+
+from fastapi.testclient import TestClient
+
+from edgeflow.backend import app as app_module
+from edgeflow.backend.api.services.metrics_service import MetricsRegistry
+from edgeflow.backend.api.services.rate_limiter import RateLimiter
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    hist = registry.histogram("demo_seconds", "Demo.", ("route",), (0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        hist.observe(value, "/x")
+
+    text = registry.render()
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{route="/x",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{route="/x",le="1"} 3' in text
+    assert 'demo_seconds_bucket{route="/x",le="+Inf"} 4' in text
+    assert 'demo_seconds_count{route="/x"} 4' in text
+    assert 'demo_seconds_sum{route="/x"} 6.05' in text
+
+
+def test_counter_shards_merge_across_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "Demo.", ("kind",))
+
+    def work():
+        for _ in range(1000):
+            counter.inc("a")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.values() == {("a",): 8000.0}
+    assert 'demo_total{kind="a"} 8000' in registry.render()
+
+
+def test_metrics_endpoint_reports_routes_stages_and_services():
+    client = TestClient(app_module.app)
+    cfg = 'model = "m.tflite"\nquantize = int8\n'
+    client.post("/api/pipeline", json={"config_file": cfg, "filename": "a.ef"})
+    client.get("/api/jobs/does-not-exist")
+
+    resp = client.get("/api/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    text = resp.text
+    assert 'route="/api/jobs/{job_id}",method="GET",status="404"' in text
+    assert 'edgeflow_http_request_duration_seconds_bucket{route="/api/pipeline"' in text
+    assert 'endpoint="pipeline",stage="code_generation.python"' in text
+    assert "edgeflow_response_cache_hit_ratio" in text
+    assert 'edgeflow_jobs{state="queued"}' in text
+
+
+def test_rate_limit_rejections_are_counted(monkeypatch):
+    monkeypatch.setattr(app_module, "rate_limiter", RateLimiter(capacity=0))
+    client = TestClient(app_module.app)
+    before = app_module.api_metrics.rate_limited.values().get(("/api/compile",), 0)
+
+    resp = client.post("/api/compile", json={"config_file": "", "filename": "a.ef"})
+
+    assert resp.status_code == 429
+    after = app_module.api_metrics.rate_limited.values()[("/api/compile",)]
+    assert after == before + 1
@@ -0,0 +1,110 @@
+"""Tests for selective and streamed /api/pipeline generation."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from edgeflow.backend import app as app_module
+from edgeflow.backend.api.services.cache_service import ResponseCache
+from edgeflow.backend.api.services.rate_limiter import RateLimiter
+from edgeflow.compiler.code_generator import CodeGenerator
+
+CONFIG = 'model = "m.tflite"\nquantize = int8\ntarget_device = "raspberry_pi"\n'
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, "response_cache", ResponseCache())
+    monkeypatch.setattr(app_module, "rate_limiter", RateLimiter(capacity=1000))
+    return TestClient(app_module.app)
+
+
+@pytest.fixture
+def generated(monkeypatch):
+    calls = []
+    original = CodeGenerator.generate_ir_based_code
+
+    def spy(self, backend):
+        calls.append(backend)
+        return original(self, backend)
+
+    monkeypatch.setattr(CodeGenerator, "generate_ir_based_code", spy)
+    return calls
+
+
+def _pipeline(client: TestClient, **options):
+    body = {"config_file": CONFIG, "filename": "a.ef", **options}
+    return client.post("/api/pipeline", json=body)
+
+
+def test_default_pipeline_generates_everything(client: TestClient, generated):
+    body = _pipeline(client).json()
+    assert body["success"]
+    assert sorted(body["generated_code"]) == ["cpp", "onnx", "python", "tensorrt"]
+    assert body["ast"] and body["ir_graph"] and body["explainability_report"]
+
+    # The route runs pipeline_payload in a job worker, out of the spy's reach
+    direct = app_module.pipeline_payload("a.ef", CONFIG)
+    assert direct["generated_code"] == body["generated_code"]
+    assert sorted(generated) == ["cpp", "onnx", "python", "tensorrt"]
+
+
+def test_only_requested_backends_and_sections_are_built(
+    client: TestClient, generated, monkeypatch
+):
+    def fail(*args, **kwargs):
+        raise AssertionError("explainability report should be skipped")
+
+    monkeypatch.setattr(app_module, "generate_explainability_report", fail)
+
+    options = {
+        "backends": ["cpp"],
+        "sections": ["generated_code", "optimization_report"],
+    }
+    body = _pipeline(client, **options).json()
+
+    assert body["success"]
+    assert list(body["generated_code"]) == ["cpp"]
+    assert body["optimization_report"]["generated_backends"] == ["cpp"]
+    assert body["ast"] is None and body["ir_graph"] is None
+    assert body["explainability_report"] is None
+
+    direct = app_module.pipeline_payload("a.ef", CONFIG, None, **options)
+    assert direct["generated_code"] == body["generated_code"]
+    assert generated == ["cpp"]
+
+
+def test_options_are_part_of_the_cache_key(client: TestClient):
+    assert _pipeline(client, backends=["python"]).headers["x-cache"] == "MISS"
+    assert _pipeline(client, backends=["cpp"]).headers["x-cache"] == "MISS"
+    assert _pipeline(client, backends=["python"]).headers["x-cache"] == "HIT"
+
+
+def test_unknown_backend_is_rejected(client: TestClient):
+    assert _pipeline(client, backends=["cobol"]).status_code == 422
+
+
+def test_stream_emits_one_line_per_result(client: TestClient):
+    resp = client.post(
+        "/api/pipeline/stream",
+        json={
+            "config_file": CONFIG,
+            "filename": "a.ef",
+            "backends": ["python", "onnx"],
+            "sections": ["generated_code", "optimization_passes"],
+        },
+    )
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in resp.text.splitlines()]
+
+    assert [e["event"] for e in events] == ["section", "backend", "backend", "done"]
+    assert [e["name"] for e in events[1:3]] == ["python", "onnx"]
+
+
+def test_stream_reports_parse_errors(client: TestClient):
+    resp = client.post(
+        "/api/pipeline/stream", json={"config_file": CONFIG, "filename": "a.txt"}
+    )
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert events[-1]["event"] == "error"
@@ -0,0 +1,112 @@
+"""Tests for live pipeline progress: tracker listeners and /api/pipeline/events."""
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from edgeflow.backend import app as app_module
+from edgeflow.backend.api.services.rate_limiter import RateLimiter
+from edgeflow.pipeline.end_to_end_pipeline import EdgeFlowPipeline
+from edgeflow.reporting.traceability_system import (
+    ProvenanceTracker,
+    TransformationType,
+    get_global_tracker,
+    register_artifact,
+    trace_transformation,
+    use_tracker,
+)
+
+CONFIG = 'model = "m.tflite"\nquantize = int8\ntarget_device = "raspberry_pi"\n'
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, "rate_limiter", RateLimiter(capacity=1000))
+    return TestClient(app_module.app)
+
+
+def _sse(text: str):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_listeners_see_events_as_they_happen():
+    tracker = ProvenanceTracker()
+    seen = []
+    tracker.add_listener(lambda kind, data: seen.append(kind))
+
+    with use_tracker(tracker):
+        assert get_global_tracker() is tracker
+        with trace_transformation(TransformationType.FUSION, "test", "fuse") as ctx:
+            assert seen == ["start"]
+            ctx.add_metric("fused", 2)
+        register_artifact("model", "model")
+    tracker.publish("benchmark_sample", {"run": 0, "latency_ms": 1.0})
+
+    assert get_global_tracker() is not tracker
+    assert seen == ["start", "end", "artifact", "benchmark_sample"]
+    assert tracker.events[0].metrics == {"fused": 2}
+
+
+def test_failing_listener_does_not_break_tracking():
+    tracker = ProvenanceTracker()
+    tracker.add_listener(lambda kind, data: 1 / 0)
+    event_id = tracker.start_transformation(TransformationType.PARSING, "t", "parse")
+    tracker.complete_transformation(event_id, duration_ms=3.0)
+    assert tracker.events[0].duration_ms == 3.0
+
+
+def test_pipeline_events_stream_stages_passes_and_artifacts(client: TestClient):
+    resp = client.post(
+        "/api/pipeline/events",
+        json={"config_file": CONFIG, "filename": "a.ef", "backends": ["python"]},
+    )
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _sse(resp.text)
+    kinds = [kind for kind, _ in events]
+
+    assert events[0][0] == "stage_start"
+    assert events[0][1]["description"] == "Parse configuration"
+    assert kinds[-1] == "done"
+
+    quant_end = next(
+        data
+        for kind, data in events
+        if kind == "stage_end" and data["description"] == "QuantizationPass"
+    )
+    assert quant_end["transformation_type"] == "quantization"
+    assert {"before_nodes", "after_nodes"} <= set(quant_end["metrics"])
+
+    # The artifact is announced before its stage ends and before the code ships
+    artifact = kinds.index("artifact")
+    assert kinds.index("backend") > artifact
+    assert events[artifact][1]["metadata"]["backend"] == "python"
+
+
+def test_pipeline_events_report_errors(client: TestClient):
+    resp = client.post(
+        "/api/pipeline/events", json={"config_file": CONFIG, "filename": "a.txt"}
+    )
+    assert _sse(resp.text)[-1][0] == "error"
+
+
+def test_end_to_end_pipeline_reports_to_its_own_tracker(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    Path("c.ef").write_text(CONFIG)
+    Path("m.tflite").write_bytes(b"\0" * 64)
+
+    pipeline = EdgeFlowPipeline()
+    seen = []
+    pipeline.tracker.add_listener(lambda kind, data: seen.append((kind, data)))
+    pipeline.run_complete_pipeline("c.ef", "m.tflite", "out")
+
+    stages = [d for kind, d in seen if kind == "stage" and d["status"] == "completed"]
+    assert [d["stage"] for d in stages][:2] == ["validation", "device_analysis"]
+    # Component traces land on the pipeline's tracker, not the global one
+    components = {e.component for e in pipeline.tracker.events}
+    assert {"end_to_end_pipeline", "interactive_validator"} <= components
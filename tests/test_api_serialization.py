@@ -0,0 +1,88 @@
+"""Tests for negotiated response serialization and the columnar IR form."""
+
+import gzip
+
+import pytest
+from fastapi.testclient import TestClient
+
+from edgeflow.backend import app as app_module
+from edgeflow.backend.api.services.cache_service import ResponseCache
+from edgeflow.backend.api.services.rate_limiter import RateLimiter
+from edgeflow.backend.api.services.serialization_service import (
+    compress,
+    dumps,
+    negotiate_encoding,
+)
+
+CONFIG = (
+    'model = "m.tflite"\nquantize = int8\ntarget_device = "raspberry_pi"\n'
+    "enable_fusion = true\n"
+)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, "response_cache", ResponseCache())
+    monkeypatch.setattr(app_module, "rate_limiter", RateLimiter(capacity=1000))
+    return TestClient(app_module.app)
+
+
+def _pipeline(client: TestClient, headers=None, **options):
+    body = {"config_file": CONFIG, "filename": "a.ef", **options}
+    return client.post("/api/pipeline", json=body, headers=headers or {})
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate", "gzip"),
+        ("zstd;q=0.9, gzip;q=0.5", "zstd"),
+        ("zstd;q=0, gzip;q=0.1", "gzip"),
+        ("*", "zstd"),
+        ("br", "identity"),
+        (None, "identity"),
+    ],
+)
+def test_encoding_negotiation_honours_q_values(header, expected):
+    assert negotiate_encoding(header, ("zstd", "gzip")) == expected
+
+
+def test_gzip_round_trip():
+    body = dumps({"nodes": list(range(1000))})
+    assert gzip.decompress(compress(body, "gzip")) == body
+
+
+def test_pipeline_is_compressed_on_request(client: TestClient):
+    plain = _pipeline(client, {"Accept-Encoding": "identity"})
+    packed = _pipeline(client, {"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in plain.headers
+    assert packed.headers["content-encoding"] == "gzip"
+    assert packed.headers["x-cache"] == "HIT"
+    assert "Accept-Encoding" in packed.headers["vary"]
+    assert packed.json() == plain.json()
+    assert plain.json()["errors"] is None  # every response field is present
+
+
+def test_pipeline_msgpack_body(client: TestClient):
+    msgpack = pytest.importorskip("msgpack")
+    resp = _pipeline(client, {"Accept": "application/msgpack"})
+    assert resp.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(resp.content)["success"]
+
+
+def test_columnar_ir_matches_dict_form(client: TestClient):
+    records = _pipeline(client, sections=["ir_graph"]).json()["ir_graph"]
+    columnar = _pipeline(client, sections=["ir_graph"], ir_format="columnar").json()[
+        "ir_graph"
+    ]
+
+    ids = columnar["node_ids"]
+    assert columnar["format"] == "columnar"
+    assert ids == [node["id"] for node in records["nodes"]]
+    assert columnar["nodes"]["op_type"] == [n["op_type"] for n in records["nodes"]]
+    edges = list(zip(columnar["edges"]["src"], columnar["edges"]["dst"]))
+    assert [(ids[a], ids[b]) for a, b in edges] == [
+        (e["from"], e["to"]) for e in records["edges"]
+    ]
+    assert [ids[i] for i in columnar["execution_order"]] == records["execution_order"]
@@ -0,0 +1,96 @@
+"""Tests for streaming (multipart and raw-body) model uploads."""
+
+import asyncio
+import base64
+import hashlib
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from edgeflow.backend import app as app_module
+from edgeflow.backend.api.services.upload_service import (
+    UploadTooLargeError,
+    spool_chunks,
+)
+
+MODEL = bytes(range(256)) * 4096  # 1 MiB
+
+
+async def _chunks(data: bytes, size: int = 100_000):
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+@pytest.fixture
+def client():
+    return TestClient(app_module.app)
+
+
+def test_spool_hashes_incrementally_and_maps_file():
+    upload = asyncio.run(spool_chunks(_chunks(MODEL), len(MODEL), suffix=".tflite"))
+    try:
+        assert upload.path.endswith(".tflite")
+        assert upload.size_bytes == len(MODEL)
+        assert upload.sha256 == hashlib.sha256(MODEL).hexdigest()
+        with upload.mmap() as mapped:
+            assert mapped[:4] == MODEL[:4] and len(mapped) == len(MODEL)
+    finally:
+        upload.cleanup()
+    assert not os.path.exists(upload.path)
+
+
+def test_spool_enforces_size_limit_and_removes_partial_file(tmp_path):
+    with pytest.raises(UploadTooLargeError):
+        asyncio.run(spool_chunks(_chunks(MODEL), 1000, directory=str(tmp_path)))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_optimize_raw_accepts_chunked_body(client: TestClient):
+    resp = client.post(
+        "/api/optimize/raw",
+        params={"config": '{"quantize": "int8"}'},
+        content=(MODEL[i : i + 65536] for i in range(0, len(MODEL), 65536)),
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["model_sha256"] == hashlib.sha256(MODEL).hexdigest()
+    assert body["model_size_bytes"] == len(MODEL)
+    assert body["optimization_report"]["original_size_mb"] == 1.0
+    assert body["optimization_report"]["quantize"] == "int8"
+
+
+def test_optimize_upload_matches_base64_report(client: TestClient):
+    multipart = client.post(
+        "/api/optimize/upload",
+        files={"model": ("m.tflite", MODEL, "application/octet-stream")},
+        data={"config": "{}"},
+    ).json()
+    legacy = client.post(
+        "/api/optimize",
+        json={"model_file": base64.b64encode(MODEL).decode(), "config": {}},
+    ).json()
+    assert (
+        multipart["optimization_report"]["original_size_mb"]
+        == legacy["optimization_report"]["original_size_mb"]
+    )
+
+
+def test_raw_upload_over_limit_is_413(client: TestClient, monkeypatch):
+    monkeypatch.setattr(app_module, "MAX_BYTES", 1024)
+    resp = client.post(
+        "/api/check/raw",
+        content=(MODEL[i : i + 512] for i in range(0, 4096, 512)),
+    )
+    assert resp.status_code == 413
+
+
+def test_check_upload_streams_multipart(client: TestClient):
+    resp = client.post(
+        "/api/check/upload",
+        files={"model": ("m.tflite", MODEL, "application/octet-stream")},
+        data={"config": '{"target_device": "raspberry_pi"}'},
+    )
+    assert resp.status_code == 200
+    assert 0.0 <= resp.json()["fit_score"] <= 100.0
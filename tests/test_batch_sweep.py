@@ -0,0 +1,90 @@
+"""Tests for the batch-size / resolution sweep benchmark."""
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from edgeflow.benchmarking import benchmarker
+
+
+class _ResizableInterpreter:
+    """Fake interpreter whose cost is a fixed overhead plus a per-item term."""
+
+    def __init__(self, model_path: str):
+        self.shape = [1, 8, 8, 3]
+
+    def resize_tensor_input(self, index, shape):
+        if shape[1] > 64:
+            raise ValueError("Cannot resize fixed-size input")
+        self.shape = list(shape)
+
+    def allocate_tensors(self):
+        self.arena = bytearray(1024 * int(np.prod(self.shape)))
+
+    def get_input_details(self):
+        return [{"shape": np.array(self.shape), "dtype": np.float32, "index": 0}]
+
+    def set_tensor(self, index, value):
+        assert list(value.shape) == self.shape
+
+    def invoke(self):
+        time.sleep(0.002 + 0.0002 * self.shape[0])
+
+
+def _patch_tf(monkeypatch):
+    fake_tf = SimpleNamespace(lite=SimpleNamespace(Interpreter=_ResizableInterpreter))
+    monkeypatch.setattr(benchmarker, "_TF_AVAILABLE", True)
+    monkeypatch.setattr(benchmarker, "_tf", fake_tf, raising=False)
+
+
+def test_sweep_reports_points_and_knee(tmp_path: Path, monkeypatch):
+    _patch_tf(monkeypatch)
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"\0")
+
+    result = benchmarker.sweep_batch_sizes(
+        str(model),
+        batch_sizes=[1, 4, 16, 64],
+        resolutions=[(8, 8), (128, 128)],
+        runs=3,
+        warmup=1,
+    )
+
+    ok = [p for p in result["points"] if p["status"] == "success"]
+    assert [p["batch_size"] for p in ok] == [1, 4, 16, 64]
+    assert ok[0]["latency_per_item_ms"] > ok[-1]["latency_per_item_ms"]
+    assert all(p["status"] == "error" for p in result["points"][4:])
+    assert result["recommendations"]["128x128"] is None
+    assert result["recommendations"]["8x8"]["batch_size"] in (16, 64)
+
+
+def test_recommendation_respects_latency_budget():
+    points = [
+        {
+            "status": "success",
+            "batch_size": b,
+            "latency_ms": lat,
+            "throughput_items_per_s": b * 1000 / lat,
+        }
+        for b, lat in [(1, 5.0), (2, 6.0), (4, 8.0), (8, 20.0)]
+    ]
+    assert benchmarker.recommend_batch_size(points)["batch_size"] == 4
+    rec = benchmarker.recommend_batch_size(points, latency_budget_ms=7.0)
+    assert rec["batch_size"] == 2
+    assert "7 ms budget" in rec["reason"]
+    assert benchmarker.recommend_batch_size(points, latency_budget_ms=1.0) is None
+
+
+def test_sweep_model_uses_buffer_size(tmp_path: Path, monkeypatch):
+    _patch_tf(monkeypatch)
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"\0")
+
+    bench = benchmarker.EdgeFlowBenchmarker({"buffer_size": 6})
+    result = bench.sweep_model(str(model))
+    assert [p["batch_size"] for p in result["points"]] == [1, 2, 4, 6]
+
+    monkeypatch.setattr(benchmarker, "_TF_AVAILABLE", False)
+    assert bench.sweep_model(str(model)) is None
@@ -0,0 +1,88 @@
+"""Tests for the compiler self-benchmark suite."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from edgeflow.benchmarking import compiler_benchmarks as cb
+from edgeflow.parser import _parse_kv_lines
+
+
+@pytest.mark.parametrize("shape", cb.GRAPH_SHAPES)
+def test_synthetic_graphs_are_connected_dags(shape):
+    edges = cb.graph_edges(shape, 10)
+    assert all(src < dst for src, dst in edges)
+    assert {n for e in edges for n in e} == set(range(10))
+
+    assert len(cb.build_edgeflow_ir_graph(shape, 10).topological_sort()) == 10
+    assert len(cb.build_uir_graph(shape, 10).topological_sort()) == 10
+    assert len(cb.build_semantic_graph(shape, 10).topological_sort()) == 10
+
+
+@pytest.mark.parametrize("shape", ["chain", "residual"])
+def test_compiler_handles_large_synthetic_graphs(shape):
+    from edgeflow.ir.uir_optimization_passes import FusionPass
+    from edgeflow.semantic_analyzer.analyzer import SemanticAnalyzer
+
+    # Deep chains used to overflow the recursive connectivity check
+    SemanticAnalyzer().analyze(cb.build_semantic_graph(shape, 1000))
+
+    # Fusion used to copy edges that pointed at the nodes it had fused away
+    fused = FusionPass().transform(cb.build_uir_graph(shape, 100))
+    assert len(fused.nodes) < 100
+    for from_id, to_id, _ in fused.edges:
+        assert from_id in fused.nodes and to_id in fused.nodes
+    assert len(fused.topological_sort()) == len(fused.nodes)
+
+
+def test_generated_ef_source_parses():
+    config = _parse_kv_lines(cb.generate_ef_source(20))
+    assert config["quantize"] == "int8"
+    assert config["target_device"] == "raspberry_pi"
+
+
+def test_suite_runs_and_skips_after_budget():
+    suite = cb.CompilerBenchmarkSuite(
+        sizes=[10, 20], shapes=["chain"], repeats=1, time_budget_s=0.0
+    )
+    results = suite.run()
+    by_point = {(r["case"], r["size"]): r for r in results["results"]}
+
+    assert by_point[("parse.fallback", 10)]["seconds"] is not None
+    # Every run exceeds a zero budget, so the larger size is skipped
+    assert by_point[("parse.fallback", 20)]["skipped"]
+    assert any(case.startswith("uir_pass.") for case, _ in by_point)
+    json.dumps(results)
+
+
+def test_scaling_exponents_and_baseline_compare():
+    linear = [{"case": "c", "size": s, "seconds": s * 1e-4} for s in (10, 100, 1000)]
+    quadratic = [
+        {"case": "c", "size": s, "seconds": s * s * 1e-6} for s in (10, 100, 1000)
+    ]
+    baseline = {"results": linear, "scaling": cb.scaling_exponents(linear)}
+    current = {"results": quadratic, "scaling": cb.scaling_exponents(quadratic)}
+
+    assert baseline["scaling"]["c"] == pytest.approx(1.0)
+    assert current["scaling"]["c"] == pytest.approx(2.0)
+
+    kinds = {r["kind"] for r in cb.compare_to_baseline(current, baseline)}
+    assert kinds == {"slowdown", "scaling"}
+    assert cb.compare_to_baseline(baseline, baseline) == []
+
+
+def test_bench_cli_saves_and_compares_baseline(tmp_path: Path, monkeypatch, capsys):
+    from edgeflow.compiler import edgeflowc
+
+    baseline = tmp_path / "baseline.json"
+    argv = ["edgeflow", "bench", "compiler", "--sizes", "10", "--repeats", "1"]
+    argv += ["--filter", "parse"]
+    monkeypatch.setattr(sys, "argv", argv + ["--save-baseline", str(baseline)])
+    assert edgeflowc.main() == 0
+    assert json.loads(baseline.read_text())["suite"] == "compiler"
+
+    monkeypatch.setattr(sys, "argv", argv + ["--baseline", str(baseline)])
+    assert edgeflowc.main() == 0
+    assert "No regressions" in capsys.readouterr().out
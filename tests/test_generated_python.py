@@ -0,0 +1,171 @@
+"""Tests for the Python inference code emitted by ``CodeGenerator``."""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from edgeflow.compiler.code_generator import CodeGenerator
+from edgeflow.ir.edgeflow_ast import create_program_from_dict
+
+
+class FakeInterpreter:
+    """Adds one to its float32 input; rejects invoke while views are held."""
+
+    shape = (1, 4)
+
+    def __init__(self, model_path=None, **kwargs):
+        self.tensors = {}
+
+    def allocate_tensors(self):
+        self.tensors = {
+            0: np.zeros(self.shape, np.float32),
+            1: np.zeros(self.shape, np.float32),
+        }
+
+    def get_input_details(self):
+        return [{"index": 0, "shape": np.array(self.shape), "dtype": np.float32}]
+
+    def get_output_details(self):
+        return [{"index": 1, "shape": np.array(self.shape), "dtype": np.float32}]
+
+    def set_tensor(self, index, value):  # pragma: no cover - must not be used
+        raise AssertionError("set_tensor copies; the view should be used")
+
+    def get_tensor(self, index):  # pragma: no cover - must not be used
+        raise AssertionError("get_tensor copies; the view should be used")
+
+    def invoke(self):
+        if any(sys.getrefcount(t) > 3 for t in self.tensors.values()):
+            raise RuntimeError("There is at least 1 reference to internal data")
+        self.tensors[1][...] = self.tensors[0] + 1
+
+    def tensor(self, index):
+        return lambda: self.tensors[index][...]
+
+
+class ImageInterpreter(FakeInterpreter):
+    shape = (1, 2, 3, 3)
+
+
+def _load(monkeypatch, interpreter_cls, **config):
+    program = create_program_from_dict(
+        {"model": "m.tflite", "quantize": "none", "input_stream": "file", **config}
+    )
+    code = CodeGenerator(program).generate_python_inference()
+
+    fake_tf = types.ModuleType("tensorflow")
+    fake_tf.lite = types.SimpleNamespace(Interpreter=interpreter_cls)
+    fake_tf.config = types.SimpleNamespace(
+        experimental=types.SimpleNamespace(list_physical_devices=lambda kind: [])
+    )
+    monkeypatch.setitem(sys.modules, "tensorflow", fake_tf)
+    monkeypatch.setitem(sys.modules, "cv2", types.ModuleType("cv2"))
+    namespace = {"__name__": "generated_inference"}
+    exec(compile(code, "inference.py", "exec"), namespace)
+    return namespace
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    return _load(monkeypatch, FakeInterpreter)["EdgeFlowInference"]("m.tflite")
+
+
+def test_predict_reads_and_writes_tensor_views(engine):
+    output = engine.predict(np.full((1, 4), 2, np.float32))
+    assert np.array_equal(output, np.full((1, 4), 3, np.float32))
+    engine.predict(np.zeros((1, 4), np.float32))
+    assert output[0, 0] == 3  # default copy=True detaches the result
+
+
+def test_predict_into_reuses_caller_buffer(engine):
+    out = engine.allocate_output()
+    buf = engine.input_buffer()
+    buf[...] = 5
+    del buf  # views must be released before invoking
+    assert engine.predict_into(out) is out
+    assert np.array_equal(out, np.full((1, 4), 6, np.float32))
+
+    view = engine.predict(np.ones((1, 4), np.float32), copy=False)
+    assert view[0, 0] == 2
+    with pytest.raises(RuntimeError):
+        engine.predict_into(out, np.ones((1, 4), np.float32))
+
+
+def test_predict_records_stage_latency(engine):
+    out = engine.allocate_output()
+    engine.predict(np.ones((1, 4), np.float32))
+    engine.predict_into(out, np.ones((1, 4), np.float32))
+
+    snapshot = engine.latency_snapshot(reset=True)
+    assert set(snapshot) == {"preprocess", "invoke", "postprocess"}
+    assert all(stage["count"] == 2 for stage in snapshot.values())
+    assert engine.latency_snapshot()["invoke"]["count"] == 0
+
+
+@pytest.fixture
+def frames_dir(tmp_path):
+    for i in range(6):
+        frame = np.full((4, 6, 3), i * 10, np.uint8)
+        frame[..., 0] = 255  # blue in OpenCV's BGR order
+        np.save(tmp_path / f"frame_{i:02d}.npy", frame)
+    return str(tmp_path)
+
+
+def test_frame_source_resizes_and_normalizes_every_frame(monkeypatch, frames_dir):
+    module = _load(monkeypatch, ImageInterpreter, buffer_size=4)
+    engine = module["EdgeFlowInference"]("m.tflite")
+
+    outputs = [o.copy() for o in engine.run_stream(frames_dir, drop_policy="block")]
+
+    assert len(outputs) == 6
+    for i, output in enumerate(outputs):
+        assert output.shape == (1, 2, 3, 3)
+        assert np.allclose(output[..., 2], 2.0)  # blue moved last, scaled, +1
+        assert np.allclose(output[..., 0], i * 10 / 255 + 1)
+
+
+def test_frame_ring_keeps_only_the_latest_frame(monkeypatch):
+    module = _load(monkeypatch, ImageInterpreter)
+    ring = module["FrameRing"](3, (1,), np.int32)
+    for value in range(5):
+        slot = ring.acquire()
+        ring.slots[slot] = value
+        ring.commit(slot)
+    assert ring.get()[0] == 4
+    assert ring.dropped == 4
+    ring.close()
+    assert ring.get() is None
+
+
+def test_preprocessor_writes_channels_first_layouts(monkeypatch):
+    module = _load(monkeypatch, ImageInterpreter)
+    preprocess = module["FramePreprocessor"]((1, 3, 2, 2), np.int8)
+    frame = np.arange(4 * 4 * 3, dtype=np.uint8).reshape(4, 4, 3)
+    out = np.empty((1, 3, 2, 2), np.int8)
+    preprocess(frame, out)
+    expected = frame[::2, ::2, ::-1].transpose(2, 0, 1).astype(np.int16) - 128
+    assert np.array_equal(out[0], expected)
+
+
+def test_camera_stream_defaults_to_v4l2_device(monkeypatch):
+    module = _load(monkeypatch, FakeInterpreter, input_stream="camera")
+    assert module["DEFAULT_FRAME_SOURCE"] == "/dev/video0"
+    sensor = _load(monkeypatch, FakeInterpreter, input_stream="sensor")
+    assert "FrameSource" not in sensor
+    assert "Iterator" not in sensor
+
+
+def test_generated_code_prewarms_and_advises_the_model(monkeypatch, tmp_path):
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"\0" * 10000)
+    namespace = _load(monkeypatch, FakeInterpreter)
+
+    result = namespace["prewarm_model"](str(model))
+    assert result["bytes"] == 10000
+    assert result["major_faults"] >= 0
+    engine = namespace["EdgeFlowInference"](str(model), madvise=("willneed",))
+    assert engine.madvise == ("willneed",)
+    with pytest.raises(RuntimeError, match="Unknown madvise hint"):
+        namespace["EdgeFlowInference"](str(model), madvise=("bogus",))
@@ -0,0 +1,456 @@
+"""Tests for the generated device inference module (packager template)."""
+
+import importlib.util
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from edgeflow.deployment.deployment_packager import (
+    DeviceType,
+    EdgeFlowDeploymentPackager,
+)
+
+
+class FakeInterpreter:
+    """Doubles its float32 input; resizable along the batch dimension."""
+
+    def __init__(self, model_path=None, **kwargs):
+        self.shape = [1, 4]
+        self.tensors = {}
+        self.invocations = 0
+
+    def allocate_tensors(self):
+        self.tensors = {0: np.zeros(self.shape, np.float32)}
+        self.tensors[1] = np.zeros(self.shape, np.float32)
+
+    def resize_tensor_input(self, index, shape):
+        self.shape = list(shape)
+
+    def get_input_details(self):
+        return [{"index": 0, "shape": np.array(self.shape), "dtype": np.float32}]
+
+    def get_output_details(self):
+        return [{"index": 1, "shape": np.array(self.shape), "dtype": np.float32}]
+
+    def set_tensor(self, index, value):
+        assert value.shape == tuple(self.shape)
+        self.tensors[index][...] = value
+
+    def invoke(self):
+        self.invocations += 1
+        self.tensors[1][...] = self.tensors[0] * 2
+
+    def get_tensor(self, index):
+        return self.tensors[index].copy()
+
+    def tensor(self, index):
+        return lambda: self.tensors[index]
+
+
+@pytest.fixture
+def inference(tmp_path: Path, monkeypatch):
+    packager = EdgeFlowDeploymentPackager()
+    device = DeviceType.RASPBERRY_PI
+    code = packager._generate_device_inference_code(
+        {"model": "m.tflite", "quantize": "int8", "buffer_size": 4},
+        device,
+        packager.device_constraints[device],
+    )
+    path = tmp_path / "inference.py"
+    path.write_text(code)
+
+    fake_interpreter = types.ModuleType("tflite_runtime.interpreter")
+    fake_interpreter.Interpreter = FakeInterpreter
+    fake_pkg = types.ModuleType("tflite_runtime")
+    fake_pkg.interpreter = fake_interpreter
+    monkeypatch.setitem(sys.modules, "tflite_runtime", fake_pkg)
+    monkeypatch.setitem(sys.modules, "tflite_runtime.interpreter", fake_interpreter)
+
+    spec = importlib.util.spec_from_file_location("generated_inference", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_dynamic_batcher_groups_concurrent_requests(inference):
+    engine = inference.EdgeFlowInference("m.tflite")
+    batcher = inference.DynamicBatcher(engine, max_batch=4, max_wait_ms=200).start()
+    results = {}
+
+    def call(i):
+        results[i] = batcher.infer(np.full((1, 4), i, np.float32))
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.stop()
+
+    for i, (output, timing) in results.items():
+        assert np.array_equal(output, np.full((1, 4), 2 * i, np.float32))
+        assert timing["total_ms"] >= timing["inference_ms"]
+    stats = batcher.stats()
+    assert stats["requests"] == 8
+    assert stats["batches"] < 8
+    assert engine.interpreter.shape == [4, 4]  # resized once, up front
+
+
+def test_batcher_rejects_wrong_shapes(inference):
+    engine = inference.EdgeFlowInference("m.tflite")
+    batcher = inference.DynamicBatcher(engine, max_batch=2).start()
+    with pytest.raises(ValueError):
+        batcher.infer(np.zeros((3,), np.float32))
+    batcher.stop()
+
+
+@pytest.mark.skipif(not hasattr(__import__("socket"), "AF_UNIX"), reason="no AF_UNIX")
+def test_server_over_unix_socket(inference, tmp_path: Path):
+    engine = inference.EdgeFlowInference("m.tflite")
+    sock = str(tmp_path / "inference.sock")
+    server = inference.create_inference_server(
+        engine, unix_socket=sock, max_batch=2, max_wait_ms=1
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = inference.InferenceClient(unix_socket=sock)
+        for value in (1.0, 3.0):
+            output, timing = client.predict(np.full((1, 4), value, np.float32))
+            assert np.array_equal(output, np.full((1, 4), 2 * value, np.float32))
+            assert timing["batch_size"] == 1
+        assert client.stats()["requests"] == 2
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.batcher.stop()
+
+
+def test_predict_stream_preserves_order_and_reuses_buffers(inference):
+    engine = inference.EdgeFlowInference("m.tflite")
+    frames = [np.full((4,), i, np.float32) for i in range(20)]
+    seen = []
+
+    def postprocess(out):
+        seen.append(id(out))
+        return float(out[0, 0])
+
+    results = list(
+        engine.predict_stream(iter(frames), postprocess=postprocess, depth=3)
+    )
+
+    assert results == [2.0 * i for i in range(20)]
+    assert len(set(seen)) <= 3  # outputs come from the pre-allocated ring
+    assert engine.stream_stats["frames"] == 20
+
+
+def test_predict_stream_propagates_stage_errors(inference):
+    engine = inference.EdgeFlowInference("m.tflite")
+
+    def preprocess(item, out):
+        if item == 2:
+            raise ValueError("bad frame")
+        out[...] = item
+
+    stream = engine.predict_stream(range(5), preprocess=preprocess)
+    assert np.array_equal(next(stream), np.zeros((1, 4), np.float32))
+    with pytest.raises(ValueError, match="bad frame"):
+        list(stream)
+
+
+def test_predict_into_writes_through_tensor_views(inference):
+    engine = inference.EdgeFlowInference("m.tflite")
+    out = engine.allocate_output()
+    engine.input_buffer()[...] = 3
+    assert engine.predict_into(out) is out
+    assert np.array_equal(out, np.full((1, 4), 6, np.float32))
+
+    copied = engine.predict(np.ones((1, 4), np.float32))
+    view = engine.predict(np.ones((1, 4), np.float32), copy=False)
+    engine.predict_into(out, np.zeros((1, 4), np.float32))
+    assert copied[0, 0] == 2 and view[0, 0] == 0  # the view aliases the arena
+
+
+def _models(inference, tmp_path: Path, names, **kwargs):
+    manager = inference.ModelRuntimeManager(**kwargs)
+    for name in names:
+        path = tmp_path / f"{name}.tflite"
+        path.write_bytes(b"\0" * (1024 * 1024))
+        manager.register(name, str(path))
+    return manager
+
+
+def test_runtime_manager_loads_lazily_and_evicts_lru(inference, tmp_path: Path):
+    manager = _models(inference, tmp_path, ["det", "cls", "ocr"], max_memory_mb=2.5)
+    assert manager.stats()["resident"] == []
+
+    frame = np.ones((1, 4), np.float32)
+    for name in ["det", "cls", "det", "ocr"]:
+        assert np.array_equal(manager.predict(name, frame), 2 * frame)
+
+    stats = manager.stats()
+    assert stats["resident"] == ["det", "ocr"]  # cls was least recently used
+    assert stats["resident_mb"] <= 2.5
+    assert stats["models"]["cls"]["evictions"] == 1
+    assert stats["models"]["det"]["loads"] == 1
+    assert stats["models"]["det"]["hits"] == 1
+    assert stats["models"]["det"]["requests"] == 2
+
+
+def test_runtime_manager_keeps_borrowed_models(inference, tmp_path: Path):
+    manager = _models(inference, tmp_path, ["a", "b"], max_memory_mb=1.5)
+    with manager.use("a"):
+        manager.predict("b", np.ones((1, 4), np.float32))
+        assert set(manager.stats()["resident"]) == {"a", "b"}
+    assert manager.over_budget_loads == 1
+
+
+def test_runtime_manager_serializes_each_engine(inference, tmp_path: Path, monkeypatch):
+    manager = _models(inference, tmp_path, ["det"], max_memory_mb=8)
+    active = []
+    overlaps = []
+    original = inference.EdgeFlowInference.predict
+
+    def predict(engine, data, copy=True):
+        active.append(engine)
+        overlaps.append(active.count(engine) > 1)
+        time.sleep(0.01)
+        active.remove(engine)
+        return original(engine, data, copy)
+
+    monkeypatch.setattr(inference.EdgeFlowInference, "predict", predict)
+    frame = np.ones((1, 4), np.float32)
+    threads = [
+        threading.Thread(target=manager.predict, args=("det", frame)) for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert overlaps == [False] * 4
+    assert manager.stats()["models"]["det"]["requests"] == 4
+
+
+def test_runtime_manager_reserves_memory_for_concurrent_loads(
+    inference, tmp_path: Path
+):
+    both_loading = threading.Barrier(2, timeout=2)
+
+    def loader(path):
+        if "old" not in path:
+            both_loading.wait()  # a and b are loading at the same time
+        return inference.EdgeFlowInference(path)
+
+    manager = _models(
+        inference, tmp_path, ["old", "a", "b"], max_memory_mb=2.5, loader=loader
+    )
+    manager.predict("old", np.ones((1, 4), np.float32))
+    threads = [
+        threading.Thread(target=manager.predict, args=(n, np.ones((1, 4), np.float32)))
+        for n in ("a", "b")
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = manager.stats()
+    assert sorted(stats["resident"]) == ["a", "b"]  # old made room for both
+    assert stats["resident_mb"] <= 2.5 and stats["loading_mb"] == 0
+
+
+def test_runtime_manager_prewarms_likely_next_model(inference, tmp_path: Path):
+    manager = _models(
+        inference, tmp_path, ["scene", "ocr"], max_memory_mb=8, auto_prewarm=True
+    )
+    frame = np.ones((1, 4), np.float32)
+    manager.predict("scene", frame)
+    manager.predict("ocr", frame)
+    manager.unload("ocr")
+    assert manager.likely_next("scene") == ["ocr"]
+
+    manager.predict("scene", frame)  # hints ocr and loads it in the background
+    deadline = time.time() + 2
+    while "ocr" not in manager.stats()["resident"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert manager.stats()["models"]["ocr"]["loads"] == 2
+
+
+class FakeSignals:
+    def __init__(self):
+        self.values = {"temperature_c": 50.0, "throttling": False, "cpu_percent": 20.0}
+
+    def __call__(self):
+        return dict(self.values)
+
+
+def test_variant_policy_switches_with_hysteresis(inference):
+    now = [0.0]
+    signals = FakeSignals()
+    policy = inference.VariantPolicy(
+        ["fp16", "int8", "pruned_int8"],
+        latency_slo_ms=50,
+        signals=signals,
+        clock=lambda: now[0],
+    )
+    now[0] = 5.0
+    assert policy.update() == "fp16"
+
+    signals.values["temperature_c"] = 78.0
+    assert policy.update() == "int8"
+    assert policy.update() == "int8"  # held: no second step within hold_down_s
+    now[0] = 8.0
+    assert policy.update() == "pruned_int8"
+
+    signals.values["temperature_c"] = 70.0  # between thresholds: stay put
+    now[0] = 100.0
+    assert policy.update() == "pruned_int8"
+    signals.values["temperature_c"] = 60.0
+    assert policy.update() == "int8"
+    now[0] = 110.0
+    assert policy.update() == "int8"  # upgrades wait the longer hold_up_s
+
+    for _ in range(10):
+        policy.observe_latency(80.0)
+    assert policy.update() == "pruned_int8"
+    assert [s["to"] for s in policy.switches] == [
+        "int8",
+        "pruned_int8",
+        "int8",
+        "pruned_int8",
+    ]
+
+
+def test_device_signals_read_sysfs_and_proc(inference, tmp_path: Path):
+    (tmp_path / "proc").mkdir()
+    thermal = tmp_path / "sys/class/thermal/thermal_zone0"
+    thermal.mkdir(parents=True)
+    (thermal / "temp").write_text("71500\n")
+    firmware = tmp_path / "sys/devices/platform/soc/soc:firmware"
+    firmware.mkdir(parents=True)
+    (firmware / "get_throttled").write_text("50004\n")
+    stat = tmp_path / "proc/stat"
+    stat.write_text("cpu  100 0 100 800 0 0 0 0 0 0\n")
+
+    signals = inference.DeviceSignals(str(tmp_path))
+    first = signals()
+    stat.write_text("cpu  150 0 150 900 0 0 0 0 0 0\n")
+    second = signals()
+
+    assert first["cpu_percent"] is None
+    assert second["cpu_percent"] == pytest.approx(50.0)
+    assert second["temperature_c"] == pytest.approx(71.5)
+    assert second["throttling"] is True
+
+
+def test_adaptive_inference_from_packaged_manifest(inference, tmp_path: Path):
+    sources = {}
+    for name in ("fp16", "int8"):
+        sources[name] = str(tmp_path / f"src_{name}.tflite")
+        Path(sources[name]).write_bytes(b"\0" * 64)
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    EdgeFlowDeploymentPackager()._package_model_variants(
+        sources, str(model_dir), {"latency_slo_ms": 20}
+    )
+
+    signals = FakeSignals()
+    signals.values["throttling"] = True
+    runtime = inference.AdaptiveInference.from_manifest(
+        str(model_dir / "variants.json"), signals=signals, hold_down_s=0
+    )
+    assert runtime.policy.latency_slo_ms == 20
+    output = runtime.predict(np.ones((1, 4), np.float32))
+    assert np.array_equal(output, np.full((1, 4), 2, np.float32))
+    stats = runtime.stats()
+    assert stats["variant"] == "int8"
+    assert stats["runtime"]["resident"] == ["int8"]
+
+
+def test_latency_histogram_is_log_linear_and_bounded(inference):
+    histogram = inference.LatencyHistogram(max_ms=1000.0)
+    for us in range(1, 100001, 10):  # 0.001 .. 100 ms, uniform
+        histogram.record_us(us)
+    histogram.record_ms(5000.0)  # clamped to max_ms
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 10001
+    assert len(histogram._counts) < 1200  # fixed, independent of the samples
+    assert snapshot["p50_ms"] == pytest.approx(50.0, rel=0.02)
+    assert snapshot["p99_ms"] == pytest.approx(99.0, rel=0.02)
+    assert snapshot["max_ms"] == 1000.0 and snapshot["min_ms"] == 0.001
+    assert sum(n for _, _, n in snapshot["buckets"]) == 10001
+    for low, high, _ in snapshot["buckets"]:
+        assert high - low <= max(low * 2**-6, 0.001) + 1e-12
+
+    histogram.reset()
+    assert histogram.snapshot()["count"] == 0
+
+
+def test_engine_records_stage_latency(inference):
+    engine = inference.EdgeFlowInference("m.tflite")
+    out = engine.allocate_output()
+    for _ in range(5):
+        engine.predict_into(out, np.ones((1, 4), np.float32))
+    engine.predict(np.ones((1, 4), np.float32))
+    list(engine.predict_stream([np.ones(4, np.float32)] * 3))
+
+    snapshot = engine.latency_snapshot(reset=True)
+    assert set(snapshot) == {"preprocess", "invoke", "postprocess"}
+    assert all(stage["count"] == 9 for stage in snapshot.values())
+    assert snapshot["invoke"]["p99_ms"] >= snapshot["invoke"]["p50_ms"]
+    assert engine.latency_snapshot()["invoke"]["count"] == 0
+
+
+@pytest.mark.skipif(not hasattr(__import__("socket"), "AF_UNIX"), reason="no AF_UNIX")
+def test_server_exposes_and_resets_latency(inference, tmp_path: Path):
+    engine = inference.EdgeFlowInference("m.tflite")
+    sock = str(tmp_path / "inference.sock")
+    server = inference.create_inference_server(engine, unix_socket=sock, max_wait_ms=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = inference.InferenceClient(unix_socket=sock)
+        for _ in range(3):
+            client.predict(np.ones((1, 4), np.float32))
+        latency = client.latency()
+        assert latency["total"]["count"] == 3
+        assert latency["queue"]["count"] == 3
+        assert latency["invoke"]["count"] >= 1  # one per batch
+        assert client.latency(reset=True)["total"]["count"] == 3
+        assert client.latency()["total"]["count"] == 0
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.batcher.stop()
+
+
+def test_prewarm_and_madvise_use_a_shared_readonly_mapping(inference, tmp_path: Path):
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"\1" * (3 * 4096 + 10))
+
+    result = inference.prewarm_model(str(model))
+    assert result["bytes"] == 3 * 4096 + 10
+    assert result["pages"] == -(-result["bytes"] // inference.mmap.PAGESIZE)
+    assert set(result["hints"]) <= {"willneed"}
+    with pytest.raises(ValueError):
+        inference.advise_model(str(model), ["hugepages"])
+    with pytest.raises(ValueError, match="does not outlive"):
+        inference.advise_model(str(model), ["sequential"])
+
+    engine = inference.EdgeFlowInference(str(model), madvise=["willneed"])
+    assert engine.memory_stats["madvise"] in ([], ["willneed"])
+    assert engine.memory_stats["model_load_ms"] >= 0
+
+
+def test_deploy_script_prewarms_the_model_at_boot():
+    script = EdgeFlowDeploymentPackager().package_templates["raspberry_pi_deployment"]
+    assert "Before=edgeflow.service" in script
+    assert "--prewarm" in script
@@ -85,6 +85,26 @@ class TestInitialCheck:
         mgr_json = DeviceSpecManager(str(json_path))
         assert "custom_json" in mgr_json.devices
 
+    def test_memory_measurement_is_opt_in_and_cached(self, sample_model, monkeypatch):
+        """Interpreter loads only happen with measure_memory, once per file."""
+        loads = []
+
+        def fake_measure(path):
+            loads.append(path)
+            return 5.0
+
+        monkeypatch.setattr(
+            InitialChecker, "_load_and_measure", staticmethod(fake_measure)
+        )
+        InitialChecker().profile_model(sample_model)
+        assert loads == []
+
+        checker = InitialChecker(measure_memory=True)
+        for _ in range(3):
+            profile = checker.profile_model(sample_model)
+        assert loads == [sample_model]
+        assert profile.estimated_ram_mb == 5.0
+
     def test_fit_score_calculation(self, sample_model):
         """Test fit score calculation logic yields reasonable range."""
         checker = InitialChecker()
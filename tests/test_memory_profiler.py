@@ -0,0 +1,100 @@
+"""Tests for benchmark memory instrumentation."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from edgeflow.benchmarking import benchmarker
+from edgeflow.benchmarking.memory_profiler import (
+    PeakRSSSampler,
+    PythonAllocTracker,
+    profile_interpreter_memory,
+    read_page_faults,
+    read_rss_mb,
+)
+
+
+class _FakeInterpreter:
+    """Minimal stand-in for ``tf.lite.Interpreter``."""
+
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        self.arena = None
+        self.tensors = {}
+
+    def allocate_tensors(self):
+        self.arena = bytearray(4 * 1024 * 1024)
+
+    def get_input_details(self):
+        return [{"shape": np.array([1, 8, 8, 3]), "dtype": np.float32, "index": 0}]
+
+    def get_output_details(self):
+        return [{"shape": np.array([1, 10]), "dtype": np.float32, "index": 1}]
+
+    def set_tensor(self, index, value):
+        self.tensors[index] = value
+
+    def invoke(self):
+        self.tensors[1] = np.zeros((1, 10), dtype=np.float32)
+
+    def get_tensor(self, index):
+        return self.tensors[index].copy()
+
+
+class TestMemoryProfiler:
+    def test_rss_and_faults(self):
+        assert read_rss_mb() > 0
+        minor, major = read_page_faults()
+        assert minor >= 0 and major >= 0
+
+    def test_peak_sampler_sees_growth(self):
+        size_mb = 64
+        with PeakRSSSampler(interval_s=0.001) as sampler:
+            block = bytearray(size_mb * 1024 * 1024)
+            block[::4096] = b"x" * len(block[::4096])  # touch every page
+        # The touched buffer is resident while the sampler is active
+        assert sampler.peak_mb - sampler.start_mb >= size_mb * 0.5
+        del block
+
+    def test_alloc_tracker_keeps_largest_peak(self):
+        tracker = PythonAllocTracker()
+        with tracker.track("preprocess"):
+            small = [0] * 1000
+        with tracker.track("preprocess"):
+            large = [0] * 100000
+        assert tracker.peaks_kb["preprocess"] > 700
+        del small, large
+
+    def test_profile_interpreter_memory(self):
+        interpreter, memory = profile_interpreter_memory(
+            lambda: _FakeInterpreter("m.tflite")
+        )
+        assert interpreter.arena is not None
+        assert memory["rss_after_allocate_mb"] >= memory["rss_before_load_mb"]
+        assert set(memory["allocate_page_faults"]) == {"minor", "major"}
+
+
+def test_benchmark_latency_reports_memory(tmp_path: Path, monkeypatch):
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"\0" * 16)
+    fake_tf = SimpleNamespace(lite=SimpleNamespace(Interpreter=_FakeInterpreter))
+    monkeypatch.setattr(benchmarker, "_TF_AVAILABLE", True)
+    monkeypatch.setattr(benchmarker, "_tf", fake_tf, raising=False)
+
+    latency, meta = benchmarker.benchmark_latency(str(model), runs=5, warmup=2)
+
+    assert latency > 0
+    memory = meta["memory"]
+    assert memory["peak_rss_invoke_mb"] > 0
+    assert set(memory["python_peak_kb"]) == {"preprocess", "postprocess"}
+    assert "invoke_page_faults" in memory
+
+    results = benchmarker.EdgeFlowBenchmarker({}).benchmark_model(str(model))
+    assert results["mode"] == "real"
+    assert results["memory"]["arena_mb"] >= 0
+
+
+def test_measure_model_memory_without_tf(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(benchmarker, "_TF_AVAILABLE", False)
+    assert benchmarker.measure_model_memory(str(tmp_path / "x.tflite")) is None
@@ -0,0 +1,152 @@
+"""Tests for the content-addressed model store and digest-based API calls."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from edgeflow.backend import app as app_module
+from edgeflow.backend.api.services.cache_service import ResponseCache
+from edgeflow.backend.api.services.model_store import ModelNotFoundError, ModelStore
+
+CONFIG = 'model = "m.tflite"\nquantize = int8\ntarget_device = "raspberry_pi"\n'
+
+
+def _add(store: ModelStore, tmp_path: Path, data: bytes):
+    src = tmp_path / f"upload-{hashlib.md5(data).hexdigest()}"
+    src.write_bytes(data)
+    return store.add_file(str(src), hashlib.sha256(data).hexdigest(), ".tflite")
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(app_module, "model_store", ModelStore(str(tmp_path / "s")))
+    monkeypatch.setattr(app_module, "response_cache", ResponseCache())
+    return TestClient(app_module.app)
+
+
+def test_duplicate_uploads_are_deduplicated(tmp_path: Path):
+    store = ModelStore(str(tmp_path / "store"))
+    first, created = _add(store, tmp_path, b"model-bytes")
+    again, created_again = _add(store, tmp_path, b"model-bytes")
+
+    assert created and not created_again
+    assert first.sha256 == again.sha256
+    assert Path(first.path).read_bytes() == b"model-bytes"
+    assert store.stats()["models"] == 1
+
+
+def test_lru_eviction_bounds_disk(tmp_path: Path):
+    store = ModelStore(str(tmp_path / "store"), max_bytes=3000)
+    a, _ = _add(store, tmp_path, b"a" * 1000)
+    b, _ = _add(store, tmp_path, b"b" * 1000)
+    past = time.time() - 60
+    os.utime(Path(a.path).parent, (past, past))
+    os.utime(Path(b.path).parent, (past + 1, past + 1))
+    store.get(a.sha256)  # "a" becomes most recently used
+
+    _add(store, tmp_path, b"c" * 1000)
+
+    with pytest.raises(ModelNotFoundError):
+        store.get(b.sha256)
+    assert store.get(a.sha256).size_bytes == 1000
+    assert store.stats()["total_bytes"] <= 3000
+
+
+def test_eviction_skips_models_in_use(tmp_path: Path):
+    store = ModelStore(str(tmp_path / "store"), max_bytes=2500, min_idle_s=30)
+    a, _ = _add(store, tmp_path, b"a" * 1000)
+    b, _ = _add(store, tmp_path, b"b" * 1000)
+    past = time.time() - 60
+    for record in (a, b):
+        os.utime(Path(record.path).parent, (past, past))
+
+    with store.pinned(a.sha256):
+        os.utime(Path(a.path).parent, (past, past))
+        _add(store, tmp_path, b"c" * 1000)  # evicts idle "b", not pinned "a"
+        assert store.get(a.sha256)
+        with pytest.raises(ModelNotFoundError):
+            store.get(b.sha256)
+
+    # "a" was opened just now, so it survives although the store is full
+    _add(store, tmp_path, b"d" * 1000)
+    assert store.get(a.sha256)
+    assert store.stats()["models"] == 3
+
+
+def test_running_total_matches_disk(tmp_path: Path):
+    store = ModelStore(str(tmp_path / "store"))
+    record, _ = _add(store, tmp_path, b"m" * 100)
+    store.put_artifact(record.sha256, "r.json", {"v": 1})
+    store.put_artifact(record.sha256, "r.json", {"v": [1] * 50})
+    on_disk = sum(p.stat().st_size for p in store.models_dir.rglob("*") if p.is_file())
+
+    assert store.stats()["total_bytes"] == on_disk
+    assert ModelStore(str(tmp_path / "store")).stats()["total_bytes"] == on_disk
+    store.delete(record.sha256)
+    assert store.stats()["total_bytes"] == 0
+
+
+def test_artifacts_live_under_the_digest(tmp_path: Path):
+    store = ModelStore(str(tmp_path / "store"))
+    record, _ = _add(store, tmp_path, b"m")
+    store.put_artifact(record.sha256, "report.json", {"ok": True})
+
+    assert store.get_artifact(record.sha256, "report.json") == {"ok": True}
+    assert store.list_artifacts(record.sha256) == ["report.json"]
+    with pytest.raises(ValueError):
+        store.get_artifact(record.sha256, "../meta.json")
+    with pytest.raises(ModelNotFoundError):
+        store.get("../../etc")
+
+
+def test_upload_once_then_reference_by_digest(client: TestClient):
+    data = b"\0" * 2048
+    digest = hashlib.sha256(data).hexdigest()
+    uploaded = client.post("/api/models/raw", content=data).json()
+    assert uploaded["sha256"] == digest and uploaded["created"]
+    assert client.post("/api/models/raw", content=data).json()["created"] is False
+
+    optimized = client.post(
+        "/api/optimize", json={"model_digest": digest, "config": {"quantize": "int8"}}
+    )
+    assert optimized.status_code == 200
+    assert optimized.json()["model_sha256"] == digest
+    assert optimized.json()["optimized_model"] is None
+
+    small = client.post(
+        "/api/models", files={"model": ("s.tflite", b"\0" * 1024, "application/x")}
+    ).json()["sha256"]
+    bench = client.post(
+        "/api/benchmark",
+        json={"original_digest": digest, "optimized_digest": small},
+    ).json()
+    assert bench["improvement"]["size_reduction"] == pytest.approx(0.5, abs=1e-3)
+
+    check = client.post("/api/check", json={"model_digest": digest, "config": {}})
+    assert check.status_code == 200
+
+    pipeline = client.post(
+        "/api/pipeline",
+        json={"config_file": CONFIG, "filename": "a.ef", "model_digest": digest},
+    )
+    assert pipeline.json()["success"]
+
+    artifacts = client.get(f"/api/models/{digest}").json()["artifacts"]
+    assert any(a.startswith("optimize-") for a in artifacts)
+    assert any(a.startswith("pipeline-") for a in artifacts)
+    assert f"benchmark-{small}.json" in artifacts
+
+
+def test_digest_errors(client: TestClient):
+    missing = "0" * 64
+    resp = client.post("/api/optimize", json={"model_digest": missing})
+    assert resp.status_code == 404
+    both = client.post(
+        "/api/optimize", json={"model_digest": missing, "model_file": ""}
+    )
+    assert both.status_code == 422
+    assert client.delete(f"/api/models/{missing}").status_code == 404
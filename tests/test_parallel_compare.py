@@ -0,0 +1,131 @@
+"""Tests for the parallel original-vs-optimized comparison."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from edgeflow.benchmarking import benchmarker
+
+_OUT_SCALE = 0.25
+
+
+class _FakeInterpreter:
+    """Linear 'model'; a file containing b"int8" behaves as its quantized twin."""
+
+    def __init__(self, model_path: str):
+        self.quantized = Path(model_path).read_bytes() == b"int8"
+        self.weights = np.linspace(0, 1, 48, dtype=np.float32).reshape(48, 1)
+        self.weights = self.weights * np.arange(1, 11, dtype=np.float32) / 10
+        self.tensors = {}
+
+    def allocate_tensors(self):
+        pass
+
+    def get_input_details(self):
+        if self.quantized:
+            return [
+                {
+                    "shape": np.array([1, 4, 4, 3]),
+                    "dtype": np.int8,
+                    "index": 0,
+                    "quantization": (1.0 / 255, -128),
+                }
+            ]
+        return [{"shape": np.array([1, 4, 4, 3]), "dtype": np.float32, "index": 0}]
+
+    def get_output_details(self):
+        if self.quantized:
+            return [{"index": 1, "dtype": np.int8, "quantization": (_OUT_SCALE, 0)}]
+        return [{"index": 1, "dtype": np.float32, "quantization": (0.0, 0)}]
+
+    def set_tensor(self, index, value):
+        self.tensors[index] = value
+
+    def invoke(self):
+        x = self.tensors[0]
+        if self.quantized:
+            x = (x.astype(np.float32) + 128) / 255
+        y = x.reshape(1, -1) @ self.weights
+        if self.quantized:
+            y = np.clip(np.round(y / _OUT_SCALE), -128, 127).astype(np.int8)
+        self.tensors[1] = y
+
+    def get_tensor(self, index):
+        return self.tensors[index].copy()
+
+
+@pytest.fixture
+def fake_tf(monkeypatch):
+    fake = SimpleNamespace(lite=SimpleNamespace(Interpreter=_FakeInterpreter))
+    monkeypatch.setattr(benchmarker, "_TF_AVAILABLE", True)
+    monkeypatch.setattr(benchmarker, "_tf", fake, raising=False)
+
+
+def test_output_difference_metrics():
+    ref = [np.array([[0.1, 0.9]]), np.array([[0.8, 0.2]])]
+    same = benchmarker.output_difference_metrics(ref, [r.copy() for r in ref])
+    assert same["max_abs_error"] == 0.0
+    assert same["cosine_similarity"] == pytest.approx(1.0)
+    assert same["top1_agreement"] == 1.0
+
+    flipped = [np.array([[0.9, 0.1]]), np.array([[0.8, 0.2]])]
+    diff = benchmarker.output_difference_metrics(ref, flipped)
+    assert diff["top1_agreement"] == 0.5
+    assert diff["max_abs_error"] == pytest.approx(0.8)
+    assert diff["cosine_similarity"] < 1.0
+
+    mismatch = benchmarker.output_difference_metrics(ref, [np.zeros(3)] * 2)
+    assert "error" in mismatch
+
+
+def test_input_sets_are_reproducible(tmp_path: Path, fake_tf):
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"float")
+    a = benchmarker.generate_input_set(str(model), num_inputs=3, seed=7)
+    b = benchmarker.generate_input_set(str(model), num_inputs=3, seed=7)
+    assert all(x.tobytes() == y.tobytes() for x, y in zip(a, b))
+
+
+def test_compare_models_with_baseline_reports_output_difference(
+    tmp_path: Path, fake_tf
+):
+    original = tmp_path / "m.tflite"
+    original.write_bytes(b"float")
+    optimized = tmp_path / "m_optimized.tflite"
+    optimized.write_bytes(b"int8")
+
+    baseline = benchmarker.BaselineBenchmark(
+        str(original), {}, num_inputs=8, parallel=False
+    ).start()
+    try:
+        comparison = benchmarker.compare_models(
+            str(original), str(optimized), {}, baseline
+        )
+        inputs = baseline.load_inputs()
+    finally:
+        baseline.cleanup()
+
+    assert len(inputs) == 8
+    assert comparison["original"]["mode"] == "real"
+    diff = comparison["output_difference"]
+    assert diff["samples"] == 8
+    assert 0.0 < diff["max_abs_error"] < 0.5
+    assert diff["cosine_similarity"] > 0.99
+    assert diff["top1_agreement"] == 1.0
+
+
+def test_parallel_baseline_runs_in_worker_process(tmp_path: Path):
+    model = tmp_path / "m.tflite"
+    model.write_bytes(b"\0" * 1024)
+
+    baseline = benchmarker.BaselineBenchmark(str(model), {"target_device": "cpu"})
+    baseline.start()
+    try:
+        results = baseline.result(timeout=120)
+    finally:
+        baseline.cleanup()
+
+    assert results["status"] == "success"
+    assert results["model_path"] == str(model)
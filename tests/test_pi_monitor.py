@@ -0,0 +1,111 @@
+"""Tests for the low-overhead sampling engine of the Pi system monitor."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from edgeflow.deployment.pi_system_monitor import (
+    MetricRing,
+    MetricSampler,
+    RaspberryPiMonitor,
+    SystemSources,
+)
+
+MEMINFO = (
+    "MemTotal:  1000000 kB\nMemFree: 100000 kB\nMemAvailable:  250000 kB\n"
+    "SwapTotal: 200000 kB\nSwapFree: 150000 kB\n"
+)
+
+
+def _fake_device(tmp_path: Path) -> SystemSources:
+    proc = tmp_path / "proc"
+    proc.mkdir()
+    (proc / "stat").write_text(
+        "cpu  100 0 100 700 100 0 0 0 0 0\n"
+        "cpu0 50 0 50 350 50 0 0 0 0 0\n"
+        "cpu1 50 0 50 350 50 0 0 0 0 0\n"
+    )
+    (proc / "meminfo").write_text(MEMINFO)
+    sys_root = tmp_path / "sys"
+    thermal = sys_root / "class/thermal/thermal_zone0"
+    thermal.mkdir(parents=True)
+    (thermal / "temp").write_text("64000\n")
+    return SystemSources(str(sys_root), lambda *a: None, proc_root=str(proc))
+
+
+def test_metric_ring_keeps_a_fixed_window_with_percentiles():
+    ring = MetricRing(capacity=100, low=0.0, high=1000.0, bins=1000)
+    for value in range(1000):
+        ring.append(float(value))
+    ring.append(None)  # unavailable readings are skipped
+
+    assert len(ring) == 100
+    assert ring.counts.sum() == 100
+    assert ring.latest == 999.0
+    assert list(ring.ordered()[:2]) == [900.0, 901.0]
+    summary = ring.summary()
+    assert summary["mean"] == pytest.approx(949.5)
+    assert summary["p50"] == pytest.approx(949.5, abs=1.0)
+    assert summary["p99"] == pytest.approx(998.5, abs=1.0)
+
+
+def test_sampler_accounts_cpu_from_proc_stat_deltas(tmp_path: Path):
+    sources = _fake_device(tmp_path)
+    sampler = MetricSampler(sources)
+    (tmp_path / "proc/stat").write_text(
+        "cpu  150 0 150 800 100 0 0 0 0 0\n"
+        "cpu0 100 0 100 350 50 0 0 0 0 0\n"
+        "cpu1 50 0 50 450 50 0 0 0 0 0\n"
+    )
+
+    start = time.perf_counter()
+    sample = sampler.sample()
+    assert time.perf_counter() - start < 0.05  # no blocking interval
+
+    assert sample["cpu_percent"] == pytest.approx(50.0)
+    assert sampler.per_core == pytest.approx([100.0, 0.0])
+    assert sample["memory_percent"] == pytest.approx(75.0)
+    assert sample["swap_percent"] == pytest.approx(25.0)
+    assert sample["temperature_c"] == 64.0
+    assert sample["throttled"] is None
+    # One cached handle per file, re-read on every sample
+    assert len(sources._handles) >= 3
+    (tmp_path / "sys/class/thermal/thermal_zone0/temp").write_text("70000\n")
+    assert sampler.sample()["temperature_c"] == 70.0
+
+
+def test_vcgencmd_fallback_is_rate_limited(tmp_path: Path):
+    calls = []
+
+    def vcgencmd(*args):
+        calls.append(args)
+        return {"get_throttled": "throttled=0x50004"}.get(args[0])
+
+    now = [0.0]
+    sources = SystemSources(str(tmp_path), vcgencmd, proc_root=str(tmp_path))
+    sampler = MetricSampler(sources, slow_interval_s=5.0, clock=lambda: now[0])
+    for _ in range(10):
+        assert sampler.sample()["throttled"] == 1.0
+    assert calls.count(("get_throttled",)) == 1
+    now[0] = 6.0
+    sampler.sample()
+    assert calls.count(("get_throttled",)) == 2
+
+
+def test_monitor_records_into_rings(tmp_path: Path):
+    monitor = RaspberryPiMonitor(sources=_fake_device(tmp_path), history=8)
+    for _ in range(20):
+        monitor.sample()
+    for latency in (10.0, 20.0, 30.0):
+        monitor.log_inference_stats(latency, "m.tflite")
+
+    summary = monitor.get_performance_summary()
+    assert summary["total_samples"] == 20
+    assert len(monitor.sampler.rings["memory_percent"]) == 8
+    assert summary["system_performance"]["memory"]["avg_percent"] == pytest.approx(75)
+    assert summary["system_performance"]["temperature"]["max_celsius"] == 64.0
+    inference = summary["inference_performance"]
+    assert inference["avg_time_ms"] == pytest.approx(20.0)
+    assert inference["p50_time_ms"] == pytest.approx(20.0, rel=0.1)
+    assert monitor.get_system_stats()["memory"]["total_gb"] > 0
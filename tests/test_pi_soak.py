@@ -0,0 +1,101 @@
+"""Tests for the sustained-load soak test in the Pi system monitor."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from edgeflow.deployment.pi_system_monitor import (
+    RaspberryPiMonitor,
+    SystemSources,
+    run_soak_test,
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _HeatingInference:
+    """Inference stand-in that gets slower once the fake SoC throttles."""
+
+    input_details = [{"shape": (1, 4), "dtype": np.float32}]
+
+    def __init__(self, clock: _FakeClock, throttled: dict):
+        self.clock = clock
+        self.throttled = throttled
+        self.calls = 0
+
+    def predict(self, data):
+        self.calls += 1
+        self.clock.now += 0.02 if self.throttled["on"] else 0.01
+
+
+def _fake_sys(tmp_path: Path, temp_mc: int, freq_khz: int) -> Path:
+    thermal = tmp_path / "class" / "thermal" / "thermal_zone0"
+    thermal.mkdir(parents=True, exist_ok=True)
+    (thermal / "temp").write_text(f"{temp_mc}\n")
+    cpufreq = tmp_path / "devices" / "system" / "cpu" / "cpu0" / "cpufreq"
+    cpufreq.mkdir(parents=True, exist_ok=True)
+    (cpufreq / "scaling_cur_freq").write_text(f"{freq_khz}\n")
+    return tmp_path
+
+
+def test_sysfs_sources_without_vcgencmd(tmp_path: Path):
+    sources = SystemSources(str(_fake_sys(tmp_path, 51234, 1500000)), lambda *a: None)
+    monitor = RaspberryPiMonitor(sources=sources)
+
+    assert monitor.get_cpu_temperature() == 51.234
+    assert monitor.get_cpu_frequency_mhz() == 1500.0
+    assert monitor.get_throttle_state() is None
+
+
+def test_vcgencmd_throttle_flags_are_decoded(tmp_path: Path):
+    replies = {
+        ("get_throttled",): "throttled=0x50005",
+        ("measure_temp",): "temp=82.0'C",
+    }
+    sources = SystemSources(str(tmp_path), lambda *a: replies.get(a))
+    state = RaspberryPiMonitor(sources=sources).get_throttle_state()
+
+    assert state["under_voltage"] and state["throttled"]
+    assert state["under_voltage_occurred"] and state["throttled_occurred"]
+    assert not state["arm_freq_capped"]
+    assert state["throttling"]
+
+
+def test_soak_reports_time_to_throttle_and_steady_state(tmp_path: Path):
+    clock = _FakeClock()
+    throttled = {"on": False}
+    sys_root = _fake_sys(tmp_path, 60000, 1500000)
+
+    def vcgencmd(*args):
+        # The fake SoC starts throttling 3 seconds into the soak
+        if clock.now >= 3.0:
+            throttled["on"] = True
+            _fake_sys(tmp_path, 85000, 600000)
+        if args == ("get_throttled",):
+            return "throttled=0x40004" if throttled["on"] else "throttled=0x0"
+        return None
+
+    monitor = RaspberryPiMonitor(sources=SystemSources(str(sys_root), vcgencmd))
+    inference = _HeatingInference(clock, throttled)
+
+    result = run_soak_test(
+        inference, duration_s=9.0, window_s=1.0, monitor=monitor, clock=clock
+    )
+
+    assert len(result["windows"]) == 9
+    assert result["time_to_throttle_s"] == pytest.approx(3.0, abs=0.05)
+    assert result["initial_fps"] == pytest.approx(100.0, rel=0.02)
+    assert result["steady_state_fps"] == pytest.approx(50.0, rel=0.02)
+    assert result["throughput_loss_percent"] == pytest.approx(50.0, abs=2.0)
+    assert result["windows"][-1]["temperature_celsius"] == 85.0
+    assert (
+        result["windows"][0]["latency_p50_ms"] < result["windows"][-1]["latency_p50_ms"]
+    )
+    assert result["temperature_latency_correlation"] > 0.5
@@ -0,0 +1,152 @@
+"""Tests for the binary telemetry log of the Pi system monitor."""
+
+import csv
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from edgeflow.deployment.pi_system_monitor import (
+    RECORD_DTYPE,
+    RECORD_INFERENCE,
+    RECORD_SYSTEM,
+    RaspberryPiMonitor,
+    SystemSources,
+    TelemetryLog,
+    export_columns,
+    read_rollups,
+    read_telemetry,
+)
+
+
+def _sample(timestamp, cpu=50.0, temperature=60.0, throttled=0.0):
+    return {
+        "timestamp": timestamp,
+        "cpu_percent": cpu,
+        "memory_percent": 40.0,
+        "temperature_c": temperature,
+        "cpu_freq_mhz": 1500.0,
+        "load_avg_1m": 1.0,
+        "throttled": throttled,
+    }
+
+
+def test_records_round_trip_as_columns(tmp_path: Path):
+    path = str(tmp_path / "run.eft")
+    log = TelemetryLog(path, rollups=(), buffer_records=4)
+    for i in range(10):
+        log.record_system(_sample(100.0 + i, cpu=float(i)))
+        log.record_inference(
+            5.0 + i, "det.tflite" if i % 2 else "cls.tflite", 100.5 + i
+        )
+    log.close()
+
+    assert (Path(path).stat().st_size - 16) == 20 * RECORD_DTYPE.itemsize
+    columns = read_telemetry(path)
+    system = columns["kind"] == RECORD_SYSTEM
+    inference = columns["kind"] == RECORD_INFERENCE
+    assert list(columns["cpu_percent"][system]) == [float(i) for i in range(10)]
+    assert np.isnan(columns["cpu_percent"][inference]).all()
+    assert columns["latency_ms"][inference][3] == pytest.approx(8.0)
+    assert list(columns["model"][inference][:2]) == ["cls.tflite", "det.tflite"]
+    assert columns["model"][system][0] == ""
+
+    # Appending to an existing log keeps the model ids stable
+    log = TelemetryLog(path, rollups=())
+    log.record_inference(1.0, "det.tflite", 200.0)
+    log.close()
+    assert read_telemetry(path)["model"][-1] == "det.tflite"
+    assert Path(f"{path}.names").read_text().splitlines() == [
+        "cls.tflite",
+        "det.tflite",
+    ]
+
+
+def test_rollups_aggregate_per_bucket_with_percentiles(tmp_path: Path):
+    path = str(tmp_path / "soak.eft")
+    log = TelemetryLog(path, raw=False, rollups=("1s", "1m"))
+    for i in range(100):
+        log.record_inference(float(i + 1), "m", 60.0 + i * 0.01)  # bucket 60s
+    log.record_system(_sample(60.2, cpu=20.0, temperature=70.0, throttled=1.0))
+    log.record_system(_sample(60.7, cpu=40.0, temperature=74.0))
+    log.record_system(_sample(61.5, cpu=90.0))  # next 1s bucket
+    log.close()
+
+    assert not Path(path).exists()  # rollups only
+    seconds = read_rollups(path, "1s")
+    assert list(seconds["start"]) == [60.0, 61.0]
+    assert list(seconds["inferences"]) == [100, 0]
+    assert seconds["cpu_mean"][0] == pytest.approx(30.0)
+    assert seconds["temperature_max"][0] == pytest.approx(74.0)
+    assert seconds["throttled_fraction"][0] == pytest.approx(0.5)
+    assert seconds["latency_p50_ms"][0] == pytest.approx(50.0, rel=0.05)
+    assert seconds["latency_p99_ms"][0] == pytest.approx(99.0, rel=0.05)
+    assert seconds["latency_max_ms"][0] == 100.0
+    assert np.isnan(seconds["latency_mean_ms"][1])
+
+    minutes = read_rollups(path, "1m")
+    assert len(minutes["start"]) == 1
+    assert minutes["samples"][0] == 3 and minutes["inferences"][0] == 100
+    with pytest.raises(ValueError):
+        read_rollups(path, "5m")
+
+
+def test_reader_ignores_a_torn_tail(tmp_path: Path):
+    path = str(tmp_path / "torn.eft")
+    log = TelemetryLog(path, rollups=())
+    for i in range(3):
+        log.record_system(_sample(float(i)))
+    log.close()
+    with open(path, "ab") as f:
+        f.write(b"\x01" * 10)  # partial record from a power cut
+
+    assert list(read_telemetry(path)["timestamp"]) == [0.0, 1.0, 2.0]
+    Path(path).write_bytes(b"NOPE" + b"\0" * 12)
+    with pytest.raises(ValueError):
+        read_telemetry(path)
+
+
+def test_export_to_csv_and_npz(tmp_path: Path):
+    path = str(tmp_path / "run.eft")
+    log = TelemetryLog(path, rollups=())
+    log.record_system(_sample(1.0))
+    log.record_inference(12.5, "m.tflite", 2.0)
+    log.close()
+    columns = read_telemetry(path)
+
+    with open(export_columns(columns, str(tmp_path / "run.csv"))) as f:
+        rows = list(csv.DictReader(f))
+    assert rows[1]["model"] == "m.tflite"
+    assert float(rows[1]["latency_ms"]) == 12.5
+
+    arrays = np.load(export_columns(columns, str(tmp_path / "run.npz")))
+    assert list(arrays["model"]) == ["", "m.tflite"]
+    assert arrays["temperature_c"][0] == pytest.approx(60.0)
+
+
+def test_monitor_writes_telemetry_and_summary(tmp_path: Path):
+    proc = tmp_path / "proc"
+    proc.mkdir()
+    (proc / "stat").write_text("cpu  100 0 100 700 100 0 0 0 0 0\n")
+    (proc / "meminfo").write_text("MemTotal: 1000 kB\nMemAvailable: 500 kB\n")
+    sources = SystemSources(str(tmp_path), lambda *a: None, proc_root=str(proc))
+    path = str(tmp_path / "live.eft")
+    monitor = RaspberryPiMonitor(sources=sources, telemetry=TelemetryLog(path))
+    monitor.sample()
+    monitor.log_inference_stats(7.0, "m.tflite")
+    assert monitor.save_detailed_log() == path
+    monitor.telemetry.close()
+
+    columns = read_telemetry(path)
+    assert list(columns["kind"]) == [RECORD_SYSTEM, RECORD_INFERENCE]
+    assert read_rollups(path, "1h")["inferences"][0] == 1
+    summary = json.loads(Path(f"{path}.summary.json").read_text())
+    assert summary["summary"]["total_inferences"] == 1
+
+    # Without a live log the in-memory history is dumped to a new file
+    offline = RaspberryPiMonitor(sources=sources)
+    offline.sample()
+    offline.log_inference_stats(3.0, "m.tflite")
+    dumped = offline.save_detailed_log(str(tmp_path / "dump.eft"))
+    assert list(read_telemetry(dumped)["model"]) == ["", "m.tflite"]
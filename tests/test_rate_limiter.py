@@ -0,0 +1,78 @@
+"""Tests for the GCRA rate limiter and its state backends."""
+
+from pathlib import Path
+
+import pytest
+
+from edgeflow.backend.api.services.rate_limiter import (
+    MemoryRateStore,
+    RateLimiter,
+    SQLiteRateStore,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_burst_then_smooth_refill():
+    clock = _Clock()
+    limiter = RateLimiter(capacity=10, period_s=60, clock=clock)
+
+    assert all(limiter.check("ip").allowed for _ in range(10))
+    denied = limiter.check("ip")
+    assert not denied.allowed
+    assert denied.retry_after_s == pytest.approx(6.0)
+
+    clock.now += 6.0  # one emission interval refills one unit
+    assert limiter.check("ip").allowed
+    assert not limiter.check("ip").allowed
+    assert limiter.check("other-ip").allowed
+
+
+def test_route_costs_are_charged():
+    clock = _Clock()
+    limiter = RateLimiter(
+        capacity=10, period_s=60, route_costs={"/api/pipeline": 4}, clock=clock
+    )
+    assert limiter.check("ip", "/api/pipeline").allowed
+    assert limiter.check("ip", "/api/pipeline").allowed
+    decision = limiter.check("ip", "/api/pipeline")
+    assert not decision.allowed
+    assert limiter.check("ip", "/api/version").allowed  # 9 of 10 units used
+    assert limiter.check("ip", "/api/version").allowed
+    assert not limiter.check("ip", "/api/version").allowed
+
+
+def test_memory_store_is_lru_bounded():
+    store = MemoryRateStore(max_keys=100)
+    limiter = RateLimiter(capacity=5, store=store, clock=_Clock())
+    for i in range(1000):
+        limiter.check(f"10.0.{i // 256}.{i % 256}")
+    assert len(store) == 100
+
+
+def test_sqlite_store_shares_one_budget(tmp_path: Path):
+    clock = _Clock()
+    db = str(tmp_path / "rate.db")
+    worker_a = RateLimiter(capacity=4, store=SQLiteRateStore(db), clock=clock)
+    worker_b = RateLimiter(capacity=4, store=SQLiteRateStore(db), clock=clock)
+
+    results = [w.check("ip").allowed for w in (worker_a, worker_b) * 3]
+    assert results == [True, True, True, True, False, False]
+
+
+def test_sqlite_store_prunes_idle_keys(tmp_path: Path):
+    clock = _Clock()
+    store = SQLiteRateStore(str(tmp_path / "rate.db"), prune_every=10, clock=clock)
+    limiter = RateLimiter(capacity=60, store=store, clock=clock)
+    for i in range(9):
+        limiter.check(f"ip-{i}")
+    assert len(store) == 9
+    clock.now += 120
+    limiter.check("fresh")
+    assert len(store) == 1